@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled lexicon bundle.
+
+Compiles stopwords, legal forms, payment context words, name lexicons and
+diminutive maps into one memory-mapped file that every service and worker
+opens instead of parsing the sources.
+
+Run during deployment and whenever data/lexicons, data/diminutives_*.json or
+the name dictionaries change (a stale bundle is ignored at startup):
+
+    python scripts/build_lexicon_bundle.py
+    python scripts/build_lexicon_bundle.py --benchmark
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Add src to path for imports
+sys.path.append(str(SRC_DIR))
+
+from ai_service.layers.normalization.lexicon_bundle import (
+    BUNDLE_PATH_ENV,
+    build_lexicon_bundle,
+    default_bundle_path,
+)
+
+# Runs in a fresh interpreter: time to a usable bundle and the Python heap it costs
+_PROBE = """
+import json, time, tracemalloc
+from ai_service.layers.normalization.lexicon_bundle import get_lexicon_bundle
+tracemalloc.start()
+start = time.perf_counter()
+bundle = get_lexicon_bundle()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "heap_kb": tracemalloc.get_traced_memory()[0] // 1024,
+    "mmap": bundle.is_mmap,
+}))
+"""
+
+
+def _probe(bundle_path: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), **{BUNDLE_PATH_ENV: bundle_path})
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def benchmark(bundle_path: Path, runs: int) -> dict:
+    """Cold-start load time of the bundle vs. parsing the sources."""
+    results = {}
+    for label, path in (
+        ("bundle", str(bundle_path)),
+        ("sources", str(bundle_path) + ".missing"),
+    ):
+        samples = [_probe(path) for _ in range(runs)]
+        results[label] = {
+            "mmap": samples[0]["mmap"],
+            "median_ms": round(statistics.median(s["ms"] for s in samples), 2),
+            "max_ms": round(max(s["ms"] for s in samples), 2),
+            "heap_kb": int(statistics.median(s["heap_kb"] for s in samples)),
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=default_bundle_path(),
+        help="Bundle file to write",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare cold-start load times after building",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Interpreter starts per benchmark variant"
+    )
+    args = parser.parse_args()
+
+    stats = build_lexicon_bundle(str(args.output))
+    if args.benchmark:
+        stats["benchmark"] = benchmark(args.output, args.runs)
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
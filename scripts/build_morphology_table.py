@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled morphology lookup table.
+
+Runs the full MorphologyAdapter nominative pipeline for every inflected form
+of the name lexicons, diminutive maps and sanctioned person names, and writes
+the results to a memory-mapped hash table that the adapter consults before
+calling pymorphy3.
+
+Run during deployment (after prepare_sanctions_data.py) and whenever
+pymorphy3, its dictionaries or the name lexicons change:
+
+    python scripts/build_morphology_table.py
+    python scripts/build_morphology_table.py --persons path/to/persons.json --output /tmp/morph.bin
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterator
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from ai_service.layers.normalization.morphology.morph_table import (
+    LANGS,
+    build_morphology_table,
+    collect_vocabulary,
+    default_table_path,
+)
+from ai_service.layers.normalization.morphology_adapter import MorphologyAdapter
+from ai_service.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PERSONS_FILE = (
+    Path(__file__).parent.parent
+    / "src"
+    / "ai_service"
+    / "data"
+    / "sanctioned_persons.json"
+)
+
+
+def iter_person_names(path: Path) -> Iterator[str]:
+    """Names (and aliases) from a sanctioned persons JSON list."""
+    if not path.exists():
+        logger.warning(f"Persons file not found: {path}")
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        persons = json.load(f)
+    for person in persons:
+        for field in ("name", "name_ru", "name_uk"):
+            if isinstance(person.get(field), str):
+                yield person[field]
+        for alias in person.get("aliases") or []:
+            if isinstance(alias, str):
+                yield alias
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--output", type=Path, default=default_table_path(), help="Table file to write"
+    )
+    parser.add_argument(
+        "--persons",
+        type=Path,
+        default=DEFAULT_PERSONS_FILE,
+        help="Sanctioned persons JSON",
+    )
+    parser.add_argument("--langs", nargs="+", default=list(LANGS), choices=list(LANGS))
+    args = parser.parse_args()
+
+    words = collect_vocabulary(iter_person_names(args.persons))
+    logger.info(f"Vocabulary: {len(words)} base words")
+
+    adapter = MorphologyAdapter(use_morph_table=False)
+    stats = build_morphology_table(adapter, str(args.output), words, args.langs)
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
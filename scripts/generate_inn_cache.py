@@ -3,7 +3,9 @@
 Generate sanctioned INN cache from JSON data files.
 
 This script should be run during deployment to create the fast lookup cache
-for sanctioned INNs that powers the FAST PATH optimization.
+for sanctioned INNs that powers the FAST PATH optimization. It also writes
+the memory-mapped sanctioned ID index (data/sanctioned_ids.idx) covering
+every identifier type of the sanctioned persons and companies.
 """
 
 import json
@@ -16,6 +18,13 @@ from typing import Dict, Any, List
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+from ai_service.layers.search.sanctioned_id_index import (
+    DEFAULT_INDEX_FILE,
+    entries_from_inn_cache,
+    iter_record_ids,
+    write_index,
+)
+
 try:
     from ai_service.utils.logging_config import get_logger
 except ImportError:
@@ -106,6 +115,33 @@ def save_cache(cache: Dict[str, Dict[str, Any]], output_file: Path):
     logger.info(f"Cache saved to {output_file}")
 
 
+def load_id_entries(cache: Dict[str, Dict[str, Any]]) -> List[tuple]:
+    """Index entries for every ID field of the sanctioned persons and companies."""
+    data_dir = Path(__file__).parent.parent / "src" / "ai_service" / "data"
+
+    # INN cache records first so INN hits return the same record as the cache
+    entries = list(entries_from_inn_cache(cache))
+    for file_name, entity_type in (("sanctioned_persons.json", "person"), ("sanctioned_companies.json", "organization")):
+        source_file = data_dir / file_name
+        if not source_file.exists():
+            continue
+        with open(source_file, 'r', encoding='utf-8') as f:
+            entities = json.load(f)
+        for entity in entities:
+            record = {
+                "name": entity.get('name', ''),
+                "name_en": entity.get('name_en', ''),
+                "type": entity_type,
+                "source": source_file.stem,
+                "person_id": entity.get('person_id'),
+                "birthdate": entity.get('birthdate'),
+                "aliases": entity.get('aliases', [])
+            }
+            for id_type, value in iter_record_ids(entity):
+                entries.append((id_type, value, record))
+    return entries
+
+
 def main():
     """Main function to generate INN cache."""
     logger.info("Starting INN cache generation...")
@@ -122,6 +158,12 @@ def main():
         output_file = Path(__file__).parent.parent / "src" / "ai_service" / "data" / "sanctioned_inns_cache.json"
         save_cache(cache, output_file)
         
+        # Write the sanctioned ID index after the cache so it is not considered stale
+        index_file = Path(os.getenv("SANCTIONED_ID_INDEX", str(DEFAULT_INDEX_FILE)))
+        entries = load_id_entries(cache)
+        write_index(entries, index_file)
+        logger.info(f"Sanctioned ID index saved to {index_file} ({len(entries)} ID entries)")
+
         # Print statistics
         persons_count = sum(1 for item in cache.values() if item.get('type') == 'person')
         orgs_count = sum(1 for item in cache.values() if item.get('type') == 'organization')
@@ -6,13 +6,18 @@ Generate vectors from AC patterns for semantic search.
 import json
 import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import sys
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from ai_service.utils.json_stream import iter_pattern_records
+
 try:
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
@@ -23,12 +28,51 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SHARD_FORMAT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+DEFAULT_DIMENSION = 384
+
+
+def _atomic_write_json(path: Path, payload: Dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def open_vector_shards(shards_dir: Path) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+    """
+    Open shard output produced by ``generate_vector_shards``.
+
+    Vectors are memory-mapped read-only, so loading is zero-copy and the
+    pages are shared between processes reading the same shards.
+    """
+    with open(shards_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    arrays = [
+        np.load(shards_dir / shard["vectors"], mmap_mode="r")
+        for shard in manifest["shards"]
+    ]
+    return manifest, arrays
+
+
+def iter_vector_entries(shards_dir: Path) -> Iterator[Tuple[str, np.ndarray, Dict[str, Any]]]:
+    """Yield ``(name, vector, metadata)`` for every pattern in the id manifest."""
+    manifest, arrays = open_vector_shards(shards_dir)
+    for shard in manifest["shards"]:
+        with open(shards_dir / shard["ids"], "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                yield entry["name"], arrays[entry["shard"]][entry["row"]], entry["metadata"]
+
+
 class VectorGenerator:
     """Generate vectors from text patterns."""
 
     def __init__(self, model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"):
         self.model_name = model_name
         self.model = None
+        self._pool = None
 
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
@@ -138,6 +182,209 @@ class VectorGenerator:
         logger.info(f"[OK] Generated {len(vectors)} vectors")
         return len(vectors)
 
+    def _encode_array(self, texts: List[str], batch_size: int, workers: int) -> np.ndarray:
+        """Encode texts into a float32 matrix, using a process pool when workers > 1."""
+        if not self.model:
+            return np.full((len(texts), DEFAULT_DIMENSION), 0.1, dtype=np.float32)
+
+        if workers > 1:
+            if self._pool is None:
+                devices = ["cpu"] * workers if self.model.device.type == "cpu" else None
+                self._pool = self.model.start_multi_process_pool(target_devices=devices)
+            embeddings = self.model.encode_multi_process(
+                texts, self._pool, batch_size=batch_size
+            )
+        else:
+            embeddings = self.model.encode(
+                texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+            )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def close(self) -> None:
+        """Stop the multi-process encoding pool if one was started."""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+
+    def generate_vector_shards(self, patterns_file: Path, output_dir: Path,
+                               max_patterns: Optional[int] = None,
+                               sample_tiers: List[int] = None,
+                               shard_size: int = 50000,
+                               batch_size: int = 256,
+                               workers: int = 1,
+                               resume: bool = True) -> int:
+        """
+        Stream patterns into float32 ``.npy`` shards plus an id manifest.
+
+        Patterns are read incrementally and deduplicated by text, so each unique
+        text is encoded once. Every pattern gets an entry in the shard's
+        ``ids-*.jsonl`` file pointing at the (shard, row) holding its vector.
+        ``manifest.json`` is rewritten atomically after every shard and acts as
+        the resume checkpoint; a run resumes only with the same input, model,
+        tiers, pattern limit and shard size.
+
+        Returns:
+            Number of patterns covered by the output
+        """
+        if sample_tiers is None:
+            sample_tiers = [0, 1, 2]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = output_dir / MANIFEST_NAME
+
+        stat = patterns_file.stat()
+        source = {
+            "path": str(patterns_file),
+            "size": stat.st_size,
+            "mtime": int(stat.st_mtime),
+        }
+        manifest = {
+            "version": SHARD_FORMAT_VERSION,
+            "model": self.model_name if self.model else "dummy",
+            "dtype": "float32",
+            "dimension": None,
+            "source": source,
+            "sample_tiers": sample_tiers,
+            "max_patterns": max_patterns,
+            "shard_size": shard_size,
+            "records_consumed": 0,
+            "patterns": 0,
+            "unique_texts": 0,
+            "shards": [],
+            "complete": False,
+        }
+
+        # text -> (shard, row) for every vector already written
+        seen: Dict[str, Tuple[int, int]] = {}
+
+        if resume and manifest_path.exists():
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+            compatible = (
+                previous.get("version") == SHARD_FORMAT_VERSION
+                and previous.get("source") == source
+                and previous.get("model") == manifest["model"]
+                and previous.get("sample_tiers") == sample_tiers
+                and previous.get("max_patterns") == max_patterns
+                and previous.get("shard_size") == shard_size
+            )
+            if compatible and previous.get("complete"):
+                logger.info(f"[OK] Shards in {output_dir} are up to date, nothing to do")
+                return previous["patterns"]
+            if compatible:
+                manifest = previous
+                for shard_index, shard in enumerate(manifest["shards"]):
+                    with open(output_dir / shard["ids"], "r", encoding="utf-8") as f:
+                        for line in f:
+                            entry = json.loads(line)
+                            if entry["shard"] == shard_index:
+                                seen[entry["name"]] = (shard_index, entry["row"])
+                logger.info(
+                    f"Resuming from checkpoint: {len(manifest['shards'])} shards, "
+                    f"{manifest['records_consumed']} records consumed"
+                )
+            else:
+                logger.info("Existing manifest does not match input/model, regenerating")
+
+        skip = manifest["records_consumed"]
+        pending_texts: List[str] = []
+        pending_ids: List[Dict[str, Any]] = []
+        records_consumed = skip
+
+        def flush() -> None:
+            shard_index = len(manifest["shards"])
+            vectors_name = f"vectors-{shard_index:05d}.npy"
+            ids_name = f"ids-{shard_index:05d}.jsonl"
+
+            if pending_texts:
+                vectors = self._encode_array(pending_texts, batch_size, workers)
+            else:
+                dimension = manifest["dimension"] or DEFAULT_DIMENSION
+                vectors = np.zeros((0, dimension), dtype=np.float32)
+            manifest["dimension"] = int(vectors.shape[1])
+
+            tmp_vectors = output_dir / (vectors_name + ".tmp")
+            with open(tmp_vectors, "wb") as f:
+                np.save(f, vectors)
+            os.replace(tmp_vectors, output_dir / vectors_name)
+
+            tmp_ids = output_dir / (ids_name + ".tmp")
+            with open(tmp_ids, "w", encoding="utf-8") as f:
+                for entry in pending_ids:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp_ids, output_dir / ids_name)
+
+            manifest["shards"].append({
+                "vectors": vectors_name,
+                "ids": ids_name,
+                "rows": int(vectors.shape[0]),
+                "patterns": len(pending_ids),
+            })
+            manifest["records_consumed"] = records_consumed
+            manifest["patterns"] += len(pending_ids)
+            manifest["unique_texts"] += len(pending_texts)
+            _atomic_write_json(manifest_path, manifest)
+            logger.info(
+                f"Checkpoint: shard {shard_index} ({vectors.shape[0]} vectors, "
+                f"{len(pending_ids)} patterns)"
+            )
+            pending_texts.clear()
+            pending_ids.clear()
+
+        try:
+            logger.info(f"Streaming patterns from {patterns_file}")
+            for index, pattern_data in enumerate(iter_pattern_records(patterns_file)):
+                if index < skip:
+                    continue
+                if max_patterns is not None and manifest["patterns"] + len(pending_ids) >= max_patterns:
+                    break
+                records_consumed = index + 1
+
+                tier = pattern_data.get('tier')
+                if tier not in sample_tiers:
+                    continue
+                pattern = pattern_data.get('pattern', '')
+                if not pattern or len(pattern) < 2:
+                    continue
+
+                shard_index = len(manifest["shards"])
+                location = seen.get(pattern)
+                if location is None:
+                    location = (shard_index, len(pending_texts))
+                    seen[pattern] = location
+                    pending_texts.append(pattern)
+
+                pending_ids.append({
+                    "name": pattern,
+                    "shard": location[0],
+                    "row": location[1],
+                    "metadata": {
+                        "tier": tier,
+                        "pattern_type": pattern_data.get('type', 'unknown'),
+                        "entity_id": pattern_data.get('entity_id', ''),
+                        "entity_type": pattern_data.get('entity_type', 'unknown'),
+                        "confidence": pattern_data.get('confidence', 0.0),
+                        "canonical": pattern_data.get('canonical', pattern)
+                    }
+                })
+
+                if len(pending_texts) >= shard_size:
+                    flush()
+
+            if pending_ids or not manifest["shards"]:
+                flush()
+            manifest["complete"] = True
+            _atomic_write_json(manifest_path, manifest)
+        finally:
+            self.close()
+
+        total = manifest["patterns"]
+        unique = manifest["unique_texts"]
+        logger.info(
+            f"[OK] {total} patterns → {unique} unique vectors in "
+            f"{len(manifest['shards'])} shards ({output_dir})"
+        )
+        return total
+
     def generate_sample_vectors(self, output_file: Path, count: int = 1000) -> int:
         """Generate sample vectors for testing."""
         logger.info(f"Generating {count} sample vectors")
@@ -214,6 +461,12 @@ async def main():
     parser.add_argument("--sample", action="store_true", help="Generate sample vectors instead")
     parser.add_argument("--model", default="sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
                        help="Model name for embeddings")
+    parser.add_argument("--shards-dir", type=Path,
+                       help="Write float32 .npy shards + id manifest here instead of JSON")
+    parser.add_argument("--shard-size", type=int, default=50000, help="Unique vectors per shard")
+    parser.add_argument("--batch-size", type=int, default=256, help="Encoding batch size")
+    parser.add_argument("--workers", type=int, default=1, help="Encoding processes")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore existing shard checkpoints")
 
     args = parser.parse_args()
 
@@ -226,6 +479,19 @@ async def main():
         count = generator.generate_sample_vectors(output_file, args.max_patterns)
         print(f"[OK] Generated {count} sample vectors in {output_file}")
 
+    elif args.input and args.shards_dir:
+        # Stream patterns into resumable binary shards
+        count = generator.generate_vector_shards(
+            args.input,
+            args.shards_dir,
+            max_patterns=args.max_patterns,
+            shard_size=args.shard_size,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            resume=not args.no_resume,
+        )
+        print(f"[OK] Generated vectors for {count} patterns from {args.input} → {args.shards_dir}")
+
     elif args.input and args.output:
         # Generate vectors from patterns file
         args.output.parent.mkdir(parents=True, exist_ok=True)
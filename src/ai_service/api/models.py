@@ -6,7 +6,7 @@ from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from enum import Enum
 
-from ..utils.feature_flags import FeatureFlags, NormalizationImplementation
+from ..utils.feature_flags import FeatureFlags, NormalizationImplementation, TraceLevel
 
 
 class ProcessingMode(str, Enum):
@@ -50,6 +50,7 @@ class FlagOverrides(BaseModel):
     enable_dual_processing: Optional[bool] = None
     log_implementation_choice: Optional[bool] = None
     debug_tracing: Optional[bool] = None
+    trace_level: Optional[TraceLevel] = None
 
     # Normalization behavior
     use_factory_normalizer: Optional[bool] = None
@@ -179,7 +180,8 @@ class ProcessingModePresets:
         enable_enhanced_diminutives=False,
         enable_ascii_fastpath=True,
         morphology_custom_rules_first=True,
-        debug_tracing=False
+        debug_tracing=False,
+        trace_level=TraceLevel.OFF
     )
 
     BALANCED = FlagOverrides(
@@ -190,7 +192,8 @@ class ProcessingModePresets:
         enable_enhanced_diminutives=True,
         enable_ascii_fastpath=True,
         morphology_custom_rules_first=True,
-        debug_tracing=False
+        debug_tracing=False,
+        trace_level=TraceLevel.SUMMARY
     )
 
     ACCURATE = FlagOverrides(
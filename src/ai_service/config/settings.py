@@ -284,6 +284,32 @@ class DeploymentConfig:
     port: int = 8000
     enable_uvicorn_logging: bool = True
     log_level: str = "info"
+    # "eager": build every subsystem before serving; "lazy": serve the core
+    # pipeline while heavy subsystems load in the background
+    startup_mode: str = field(default_factory=lambda: os.getenv("STARTUP_MODE", "eager").lower())
+    # Report ready once the core pipeline is up (lazy mode only); /process still
+    # answers 503 until search and sanctions data are loaded
+    ready_on_core: bool = field(default_factory=lambda: os.getenv("READY_ON_CORE", "false").lower() == "true")
+    # Warm shared state once and fork workers (python main.py with WORKERS > 1)
+    prefork: bool = field(default_factory=lambda: os.getenv("PREFORK", "false").lower() == "true")
+    # Seconds between per-worker memory log lines in pre-fork mode (0 = off)
+    memory_report_interval: float = field(
+        default_factory=lambda: float(os.getenv("MEMORY_REPORT_INTERVAL", "300"))
+    )
+    # Where normalization + signals run: "inline" (event loop) or "process" (pool)
+    execution_backend: str = field(default_factory=lambda: os.getenv("EXECUTION_BACKEND", "inline").lower())
+    process_pool_workers: int = field(default_factory=lambda: int(os.getenv("PROCESS_POOL_WORKERS", "0")))
+    process_pool_max_queue: int = field(default_factory=lambda: int(os.getenv("PROCESS_POOL_MAX_QUEUE", "0")))
+    process_pool_batch_size: int = field(default_factory=lambda: int(os.getenv("PROCESS_POOL_BATCH_SIZE", "8")))
+    process_pool_batch_window_ms: float = field(
+        default_factory=lambda: float(os.getenv("PROCESS_POOL_BATCH_WINDOW_MS", "1.0"))
+    )
+    process_pool_queue_timeout: float = field(
+        default_factory=lambda: float(os.getenv("PROCESS_POOL_QUEUE_TIMEOUT", "1.0"))
+    )
+    process_pool_start_method: str = field(
+        default_factory=lambda: os.getenv("PROCESS_POOL_START_METHOD", "spawn")
+    )
 
     def __post_init__(self):
         """Post-initialization setup"""
@@ -308,6 +334,17 @@ class DeploymentConfig:
             "port": self.port,
             "enable_uvicorn_logging": self.enable_uvicorn_logging,
             "log_level": self.log_level,
+            "startup_mode": self.startup_mode,
+            "ready_on_core": self.ready_on_core,
+            "prefork": self.prefork,
+            "memory_report_interval": self.memory_report_interval,
+            "execution_backend": self.execution_backend,
+            "process_pool_workers": self.process_pool_workers,
+            "process_pool_max_queue": self.process_pool_max_queue,
+            "process_pool_batch_size": self.process_pool_batch_size,
+            "process_pool_batch_window_ms": self.process_pool_batch_window_ms,
+            "process_pool_queue_timeout": self.process_pool_queue_timeout,
+            "process_pool_start_method": self.process_pool_start_method,
         }
 
 
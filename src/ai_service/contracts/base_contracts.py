@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import TYPE_CHECKING
+    from ..utils.text_profile import TextProfile
 
 from pydantic import BaseModel
 
@@ -204,6 +204,8 @@ class ProcessingContext:
     should_process: bool = True
     processing_flags: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Character statistics of sanitized_text, shared by all layers
+    text_profile: Optional["TextProfile"] = None
 
 
 @dataclass
@@ -6,7 +6,7 @@ across different stages (AC, LEXICAL, SEMANTIC, HYBRID, RERANK, WATCHLIST).
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 # ============================================================================
 # Search Stage Types
@@ -78,16 +78,39 @@ class SearchTrace:
     enabled: bool
     steps: List[SearchTraceStep] = field(default_factory=list)
     notes: List[str] = field(default_factory=list)
-
-    def add_step(self, step: SearchTraceStep) -> None:
-        """Add a search step to the trace if enabled."""
-        if self.enabled:
-            self.steps.append(step)
-
-    def note(self, msg: str) -> None:
-        """Add a note to the trace if enabled."""
+    level: str = "full"  # "summary" records steps without per-hit lists
+
+    @property
+    def include_hits(self) -> bool:
+        """Whether callers should build SearchTraceHit lists."""
+        return self.enabled and self.level == "full"
+
+    def add_step(
+        self,
+        step: Union[SearchTraceStep, Callable[[], SearchTraceStep]],
+        hit_count: Optional[int] = None,
+    ) -> None:
+        """
+        Add a search step to the trace if enabled.
+
+        ``step`` may be a zero-argument callable; it is only called when the
+        trace is enabled, so disabled traces cost no allocation. Summary
+        traces drop the hit list and keep ``hit_count`` (default: number of
+        hits) in the step meta.
+        """
+        if not self.enabled:
+            return
+        if not isinstance(step, SearchTraceStep):
+            step = step()
+        if not self.include_hits:
+            step.meta["hit_count"] = len(step.hits) if hit_count is None else hit_count
+            step.hits = []
+        self.steps.append(step)
+
+    def note(self, msg: str, *args: Any) -> None:
+        """Add a note if enabled; ``msg % args`` is only formatted then."""
         if self.enabled:
-            self.notes.append(msg)
+            self.notes.append(msg % args if args else msg)
 
     def get_stage_steps(self, stage: SearchStage) -> List[SearchTraceStep]:
         """Get all steps for a specific stage."""
@@ -99,7 +122,7 @@ class SearchTrace:
 
     def get_hit_count(self) -> int:
         """Get total number of hits across all steps."""
-        return sum(len(step.hits) for step in self.steps)
+        return sum(len(step.hits) or step.meta.get("hit_count", 0) for step in self.steps)
     
     def prepare_for_snapshot(self, max_hits: int = 3) -> None:
         """Prepare trace for stable snapshot comparison."""
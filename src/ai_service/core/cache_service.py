@@ -6,6 +6,8 @@ from typing import Any, Optional
 import threading
 import time
 
+from ..utils.allocation_tracker import register_cache
+
 
 class CacheService:
     """Simple in-memory cache service."""
@@ -20,6 +22,7 @@ class CacheService:
         self._ttl = {}
         self._default_ttl = default_ttl
         self._lock = threading.Lock()
+        register_cache("orchestrator.results", self)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
@@ -0,0 +1,453 @@
+"""
+Execution backends for the CPU-bound core layers (name normalization + signals).
+
+By default ('inline') the orchestrator runs layers 5 and 6 on the event
+loop thread, so one API process uses at most one core and a long
+normalization stalls every other request. ``ProcessPoolBackend`` ('process')
+sends them to pre-warmed worker processes instead:
+
+- requests arriving within ``batch_window_ms`` are grouped into one
+  micro-batch (at most ``batch_size``) and cost a single IPC round trip;
+- payloads are marshalled as plain tuples (``NormalizationResult`` packed
+  field by field, signals as the dict ``SignalsService.extract`` returns),
+  falling back to pickle only when a value is not marshallable;
+- at most ``max_queue`` requests are admitted at once; a request that cannot
+  get a slot within ``queue_timeout`` is rejected with
+  ``ServiceUnavailableError`` (HTTP 503) instead of queueing without bound;
+- queue depth, in-flight requests, rejections and batch sizes are exported
+  to Prometheus and reported by ``stats()``.
+"""
+
+import asyncio
+import marshal
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import fields
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..contracts.base_contracts import NormalizationResult, TokenTrace
+from ..exceptions import NormalizationError, ServiceUnavailableError
+from ..utils import get_logger
+from ..utils.feature_flags import FeatureFlags
+
+logger = get_logger(__name__)
+
+INLINE = "inline"
+PROCESS = "process"
+
+# Texts every pool worker normalizes once at start (loads lexicons, morphology, caches)
+WARMUP_TEXTS = [
+    ("Іван Петренко", "uk"),
+    ("Сергей Иванов", "ru"),
+    ("John Smith", "en"),
+]
+
+_MARSHAL = b"M"
+_PICKLE = b"P"
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize with marshal (fast, compact for builtins), else pickle."""
+    try:
+        return _MARSHAL + marshal.dumps(obj)
+    except ValueError:
+        return _PICKLE + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> Any:
+    if data[:1] == _MARSHAL:
+        return marshal.loads(data[1:])
+    return pickle.loads(data[1:])
+
+
+def _model_fields(model) -> Tuple[str, ...]:
+    return tuple(model.model_fields)
+
+
+def pack_normalization_result(result: NormalizationResult) -> Tuple[Any, ...]:
+    """
+    Pack a NormalizationResult into nested tuples of builtins.
+
+    Fields are stored positionally in declaration order, trace entries as
+    tuples of TokenTrace fields, and extra attributes as a trailing dict.
+    """
+    trace_fields = _model_fields(TokenTrace)
+    values = []
+    for name in _model_fields(NormalizationResult):
+        value = getattr(result, name)
+        if name == "trace" and value:
+            value = [
+                (
+                    tuple(getattr(entry, f) for f in trace_fields)
+                    if isinstance(entry, TokenTrace)
+                    else entry
+                )
+                for entry in value
+            ]
+        values.append(value)
+    return tuple(values), dict(result.model_extra or {})
+
+
+def unpack_normalization_result(packed: Tuple[Any, ...]) -> NormalizationResult:
+    """Rebuild a NormalizationResult packed by ``pack_normalization_result`` (no re-validation)."""
+    values, extra = packed
+    data = dict(zip(_model_fields(NormalizationResult), values))
+    trace_fields = _model_fields(TokenTrace)
+    data["trace"] = [
+        (
+            TokenTrace.model_construct(**dict(zip(trace_fields, entry)))
+            if isinstance(entry, tuple)
+            else entry
+        )
+        for entry in data.get("trace") or []
+    ]
+    return NormalizationResult.model_construct(**data, **extra)
+
+
+_DEFAULT_FLAGS = None
+
+
+def pack_feature_flags(flags: Optional[FeatureFlags]) -> Optional[Dict[str, Any]]:
+    """Only the fields that differ from the defaults (usually none or a few bools)."""
+    global _DEFAULT_FLAGS
+    if flags is None:
+        return None
+    if _DEFAULT_FLAGS is None:
+        _DEFAULT_FLAGS = FeatureFlags()
+    return {
+        f.name: getattr(flags, f.name)
+        for f in fields(FeatureFlags)
+        if getattr(flags, f.name) != getattr(_DEFAULT_FLAGS, f.name)
+    }
+
+
+def unpack_feature_flags(delta: Optional[Dict[str, Any]]) -> Optional[FeatureFlags]:
+    return None if delta is None else FeatureFlags(**delta)
+
+
+# ============================================================================
+# Worker process side
+# ============================================================================
+
+_worker = None
+
+
+class _WorkerServices:
+    """Normalization and signals services of one pool process."""
+
+    def __init__(self):
+        from ..layers.normalization.factory_wrapper import (
+            FactoryBasedNormalizationService,
+        )
+        from ..layers.signals.signals_service import SignalsService
+
+        self.normalization = FactoryBasedNormalizationService()
+        self.signals = SignalsService()
+        self.loop = asyncio.new_event_loop()
+
+    def run(
+        self, text: str, language: Optional[str], kwargs: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        norm_result = self.loop.run_until_complete(
+            self.normalization.normalize_async(text, language=language, **kwargs)
+        )
+        signals = self.signals.extract(text, norm_result, language)
+        return norm_result, signals
+
+
+def _init_worker() -> None:
+    """Pool initializer: build the services and warm them up."""
+    global _worker
+    start = time.perf_counter()
+    _worker = _WorkerServices()
+    for text, language in WARMUP_TEXTS:
+        try:
+            _worker.run(text, language, {})
+        except Exception as e:
+            logger.warning(f"Pool worker warm-up failed for {language}: {e}")
+    logger.info(
+        f"Pool worker {os.getpid()} ready in {time.perf_counter() - start:.2f}s"
+    )
+
+
+def _worker_ping() -> int:
+    return os.getpid()
+
+
+def _run_batch(payload: bytes) -> bytes:
+    """
+    Normalize + extract signals for a micro-batch.
+
+    Args:
+        payload: ``dumps`` of [(text, language, kwargs, packed_flags), ...]
+
+    Returns:
+        ``dumps`` of [(True, packed_result, signals) | (False, error, None), ...]
+    """
+    results = []
+    for text, language, kwargs, packed_flags in loads(payload):
+        try:
+            kwargs = dict(kwargs, feature_flags=unpack_feature_flags(packed_flags))
+            norm_result, signals = _worker.run(text, language, kwargs)
+            results.append((True, pack_normalization_result(norm_result), signals))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}", None))
+    return dumps(results)
+
+
+# ============================================================================
+# API process side
+# ============================================================================
+
+
+class ProcessPoolBackend:
+    """Runs normalization + signals in a pool of pre-warmed processes."""
+
+    name = PROCESS
+
+    def __init__(
+        self,
+        workers: int = 0,
+        max_queue: int = 0,
+        batch_size: int = 8,
+        batch_window_ms: float = 1.0,
+        queue_timeout: float = 1.0,
+        start_method: str = "spawn",
+    ):
+        """
+        Args:
+            workers: Pool processes (0 = one per CPU)
+            max_queue: Requests admitted at once (0 = 4 x workers x batch_size)
+            batch_size: Maximum requests per micro-batch
+            batch_window_ms: How long a request waits for others to join its batch
+            queue_timeout: Seconds to wait for a slot before rejecting
+            start_method: multiprocessing start method ('spawn' or 'forkserver';
+                'fork' is unsafe with the event loop and loader threads)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.max_queue = max_queue or 4 * self.workers * self.batch_size
+        self.batch_window = max(0.0, batch_window_ms) / 1000.0
+        self.queue_timeout = queue_timeout
+        self.start_method = start_method
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending: List[Tuple[tuple, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._exporter = None
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "batches": 0,
+            "pool_restarts": 0,
+            "peak_in_flight": 0,
+            "roundtrip_s": 0.0,
+        }
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context(self.start_method),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Spawn and warm every pool process before the first request."""
+        executor = self._ensure_pool()
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        # One task per process: each submit spawns a process until max_workers
+        pids = await asyncio.gather(
+            *(loop.run_in_executor(executor, _worker_ping) for _ in range(self.workers))
+        )
+        logger.info(
+            f"Process pool ready: {len(set(pids))}/{self.workers} workers "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+    async def normalize_and_extract(
+        self,
+        text: str,
+        language: Optional[str],
+        normalize_kwargs: Dict[str, Any],
+        feature_flags: Optional[FeatureFlags] = None,
+    ) -> Tuple[NormalizationResult, Dict[str, Any]]:
+        """
+        Run layers 5 and 6 for one request in the pool.
+
+        Returns:
+            (NormalizationResult, signals dict as returned by SignalsService.extract)
+
+        Raises:
+            ServiceUnavailableError: No slot within ``queue_timeout`` (back-pressure)
+            NormalizationError: Processing failed in the worker
+        """
+        await self._acquire_slot()
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            item = (text, language, normalize_kwargs, pack_feature_flags(feature_flags))
+            self._pending.append((item, future))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            ok, payload, signals = await future
+        finally:
+            self._release_slot()
+        if not ok:
+            self._stats["failed"] += 1
+            raise NormalizationError(f"Pool normalization failed: {payload}")
+        self._stats["completed"] += 1
+        return unpack_normalization_result(payload), signals
+
+    async def _acquire_slot(self) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_queue)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._stats["rejected"] += 1
+            self._export(rejected=True)
+            raise ServiceUnavailableError(
+                f"Normalization pool saturated ({self.max_queue} requests in flight)"
+            )
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        self._stats["submitted"] += 1
+        self._stats["peak_in_flight"] = max(
+            self._stats["peak_in_flight"], self._in_flight
+        )
+        self._export()
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._slots.release()
+        self._export()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self._stats["batches"] += 1
+        self._export(batch_size=len(batch))
+        futures = [future for _, future in batch]
+        started = time.perf_counter()
+        try:
+            pool_future = self._ensure_pool().submit(
+                _run_batch, dumps([item for item, _ in batch])
+            )
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._on_batch_done(futures, started, error=e)
+            return
+        asyncio.wrap_future(pool_future).add_done_callback(
+            lambda done: self._on_batch_done(futures, started, done=done)
+        )
+
+    def _on_batch_done(
+        self, futures, started: float, done=None, error: Optional[BaseException] = None
+    ) -> None:
+        self._stats["roundtrip_s"] += time.perf_counter() - started
+        results = None
+        if error is None:
+            if done.cancelled():
+                error = asyncio.CancelledError()
+            else:
+                error = done.exception()
+        if error is None:
+            results = loads(done.result())
+        elif isinstance(error, BrokenProcessPool):
+            # A worker died (OOM, segfault): start a fresh pool for the next batch
+            logger.error(f"Process pool broken, restarting: {error}")
+            self._stats["pool_restarts"] += 1
+            self._executor = None
+        for index, future in enumerate(futures):
+            if future.done():
+                continue
+            if results is not None:
+                future.set_result(results[index])
+            else:
+                future.set_exception(
+                    NormalizationError(f"Pool batch failed: {error!r}")
+                )
+
+    def _export(self, rejected: bool = False, batch_size: int = 0) -> None:
+        try:
+            if self._exporter is None:
+                from ..monitoring.prometheus_exporter import get_exporter
+
+                self._exporter = get_exporter()
+            exporter = self._exporter
+            exporter.record_process_pool_state(
+                self._in_flight, self._waiting + len(self._pending)
+            )
+            if rejected:
+                exporter.record_process_pool_rejection()
+            if batch_size:
+                exporter.record_process_pool_batch(batch_size)
+        except Exception as e:
+            logger.debug(f"Process pool metrics not exported: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and batching statistics."""
+        batches = self._stats["batches"]
+        return {
+            "backend": self.name,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "pending_batch": len(self._pending),
+            **{k: v for k, v in self._stats.items() if k != "roundtrip_s"},
+            "avg_batch_size": (
+                round(self._stats["submitted"] / batches, 2) if batches else 0.0
+            ),
+            "avg_batch_roundtrip_ms": (
+                round(self._stats["roundtrip_s"] * 1000 / batches, 3)
+                if batches
+                else 0.0
+            ),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+def create_execution_backend(config) -> Optional[ProcessPoolBackend]:
+    """
+    Backend selected by DeploymentConfig.execution_backend.
+
+    Returns:
+        ProcessPoolBackend for 'process', None for 'inline' (the orchestrator
+        then runs the layers itself)
+    """
+    if config.execution_backend == INLINE:
+        return None
+    if config.execution_backend != PROCESS:
+        raise ValueError(f"Unknown execution backend: {config.execution_backend}")
+    return ProcessPoolBackend(
+        workers=config.process_pool_workers,
+        max_queue=config.process_pool_max_queue,
+        batch_size=config.process_pool_batch_size,
+        batch_window_ms=config.process_pool_batch_window_ms,
+        queue_timeout=config.process_pool_queue_timeout,
+        start_method=config.process_pool_start_method,
+    )
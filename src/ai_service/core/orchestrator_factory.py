@@ -5,7 +5,8 @@ This factory wires together all the existing service implementations
 into the unified orchestrator architecture.
 """
 
-from typing import Optional
+import asyncio
+from typing import List, Optional
 
 from ..config import SERVICE_CONFIG, FEATURE_FLAGS
 from ..exceptions import ServiceInitializationError
@@ -57,6 +58,10 @@ class OrchestratorFactory:
         embeddings_service: Optional = None,
         decision_engine: Optional = None,
         search_service: Optional = None,
+        # Startup behavior
+        defer_heavy: bool = False,
+        # Out-of-process normalization + signals (see core.execution_backend)
+        execution_backend: Optional = None,
     ) -> UnifiedOrchestrator:
         """
         Create a fully configured UnifiedOrchestrator.
@@ -69,6 +74,10 @@ class OrchestratorFactory:
             enable_search: Enable hybrid search service
             allow_smart_filter_skip: Allow smart filter to skip expensive processing
             *_service: Custom service implementations (optional)
+            defer_heavy: Do not build variants/embeddings/search;
+                their names are listed in ``orchestrator.deferred_services``
+                for ``load_deferred_services``
+            execution_backend: Backend running layers 5-6 (None: inline)
 
         Returns:
             Configured UnifiedOrchestrator instance
@@ -144,72 +153,43 @@ class OrchestratorFactory:
                     smart_filter_service = None
                     enable_smart_filter = False
 
-            # Variants service - optional
+            # Heavy optional services: built now, or in the background
+            # (load_deferred_services) when defer_heavy is set
+            deferred: List[str] = []
             if enable_variants and variants_service is None:
-                try:
-                    from ..layers.variants.variant_generation_service import VariantGenerationService
-                    variants_service = VariantGenerationService()
-                    variants_service.initialize()  # Not async
-                    logger.info("Variants service initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize variants service: {e}")
-                    variants_service = None
-                    enable_variants = False
+                if defer_heavy:
+                    deferred.append("variants")
+                else:
+                    variants_service = OrchestratorFactory._build_variants_service()
+                    enable_variants = variants_service is not None
 
-            # Embeddings service - optional
             if enable_embeddings and embeddings_service is None:
-                try:
-                    from ..config import EmbeddingConfig
-                    from ..layers.embeddings.embedding_service import EmbeddingService
-                    embedding_config = EmbeddingConfig()
-                    embeddings_service = EmbeddingService(embedding_config)
-                    await embeddings_service.initialize()
-                    logger.info("Embeddings service initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize embeddings service: {e}")
-                    embeddings_service = None
-                    enable_embeddings = False
+                if defer_heavy:
+                    deferred.append("embeddings")
+                else:
+                    embeddings_service = await OrchestratorFactory._build_embeddings_service()
+                    enable_embeddings = embeddings_service is not None
 
-            # Decision engine - optional
+            # Decision engine is cheap and changes results, so never deferred
             if enable_decision_engine and decision_engine is None:
-                try:
-                    # Use unified config with ENV overrides
-                    decision_engine = DecisionEngine(DECISION_CONFIG)
-                    logger.info("Decision engine initialized with unified config (ENV overrides supported)")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize decision engine: {e}")
-                    decision_engine = None
-                    enable_decision_engine = False
+                decision_engine = OrchestratorFactory._build_decision_engine()
+                enable_decision_engine = decision_engine is not None
 
-            # Search service - optional
             if enable_search and search_service is None:
-                try:
-                    from ..layers.search.config import HybridSearchConfig
-                    from ..layers.search.hybrid_search_service import HybridSearchService
-                    search_config = HybridSearchConfig.from_env()
-                    search_service = HybridSearchService(search_config)
-                    search_service.initialize()  # Not async
-                    logger.info("Search service initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize HybridSearchService: {e}")
-                    logger.info("Falling back to MockSearchService for development/testing")
-                    # Force use MockSearchService when Elasticsearch is not available
-                    try:
-                        from ..layers.search.mock_search_service import MockSearchService
-                        search_service = MockSearchService()
-                        search_service.initialize()
-                        logger.info("[OK] MockSearchService initialized successfully - search escalation available")
-                        # Keep enable_search=True so search layer still runs with mock
-                    except Exception as mock_e:
-                        logger.error(f"[ERROR] Critical: Failed to initialize MockSearchService: {mock_e}")
-                        search_service = None
-                        enable_search = False
+                if defer_heavy:
+                    deferred.append("search")
+                else:
+                    search_service = OrchestratorFactory._build_search_service()
+                    enable_search = search_service is not None
 
             # Metrics service - optional but recommended for production
             metrics_service = None
             try:
                 from ..monitoring.metrics_collector import MetricsCollector
+                from ..monitoring.prometheus_exporter import get_exporter
                 metrics_service = MetricsCollector()
+                # Serve its latency/score quantiles on /metrics
+                get_exporter().attach_metrics_collector(metrics_service)
                 logger.info("Metrics service initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize metrics service: {e}")
@@ -241,7 +221,10 @@ class OrchestratorFactory:
                 enable_decision_engine=enable_decision_engine,
                 enable_search=enable_search,
                 allow_smart_filter_skip=allow_smart_filter_skip,
+                auto_init_search=not defer_heavy,
+                execution_backend=execution_backend,
             )
+            orchestrator.deferred_services = deferred
 
             logger.info("UnifiedOrchestrator created successfully")
             return orchestrator
@@ -250,6 +233,120 @@ class OrchestratorFactory:
             logger.error(f"Failed to create orchestrator: {e}", exc_info=True)
             raise ServiceInitializationError(f"Orchestrator creation failed: {e}")
 
+    @staticmethod
+    def _build_variants_service():
+        try:
+            from ..layers.variants.variant_generation_service import VariantGenerationService
+            variants_service = VariantGenerationService()
+            variants_service.initialize()  # Not async
+            logger.info("Variants service initialized")
+            return variants_service
+        except Exception as e:
+            logger.warning(f"Failed to initialize variants service: {e}")
+            return None
+
+    @staticmethod
+    async def _build_embeddings_service():
+        try:
+            from ..config import EmbeddingConfig
+            from ..layers.embeddings.embedding_service import EmbeddingService
+            embedding_config = EmbeddingConfig()
+            embeddings_service = EmbeddingService(embedding_config)
+            await embeddings_service.initialize()
+            logger.info("Embeddings service initialized")
+            return embeddings_service
+        except Exception as e:
+            logger.warning(f"Failed to initialize embeddings service: {e}")
+            return None
+
+    @staticmethod
+    def _build_decision_engine():
+        try:
+            # Use unified config with ENV overrides
+            decision_engine = DecisionEngine(DECISION_CONFIG)
+            logger.info("Decision engine initialized with unified config (ENV overrides supported)")
+            return decision_engine
+        except Exception as e:
+            logger.warning(f"Failed to initialize decision engine: {e}")
+            return None
+
+    @staticmethod
+    def _build_search_service():
+        try:
+            from ..layers.search.config import HybridSearchConfig
+            from ..layers.search.hybrid_search_service import HybridSearchService
+            search_config = HybridSearchConfig.from_env()
+            search_service = HybridSearchService(search_config)
+            search_service.initialize()  # Not async
+            logger.info("Search service initialized")
+            return search_service
+        except Exception as e:
+            logger.warning(f"Failed to initialize HybridSearchService: {e}")
+            logger.info("Falling back to MockSearchService for development/testing")
+            # Force use MockSearchService when Elasticsearch is not available
+            try:
+                from ..layers.search.mock_search_service import MockSearchService
+                search_service = MockSearchService()
+                search_service.initialize()
+                logger.info("[OK] MockSearchService initialized successfully - search escalation available")
+                # Keep enable_search=True so search layer still runs with mock
+                return search_service
+            except Exception as mock_e:
+                logger.error(f"[ERROR] Critical: Failed to initialize MockSearchService: {mock_e}")
+                return None
+
+    @staticmethod
+    async def load_deferred_services(
+        orchestrator: UnifiedOrchestrator,
+        readiness=None,
+        names: Optional[List[str]] = None,
+        warmup: bool = True,
+    ) -> None:
+        """
+        Build the services listed in ``orchestrator.deferred_services`` and
+        attach them one by one as they become available.
+
+        Synchronous constructors run in a worker thread so the event loop
+        keeps serving requests. The embedding model is loaded here as well
+        (EmbeddingService otherwise loads it on the first request).
+
+        Args:
+            orchestrator: Orchestrator created with ``defer_heavy=True``
+            readiness: Optional ReadinessTracker to report progress to
+            names: Load only these of the deferred services; the rest stay deferred
+            warmup: Run a first embedding so the model is fully loaded (skipped
+                in the pre-fork master: the encoder's thread pools do not
+                survive fork)
+        """
+        builders = {
+            "variants": lambda: asyncio.to_thread(OrchestratorFactory._build_variants_service),
+            "embeddings": OrchestratorFactory._build_embeddings_service,
+            "search": lambda: asyncio.to_thread(OrchestratorFactory._build_search_service),
+        }
+        deferred = list(getattr(orchestrator, "deferred_services", []))
+        names = [name for name in deferred if names is None or name in names]
+        if readiness is not None:
+            for name in names:
+                readiness.register(name)
+
+        for name in names:
+            if readiness is not None:
+                readiness.start(name)
+            service = await builders[name]()
+            if name == "embeddings" and service is not None and warmup:
+                try:
+                    await asyncio.to_thread(service.encode_one, "warmup")
+                except Exception as e:
+                    logger.warning(f"Embedding model warmup failed: {e}")
+            if service is None:
+                if readiness is not None:
+                    readiness.fail(name, "initialization failed")
+                continue
+            orchestrator.attach_service(name, service)
+            if readiness is not None:
+                readiness.ready(name)
+        orchestrator.deferred_services = [name for name in deferred if name not in names]
+
     @staticmethod
     async def create_testing_orchestrator(minimal: bool = False) -> UnifiedOrchestrator:
         """
@@ -271,14 +368,23 @@ class OrchestratorFactory:
         )
 
     @staticmethod
-    async def create_production_orchestrator() -> UnifiedOrchestrator:
+    async def create_production_orchestrator(defer_heavy: bool = False) -> UnifiedOrchestrator:
         """
         Create orchestrator optimized for production.
 
+        Args:
+            defer_heavy: Leave heavy services to ``load_deferred_services``
+
         Returns:
             Production-optimized orchestrator
         """
-        logger.info("Creating production orchestrator")
+        from ..config import DEPLOYMENT_CONFIG
+        from .execution_backend import create_execution_backend
+
+        logger.info(
+            f"Creating production orchestrator (defer_heavy={defer_heavy}, "
+            f"execution_backend={DEPLOYMENT_CONFIG.execution_backend})"
+        )
 
         return await OrchestratorFactory.create_orchestrator(
             enable_smart_filter=True,
@@ -287,4 +393,6 @@ class OrchestratorFactory:
             enable_decision_engine=True,    # Enable automated decision making
             enable_search=True,             # Enable hybrid search service
             allow_smart_filter_skip=False,  # Don't skip processing - always normalize
+            defer_heavy=defer_heavy,
+            execution_backend=create_execution_backend(DEPLOYMENT_CONFIG),
         )
@@ -19,10 +19,11 @@ Layers implemented:
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import SERVICE_CONFIG
-from ..utils.feature_flags import FeatureFlags
+from ..utils.feature_flags import FeatureFlags, TraceLevel, get_trace_level
+from ..utils.text_profile import begin_text_profile_scope, end_text_profile_scope, get_text_profile
 from ..contracts.base_contracts import (
     EmbeddingsServiceInterface,
     LanguageDetectionInterface,
@@ -58,9 +59,12 @@ from ..contracts.trace_models import SearchTrace, SearchTraceBuilder
 from ..core.decision_engine import DecisionEngine
 from ..config.settings import DecisionConfig
 from ..layers.normalization.homoglyph_detector import HomoglyphDetector
-from ..exceptions import InternalServerError, ServiceInitializationError
+from ..exceptions import InternalServerError, ServiceInitializationError, ServiceUnavailableError
 from ..utils import get_logger
 from ..monitoring.metrics_service import MetricsService, MetricType, AlertSeverity
+from ..monitoring.prometheus_exporter import get_exporter
+from ..utils.allocation_tracker import begin_allocation_sample, end_allocation_sample, track_layer_allocations
+from ..utils.tracing import begin_request_trace, end_request_trace, span, trace_event
 
 logger = get_logger(__name__)
 
@@ -96,6 +100,10 @@ class UnifiedOrchestrator:
         enable_decision_engine: Optional[bool] = None,
         enable_search: Optional[bool] = None,
         allow_smart_filter_skip: Optional[bool] = None,
+        # Set False when search is attached later (lazy startup)
+        auto_init_search: bool = True,
+        # Runs layers 5 + 6 out of process (None: on the event loop)
+        execution_backend: Optional[Any] = None,
     ):
         # Validate required services are not None
         if validation_service is None:
@@ -120,9 +128,10 @@ class UnifiedOrchestrator:
         self.decision_engine = decision_engine
         self.metrics_service = metrics_service
         self.search_service = search_service
+        self.execution_backend = execution_backend
 
         # Auto-initialize search service if enabled but not provided
-        if self.search_service is None and SERVICE_CONFIG.enable_search:
+        if self.search_service is None and SERVICE_CONFIG.enable_search and auto_init_search:
             try:
                 from ai_service.layers.search.hybrid_search_service import HybridSearchService
                 from ai_service.layers.search.config import HybridSearchConfig
@@ -210,6 +219,42 @@ class UnifiedOrchestrator:
             f"search={self.enable_search}, search_service={search_service_type}"
         )
 
+    # Deferred service name -> (service attribute, enable flag attribute)
+    _ATTACHABLE_SERVICES = {
+        "variants": ("variants_service", "enable_variants"),
+        "embeddings": ("embeddings_service", "enable_embeddings"),
+        "search": ("search_service", "enable_search"),
+    }
+
+    def attach_service(self, name: str, service: Any) -> None:
+        """
+        Attach an optional service that finished loading after construction.
+
+        Used by lazy startup: requests served before this call skip the
+        stage, later requests run it.
+
+        Args:
+            name: One of 'variants', 'embeddings', 'search'
+            service: Initialized service instance
+        """
+        if name not in self._ATTACHABLE_SERVICES:
+            raise ValueError(f"Unknown service: {name}")
+        service_attr, flag_attr = self._ATTACHABLE_SERVICES[name]
+        setattr(self, service_attr, service)
+        if name == "embeddings":
+            self.embedding_service = service
+        setattr(self, flag_attr, service is not None)
+        logger.info(f"Attached deferred service: {name} ({type(service).__name__})")
+
+    @staticmethod
+    def _exporter():
+        """Prometheus exporter, or None when metrics are unavailable."""
+        try:
+            return get_exporter()
+        except Exception as e:
+            logger.debug(f"Metrics not available: {e}")
+            return None
+
     async def _maybe_await(self, x):
         """Helper to await if needed"""
         import inspect
@@ -258,6 +303,8 @@ class UnifiedOrchestrator:
 
         validation_result = await self._maybe_await(self.validation_service.validate_and_sanitize(text))
         context.sanitized_text = validation_result.get("sanitized_text", text)
+        # Profiled once here; later layers read it via get_text_profile()
+        context.text_profile = get_text_profile(context.sanitized_text)
 
         # Debug trace for lengths
         logger.debug(f"Validation: input_len={self._safe_len(text)}, sanitized_len={self._safe_len(context.sanitized_text)}")
@@ -402,35 +449,19 @@ class UnifiedOrchestrator:
         layer_start = time.time()
 
         # Initialize metrics tracking for this layer
-        metrics = None
-        try:
-            from ..monitoring.prometheus_exporter import get_exporter
-            metrics = get_exporter()
-        except Exception as e:
-            logger.debug(f"Metrics not available in normalization layer: {e}")
-            metrics = None
-
-        # Align legacy flags with feature flag directives
-        remove_stop_words = feature_flags.strict_stopwords
-        if feature_flags.preserve_hyphenated_case:
-            preserve_names = True
+        metrics = self._exporter()
 
-        # Conditional morphology for performance optimization
-        token_count = len(text_u.split()) if text_u else 0
-        if token_count <= 2 and len(text_u) < 15:
-            # Skip heavy morphology for very short inputs
-            enable_advanced_features = False
-            logger.debug(f"Skipping morphology for short text: {token_count} tokens, {len(text_u)} chars")
+        normalize_kwargs = self._normalization_kwargs(
+            text_u, remove_stop_words, preserve_names, enable_advanced_features, feature_flags
+        )
 
         # Use unicode-normalized text for normalization
         norm_start = time.time()
         norm_result = await self._maybe_await(self.normalization_service.normalize_async(
             text_u,  # Use unicode-normalized text
             language=context.language,
-            remove_stop_words=remove_stop_words,
-            preserve_names=preserve_names,
-            enable_advanced_features=enable_advanced_features,
             feature_flags=feature_flags,
+            **normalize_kwargs,
         ))
 
         # Record normalization metrics
@@ -449,6 +480,39 @@ class UnifiedOrchestrator:
         # Note: Feature flags are logged separately, not added to trace
         # as trace should only contain TokenTrace objects
 
+        self._record_normalization_result(norm_result, layer_start, errors)
+        return norm_result
+
+    def _normalization_kwargs(
+        self,
+        text_u: str,
+        remove_stop_words: bool,
+        preserve_names: bool,
+        enable_advanced_features: bool,
+        feature_flags: FeatureFlags,
+    ) -> Dict[str, bool]:
+        """Effective normalization options for one request."""
+        # Align legacy flags with feature flag directives
+        remove_stop_words = feature_flags.strict_stopwords
+        if feature_flags.preserve_hyphenated_case:
+            preserve_names = True
+
+        # Conditional morphology for performance optimization
+        token_count = len(text_u.split()) if text_u else 0
+        if token_count <= 2 and len(text_u) < 15:
+            # Skip heavy morphology for very short inputs
+            enable_advanced_features = False
+            logger.debug(f"Skipping morphology for short text: {token_count} tokens, {len(text_u)} chars")
+
+        return {
+            "remove_stop_words": remove_stop_words,
+            "preserve_names": preserve_names,
+            "enable_advanced_features": enable_advanced_features,
+        }
+
+    def _record_normalization_result(self, norm_result: Any, layer_start: float, errors: list) -> None:
+        """Layer 5 metrics and errors, shared by the inline and offloaded paths."""
+
         if self.metrics_service:
             self.metrics_service.record_timer('processing.layer.normalization', time.time() - layer_start)
             if hasattr(norm_result, 'confidence') and norm_result.confidence is not None:
@@ -460,7 +524,41 @@ class UnifiedOrchestrator:
                 self.metrics_service.record_counter('processing.normalization.failed', 1)
             errors.extend(norm_result.errors)
 
-        return norm_result
+    async def _handle_offloaded_core_layers(
+        self,
+        text_u: str,
+        context: ProcessingContext,
+        remove_stop_words: bool,
+        preserve_names: bool,
+        enable_advanced_features: bool,
+        feature_flags: FeatureFlags,
+        errors: list,
+    ) -> Tuple[Any, Any]:
+        """
+        Handle Layers 5 and 6 in the execution backend's worker processes.
+
+        Both layers run in one round trip, so the event loop stays free for
+        I/O while the CPU-bound work uses the other cores.
+
+        Returns:
+            (normalization result, signals result)
+        """
+        logger.debug("Stages 5-6: Name Normalization + Signals (process pool)")
+        layer_start = time.time()
+        normalize_kwargs = self._normalization_kwargs(
+            text_u, remove_stop_words, preserve_names, enable_advanced_features, feature_flags
+        )
+        norm_result, signals_dict = await self.execution_backend.normalize_and_extract(
+            text_u, context.language, normalize_kwargs, feature_flags
+        )
+        metrics = self._exporter()
+        if metrics:
+            metrics.record_pipeline_stage_duration("normalization_signals", (time.time() - layer_start) * 1000)
+
+        from ..layers.signals.signals_service import SignalsResultWrapper
+
+        self._record_normalization_result(norm_result, layer_start, errors)
+        return norm_result, SignalsResultWrapper(signals_dict)
 
     async def _handle_signals_layer(
         self, text_u: str, norm_result: Any, context: ProcessingContext
@@ -480,13 +578,7 @@ class UnifiedOrchestrator:
         layer_start = time.time()
 
         # Initialize metrics tracking for this layer
-        metrics = None
-        try:
-            from ..monitoring.prometheus_exporter import get_exporter
-            metrics = get_exporter()
-        except Exception as e:
-            logger.debug(f"Metrics not available in signals layer: {e}")
-            metrics = None
+        metrics = self._exporter()
 
         signals_result = await self._maybe_await(self.signals_service.extract_signals(
             text=text_u, normalization_result=norm_result, language=context.language  # Use unicode-normalized text
@@ -786,7 +878,7 @@ class UnifiedOrchestrator:
 
                     if search_trace:
                         result_count = search_results.get('total_hits', 0) if search_results else 0
-                        search_trace.note(f"Search completed: {result_count} results for '{query}'")
+                        search_trace.note("Search completed: %s results for '%s'", result_count, query)
 
                     logger.debug(f"Search completed for '{query}': {search_results.get('total_hits', 0) if search_results else 0} results")
 
@@ -809,7 +901,7 @@ class UnifiedOrchestrator:
             except Exception as e:
                 logger.warning(f"Search failed: {e}")
                 if search_trace:
-                    search_trace.note(f"Search failed: {str(e)}")
+                    search_trace.note("Search failed: %s", e)
                 if self.metrics_service:
                     self.metrics_service.record_counter('processing.search.failed', 1)
                 errors.append(f"Search: {str(e)}")
@@ -849,13 +941,7 @@ class UnifiedOrchestrator:
         decision_result = None
 
         # Initialize metrics tracking for this layer
-        metrics = None
-        try:
-            from ..monitoring.prometheus_exporter import get_exporter
-            metrics = get_exporter()
-        except Exception as e:
-            logger.debug(f"Metrics not available in decision layer: {e}")
-            metrics = None
+        metrics = self._exporter()
 
         # Create processing result for decision engine
         temp_processing_result = UnifiedProcessingResult(
@@ -928,7 +1014,7 @@ class UnifiedOrchestrator:
         generate_embeddings: Optional[bool] = None,
         feature_flags: Optional[FeatureFlags] = None,
         # Search tracing
-        search_trace_enabled: bool = True,  # Enable by default for debugging
+        search_trace_enabled: Optional[bool] = None,  # None: follow feature_flags.trace_level
         # Legacy compatibility kwargs (ignored but accepted)
         cache_result: Optional[bool] = None,
         embeddings: Optional[bool] = None,
@@ -946,6 +1032,8 @@ class UnifiedOrchestrator:
             language_hint: Optional language hint
             generate_variants: Override variants generation
             generate_embeddings: Override embeddings generation
+            search_trace_enabled: Force the search trace on/off; by default
+                it follows ``feature_flags.trace_level``
 
         Returns:
             UnifiedProcessingResult with all layers' output
@@ -954,23 +1042,19 @@ class UnifiedOrchestrator:
         context = ProcessingContext(original_text=text)
         errors = []
 
-        # Initialize metrics tracking
-        metrics = None
-        try:
-            from ..monitoring.prometheus_exporter import get_exporter
-            metrics = get_exporter()
-        except Exception as e:
-            # Catch all exceptions to ensure metrics is always defined
-            logger.debug(f"Metrics not available: {e}")
-            metrics = None
-        
-        # Initialize search trace if enabled
-        search_trace = None
-        if search_trace_enabled:
-            search_trace = SearchTrace(enabled=True)
-
         # Defensive handling of feature flags
         effective_flags = self._validate_and_normalize_flags(feature_flags)
+
+        # Initialize search trace per trace level (explicit argument wins)
+        trace_level = get_trace_level(effective_flags)
+        if search_trace_enabled is None:
+            search_trace_enabled = trace_level != TraceLevel.OFF
+        search_trace = None
+        if search_trace_enabled:
+            search_trace = SearchTrace(
+                enabled=True,
+                level="summary" if trace_level == TraceLevel.SUMMARY else "full",
+            )
         context.processing_flags["feature_flags"] = effective_flags.to_dict()
         context.metadata["feature_flags"] = effective_flags.to_dict()
 
@@ -984,40 +1068,50 @@ class UnifiedOrchestrator:
         if variants is not None:
             generate_variants = variants
 
-        # Handle caching if enabled and cache_service is available
-        cache_key = None
-        if cache_result and self.cache_service:
-            cache_key = self._generate_cache_key(text, remove_stop_words, preserve_names)
-            try:
-                cached_result = self.cache_service.get(cache_key)
-                if cached_result:
-                    # Update stats for cache hit
-                    self.update_stats(0.001, cache_hit=True, error=False)
-                    return cached_result
-            except Exception as e:
-                logger.debug(f"Cache get failed: {e}")
+        # Head-sampled span tree of this request (no-op unless sampled)
+        trace_scope = begin_request_trace("process", text_length=self._safe_len(text))
+        # Sampled per-layer allocation accounting (no-op unless enabled)
+        allocation_scope = begin_allocation_sample()
+        # Per-request text profiles: every layer shares one scan per distinct text
+        profile_scope = begin_text_profile_scope()
+        try:
+            # Handle caching if enabled and cache_service is available
+            cache_key = None
+            if cache_result and self.cache_service:
+                cache_key = self._generate_cache_key(text, remove_stop_words, preserve_names)
+                try:
+                    cached_result = self.cache_service.get(cache_key)
+                    if cached_result:
+                        trace_event("cache.hit", cache="result")
+                        # Update stats for cache hit
+                        self.update_stats(0.001, cache_hit=True, error=False)
+                        return cached_result
+                except Exception as e:
+                    logger.debug(f"Cache get failed: {e}")
 
-        # Cache miss or caching disabled
-        if self.cache_service:
-            self.processing_stats["cache_misses"] += 1
+            # Cache miss or caching disabled
+            if self.cache_service:
+                trace_event("cache.miss", cache="result")
+                self.processing_stats["cache_misses"] += 1
 
-        # Initialize metrics collection
-        if self.metrics_service:
-            self.metrics_service.record_counter('processing.requests.total', 1)
-            self.metrics_service.record_gauge('processing.requests.active', 1)
+            # Initialize metrics collection
+            if self.metrics_service:
+                self.metrics_service.record_counter('processing.requests.total', 1)
+                self.metrics_service.record_gauge('processing.requests.active', 1)
 
-        try:
             # ================================================================
             # Layer 1: Validation & Sanitization
             # ================================================================
-            validation_result = await self._handle_validation_layer(text, context, start_time)
+            with span("layer.validation"):
+                validation_result = await self._handle_validation_layer(text, context, start_time)
             if validation_result is not None:  # Early return if validation failed
                 return validation_result
 
             # ================================================================
             # Layer 2: Smart Filter (optional skip)
             # ================================================================
-            smart_filter_result = await self._handle_smart_filter_layer(context, start_time)
+            with span("layer.smart_filter"):
+                smart_filter_result = await self._handle_smart_filter_layer(context, start_time)
             if smart_filter_result is not None:  # Early return if filtered
                 return smart_filter_result
             
@@ -1028,19 +1122,30 @@ class UnifiedOrchestrator:
             # ================================================================
             # Layer 3: Language Detection (on original text to preserve language markers)
             # ================================================================
-            await self._handle_language_detection_layer(context, language_hint)
+            with span("layer.language_detection"):
+                await self._handle_language_detection_layer(context, language_hint)
 
             # ================================================================
             # Layer 4: Unicode Normalization (after language detection)
             # ================================================================
-            text_u = await self._handle_unicode_normalization_layer(context)
+            with span("layer.unicode_normalization"):
+                text_u = await self._handle_unicode_normalization_layer(context)
 
             # ================================================================
             # Layer 5: Name Normalization (morph) - THE CORE
             # ================================================================
-            norm_result = await self._handle_name_normalization_layer(
-                text_u, context, remove_stop_words, preserve_names, enable_advanced_features, effective_flags, errors
-            )
+            signals_result = None
+            if self.execution_backend is not None:
+                # Layers 5 + 6 in the process pool
+                with span("layer.normalization_signals", backend="process"):
+                    norm_result, signals_result = await self._handle_offloaded_core_layers(
+                        text_u, context, remove_stop_words, preserve_names, enable_advanced_features, effective_flags, errors
+                    )
+            else:
+                with span("layer.normalization"), track_layer_allocations("normalization"):
+                    norm_result = await self._handle_name_normalization_layer(
+                        text_u, context, remove_stop_words, preserve_names, enable_advanced_features, effective_flags, errors
+                    )
             
             # Add trace note for AC patterns after normalization
             if search_trace and hasattr(norm_result, 'tokens') and norm_result.tokens:
@@ -1058,17 +1163,21 @@ class UnifiedOrchestrator:
             # ================================================================
             # Layer 6: Signals (enrichment)
             # ================================================================
-            signals_result = await self._handle_signals_layer(text_u, norm_result, context)
+            if signals_result is None:
+                with span("layer.signals"), track_layer_allocations("signals"):
+                    signals_result = await self._handle_signals_layer(text_u, norm_result, context)
 
             # ================================================================
             # Layer 7: Variants (optional)
             # ================================================================
-            variants = await self._handle_variants_layer(norm_result, context, generate_variants, errors)
+            with span("layer.variants"), track_layer_allocations("variants"):
+                variants = await self._handle_variants_layer(norm_result, context, generate_variants, errors)
 
             # ================================================================
             # Layer 8: Embeddings (optional)
             # ================================================================
-            embeddings = await self._handle_embeddings_layer(norm_result, generate_embeddings, errors)
+            with span("layer.embeddings"):
+                embeddings = await self._handle_embeddings_layer(norm_result, generate_embeddings, errors)
 
             # Add trace note for vector fallback
             if search_trace and embeddings:
@@ -1077,14 +1186,18 @@ class UnifiedOrchestrator:
             # ================================================================
             # Layer 9: Search (optional)
             # ================================================================
-            search_results = await self._handle_search_layer(norm_result, embeddings, errors, text, search_trace, signals_result)
+            with span("layer.search"), track_layer_allocations("search"):
+                search_results = await self._handle_search_layer(
+                    norm_result, embeddings, errors, text, search_trace, signals_result
+                )
 
             # ================================================================
             # Layer 10: Decision & Response
             # ================================================================
-            decision_result = await self._handle_decision_layer(
-                context, norm_result, signals_result, variants, embeddings, search_results, errors, search_trace
-            )
+            with span("layer.decision"), track_layer_allocations("decision"):
+                decision_result = await self._handle_decision_layer(
+                    context, norm_result, signals_result, variants, embeddings, search_results, errors, search_trace
+                )
 
             processing_time = time.time() - start_time
 
@@ -1139,6 +1252,12 @@ class UnifiedOrchestrator:
 
             return result
 
+        except ServiceUnavailableError:
+            # Execution backend back-pressure: surface as 503, not as a failed result
+            if self.metrics_service:
+                self.metrics_service.record_counter('processing.requests.rejected', 1)
+                self.metrics_service.record_gauge('processing.requests.active', -1)
+            raise
         except Exception as e:
             processing_time = time.time() - start_time
             logger.error(f"Processing failed: {e}", exc_info=True)
@@ -1162,6 +1281,10 @@ class UnifiedOrchestrator:
                 success=False,
                 errors=[str(e)],
             )
+        finally:
+            end_text_profile_scope(profile_scope)
+            end_request_trace(trace_scope)
+            end_allocation_sample(allocation_scope)
 
     def _create_early_response(
         self, context: ProcessingContext, reason: str, start_time: float
@@ -1541,7 +1664,10 @@ class UnifiedOrchestrator:
 
     def get_processing_stats(self) -> Dict[str, Any]:
         """Legacy method for getting processing statistics"""
-        return self.processing_stats.copy()
+        stats = self.processing_stats.copy()
+        if self.execution_backend is not None:
+            stats["execution_backend"] = self.execution_backend.stats()
+        return stats
 
     def reset_stats(self):
         """Legacy method for resetting statistics"""
@@ -1612,10 +1738,10 @@ class UnifiedOrchestrator:
         
         # Validate individual flag values
         try:
-            # Check for any invalid boolean values
+            # Check for any invalid boolean values (trace_level is checked by get_trace_level)
             flag_dict = feature_flags.to_dict()
             for flag_name, flag_value in flag_dict.items():
-                if not isinstance(flag_value, bool):
+                if flag_name != "trace_level" and not isinstance(flag_value, bool):
                     logger.warning(f"Invalid flag value for {flag_name}: {flag_value} (type: {type(flag_value)}), using default")
                     # Reset to default value
                     if hasattr(self.default_feature_flags, flag_name):
@@ -1699,39 +1825,43 @@ class UnifiedOrchestrator:
             return []
 
     async def _find_candidates_by_id(self, id_value: str, id_type: str) -> List[Dict[str, Any]]:
-        """Find candidates in sanctions database by specific ID using fast INN cache."""
+        """Find candidates in sanctions database by specific ID using the sanctioned ID index."""
         try:
-            from ..layers.search.sanctioned_inn_cache import lookup_sanctioned_inn
-
-            # For INN/ITN, use fast cache lookup
-            if id_type.lower() in ['inn', 'itn', 'tax_id']:
-                sanctioned_data = lookup_sanctioned_inn(id_value)
-                if sanctioned_data:
-                    # Convert cached data to candidate format
-                    candidate = {
-                        "doc_id": f"sanctioned_inn_{id_value}",
-                        "score": 1.0,  # Perfect match on sanctioned INN
-                        "text": sanctioned_data.get('name', 'Unknown'),
-                        "entity_type": sanctioned_data.get('type', 'person'),
-                        "metadata": {
-                            'itn': id_value,
-                            'name_en': sanctioned_data.get('name_en', ''),
-                            'birthdate': sanctioned_data.get('birthdate'),
-                            'person_id': sanctioned_data.get('person_id'),
-                            'org_id': sanctioned_data.get('org_id'),
-                            'source': sanctioned_data.get('source', 'sanctioned_inn_cache'),
-                            'status': sanctioned_data.get('status', 1),
-                            'risk_level': sanctioned_data.get('risk_level', 'high')
-                        },
-                        "search_mode": "inn_cache",
-                        "match_fields": ["itn"],
-                        "confidence": 1.0
-                    }
-
-                    print(f"🚨 SANCTIONED INN CACHE HIT: {id_value} -> {sanctioned_data.get('name', 'Unknown')}")
-                    return [candidate]
-
-            # Fallback to mock search for other ID types
+            from ..layers.search.sanctioned_id_index import index_id_type
+            from ..layers.search.sanctioned_inn_cache import get_inn_cache
+
+            # Exact lookup restricted to the extracted type, so e.g. a passport
+            # number equal to a sanctioned INN is not reported as that INN
+            match = get_inn_cache().find(id_value, index_id_type(id_type))
+            if match:
+                matched_type, sanctioned_data = match
+                is_inn = matched_type == 'inn'
+                id_field = 'itn' if is_inn else matched_type
+                # Convert cached data to candidate format
+                candidate = {
+                    "doc_id": f"sanctioned_{'inn' if is_inn else matched_type}_{id_value}",
+                    "score": 1.0,  # Perfect match on sanctioned ID
+                    "text": sanctioned_data.get('name', 'Unknown'),
+                    "entity_type": sanctioned_data.get('type', 'person'),
+                    "metadata": {
+                        id_field: id_value,
+                        'name_en': sanctioned_data.get('name_en', ''),
+                        'birthdate': sanctioned_data.get('birthdate'),
+                        'person_id': sanctioned_data.get('person_id'),
+                        'org_id': sanctioned_data.get('org_id'),
+                        'source': sanctioned_data.get('source', 'sanctioned_inn_cache'),
+                        'status': sanctioned_data.get('status', 1),
+                        'risk_level': sanctioned_data.get('risk_level', 'high')
+                    },
+                    "search_mode": "inn_cache" if is_inn else "id_index",
+                    "match_fields": [id_field],
+                    "confidence": 1.0
+                }
+
+                logger.debug(f"Sanctioned {matched_type} cache hit: {id_value} -> {sanctioned_data.get('name', 'Unknown')}")
+                return [candidate]
+
+            # Fallback to mock search data (no sanctions ID data loaded)
             if hasattr(self.search_service, '_test_persons'):
                 candidates = []
 
@@ -1200,6 +1200,263 @@ REGISTRATION_PATTERNS = [
     r"\b(єдрпоу|едрпоу|edrpou|іпн|инн|inn|окпо|окпо|okpo)\s*\d+\b",
 ]
 
+# Banking terms (substring matches, all languages)
+BANKING_TERMS = {
+    "ukrainian": [
+        "банк",
+        "банківська",
+        "банківський",
+        "банківське",
+        "кредитний",
+        "кредитна",
+        "кредитне",
+        "фінансовий",
+        "фінансова",
+        "фінансове",
+        "фінансові",
+        "операції",
+        "програми",
+        "інвестиційний",
+        "інвестиційна",
+        "інвестиційне",
+        "страховий",
+        "страхова",
+        "страхове",
+        "лізинговий",
+        "лізингова",
+        "лізингове",
+        "факторинговий",
+        "факторингова",
+        "факторингове",
+        "мікрофінанс",
+        "мікрокредит",
+        "платіжний",
+        "платіжна",
+        "платіжне",
+        "розрахунковий",
+        "розрахункова",
+        "розрахункове",
+        "депозитний",
+        "депозитна",
+        "депозитне",
+        "валютний",
+        "валютна",
+        "валютне",
+        "біржовий",
+        "біржова",
+        "біржове",
+        "брокерський",
+        "брокерська",
+        "брокерське",
+        "трастовий",
+        "трастова",
+        "трастове",
+        "клірингова",
+        "клірингове",
+        "клірингової",
+        "національний банк",
+        "центральний банк",
+        "комерційний банк",
+        "ощадний банк",
+        "приват банк",
+        "альфа банк",
+        "укрексімбанк",
+        "ощадбанк",
+        "райффайзен",
+        "кредитспілка",
+        "кредитна спілка",
+        "ломбард",
+        "мікрофінансова організація",
+    ],
+    "russian": [
+        "банк",
+        "банковская",
+        "банковский",
+        "банковское",
+        "кредитный",
+        "кредитная",
+        "кредитное",
+        "финансовый",
+        "финансовая",
+        "финансовое",
+        "инвестиционный",
+        "инвестиционная",
+        "инвестиционное",
+        "страховой",
+        "страховая",
+        "страховое",
+        "лизинговый",
+        "лизинговая",
+        "лизинговое",
+        "факторинговый",
+        "факторинговая",
+        "факторинговое",
+        "микрофинанс",
+        "микрокредит",
+        "платежный",
+        "платежная",
+        "платежное",
+        "расчетный",
+        "расчетная",
+        "расчетное",
+        "депозитный",
+        "депозитная",
+        "депозитное",
+        "валютный",
+        "валютная",
+        "валютное",
+        "биржевой",
+        "биржевая",
+        "биржевое",
+        "брокерский",
+        "брокерская",
+        "брокерское",
+        "трастовый",
+        "трастовая",
+        "трастовое",
+        "клиринговая",
+        "клиринговое",
+        "клиринговой",
+        "национальный банк",
+        "центральный банк",
+        "коммерческий банк",
+        "сберегательный банк",
+        "приват банк",
+        "альфа банк",
+        "сбербанк",
+        "втб",
+        "газпромбанк",
+        "россельхозбанк",
+        "кредитный союз",
+        "ломбард",
+        "микрофинансовая организация",
+    ],
+    "english": [
+        "bank",
+        "banking",
+        "financial",
+        "finance",
+        "investment",
+        "credit",
+        "loan",
+        "insurance",
+        "leasing",
+        "factoring",
+        "microfinance",
+        "microcredit",
+        "payment",
+        "settlement",
+        "deposit",
+        "currency",
+        "exchange",
+        "trading",
+        "brokerage",
+        "trust",
+        "clearing",
+        "custodial",
+        "wealth",
+        "asset",
+        "fund",
+        "capital",
+        "national bank",
+        "central bank",
+        "commercial bank",
+        "savings bank",
+        "investment bank",
+        "private bank",
+        "retail bank",
+        "corporate bank",
+        "development bank",
+        "jpmorgan",
+        "goldman sachs",
+        "morgan stanley",
+        "wells fargo",
+        "bank of america",
+        "credit union",
+        "credit card",
+        "debit card",
+        "atm",
+        "swift",
+        "wire transfer",
+        "correspondent bank",
+        "nostro",
+        "vostro",
+        "clearing house",
+        "settlement system",
+    ],
+}
+
+# Patterns for financial services
+FINANCIAL_SERVICES_PATTERNS = [
+    r"\b(?:банк|bank|банківський|банковский|banking)\b",
+    r"\b(?:кредит|credit|loan|позика|заем)\b",
+    r"\b(?:страхування|страхование|insurance|страховка)\b",
+    r"\b(?:інвестиції|инвестиции|investment|вложения)\b",
+    r"\b(?:біржа|биржа|exchange|trading|торги)\b",
+    r"\b(?:брокер|broker|брокерський|брокерский)\b",
+    r"\b(?:фінанси|финансы|finance|фінансовий|финансовый)\b",
+    r"\b(?:платіжний|платежный|payment|оплата|платеж)\b",
+    r"\b(?:депозит|deposit|вклад|депозитний|депозитный)\b",
+    r"\b(?:валюта|currency|обмін|обмен|exchange)\b",
+]
+
+# Terrorism indicator patterns (defensive use only, see TerrorismDetector)
+# Patterns for terrorism financing (general indicators)
+TERRORISM_FINANCING_PATTERNS = [
+    # Suspicious terms for transfers
+    r"\b(?:джихад|jihad|муджахид|mujahid|шахид|shahid|мученик|martyr)\b",
+    r"\b(?:халифат|caliphate|emirate|эмират|имарат)\b",
+    r"\b(?:фонд|fund|foundation|благотвор|charity|زكاة|закят|zakat)\s*(?:помощи|помощь|support|aid|relief)\b",
+    # Code words (general patterns)
+    r"\b(?:операция|operation|миссия|mission|проект|project)\s+[А-ЯІЇЄҐA-Z][а-яіїєґa-z]+\b",
+    r"\b(?:братья|brothers|сестры|sisters|товарищи|comrades)\s+(?:по|in|from)\s+[а-яіїєґa-z]+\b",
+    # Suspicious geographical regions (general)
+    r"\b(?:syria|сирия|iraq|ирак|afghanistan|афганистан|somalia|сомали)\b",
+    r"\b(?:tribal|племенн|region|регион|border|граница|frontier)\s+(?:area|зона|territory|территория)\b",
+]
+
+# Patterns for weapons and explosives (defensive)
+TERRORISM_WEAPONS_PATTERNS = [
+    r"\b(?:explosive|взрывчат|bomb|бомба|ied|взрывн|device|устройство)\b",
+    r"\b(?:ammunition|боеприпас|weapons|оружие|arms|вооружение)\b",
+    r"\b(?:training|тренировк|preparation|подготовк|equipment|оборудование)\b",
+    r"\b(?:chemical|химическ|biological|биологическ|nuclear|ядерн|radioactive|радиоактивн)\b",
+]
+
+# Patterns for suspicious organizations (defensive lists)
+TERRORISM_ORGANIZATION_PATTERNS = [
+    # General patterns for suspicious structures
+    r"\b(?:cell|ячейка|network|сеть|group|группа|wing|крыло|brigade|бригада)\b",
+    r"\b(?:movement|движение|front|фронт|liberation|освобождение|resistance|сопротивление)\b",
+    r"\b(?:foundation|фонд|charity|благотвор|relief|помощь|aid|поддержка)\s+(?:international|международн|global|глобальн)\b",
+]
+
+# Patterns for suspicious activity
+TERRORISM_ACTIVITY_PATTERNS = [
+    # Financial operations
+    r"\b(?:cash|наличные|courier|курьер|transfer|перевод|hawala|хавала|informal|неформальн)\s+(?:service|сервис|system|система|network|сеть)\b",
+    r"\b(?:multiple|множественн|frequent|частые|unusual|необычн|suspicious|подозрительн)\s+(?:transactions|операции|transfers|переводы|payments|платежи)\b",
+    # Communications
+    r"\b(?:encrypted|зашифрован|secure|защищен|anonymous|анонимн|coded|кодирован)\s+(?:message|сообщение|communication|связь|channel|канал)\b",
+    r"\b(?:meeting|встреча|gathering|собрание|assembly|ассамблея|conference|конференция)\s+(?:secret|секретн|private|частн|closed|закрыт)\b",
+    # Travel and movements
+    r"\b(?:travel|поездка|journey|путешествие|trip|поход|visit|визит)\s+(?:to|в|from|из|via|через)\s+(?:conflict|конфликт|war|война|unstable|нестабильн)\b",
+    r"\b(?:border|граница|crossing|пересечение|entry|въезд|exit|выезд)\s+(?:point|пункт|control|контроль)\b",
+]
+
+# Exclusions (words that may cause false positives)
+TERRORISM_EXCLUSION_PATTERNS = [
+    r"\b(?:игра|game|фильм|movie|книга|book|история|story|новости|news)\b",
+    r"\b(?:university|университет|school|школа|education|образование|academic|академическ)\b",
+    r"\b(?:historical|историческ|documentary|документальн|research|исследование)\b",
+    r"\b(?:legitimate|законн|official|официальн|registered|зарегистрирован)\b",
+]
+
+# Capitalized words (potential company names), case-sensitive
+CAPITALIZED_NAME_PATTERN = (
+    r"\b[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,}(?:\s+[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,})*\b"
+)
+
 # Паттерны для определения имен
 NAME_PATTERNS = {
     "full_names": [
@@ -29,6 +29,7 @@ from .identifiers import (
     validate_iban,
     validate_ein,
     validate_edrpou,
+    validate_identifiers,
     validate_inn,
     validate_lei,
     validate_ogrn,
@@ -73,6 +74,7 @@ __all__ = [
     "validate_iban",
     "validate_ein",
     "validate_edrpou", 
+    "validate_identifiers",
     "validate_inn",
     "validate_lei",
     "validate_ogrn",
@@ -7,7 +7,8 @@ Contains patterns and utilities for detecting various types of identifiers
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Pattern, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Pattern, Tuple
 
 
 # ISO 3166-1 alpha-2 country codes used for SWIFT/BIC validation
@@ -40,6 +41,8 @@ class IdentifierPattern:
     pattern: str
     description: str
     validation_func: str = None
+    # False only for patterns that can match text without any digit
+    requires_digits: bool = True
 
 
 # Identifier patterns by type
@@ -125,7 +128,8 @@ IDENTIFIER_PATTERNS = [
         name="SWIFT_BIC",
         type="swift_bic",
         pattern=r"\b(?:SWIFT|BIC|SWIFT/BIC|МФО|MFO)[:\s]*([A-Z]{4}[A-Z]{2}[A-Z0-9]{2}(?:[A-Z0-9]{3})?)\b",
-        description="SWIFT/BIC code"
+        description="SWIFT/BIC code",
+        requires_digits=False,
     ),
     IdentifierPattern(
         name="EIN_US",
@@ -310,19 +314,34 @@ def get_validation_function(identifier_type: str):
     Returns:
         Validation function callable or None
     """
-    validation_functions = {
-        'inn': validate_inn,
-        'edrpou': validate_edrpou,
-        'ogrn': validate_ogrn,
-        'ogrnip': validate_ogrnip,
-        'vat': validate_vat,
-        'lei': validate_lei,
-        'ein': validate_ein,
-        'iban': validate_iban,
-        'swift_bic': validate_swift_bic,
-        'ssn': validate_ssn,
-    }
-    return validation_functions.get(identifier_type)
+    return _VALIDATION_FUNCTIONS.get(identifier_type)
+
+
+def validate_identifiers(values: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+    """
+    Validate many identifiers in one pass.
+
+    Each distinct (type, value) pair is checked once, and results are cached
+    across calls, so values repeated within a text or a batch of texts are
+    validated only once.
+
+    Args:
+        values: (identifier_type, normalized_value) pairs
+
+    Returns:
+        Dict mapping each pair to its validity (types without a validator are valid)
+    """
+    results: Dict[Tuple[str, str], bool] = {}
+    for key in values:
+        if key not in results:
+            results[key] = _validate_cached(key[0], key[1])
+    return results
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(identifier_type: str, value: str) -> bool:
+    validator = get_validation_function(identifier_type)
+    return validator(value) if validator else True
 
 
 def validate_inn(value: str) -> bool:
@@ -596,6 +615,20 @@ def validate_ssn(value: str) -> bool:
     return True
 
 
+_VALIDATION_FUNCTIONS = {
+    'inn': validate_inn,
+    'edrpou': validate_edrpou,
+    'ogrn': validate_ogrn,
+    'ogrnip': validate_ogrnip,
+    'vat': validate_vat,
+    'lei': validate_lei,
+    'ein': validate_ein,
+    'iban': validate_iban,
+    'swift_bic': validate_swift_bic,
+    'ssn': validate_ssn,
+}
+
+
 def extract_identifiers(text: str, identifier_types: List[str] = None) -> List[Dict]:
     """
     Extract all identifiers from text.
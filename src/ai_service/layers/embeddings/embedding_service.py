@@ -35,7 +35,7 @@ Usage:
 
 import logging
 import time
-from typing import List, Union, Optional, Dict, Any
+from typing import List, Union, Optional, Dict, Any, Tuple
 
 import numpy as np
 
@@ -43,6 +43,8 @@ from ...config import EmbeddingConfig
 from ...core.base_service import BaseService
 from ...services.embedding_preprocessor import EmbeddingPreprocessor
 from ...utils.logging_config import get_logger
+from ...utils.allocation_tracker import register_cache
+from ...utils.tracing import span, trace_event
 
 # Public API - only expose vector generation methods
 __all__ = [
@@ -72,8 +74,13 @@ class EmbeddingService(BaseService):
         # Performance optimizations
         self._preprocessing_cache: Dict[str, str] = {}
         self._cache_max_size = 1000  # Limit preprocessing cache size
+        register_cache("embedding.preprocessing", self, "_preprocessing_cache")
         self._warmup_done = False
 
+        # Batch dedup accounting (non-empty texts seen vs. texts sent to the model)
+        self._batch_texts_total = 0
+        self._batch_texts_encoded = 0
+
         self.logger.info(
             f"EmbeddingService initialized with model: {config.model_name}"
         )
@@ -186,7 +193,9 @@ class EmbeddingService(BaseService):
         """
         # Check cache first
         if text in self._preprocessing_cache:
+            trace_event("cache.hit", cache="embedding_preprocessing")
             return self._preprocessing_cache[text]
+        trace_event("cache.miss", cache="embedding_preprocessing")
 
         # Compute preprocessing
         normalized = self.preprocessor.normalize_for_embedding(text)
@@ -220,13 +229,14 @@ class EmbeddingService(BaseService):
             model = self._load_model()
 
             # Generate embedding
-            embedding = model.encode(
-                [normalized_text],
-                batch_size=1,
-                show_progress_bar=False,
-                normalize_embeddings=True,
-                convert_to_numpy=True,
-            )
+            with span("embeddings.encode", texts=1):
+                embedding = model.encode(
+                    [normalized_text],
+                    batch_size=1,
+                    show_progress_bar=False,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                )
 
             # Convert to 32-bit float and ensure it's a list
             if isinstance(embedding, np.ndarray):
@@ -238,44 +248,100 @@ class EmbeddingService(BaseService):
             self.logger.error(f"Failed to encode text: {e}")
             raise
 
+    def _dedupe_preprocessed(self, texts: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Preprocess texts and collapse duplicates on the preprocessed key.
+
+        Args:
+            texts: Raw input texts
+
+        Returns:
+            Tuple of (unique preprocessed texts, slot per input text). The slot
+            is the index into the unique list, or -1 when the text is empty
+            after preprocessing.
+        """
+        unique_texts: List[str] = []
+        unique_index: Dict[str, int] = {}
+        slots: List[int] = []
+
+        for text in texts:
+            normalized = self._get_cached_preprocessing(text) if text and text.strip() else ""
+            if not normalized:
+                slots.append(-1)
+                continue
+            slot = unique_index.get(normalized)
+            if slot is None:
+                slot = len(unique_texts)
+                unique_index[normalized] = slot
+                unique_texts.append(normalized)
+            slots.append(slot)
+
+        non_empty = len(slots) - slots.count(-1)
+        self._batch_texts_total += non_empty
+        self._batch_texts_encoded += len(unique_texts)
+        if non_empty:
+            try:
+                from ...monitoring.prometheus_exporter import get_exporter
+                get_exporter().record_embedding_batch(non_empty, len(unique_texts))
+            except Exception:
+                # Metrics are optional
+                pass
+
+        return unique_texts, slots
+
+    @staticmethod
+    def _scatter(unique_vectors: List[List[float]], slots: List[int]) -> List[List[float]]:
+        """Map unique vectors back to input positions; repeats get their own copy."""
+        result: List[List[float]] = []
+        used = [False] * len(unique_vectors)
+        for slot in slots:
+            if slot < 0:
+                result.append([])
+            elif used[slot]:
+                result.append(list(unique_vectors[slot]))
+            else:
+                used[slot] = True
+                result.append(unique_vectors[slot])
+        return result
+
     def encode_batch(self, texts: List[str]) -> List[List[float]]:
         """
         Encode multiple texts to embedding vectors
 
+        Texts are deduplicated after preprocessing so each unique text is
+        encoded once. The output is aligned with the input: texts that are
+        empty after preprocessing get an empty vector at their position.
+
         Args:
             texts: List of text strings
 
         Returns:
-            List of embedding vectors as 32-bit floats
+            List of embedding vectors as 32-bit floats, one per input text
         """
         start_time = time.perf_counter()
 
         if not texts:
             return []
 
-        # Preprocess texts to remove dates/IDs (with caching)
-        normalized_texts = []
-        for text in texts:
-            if text and text.strip():
-                normalized = self._get_cached_preprocessing(text)
-                if normalized:  # Only include non-empty normalized texts
-                    normalized_texts.append(normalized)
+        # Preprocess texts to remove dates/IDs (with caching) and dedupe
+        unique_texts, slots = self._dedupe_preprocessed(texts)
 
-        if not normalized_texts:
-            return []
+        if not unique_texts:
+            return [[] for _ in texts]
 
         try:
             # Load model lazily
             model = self._load_model()
 
-            # Generate embeddings
-            embeddings = model.encode(
-                normalized_texts,
-                batch_size=self.config.batch_size,
-                show_progress_bar=False,
-                normalize_embeddings=True,
-                convert_to_numpy=True,
-            )
+            # Generate embeddings for the unique texts only
+            with span("embeddings.encode", texts=len(unique_texts)):
+                embeddings = model.encode(
+                    unique_texts,
+                    batch_size=self.config.batch_size,
+                    show_progress_bar=False,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                )
 
             # Convert to 32-bit float and ensure it's a list
             if isinstance(embeddings, np.ndarray):
@@ -283,14 +349,16 @@ class EmbeddingService(BaseService):
 
             # Log timing
             duration_ms = (time.perf_counter() - start_time) * 1000
-            self.logger.debug(f"encode_batch({len(texts)} texts): {duration_ms:.2f}ms")
+            self.logger.debug(
+                f"encode_batch({len(texts)} texts, {len(unique_texts)} unique): {duration_ms:.2f}ms"
+            )
 
             if duration_ms > 100:
                 self.logger.warning(
                     f"Slow encode_batch({len(texts)} texts): {duration_ms:.2f}ms > 100ms"
                 )
 
-            return embeddings
+            return self._scatter(embeddings, slots)
 
         except Exception as e:
             self.logger.error(f"Failed to encode texts: {e}")
@@ -345,29 +413,28 @@ class EmbeddingService(BaseService):
             # Load model
             model = self._load_model(model_name)
             
-            # Preprocess texts (with caching)
-            normalized_texts = []
-            for text in text_list:
-                if text and text.strip():
-                    normalized = self._get_cached_preprocessing(text)
-                    if normalized:
-                        normalized_texts.append(normalized)
+            # Preprocess texts (with caching) and dedupe
+            unique_texts, slots = self._dedupe_preprocessed(text_list)
             
-            if not normalized_texts:
+            if not unique_texts:
                 return [] if not is_single else []
             
             # Generate embeddings
-            embeddings = model.encode(
-                normalized_texts,
-                batch_size=batch_size or self.config.batch_size,
-                show_progress_bar=False,
-                normalize_embeddings=normalize_embeddings,
-                convert_to_numpy=to_numpy,
-            )
+            with span("embeddings.encode", texts=len(unique_texts)):
+                embeddings = model.encode(
+                    unique_texts,
+                    batch_size=batch_size or self.config.batch_size,
+                    show_progress_bar=False,
+                    normalize_embeddings=normalize_embeddings,
+                    convert_to_numpy=to_numpy,
+                )
             
             # Convert to 32-bit float and ensure it's a list
             if isinstance(embeddings, np.ndarray):
                 embeddings = embeddings.astype(np.float32).tolist()
+
+            # Legacy behaviour: texts that are empty after preprocessing are dropped
+            embeddings = self._scatter(embeddings, [slot for slot in slots if slot >= 0])
             
             processing_time = time.perf_counter() - start_time
             
@@ -409,6 +476,12 @@ class EmbeddingService(BaseService):
             "preprocessing_cache_max_size": self._cache_max_size,
             "model_cache_size": len(self.model_cache),
             "warmup_done": self._warmup_done,
+            "batch_texts_total": self._batch_texts_total,
+            "batch_texts_encoded": self._batch_texts_encoded,
+            "batch_dedup_ratio": (
+                1.0 - self._batch_texts_encoded / self._batch_texts_total
+                if self._batch_texts_total else 0.0
+            ),
         }
 
     def get_embedding_dimension(self) -> int:
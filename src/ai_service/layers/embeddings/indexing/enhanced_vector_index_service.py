@@ -37,6 +37,9 @@ class EnhancedVectorIndexConfig(VectorIndexConfig):
     enable_hybrid_search: bool = True
     min_semantic_similarity: float = 0.3
     max_candidates_for_reranking: int = 100
+    # Fold incrementally added overlay docs into a new active generation once
+    # the overlay reaches this size (0 = compact only on demand)
+    overlay_compaction_threshold: int = 5000
 
 
 class EnhancedVectorIndex(CharTfidfVectorIndex):
@@ -293,7 +296,8 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
         """Get comprehensive index statistics"""
         stats = {
             "document_count": len(self.doc_ids),
-            "lexical_index_built": self.X_vec is not None,
+            "lexical_index_built": self.X_vec is not None or self.postings is not None,
+            "retrieval_mode": self.cfg.retrieval_mode,
             "semantic_index_built": self.semantic_embeddings is not None,
             "faiss_lexical_available": self.faiss_index is not None,
             "faiss_semantic_available": self.semantic_faiss_index is not None,
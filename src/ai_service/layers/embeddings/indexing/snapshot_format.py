@@ -0,0 +1,291 @@
+"""
+Binary snapshot format for watchlist char TF-IDF indexes.
+
+Layout of a snapshot directory (format version 2)::
+
+    manifest.json                   format/version, generation, index config,
+                                    vectorizer params
+    gen-<id>/                       the files below, one directory per save
+    vocab.pool, vocab.offsets.npy   n-grams sorted by UTF-8 bytes
+    vocab.values.npy                column index of each sorted n-gram
+    idf.npy                         IDF weights per column
+    svd_components.npy              TruncatedSVD components (dense mode)
+    doc_ids.*, doc_texts.*          offset-indexed string pools in index row order
+    X_vec.npy                       dense doc vectors (dense mode)
+    postings_*.npy                  CSR inverted index (sparse mode)
+    docs_keys.*, docs_records.*     sorted doc_id index -> JSON metadata record
+    faiss.index                     optional FAISS index
+
+Snapshots written before generations were introduced keep the files next to
+the manifest and still load.
+
+Nothing is unpickled and no per-document JSON is parsed at load time: every
+array is opened with ``mmap`` so reload is O(1) in corpus size and the pages
+are shared between worker processes through the OS page cache.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+SNAPSHOT_FORMAT = "watchlist-char-tfidf"
+SNAPSHOT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+GENERATION_PREFIX = "gen-"
+
+# Vectorizer parameters needed to reproduce transform() without pickling
+VECTORIZER_PARAMS = (
+    "analyzer",
+    "ngram_range",
+    "lowercase",
+    "strip_accents",
+    "norm",
+    "use_idf",
+    "smooth_idf",
+    "sublinear_tf",
+)
+
+
+# ---- Writers ------------------------------------------------------------
+#
+# A save writes every file into a new generation directory and then renames
+# the manifest naming it into place: that rename is the commit point. A
+# loader reads the manifest once and opens every file of that generation, so
+# it never mixes arrays of two saves. The previous generation is kept for
+# loaders that read the old manifest just before the commit; older ones (and
+# leftovers of failed saves) are removed. Readers that still have a removed
+# generation mapped keep its inodes, so a snapshot can be rewritten while
+# other workers are serving from it.
+
+
+def new_generation(snapshot_dir: str) -> str:
+    """Create an empty generation directory; returns its name (relative)."""
+    name = f"{GENERATION_PREFIX}{time.time_ns():x}-{os.getpid()}"
+    os.makedirs(os.path.join(snapshot_dir, name))
+    return name
+
+
+def snapshot_data_dir(snapshot_dir: str, manifest: Dict[str, Any]) -> str:
+    """Directory holding the files of the generation ``manifest`` describes."""
+    generation = manifest.get("generation")
+    return os.path.join(snapshot_dir, generation) if generation else snapshot_dir
+
+
+def save_array(path: str, array: np.ndarray) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def _write_pool(prefix: str, chunks: Iterable[bytes]) -> int:
+    offsets = [0]
+    tmp_path = prefix + ".pool.tmp"
+    with open(tmp_path, "wb") as f:
+        for data in chunks:
+            f.write(data)
+            offsets.append(offsets[-1] + len(data))
+    os.replace(tmp_path, prefix + ".pool")
+    save_array(prefix + ".offsets.npy", np.asarray(offsets, dtype=np.int64))
+    return len(offsets) - 1
+
+
+def write_string_pool(prefix: str, strings: Iterable[str]) -> int:
+    """Write strings as ``<prefix>.pool`` (UTF-8 bytes) + ``<prefix>.offsets.npy``."""
+    return _write_pool(prefix, (value.encode("utf-8") for value in strings))
+
+
+# ---- Readers ------------------------------------------------------------
+
+
+def _map_file(path: str):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class StringPool(Sequence):
+    """Read-only sequence of strings backed by a memory-mapped pool."""
+
+    def __init__(self, prefix: str) -> None:
+        self._pool = _map_file(prefix + ".pool")
+        self._offsets = np.load(prefix + ".offsets.npy", mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, i: int) -> bytes:
+        return self._pool[int(self._offsets[i]) : int(self._offsets[i + 1])]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.raw(i).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self.raw(i).decode("utf-8")
+
+
+def write_sorted_index(prefix: str, items: Iterable[Tuple[str, int]]) -> int:
+    """Write (key, value) pairs sorted by UTF-8 key bytes for binary search."""
+    encoded = sorted((key.encode("utf-8"), int(value)) for key, value in items)
+    _write_pool(prefix, (key for key, _ in encoded))
+    save_array(
+        prefix + ".values.npy", np.asarray([v for _, v in encoded], dtype=np.int64)
+    )
+    return len(encoded)
+
+
+class SortedStringIndex(Mapping):
+    """
+    Read-only ``str -> int`` mapping over a sorted memory-mapped key pool.
+
+    Lookups binary-search the raw UTF-8 bytes (byte order equals code point
+    order), so no Python dict is materialized at load time. Resolved keys are
+    memoized up to ``cache_size`` entries.
+    """
+
+    def __init__(self, prefix: str, cache_size: int = 65536) -> None:
+        self._keys = StringPool(prefix)
+        self._values = np.load(prefix + ".values.npy", mmap_mode="r")
+        self._cache: Dict[str, int] = {}
+        self._cache_size = cache_size
+
+    def find(self, key: str) -> int:
+        """Return the value for ``key`` or -1 if absent."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        target = key.encode("utf-8")
+        keys = self._keys
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys.raw(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        value = -1
+        if lo < len(keys) and keys.raw(lo) == target:
+            value = int(self._values[lo])
+        if len(self._cache) < self._cache_size:
+            self._cache[key] = value
+        return value
+
+    def __getitem__(self, key: str) -> int:
+        value = self.find(key) if isinstance(key, str) else -1
+        if value < 0:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.find(key) >= 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+
+class LazyRecordStore(Mapping):
+    """
+    Read-only ``doc_id -> object`` mapping that decodes JSON records on access.
+
+    ``factory(doc_id, record)`` builds the returned object; results are cached
+    so each record is parsed at most once per process.
+    """
+
+    def __init__(
+        self, prefix: str, factory: Callable[[str, Dict[str, Any]], Any]
+    ) -> None:
+        self._index = SortedStringIndex(prefix + "_keys")
+        self._records = StringPool(prefix + "_records")
+        self._factory = factory
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        doc = self._decoded.get(key)
+        if doc is not None:
+            return doc
+        row = self._index.find(key) if isinstance(key, str) else -1
+        if row < 0:
+            raise KeyError(key)
+        doc = self._factory(key, json.loads(self._records[row]))
+        self._decoded[key] = doc
+        return doc
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._index.find(key) >= 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+
+def write_record_store(
+    prefix: str, records: Iterable[Tuple[str, Dict[str, Any]]]
+) -> int:
+    """Write ``(doc_id, record)`` pairs as a JSON record pool + sorted key index."""
+    keys: List[Tuple[str, int]] = []
+
+    def encoded() -> Iterator[str]:
+        for row, (doc_id, record) in enumerate(records):
+            keys.append((doc_id, row))
+            yield json.dumps(record, ensure_ascii=False)
+
+    write_string_pool(prefix + "_records", encoded())
+    return write_sorted_index(prefix + "_keys", keys)
+
+
+# ---- Manifest -----------------------------------------------------------
+
+
+def write_manifest(snapshot_dir: str, manifest: Dict[str, Any]) -> None:
+    """Commit a save: publish the manifest, then prune stale generations."""
+    payload = {"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION, **manifest}
+    try:
+        previous = (read_manifest(snapshot_dir) or {}).get("generation")
+    except (ValueError, OSError):
+        previous = None
+    tmp_path = os.path.join(snapshot_dir, MANIFEST_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    # Manifest is written last: a snapshot without it is never picked up
+    os.replace(tmp_path, os.path.join(snapshot_dir, MANIFEST_FILE))
+    keep = {payload.get("generation"), previous}
+    for name in os.listdir(snapshot_dir):
+        if name.startswith(GENERATION_PREFIX) and name not in keep:
+            shutil.rmtree(os.path.join(snapshot_dir, name), ignore_errors=True)
+
+
+def read_manifest(snapshot_dir: str) -> Optional[Dict[str, Any]]:
+    """Return the manifest if ``snapshot_dir`` holds a binary snapshot, else None."""
+    path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict) or manifest.get("format") != SNAPSHOT_FORMAT:
+        return None
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {manifest.get('version')} in {snapshot_dir}"
+        )
+    return manifest
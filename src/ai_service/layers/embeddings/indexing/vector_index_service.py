@@ -3,14 +3,24 @@ Char TF-IDF kNN index with optional FAISS HNSW backend.
 
 Falls back to cosine similarity over dense vectors if FAISS is unavailable.
 Supports quick ephemeral builds for small candidate pools (e.g., from blocking/AC).
+
+With ``retrieval_mode="sparse"`` the index skips SVD/densification entirely and
+serves top-k from an inverted index over char n-grams (sparse dot product),
+which keeps memory proportional to the number of non-zero n-grams.
+
+A fitted index can also grow incrementally: ``frozen_copy()`` returns an empty
+index sharing the fitted vectorizer/SVD, ``append()`` projects new docs through
+them (no refit) and adds them to the HNSW/inverted index, and ``remove()``
+tombstones rows so they are filtered out of search results.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
+import scipy.sparse as sp
 
 try:
     import faiss  # type: ignore
@@ -37,6 +47,9 @@ class VectorIndexConfig:
     use_faiss: bool = True
     hnsw_m: int = 32
     ef_search: int = 96
+    # "dense": SVD (or densified TF-IDF) vectors searched via FAISS/brute-force
+    # "sparse": inverted index over char n-grams, never densified
+    retrieval_mode: str = "dense"
 
 
 class CharTfidfVectorIndex:
@@ -50,7 +63,14 @@ class CharTfidfVectorIndex:
         self.doc_ids: List[str] = []
         self.doc_texts: List[str] = []
         self.X_vec: Optional[np.ndarray] = None  # dense matrix after SVD
+        self.postings: Optional[sp.csr_matrix] = None  # n-gram x doc (sparse mode)
         self.faiss_index = None
+        self.tombstones: Set[int] = set()  # rows hidden from search results
+        self._row_by_id: Optional[Dict[str, int]] = None
+
+    @property
+    def is_sparse(self) -> bool:
+        return self.cfg.retrieval_mode == "sparse"
 
     def _build_vectorizer(self) -> TfidfVectorizer:
         return TfidfVectorizer(
@@ -72,7 +92,9 @@ class CharTfidfVectorIndex:
             return
         dim = X.shape[1]
         # HNSW index over Inner Product (use normalized vectors -> cosine)
-        self.faiss_index = faiss.IndexHNSWFlat(dim, self.cfg.hnsw_m)
+        self.faiss_index = faiss.IndexHNSWFlat(
+            dim, self.cfg.hnsw_m, faiss.METRIC_INNER_PRODUCT
+        )
         try:
             self.faiss_index.hnsw.efSearch = self.cfg.ef_search
         except Exception:
@@ -83,21 +105,35 @@ class CharTfidfVectorIndex:
         """Rebuild index from (doc_id, text) pairs."""
         self.doc_ids = [d[0] for d in docs]
         self.doc_texts = [d[1] for d in docs]
+        self.tombstones = set()
+        self._row_by_id = None
         if not self.doc_texts:
             # Clear state
             self.vectorizer = None
             self.svd = None
             self.X_vec = None
+            self.postings = None
             self.faiss_index = None
             return
         self.vectorizer = self._build_vectorizer()
         X = self.vectorizer.fit_transform(self.doc_texts)
 
+        if self.is_sparse:
+            self.svd = None
+            self.X_vec = None
+            self.faiss_index = None
+            self.postings = self._build_postings(X)
+            return
+        self.postings = None
+
         if self.cfg.use_svd:
             self.svd = TruncatedSVD(
                 n_components=min(self.cfg.svd_dim, max(2, X.shape[1] - 1))
             )
             Xr = self.svd.fit_transform(X)
+            # transform() computes X @ components_.T; keep that view C-contiguous
+            # so per-query encoding does not copy the whole component matrix
+            self.svd.components_ = np.asfortranarray(self.svd.components_)
         else:
             # Use dense array cautiously for small doc sets
             Xr = X.toarray() if hasattr(X, "toarray") else np.asarray(X)
@@ -110,20 +146,140 @@ class CharTfidfVectorIndex:
             self.logger.warning(f"FAISS init failed, fallback to brute-force: {e}")
             self.faiss_index = None
 
+    def _build_postings(self, X) -> sp.csr_matrix:
+        """Transpose doc x n-gram TF-IDF rows into an n-gram x doc inverted index."""
+        X = normalize(sp.csr_matrix(X, dtype=np.float32), norm="l2")
+        postings = X.T.tocsr()
+        postings.sort_indices()
+        return postings
+
+    # ---- Incremental updates --------------------------------------------
+
+    @property
+    def live_count(self) -> int:
+        return len(self.doc_ids) - len(self.tombstones)
+
+    def frozen_copy(self) -> "CharTfidfVectorIndex":
+        """Empty index sharing this index's fitted vectorizer/SVD, for append()."""
+        idx = CharTfidfVectorIndex(self.cfg)
+        idx.vectorizer = self.vectorizer
+        idx.svd = self.svd
+        return idx
+
+    def _row_map(self) -> Dict[str, int]:
+        if self._row_by_id is None:
+            self._row_by_id = {
+                doc_id: row
+                for row, doc_id in enumerate(self.doc_ids)
+                if row not in self.tombstones
+            }
+        return self._row_by_id
+
+    def append(self, docs: List[Tuple[str, str]]) -> None:
+        """
+        Add (doc_id, text) pairs using the frozen vectorizer/SVD (no refit).
+
+        N-grams unseen at fit time are ignored. A doc_id that is already indexed
+        is superseded: its previous row is tombstoned.
+        """
+        if self.vectorizer is None:
+            raise RuntimeError("Index has no fitted vectorizer; call rebuild() first")
+        if not docs:
+            return
+        self.remove(doc_id for doc_id, _ in docs)
+        X = self.vectorizer.transform([text for _, text in docs])
+
+        start = len(self.doc_ids)
+        if not isinstance(self.doc_ids, list):
+            # Snapshot-backed string pools are read-only
+            self.doc_ids = list(self.doc_ids)
+            self.doc_texts = list(self.doc_texts)
+        rows = self._row_map()
+        # Ids go in before vectors so every searchable row resolves to a doc_id
+        for offset, (doc_id, text) in enumerate(docs):
+            self.doc_ids.append(doc_id)
+            self.doc_texts.append(text)
+            rows[doc_id] = start + offset
+
+        if self.is_sparse:
+            cols = self._build_postings(X)
+            self.postings = (
+                cols if self.postings is None else sp.hstack([self.postings, cols], format="csr")
+            )
+            return
+        Xr = self._project(X)
+        self.X_vec = Xr if self.X_vec is None else np.vstack([self.X_vec, Xr])
+        try:
+            if self.faiss_index is not None:
+                self.faiss_index.add(Xr)
+            elif start == 0:
+                self._fit_faiss(Xr)
+        except Exception as e:
+            self.logger.warning(f"FAISS append failed, fallback to brute-force: {e}")
+            self.faiss_index = None
+
+    def remove(self, doc_ids: Iterable[str]) -> int:
+        """Tombstone the live rows of ``doc_ids``; returns the number of rows hidden."""
+        rows = self._row_map()
+        removed = 0
+        for doc_id in doc_ids:
+            row = rows.pop(doc_id, None)
+            if row is not None:
+                self.tombstones.add(row)
+                removed += 1
+        return removed
+
+    # ---- Search ---------------------------------------------------------
+
+    def _search_sparse(self, query: str, top_k: int) -> List[Tuple[int, float]]:
+        """Top-k rows by sparse dot product over the posting lists of the query n-grams."""
+        if self.vectorizer is None or self.postings is None:
+            return []
+        q = self.vectorizer.transform([query])
+        if q.nnz == 0:
+            return []
+        q = normalize(q, norm="l2")
+        # 1 x nnz(q) times nnz(q) x n_docs -> sparse scores for touched docs only
+        weights = sp.csr_matrix(q.data.astype(np.float32).reshape(1, -1))
+        scores = (weights @ self.postings[q.indices]).tocoo()
+        if scores.nnz == 0:
+            return []
+        data, docs = scores.data, scores.col
+        if len(data) > top_k:
+            part = np.argpartition(-data, top_k - 1)[:top_k]
+            data, docs = data[part], docs[part]
+        order = np.argsort(-data, kind="stable")
+        return [(int(docs[i]), float(data[i])) for i in order]
+
+    def _project(self, X) -> np.ndarray:
+        if self.cfg.use_svd and self.svd is not None:
+            Xr = self.svd.transform(X)
+        else:
+            Xr = X.toarray() if hasattr(X, "toarray") else np.asarray(X)
+        Xr = self._ensure_l2(Xr)
+        return Xr.astype("float32")
+
     def _encode(self, text: str) -> Optional[np.ndarray]:
         if not self.vectorizer:
             return None
-        Xq = self.vectorizer.transform([text])
-        if self.cfg.use_svd and self.svd is not None:
-            Xqr = self.svd.transform(Xq)
-        else:
-            Xqr = Xq.toarray() if hasattr(Xq, "toarray") else np.asarray(Xq)
-        Xqr = self._ensure_l2(Xqr)
-        return Xqr.astype("float32")
+        return self._project(self.vectorizer.transform([text]))
 
     def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
         """Return list of (doc_id, score) by cosine similarity."""
-        if not self.doc_ids or self.X_vec is None:
+        if not self.doc_ids:
+            return []
+        if not self.tombstones:
+            return [(self.doc_ids[row], score) for row, score in self._search_rows(query, top_k)]
+        # Over-fetch so tombstoned rows do not shrink the result list
+        hits = self._search_rows(query, top_k + len(self.tombstones))
+        return [
+            (self.doc_ids[row], score) for row, score in hits if row not in self.tombstones
+        ][:top_k]
+
+    def _search_rows(self, query: str, top_k: int) -> List[Tuple[int, float]]:
+        if self.is_sparse:
+            return self._search_sparse(query, top_k)
+        if self.X_vec is None:
             return []
         Xq = self._encode(query)
         if Xq is None:
@@ -133,9 +289,7 @@ class CharTfidfVectorIndex:
             # Use inner product; vectors are L2-normalized -> cosine
             try:
                 scores, idx = self.faiss_index.search(q, min(top_k, len(self.doc_ids)))
-                ids = [self.doc_ids[i] for i in idx[0] if i >= 0]
-                scs = [float(s) for s in scores[0][: len(ids)]]
-                return list(zip(ids, scs))
+                return [(int(i), float(s)) for i, s in zip(idx[0], scores[0]) if i >= 0]
             except Exception as e:
                 self.logger.warning(
                     f"FAISS search failed, fallback to brute-force: {e}"
@@ -143,4 +297,4 @@ class CharTfidfVectorIndex:
         # Brute-force cosine on dense vectors
         sims = (self.X_vec @ q.T).reshape(-1)
         order = np.argsort(-sims)[:top_k]
-        return [(self.doc_ids[i], float(sims[i])) for i in order]
+        return [(int(i), float(sims[i])) for i in order]
@@ -3,6 +3,15 @@ Watchlist index manager: persistent char TF-IDF kNN index with atomic swap.
 
 Supports active base index + optional delta overlay. Provides load/save snapshot,
 atomic reload, and combined search. Stores per-doc metadata and entity_type.
+
+Urgent list changes are applied without a refit: ``upsert_docs``/``remove_docs``
+project documents through the active index's frozen vectorizer/SVD into an
+append-only overlay, and shadow superseded or deleted active docs with
+tombstones. ``compact`` (or ``start_compaction`` in a background thread) folds
+the overlay into a freshly fitted active generation and swaps it in atomically.
+
+Snapshots use the binary format in ``snapshot_format`` (memory-mapped, no pickle);
+legacy pickle/JSON snapshots are still readable.
 """
 
 from __future__ import annotations
@@ -10,16 +19,35 @@ from __future__ import annotations
 import json
 import os
 import pickle
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 import numpy as np
+import scipy.sparse as sp
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
 
 from ....utils.logging_config import get_logger
 from ....contracts.trace_models import SearchTrace, SearchTraceHit, SearchTraceStep
 from .vector_index_service import CharTfidfVectorIndex, VectorIndexConfig
 from .enhanced_vector_index_service import EnhancedVectorIndex, EnhancedVectorIndexConfig
+from .snapshot_format import (
+    SNAPSHOT_VERSION,
+    VECTORIZER_PARAMS,
+    LazyRecordStore,
+    SortedStringIndex,
+    StringPool,
+    new_generation,
+    read_manifest,
+    save_array,
+    snapshot_data_dir,
+    write_manifest,
+    write_record_store,
+    write_sorted_index,
+    write_string_pool,
+)
 
 
 @dataclass
@@ -37,11 +65,19 @@ class WatchlistIndexService:
         self.logger = get_logger(__name__)
         self.cfg = cfg or EnhancedVectorIndexConfig()
         self._active = EnhancedVectorIndex(self.cfg)
-        self._overlay: Optional[EnhancedVectorIndex] = None
-        self._docs: Dict[str, WatchlistDoc] = {}
-        self._overlay_docs: Dict[str, WatchlistDoc] = {}
+        self._overlay: Optional[CharTfidfVectorIndex] = None
+        self._docs: Mapping[str, WatchlistDoc] = {}
+        self._overlay_docs: Mapping[str, WatchlistDoc] = {}
         self._active_id: Optional[str] = None
         self._overlay_id: Optional[str] = None
+        # Active doc_ids hidden by incremental updates (removed or superseded by overlay)
+        self._tombstones: Set[str] = set()
+        self._generation = 0
+        # Guards overlay mutation/search and generation swaps
+        self._lock = threading.RLock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        # Mutations recorded while a compaction is running, replayed after the swap
+        self._journal: Optional[List[Tuple[str, Any]]] = None
 
     def ready(self) -> bool:
         return bool(self._active and len(self._docs) > 0)
@@ -56,6 +92,7 @@ class WatchlistIndexService:
             doc_id: WatchlistDoc(doc_id, text, et, md)
             for (doc_id, text, et, md) in corpus
         }
+        self._tombstones = set()
         self._active_id = index_id or "in-memory"
         self.logger.info(
             f"Watchlist active index built: {len(self._docs)} docs, id={self._active_id}"
@@ -64,23 +101,199 @@ class WatchlistIndexService:
     def set_overlay_from_corpus(
         self, corpus: List[Tuple[str, str, str, Dict]], overlay_id: Optional[str] = None
     ) -> None:
+        """Replace the overlay with a separately fitted index (drops incremental state)."""
         idx = EnhancedVectorIndex(self.cfg)
         docs = [(doc_id, text) for (doc_id, text, _et, _md) in corpus]
         idx.rebuild(docs)
-        self._overlay = idx
-        self._overlay_docs = {
-            doc_id: WatchlistDoc(doc_id, text, et, md)
-            for (doc_id, text, et, md) in corpus
-        }
-        self._overlay_id = overlay_id or "overlay"
+        with self._lock:
+            self._overlay = idx
+            self._overlay_docs = {
+                doc_id: WatchlistDoc(doc_id, text, et, md)
+                for (doc_id, text, et, md) in corpus
+            }
+            self._overlay_id = overlay_id or "overlay"
+            self._tombstones = set()
+            self._record("set_overlay", (corpus, overlay_id))
         self.logger.info(
             f"Watchlist overlay set: {len(self._overlay_docs)} docs, id={self._overlay_id}"
         )
 
     def clear_overlay(self) -> None:
-        self._overlay = None
-        self._overlay_docs = {}
-        self._overlay_id = None
+        with self._lock:
+            self._overlay = None
+            self._overlay_docs = {}
+            self._overlay_id = None
+            self._tombstones = set()
+            self._record("clear", None)
+
+    # ---- Incremental updates --------------------------------------------
+
+    def _record(self, op: str, payload: Any) -> None:
+        if self._journal is not None:
+            self._journal.append((op, payload))
+
+    def _incremental_overlay(self) -> Optional[CharTfidfVectorIndex]:
+        """Overlay that shares the active vectorizer, creating/converting it if needed."""
+        if self._active.vectorizer is None:
+            return None
+        overlay = self._overlay
+        if overlay is not None and overlay.vectorizer is self._active.vectorizer:
+            return overlay
+        overlay = self._active.frozen_copy()
+        # Re-project a separately fitted overlay into the active feature space
+        overlay.append([(doc_id, doc.text) for doc_id, doc in self._overlay_docs.items()])
+        self._overlay = overlay
+        self._overlay_id = self._overlay_id or "overlay"
+        return overlay
+
+    def upsert_docs(self, corpus: List[Tuple[str, str, str, Dict]]) -> Dict:
+        """
+        Add or replace documents without refitting the active index.
+
+        Documents are projected with the active vectorizer/SVD and appended to
+        the overlay; active copies of the same doc_ids are tombstoned.
+        """
+        if not corpus:
+            return {"upserted": 0, "overlay_count": len(self._overlay_docs)}
+        start_time = time.perf_counter()
+        with self._lock:
+            overlay = self._incremental_overlay()
+            docs = dict(self._overlay_docs)
+            docs.update(
+                (doc_id, WatchlistDoc(doc_id, text, et, md)) for (doc_id, text, et, md) in corpus
+            )
+            if overlay is None:
+                # Nothing fitted yet: fall back to a full overlay build
+                self.set_overlay_from_corpus(
+                    [(d.doc_id, d.text, d.entity_type, d.metadata) for d in docs.values()],
+                    self._overlay_id,
+                )
+            else:
+                overlay.append([(doc_id, text) for (doc_id, text, _et, _md) in corpus])
+                self._overlay_docs = docs
+                self._tombstones.update(doc_id for (doc_id, *_rest) in corpus if doc_id in self._docs)
+                self._record("upsert", corpus)
+            overlay_count = len(self._overlay_docs)
+        took_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(f"Watchlist upsert: {len(corpus)} docs in {took_ms:.1f}ms")
+        self._maybe_compact()
+        return {"upserted": len(corpus), "overlay_count": overlay_count, "took_ms": took_ms}
+
+    def remove_docs(self, doc_ids: Iterable[str]) -> Dict:
+        """Hide documents from search and get_doc until the next compaction."""
+        doc_ids = list(doc_ids)
+        removed = set()
+        with self._lock:
+            if self._overlay is not None and self._overlay_docs:
+                docs = dict(self._overlay_docs)
+                for doc_id in doc_ids:
+                    if docs.pop(doc_id, None) is not None:
+                        removed.add(doc_id)
+                if removed:
+                    self._overlay.remove(removed)
+                    self._overlay_docs = docs
+            for doc_id in doc_ids:
+                if doc_id in self._docs and doc_id not in self._tombstones:
+                    self._tombstones.add(doc_id)
+                    removed.add(doc_id)
+            self._record("remove", doc_ids)
+        self.logger.info(f"Watchlist remove: {len(removed)} of {len(doc_ids)} docs hidden")
+        return {"removed": len(removed)}
+
+    def _maybe_compact(self) -> None:
+        threshold = getattr(self.cfg, "overlay_compaction_threshold", 0)
+        if threshold and len(self._overlay_docs) >= threshold:
+            self.start_compaction()
+
+    def compact(self, index_id: Optional[str] = None) -> Dict:
+        """
+        Fold overlay and tombstones into a newly fitted active generation.
+
+        The fit runs without holding the lock, so searches and updates keep
+        being served from the current generation; updates made meanwhile are
+        replayed onto the new generation after the swap.
+        """
+        with self._lock:
+            if self._journal is not None:
+                return {"compacted": False, "reason": "compaction already running"}
+            base_docs = self._docs
+            tombstones = set(self._tombstones)
+            overlay_docs = dict(self._overlay_docs)
+            self._journal = []
+
+        try:
+            start_time = time.perf_counter()
+            merged: Dict[str, WatchlistDoc] = {
+                doc_id: doc for doc_id, doc in base_docs.items() if doc_id not in tombstones
+            }
+            merged.update(overlay_docs)
+            idx = EnhancedVectorIndex(self.cfg)
+            idx.rebuild([(doc_id, doc.text) for doc_id, doc in merged.items()])
+        except Exception:
+            with self._lock:
+                self._journal = None
+            raise
+
+        with self._lock:
+            journal, self._journal = self._journal, None
+            self._active = idx
+            self._docs = merged
+            self._generation += 1
+            self._active_id = index_id or f"generation-{self._generation}"
+            self._overlay = None
+            self._overlay_docs = {}
+            self._overlay_id = None
+            self._tombstones = set()
+            for op, payload in journal:
+                if op == "upsert":
+                    self.upsert_docs(payload)
+                elif op == "remove":
+                    self.remove_docs(payload)
+                elif op == "set_overlay":
+                    self.set_overlay_from_corpus(*payload)
+                elif op == "clear":
+                    self.clear_overlay()
+
+        took_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            f"Watchlist compacted: {len(merged)} docs, id={self._active_id}, "
+            f"replayed={len(journal)}, took={took_ms:.1f}ms"
+        )
+        return {
+            "compacted": True,
+            "active_count": len(merged),
+            "generation": self._generation,
+            "replayed": len(journal),
+            "took_ms": took_ms,
+        }
+
+    def start_compaction(self, index_id: Optional[str] = None) -> bool:
+        """Run compact() in a background thread; False if one is already running."""
+        with self._lock:
+            if self._journal is not None or (
+                self._compaction_thread is not None and self._compaction_thread.is_alive()
+            ):
+                return False
+
+            def run() -> None:
+                try:
+                    self.compact(index_id)
+                except Exception as e:
+                    self.logger.error(f"Watchlist compaction failed: {e}")
+
+            self._compaction_thread = threading.Thread(
+                target=run, name="watchlist-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+            return True
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> bool:
+        """Block until a background compaction finishes; True if none is running."""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
 
     def search(self, query: str, top_k: int = 50, trace: Optional[SearchTrace] = None) -> List[Tuple[str, float]]:
         """Search overlay then active; merge unique doc_ids preserving best score."""
@@ -96,20 +309,33 @@ class WatchlistIndexService:
             
             results: Dict[str, float] = {}
             all_hits: List[SearchTraceHit] = []
+            overlay_hits: List[SearchTraceHit] = []
+            
+            # One consistent view: compact(), upserts and snapshot loads swap or
+            # mutate these concurrently. The overlay is appended to in place, so
+            # it is searched under the lock as well.
+            start_time = time.perf_counter()
+            with self._lock:
+                overlay = self._overlay
+                overlay_docs = self._overlay_docs
+                overlay_id = self._overlay_id
+                active = self._active
+                active_docs = self._docs
+                active_id = self._active_id
+                tombstones = frozenset(self._tombstones)
+                if overlay is not None:
+                    overlay_results = overlay.search(query, top_k=min(top_k, 200))
             
             # Overlay search
-            if self._overlay is not None:
-                start_time = time.perf_counter()
-                overlay_results = self._overlay.search(query, top_k=min(top_k, 200))
+            if overlay is not None:
                 overlay_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
                 
                 # Convert overlay results to SearchTraceHit with signals
-                overlay_hits = []
                 for rank, (doc_id, score) in enumerate(overlay_results, 1):
                     results[doc_id] = max(results.get(doc_id, 0.0), float(score))
                     
                     # Extract signals from metadata if available
-                    doc_metadata = self._overlay_docs.get(doc_id, WatchlistDoc("", "", "", {}))
+                    doc_metadata = overlay_docs.get(doc_id, WatchlistDoc("", "", "", {}))
                     signals = self._extract_signals(doc_id, doc_metadata, query)
                     
                     hit = SearchTraceHit(
@@ -130,10 +356,11 @@ class WatchlistIndexService:
                     took_ms=overlay_time,
                     hits=overlay_hits,
                     meta={
-                        "overlay_id": self._overlay_id,
+                        "overlay_id": overlay_id,
                         "active_id": None,
                         "search_type": "overlay",
-                        "index_type": "char_tfidf"
+                        "index_type": "char_tfidf",
+                        "retrieval_mode": self.cfg.retrieval_mode,
                     }
                 ))
             else:
@@ -141,7 +368,16 @@ class WatchlistIndexService:
             
             # Active search
             start_time = time.perf_counter()
-            active_results = self._active.search(query, top_k=min(top_k, 200))
+            if tombstones:
+                # Over-fetch so docs hidden by incremental updates do not shrink results
+                active_results = active.search(
+                    query, top_k=min(top_k, 200) + len(tombstones)
+                )
+                active_results = [
+                    (doc_id, score) for doc_id, score in active_results if doc_id not in tombstones
+                ][: min(top_k, 200)]
+            else:
+                active_results = active.search(query, top_k=min(top_k, 200))
             active_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
             
             # Convert active results to SearchTraceHit with signals
@@ -150,7 +386,7 @@ class WatchlistIndexService:
                 results[doc_id] = max(results.get(doc_id, 0.0), float(score))
                 
                 # Extract signals from metadata if available
-                doc_metadata = self._docs.get(doc_id, WatchlistDoc("", "", "", {}))
+                doc_metadata = active_docs.get(doc_id, WatchlistDoc("", "", "", {}))
                 signals = self._extract_signals(doc_id, doc_metadata, query)
                 
                 hit = SearchTraceHit(
@@ -172,9 +408,10 @@ class WatchlistIndexService:
                 hits=active_hits,
                 meta={
                     "overlay_id": None,
-                    "active_id": self._active_id,
+                    "active_id": active_id,
                     "search_type": "active",
-                    "index_type": "char_tfidf"
+                    "index_type": "char_tfidf",
+                    "retrieval_mode": self.cfg.retrieval_mode,
                 }
             ))
             
@@ -210,7 +447,7 @@ class WatchlistIndexService:
                     "total_candidates": len(results),
                     "final_results": len(items),
                     "merge_strategy": "max_score",
-                    "overlay_hits": len(overlay_hits) if self._overlay else 0,
+                    "overlay_hits": len(overlay_hits),
                     "active_hits": len(active_hits)
                 }
             ))
@@ -301,7 +538,7 @@ class WatchlistIndexService:
                 return doc
             
             # Check active index
-            doc = self._docs.get(doc_id)
+            doc = self._docs.get(doc_id) if doc_id not in self._tombstones else None
             if doc is not None:
                 trace.note(f"Document {doc_id} found in active index")
                 return doc
@@ -317,49 +554,139 @@ class WatchlistIndexService:
     # ---- Snapshot I/O ---------------------------------------------------
 
     def save_snapshot(self, snapshot_dir: str, as_overlay: bool = False) -> Dict:
-        os.makedirs(snapshot_dir, exist_ok=True)
+        """
+        Write the active (or overlay) index as a versioned binary snapshot.
+
+        Files go to a new generation directory and the manifest rename
+        commits them, so the snapshot can be rewritten while being loaded.
+        """
         idx = self._overlay if as_overlay else self._active
         if idx is None:
             raise RuntimeError("No index to save")
-        # Persist vectorizer + svd + doc ids/texts + dense vectors
-        with open(os.path.join(snapshot_dir, "vectorizer.pkl"), "wb") as f:
-            pickle.dump(idx.vectorizer, f)
-        with open(os.path.join(snapshot_dir, "svd.pkl"), "wb") as f:
-            pickle.dump(idx.svd, f)
-        data = {
-            "doc_ids": idx.doc_ids,
-            "doc_texts": idx.doc_texts,
-            "index_config": self.cfg.__dict__,
+        os.makedirs(snapshot_dir, exist_ok=True)
+        generation = new_generation(snapshot_dir)
+
+        def path(name: str) -> str:
+            return os.path.join(snapshot_dir, generation, name)
+
+        manifest: Dict[str, Any] = {
+            "generation": generation,
+            "index_config": {
+                k: list(v) if isinstance(v, tuple) else v for k, v in self.cfg.__dict__.items()
+            },
+            "doc_count": len(idx.doc_ids),
+            "vectorizer": None,
+            "svd": None,
+            "dense": False,
+            "postings": None,
+            "faiss": False,
         }
-        with open(os.path.join(snapshot_dir, "meta.json"), "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        write_string_pool(path("doc_ids"), idx.doc_ids)
+        write_string_pool(path("doc_texts"), idx.doc_texts)
+
+        # Vectorizer as params + sorted vocab pool + idf array (no pickle)
+        if idx.vectorizer is not None:
+            params = idx.vectorizer.get_params()
+            manifest["vectorizer"] = {
+                k: list(params[k]) if isinstance(params[k], tuple) else params[k]
+                for k in VECTORIZER_PARAMS
+            }
+            manifest["vocab_size"] = write_sorted_index(
+                path("vocab"), idx.vectorizer.vocabulary_.items()
+            )
+            save_array(path("idf.npy"), np.asarray(idx.vectorizer.idf_, dtype=np.float64))
+        if idx.svd is not None:
+            # Fortran order so the mmap'd components_.T used by transform() is C-contiguous
+            save_array(path("svd_components.npy"), np.asfortranarray(idx.svd.components_))
+            manifest["svd"] = {"n_components": int(idx.svd.components_.shape[0])}
         if idx.X_vec is not None:
-            np.save(os.path.join(snapshot_dir, "X_vec.npy"), idx.X_vec)
+            save_array(path("X_vec.npy"), np.asarray(idx.X_vec, dtype=np.float32))
+            manifest["dense"] = True
+        if idx.postings is not None:
+            for part in ("indptr", "indices", "data"):
+                save_array(path(f"postings_{part}.npy"), getattr(idx.postings, part))
+            manifest["postings"] = {"shape": list(idx.postings.shape)}
         # Save FAISS if present
         try:
             import faiss  # type: ignore
 
             if idx.faiss_index is not None:
-                faiss.write_index(
-                    idx.faiss_index, os.path.join(snapshot_dir, "faiss.index")
-                )
+                faiss.write_index(idx.faiss_index, path("faiss.index.tmp"))
+                os.replace(path("faiss.index.tmp"), path("faiss.index"))
+                manifest["faiss"] = True
         except Exception:
             pass
-        # Save doc metadata
+
+        # Doc metadata: JSON record per doc, looked up lazily by doc_id
         dmap = self._overlay_docs if as_overlay else self._docs
-        md = {
-            k: {"text": v.text, "entity_type": v.entity_type, "metadata": v.metadata}
-            for k, v in dmap.items()
-        }
-        with open(os.path.join(snapshot_dir, "docs.json"), "w", encoding="utf-8") as f:
-            json.dump(md, f, ensure_ascii=False)
-        return {"saved": True, "path": snapshot_dir}
+        manifest["docs"] = write_record_store(
+            path("docs"),
+            (
+                (k, {"text": v.text, "entity_type": v.entity_type, "metadata": v.metadata})
+                for k, v in dmap.items()
+            ),
+        )
+        write_manifest(snapshot_dir, manifest)
+        return {"saved": True, "path": snapshot_dir, "version": SNAPSHOT_VERSION}
+
+    def _load_char_index(self, snapshot_dir: str, manifest: Optional[Dict[str, Any]]) -> CharTfidfVectorIndex:
+        if manifest is None:
+            return self._load_legacy_char_index(snapshot_dir)
+        data_dir = snapshot_data_dir(snapshot_dir, manifest)
+
+        def path(name: str) -> str:
+            return os.path.join(data_dir, name)
+
+        known = {f.name for f in fields(VectorIndexConfig)}
+        index_config = {k: v for k, v in manifest["index_config"].items() if k in known}
+        if "ngram_range" in index_config:
+            index_config["ngram_range"] = tuple(index_config["ngram_range"])
+        idx = CharTfidfVectorIndex(VectorIndexConfig(**index_config))
+        idx.doc_ids = StringPool(path("doc_ids"))
+        idx.doc_texts = StringPool(path("doc_texts"))
 
-    def _load_char_index(self, snapshot_dir: str) -> CharTfidfVectorIndex:
-        # Load vectorizer + svd + docs + vectors + faiss (if available)
+        if manifest["vectorizer"] is not None:
+            params = dict(manifest["vectorizer"])
+            params["ngram_range"] = tuple(params["ngram_range"])
+            vectorizer = TfidfVectorizer(**params)
+            vectorizer.vocabulary_ = SortedStringIndex(path("vocab"))
+            vectorizer.idf_ = np.load(path("idf.npy"), mmap_mode="r")
+            idx.vectorizer = vectorizer
+        if manifest["svd"] is not None:
+            components = np.load(path("svd_components.npy"), mmap_mode="r")
+            svd = TruncatedSVD(n_components=manifest["svd"]["n_components"])
+            svd.components_ = components
+            svd.n_features_in_ = components.shape[1]
+            idx.svd = svd
+        if manifest["dense"]:
+            idx.X_vec = np.load(path("X_vec.npy"), mmap_mode="r")
+        if manifest["postings"] is not None:
+            idx.postings = sp.csr_matrix(
+                (
+                    np.load(path("postings_data.npy"), mmap_mode="r"),
+                    np.load(path("postings_indices.npy"), mmap_mode="r"),
+                    np.load(path("postings_indptr.npy"), mmap_mode="r"),
+                ),
+                shape=tuple(manifest["postings"]["shape"]),
+                copy=False,
+            )
+        if manifest["faiss"]:
+            try:
+                import faiss  # type: ignore
+
+                idx.faiss_index = faiss.read_index(path("faiss.index"))
+            except Exception:
+                idx.faiss_index = None
+        return idx
+
+    def _load_legacy_char_index(self, snapshot_dir: str) -> CharTfidfVectorIndex:
+        # Pre-v2 snapshots: pickled vectorizer/svd + meta.json
         with open(os.path.join(snapshot_dir, "meta.json"), "r", encoding="utf-8") as f:
             meta = json.load(f)
-        cfg = VectorIndexConfig(**meta.get("index_config", {}))
+        known = {f.name for f in fields(VectorIndexConfig)}
+        cfg = VectorIndexConfig(
+            **{k: v for k, v in meta.get("index_config", {}).items() if k in known}
+        )
         idx = CharTfidfVectorIndex(cfg)
         with open(os.path.join(snapshot_dir, "vectorizer.pkl"), "rb") as f:
             idx.vectorizer = pickle.load(f)
@@ -373,6 +700,9 @@ class WatchlistIndexService:
                 idx.X_vec = np.load(xvec_path).astype("float32")
             except Exception:
                 idx.X_vec = None
+        postings_path = os.path.join(snapshot_dir, "postings.npz")
+        if os.path.exists(postings_path):
+            idx.postings = sp.load_npz(postings_path).tocsr()
         # Load faiss index if present
         try:
             import faiss  # type: ignore
@@ -384,6 +714,27 @@ class WatchlistIndexService:
             idx.faiss_index = None
         return idx
 
+    @staticmethod
+    def _doc_from_record(doc_id: str, record: Dict) -> WatchlistDoc:
+        return WatchlistDoc(
+            doc_id, record["text"], record.get("entity_type", ""), record.get("metadata", {})
+        )
+
+    def _load_docs(
+        self, snapshot_dir: str, manifest: Optional[Dict[str, Any]]
+    ) -> Optional[Mapping[str, WatchlistDoc]]:
+        """Open doc metadata: lazy per-doc store for v2 snapshots, docs.json for legacy."""
+        if manifest is not None:
+            return LazyRecordStore(
+                os.path.join(snapshot_data_dir(snapshot_dir, manifest), "docs"), self._doc_from_record
+            )
+        docs_path = os.path.join(snapshot_dir, "docs.json")
+        if not os.path.exists(docs_path):
+            return None
+        with open(docs_path, "r", encoding="utf-8") as f:
+            md = json.load(f)
+        return {k: self._doc_from_record(k, v) for k, v in md.items()}
+
     def reload_snapshot(self, snapshot_dir: str, as_overlay: bool = False, trace: Optional[SearchTrace] = None) -> Dict:
         """Reload snapshot from directory."""
         # Create dummy trace if none provided
@@ -398,30 +749,27 @@ class WatchlistIndexService:
             
             start_time = time.perf_counter()
             
+            # Read the manifest once: index and docs come from the same generation
+            manifest = read_manifest(snapshot_dir)
+            
             # Load index
-            idx = self._load_char_index(snapshot_dir)
+            idx = self._load_char_index(snapshot_dir, manifest)
             trace.note(f"Index loaded from {snapshot_dir}")
             
             # Load docs metadata
-            docs_path = os.path.join(snapshot_dir, "docs.json")
-            if not os.path.exists(docs_path):
+            docs = self._load_docs(snapshot_dir, manifest)
+            if docs is None:
+                docs_path = os.path.join(snapshot_dir, "docs.json")
                 trace.note(f"Docs metadata file not found: {docs_path}")
                 return {"error": f"Docs metadata file not found: {docs_path}"}
             
-            with open(docs_path, "r", encoding="utf-8") as f:
-                md = json.load(f)
-            
             load_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
             
             if as_overlay:
                 self._overlay = idx
-                self._overlay_docs = {
-                    k: WatchlistDoc(
-                        k, v["text"], v.get("entity_type", ""), v.get("metadata", {})
-                    )
-                    for k, v in md.items()
-                }
+                self._overlay_docs = docs
                 self._overlay_id = snapshot_dir
+                self._tombstones = set()
                 info = {
                     "overlay_loaded": True,
                     "overlay_count": len(self._overlay_docs),
@@ -431,13 +779,9 @@ class WatchlistIndexService:
                 trace.note(f"Overlay snapshot loaded: {len(self._overlay_docs)} documents")
             else:
                 self._active = idx
-                self._docs = {
-                    k: WatchlistDoc(
-                        k, v["text"], v.get("entity_type", ""), v.get("metadata", {})
-                    )
-                    for k, v in md.items()
-                }
+                self._docs = docs
                 self._active_id = snapshot_dir
+                self._tombstones = set()
                 info = {
                     "active_loaded": True,
                     "active_count": len(self._docs),
@@ -459,4 +803,8 @@ class WatchlistIndexService:
         return {
             "active": {"id": self._active_id, "count": len(self._docs)},
             "overlay": {"id": self._overlay_id, "count": len(self._overlay_docs)},
+            "tombstones": len(self._tombstones),
+            "generation": self._generation,
+            "compacting": self._journal is not None,
+            "retrieval_mode": self.cfg.retrieval_mode,
         }
@@ -18,6 +18,7 @@ except ImportError:
 from ...config import SERVICE_CONFIG, LANGUAGE_CONFIG
 from ...exceptions import LanguageDetectionError
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import get_text_profile
 from ...utils.types import LanguageDetectionResult
 
 
@@ -362,6 +363,10 @@ class LanguageDetectionService:
     
     def _calculate_character_ratios(self, text: str) -> Dict[str, Any]:
         """Calculate character ratios and counts in single pass for performance"""
+        profile = get_text_profile(text)
+        if profile is not None:
+            return self._character_ratios_from_profile(profile)
+
         # Initialize counters
         cyr_chars = 0
         lat_chars = 0
@@ -415,6 +420,23 @@ class LanguageDetectionService:
             "bonuses": {}
         }
     
+    def _character_ratios_from_profile(self, profile) -> Dict[str, Any]:
+        """Same result as _calculate_character_ratios, read from a shared TextProfile"""
+        total_letters = profile.letters
+        return {
+            "cyr_chars": profile.cyrillic,
+            "lat_chars": profile.latin,
+            "cyr_ratio": profile.cyrillic / total_letters if total_letters > 0 else 0.0,
+            "lat_ratio": profile.latin / total_letters if total_letters > 0 else 0.0,
+            "uk_chars": profile.ukrainian_specific,
+            "ru_chars": profile.russian_specific,
+            "total_letters": total_letters,
+            "digits": profile.digits,
+            "punct": profile.other,
+            "uppercase_chars": profile.uppercase,
+            "bonuses": {}
+        }
+
     def _determine_language_from_ratios(self, details: Dict[str, Any], config: Any, text: str) -> tuple[str, float, str]:
         """Determine primary language from character ratios"""
         cyr_ratio = details["cyr_ratio"]
@@ -540,14 +562,21 @@ class LanguageDetectionService:
 
     def _detect_cyrillic_priority(self, text: str) -> Dict[str, Any]:
         """ABSOLUTE PRIORITY of Cyrillic characters"""
-        # Count Ukrainian unique characters
-        ukrainian_chars = len(re.findall(r"[іїєґІЇЄҐ]", text))
+        profile = get_text_profile(text)
+        if profile is not None:
+            ukrainian_chars = profile.ukrainian_specific
+            russian_chars = profile.russian_specific
+            # [а-яёА-ЯЁ]: the alphabet minus і ї є ґ
+            cyrillic_chars = profile.cyrillic - ukrainian_chars
+        else:
+            # Count Ukrainian unique characters
+            ukrainian_chars = len(re.findall(r"[іїєґІЇЄҐ]", text))
 
-        # Count Russian specific characters
-        russian_chars = len(re.findall(r"[ёъыэЁЪЫЭ]", text))
+            # Count Russian specific characters
+            russian_chars = len(re.findall(r"[ёъыэЁЪЫЭ]", text))
 
-        # Count total Cyrillic characters
-        cyrillic_chars = len(re.findall(r"[а-яёА-ЯЁ]", text))
+            # Count total Cyrillic characters
+            cyrillic_chars = len(re.findall(r"[а-яёА-ЯЁ]", text))
 
         # ABSOLUTE PRIORITY: even ONE Ukrainian character = Ukrainian language
         if ukrainian_chars > 0:
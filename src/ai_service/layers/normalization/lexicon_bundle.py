@@ -0,0 +1,489 @@
+"""
+Precompiled lexicon bundle.
+
+Stopwords, legal forms, payment context words, name lexicons and diminutive
+maps used to be parsed separately by ``lexicon_loader``, ``NormalizationService``,
+``NormalizationFactory``, ``HighRecallACGenerator`` and the smart filter, so
+each process held several copies of the same sets. The offline build step
+compiles all of them into one versioned file::
+
+    namespace \\0 key -> value
+
+stored in a memory-mapped hash table (``utils.mmap_hash``). Identical values
+are stored once. Namespaces are sets (empty value), maps (string value) or
+lists (values joined with ``\\x1f``), e.g. ``stopwords:ru``,
+``diminutives:uk`` or the precomputed inverse ``diminutive_forms:ru``
+(canonical name -> diminutives).
+
+Entries are written grouped by namespace and the metadata records each
+namespace's byte range of the records section, so iterating a set or map
+reads only that namespace.
+
+``get_lexicon_bundle()`` opens the bundle once per process; workers forked
+after that share its pages. If the bundle is missing or was built from
+different source files, the same namespaces are collected from the sources
+instead, still once per process.
+
+Build with ``python scripts/build_lexicon_bundle.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import unicodedata
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ...utils.logging_config import get_logger
+from ...utils.mmap_hash import MmapHashTable, record_size, write_hash_table
+
+logger = get_logger(__name__)
+
+BUNDLE_KIND = "lexicon_bundle"
+BUNDLE_VERSION = 1
+LANGS = ("ru", "uk", "en")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_BUNDLE_PATH = PROJECT_ROOT / "data" / "bundle" / "lexicons.bin"
+BUNDLE_PATH_ENV = "LEXICON_BUNDLE_PATH"
+
+# Memoized lookups per namespace view
+LOOKUP_CACHE_SIZE = 4096
+
+KIND_SET = "set"
+KIND_MAP = "map"
+KIND_LIST = "list"
+
+_SEP = "\x00"
+_LIST_SEP = "\x1f"
+
+
+def default_bundle_path() -> Path:
+    """Bundle location: $LEXICON_BUNDLE_PATH or data/bundle/lexicons.bin."""
+    return Path(os.getenv(BUNDLE_PATH_ENV) or DEFAULT_BUNDLE_PATH)
+
+
+def _prefix(namespace: str) -> bytes:
+    return f"{namespace}{_SEP}".encode("utf-8")
+
+
+def _nfc_lower(value: str) -> str:
+    return unicodedata.normalize("NFC", value).lower()
+
+
+# ---- Sources ------------------------------------------------------------
+
+
+def source_files(root: Path = PROJECT_ROOT) -> List[Path]:
+    """Files the bundle is compiled from (for the staleness fingerprint)."""
+    dicts_dir = Path(__file__).resolve().parents[2] / "data" / "dicts"
+    files = [root / "data" / f"diminutives_{lang}.json" for lang in ("ru", "uk")]
+    lexicons_dir = root / "data" / "lexicons"
+    if lexicons_dir.exists():
+        files.extend(
+            sorted(p for p in lexicons_dir.iterdir() if p.suffix in (".txt", ".json"))
+        )
+    files.extend(
+        dicts_dir / f"{name}_names.py" for name in ("russian", "ukrainian", "english")
+    )
+    return [p for p in files if p.exists()]
+
+
+def source_fingerprint(root: Path = PROJECT_ROOT) -> str:
+    """SHA-256 over the names and contents of all source files."""
+    digest = hashlib.sha256()
+    for path in source_files(root):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_json_map(path: Path) -> Dict[str, str]:
+    if not path.exists():
+        logger.warning(f"Lexicon source missing: {path}")
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    return {_nfc_lower(key): _nfc_lower(value) for key, value in raw.items()}
+
+
+def _inverse(mapping: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """canonical -> diminutives in source order (the canonical form itself excluded)."""
+    inverse: Dict[str, List[str]] = {}
+    for diminutive, full in mapping.items():
+        if diminutive != full:
+            inverse.setdefault(full, []).append(diminutive)
+    return {full: tuple(forms) for full, forms in inverse.items()}
+
+
+def _name_sets(names: Dict[str, Any]) -> Tuple[set, set]:
+    given, diminutives = set(), set()
+    for name, props in names.items():
+        given.add(name)
+        given.update(props.get("variants", ()))
+        given.update(props.get("declensions", ()))
+        diminutives.update(props.get("diminutives", ()))
+    return given, diminutives
+
+
+def _russian_to_ukrainian(names: Dict[str, Any]) -> Dict[str, str]:
+    mapping = {}
+    for ukrainian_name, props in names.items():
+        for variant in props.get("variants", ()):
+            has_russian_chars = any(ch in variant for ch in "ИЫЭЁ")
+            if has_russian_chars or variant not in names:
+                mapping[variant] = ukrainian_name
+    return mapping
+
+
+def collect_lexicons(root: Path = PROJECT_ROOT) -> Dict[str, Tuple[str, Any]]:
+    """
+    Parse every lexicon source into ``namespace -> (kind, data)``.
+
+    Args:
+        root: Project root containing ``data/`` and ``data/lexicons/``
+
+    Returns:
+        Sets as frozensets, maps as dicts, lists as ``key -> tuple`` dicts
+    """
+    from .lexicon_loader import load_lexicons
+
+    namespaces: Dict[str, Tuple[str, Any]] = {}
+
+    lexicons = load_lexicons(root / "data" / "lexicons", use_bundle=False)
+    for name in ("stopwords", "stopwords_init", "stopwords_person", "legal_forms_lang"):
+        per_lang = getattr(lexicons, name)
+        ns_name = "legal_forms" if name == "legal_forms_lang" else name
+        for lang in LANGS:
+            namespaces[f"{ns_name}:{lang}"] = (
+                KIND_SET,
+                frozenset(per_lang.get(lang, ())),
+            )
+    namespaces["legal_forms"] = (KIND_SET, frozenset(lexicons.legal_forms))
+    namespaces["payment_context"] = (KIND_SET, frozenset(lexicons.payment_context))
+
+    # Raw lines, as NormalizationFactory._load_english_lexicons expects them
+    for name in ("en_titles", "en_suffixes"):
+        path = root / "data" / "lexicons" / f"{name}.txt"
+        lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+        namespaces[name] = (
+            KIND_SET,
+            frozenset(line.strip() for line in lines if line.strip()),
+        )
+
+    diminutives = {
+        lang: _load_json_map(root / "data" / f"diminutives_{lang}.json")
+        for lang in ("ru", "uk")
+    }
+    diminutives["en"] = _load_json_map(root / "data" / "lexicons" / "en_nicknames.json")
+    for lang, mapping in diminutives.items():
+        namespaces[f"diminutives:{lang}"] = (KIND_MAP, mapping)
+        namespaces[f"diminutive_forms:{lang}"] = (KIND_LIST, _inverse(mapping))
+        namespaces[f"diminutive_names:{lang}"] = (
+            KIND_SET,
+            frozenset(mapping) | frozenset(mapping.values()),
+        )
+
+    try:
+        from ...data.dicts import english_names, russian_names, ukrainian_names
+    except ImportError:  # pragma: no cover - optional heavy dependency
+        logger.warning(
+            "Name dictionaries unavailable; bundle built without name lexicons"
+        )
+        return namespaces
+
+    for lang, names in (
+        ("ru", russian_names.RUSSIAN_NAMES),
+        ("uk", ukrainian_names.UKRAINIAN_NAMES),
+    ):
+        given, name_diminutives = _name_sets(names)
+        namespaces[f"names:{lang}"] = (KIND_SET, frozenset(names))
+        namespaces[f"given_names:{lang}"] = (KIND_SET, frozenset(given))
+        namespaces[f"name_diminutives:{lang}"] = (KIND_SET, frozenset(name_diminutives))
+    namespaces["names:en"] = (KIND_SET, frozenset(english_names.ENGLISH_NAMES))
+    namespaces["nicknames:en"] = (
+        KIND_MAP,
+        {
+            _nfc_lower(key): _nfc_lower(value)
+            for key, value in getattr(english_names, "NICKNAMES_EN", {}).items()
+        },
+    )
+    namespaces["ru_to_uk_names"] = (
+        KIND_MAP,
+        _russian_to_ukrainian(ukrainian_names.UKRAINIAN_NAMES),
+    )
+    return namespaces
+
+
+# ---- Read side ----------------------------------------------------------
+
+
+class _BundleView:
+    """Base for namespace views; recent lookups are memoized per view."""
+
+    def __init__(
+        self,
+        table: MmapHashTable,
+        namespace: str,
+        size: int,
+        records: Optional[List[int]] = None,
+    ) -> None:
+        self._table = table
+        self._prefix = _prefix(namespace)
+        self._size = size
+        # [start, end) of the namespace in the records section; None: scan all
+        self._records = records
+        # Token vocabularies repeat heavily; skip the hash + probe for them
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup_uncached)
+
+    def _lookup_uncached(self, key: str) -> Optional[str]:
+        value = self._table.get(self._prefix + key.encode("utf-8"))
+        return None if value is None else bytes(value).decode("utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        n = len(self._prefix)
+        if self._records is not None:
+            for key, _ in self._table.items(*self._records):
+                yield key[n:].decode("utf-8")
+            return
+        for key, _ in self._table.items():
+            if key[:n] == self._prefix:
+                yield bytes(key[n:]).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class BundleSet(_BundleView, AbstractSet):
+    """Read-only set view of one bundle namespace."""
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return frozenset(iterable)
+
+
+class BundleMap(_BundleView, Mapping):
+    """Read-only mapping view of one bundle namespace."""
+
+    def __getitem__(self, key: str) -> str:
+        value = self._lookup(key) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key) if isinstance(key, str) else None
+        return default if value is None else value
+
+
+class LexiconBundle:
+    """
+    All lexicons of the service, served from the mmap'd bundle or, as a
+    fallback, from ``collect_lexicons()``.
+
+    Unknown namespaces read as empty.
+    """
+
+    def __init__(
+        self,
+        table: Optional[MmapHashTable] = None,
+        namespaces: Optional[Dict[str, Tuple[str, Any]]] = None,
+    ) -> None:
+        self._table = table
+        self._data = namespaces if table is None else None
+        if table is not None:
+            self.meta = table.meta
+            self._kinds = {
+                ns: info["kind"] for ns, info in table.meta["namespaces"].items()
+            }
+            self._sizes = {
+                ns: info["size"] for ns, info in table.meta["namespaces"].items()
+            }
+            self._records = {
+                ns: info.get("records") for ns, info in table.meta["namespaces"].items()
+            }
+        else:
+            self.meta = {"kind": BUNDLE_KIND, "source": "sources"}
+            self._kinds = {ns: kind for ns, (kind, _) in (namespaces or {}).items()}
+            self._sizes = {
+                ns: len(data) for ns, (_, data) in (namespaces or {}).items()
+            }
+        self._views: Dict[str, Any] = {}
+
+    @property
+    def is_mmap(self) -> bool:
+        return self._table is not None
+
+    @classmethod
+    def open(cls, path: str) -> "LexiconBundle":
+        table = MmapHashTable(str(path))
+        if table.meta.get("kind") != BUNDLE_KIND:
+            table.close()
+            raise ValueError(f"Not a lexicon bundle: {path}")
+        if table.meta.get("bundle_version") != BUNDLE_VERSION:
+            table.close()
+            raise ValueError(
+                f"Unsupported lexicon bundle version {table.meta.get('bundle_version')} in {path}"
+            )
+        return cls(table=table)
+
+    @classmethod
+    def from_sources(cls, root: Path = PROJECT_ROOT) -> "LexiconBundle":
+        return cls(namespaces=collect_lexicons(root))
+
+    @classmethod
+    def load(
+        cls, path: Optional[str] = None, root: Path = PROJECT_ROOT
+    ) -> "LexiconBundle":
+        """Open the bundle if present and current, otherwise parse the sources."""
+        bundle_path = Path(path) if path else default_bundle_path()
+        if bundle_path.exists():
+            try:
+                bundle = cls.open(str(bundle_path))
+                if bundle.meta.get("fingerprint") == source_fingerprint(root):
+                    logger.info(
+                        f"Loaded lexicon bundle {bundle_path} ({len(bundle._kinds)} namespaces)"
+                    )
+                    return bundle
+                logger.warning(
+                    f"Ignoring stale lexicon bundle {bundle_path}: sources changed since build"
+                )
+                bundle.close()
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring lexicon bundle {bundle_path}: {e}")
+        return cls.from_sources(root)
+
+    def namespaces(self) -> Dict[str, str]:
+        """namespace -> kind."""
+        return dict(self._kinds)
+
+    def get_set(self, namespace: str) -> AbstractSet:
+        """Read-only set for ``namespace`` (empty if unknown)."""
+        view = self._views.get(namespace)
+        if view is None:
+            if self._kinds.get(namespace) != KIND_SET:
+                return frozenset()
+            if self._table is not None:
+                view = BundleSet(
+                    self._table,
+                    namespace,
+                    self._sizes[namespace],
+                    self._records[namespace],
+                )
+            else:
+                view = self._data[namespace][1]
+            self._views[namespace] = view
+        return view
+
+    def get_map(self, namespace: str) -> Mapping:
+        """Read-only mapping for ``namespace`` (empty if unknown)."""
+        view = self._views.get(namespace)
+        if view is None:
+            if self._kinds.get(namespace) != KIND_MAP:
+                return {}
+            if self._table is not None:
+                view = BundleMap(
+                    self._table,
+                    namespace,
+                    self._sizes[namespace],
+                    self._records[namespace],
+                )
+            else:
+                view = self._data[namespace][1]
+            self._views[namespace] = view
+        return view
+
+    def get_list(self, namespace: str, key: str) -> List[str]:
+        """Values stored under ``key`` in a list namespace ([] if absent)."""
+        if self._kinds.get(namespace) != KIND_LIST:
+            return []
+        if self._table is None:
+            return list(self._data[namespace][1].get(key, ()))
+        value = self._table.get(_prefix(namespace) + key.encode("utf-8"))
+        return bytes(value).decode("utf-8").split(_LIST_SEP) if value else []
+
+    def close(self) -> None:
+        if self._table is not None:
+            self._table.close()
+
+
+# ---- Build --------------------------------------------------------------
+
+
+def build_lexicon_bundle(output_path: str, root: Path = PROJECT_ROOT) -> Dict[str, Any]:
+    """Compile all lexicon sources under ``root`` into ``output_path``."""
+    start = time.time()
+    namespaces = collect_lexicons(root)
+    entries: List[Tuple[bytes, bytes]] = []
+    namespace_meta: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for namespace, (kind, data) in sorted(namespaces.items()):
+        prefix = _prefix(namespace)
+        if kind == KIND_SET:
+            section = [(prefix + key.encode("utf-8"), b"") for key in sorted(data)]
+        elif kind == KIND_MAP:
+            section = [
+                (prefix + key.encode("utf-8"), value.encode("utf-8"))
+                for key, value in data.items()
+            ]
+        else:
+            section = [
+                (prefix + key.encode("utf-8"), _LIST_SEP.join(values).encode("utf-8"))
+                for key, values in data.items()
+            ]
+        # Keys are unique (namespace prefix), so records keep this order in the file
+        entry_start = offset
+        offset += sum(record_size(key) for key, _ in section)
+        namespace_meta[namespace] = {
+            "kind": kind,
+            "size": len(data),
+            "records": [entry_start, offset],
+        }
+        entries.extend(section)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        "kind": BUNDLE_KIND,
+        "bundle_version": BUNDLE_VERSION,
+        "fingerprint": source_fingerprint(root),
+        "namespaces": namespace_meta,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    count = write_hash_table(str(output_path), entries, meta)
+    stats = {
+        "entries": count,
+        "namespaces": len(namespaces),
+        "bytes": os.path.getsize(output_path),
+        "took_s": round(time.time() - start, 2),
+    }
+    logger.info(f"Lexicon bundle written to {output_path}: {json.dumps(stats)}")
+    return stats
+
+
+# Process-wide bundle
+_bundle: Optional[LexiconBundle] = None
+
+
+def get_lexicon_bundle() -> LexiconBundle:
+    """Get the process-wide lexicon bundle, loading it on first use."""
+    global _bundle
+    if _bundle is None:
+        _bundle = LexiconBundle.load()
+    return _bundle
+
+
+def clear_lexicon_bundle() -> None:
+    """Drop the process-wide bundle (useful for testing)."""
+    global _bundle
+    if _bundle is not None:
+        _bundle.close()
+    _bundle = None
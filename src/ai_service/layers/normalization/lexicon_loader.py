@@ -22,16 +22,21 @@ class Lexicons:
     payment_context: Set[str]  # payment context words
 
 
-def load_lexicons(base_path: Optional[Path] = None) -> Lexicons:
+def load_lexicons(base_path: Optional[Path] = None, use_bundle: bool = True) -> Lexicons:
     """
     Load all lexicons from the data/lexicons directory.
     
     Args:
         base_path: Base path to lexicon files. If None, uses default location.
+        use_bundle: Serve the default location from the process-wide lexicon
+            bundle instead of parsing the files again.
         
     Returns:
         Lexicons object with loaded data.
     """
+    if base_path is None and use_bundle:
+        return _lexicons_from_bundle()
+
     if base_path is None:
         # Default to project root/data/lexicons
         # Try to find the project root by looking for pyproject.toml
@@ -104,6 +109,21 @@ def load_lexicons(base_path: Optional[Path] = None) -> Lexicons:
     )
 
 
+def _lexicons_from_bundle() -> Lexicons:
+    """Build Lexicons from the shared bundle (copies are small and hot, so plain sets)."""
+    from .lexicon_bundle import LANGS, get_lexicon_bundle
+
+    bundle = get_lexicon_bundle()
+    return Lexicons(
+        stopwords={lang: set(bundle.get_set(f"stopwords:{lang}")) for lang in LANGS},
+        stopwords_init={lang: set(bundle.get_set(f"stopwords_init:{lang}")) for lang in LANGS},
+        stopwords_person={lang: set(bundle.get_set(f"stopwords_person:{lang}")) for lang in LANGS},
+        legal_forms=set(bundle.get_set("legal_forms")),
+        legal_forms_lang={lang: set(bundle.get_set(f"legal_forms:{lang}")) for lang in LANGS},
+        payment_context=set(bundle.get_set("payment_context")),
+    )
+
+
 def _load_word_list(file_path: Path) -> Set[str]:
     """
     Load a word list from a file, trimming whitespace and skipping comments.
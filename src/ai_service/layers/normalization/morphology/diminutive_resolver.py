@@ -6,7 +6,7 @@ import json
 import unicodedata
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from ....utils.logging_config import get_logger
 
@@ -17,12 +17,21 @@ _SUPPORTED_LANGS = ("ru", "uk")
 class DiminutiveResolver:
     """Map diminutive tokens to their canonical form using static dictionaries."""
 
-    def __init__(self, base_path: Path) -> None:
+    def __init__(self, base_path: Path, maps: Optional[Dict[str, Mapping[str, str]]] = None) -> None:
+        """
+        Args:
+            base_path: Project root holding ``data/diminutives_{lang}.json``
+            maps: Preloaded NFC/lower-case maps per language (e.g. from the
+                lexicon bundle); languages missing here are read from disk
+        """
         self._logger = get_logger(__name__)
         self._base_path = base_path
-        self._maps: Dict[str, Dict[str, str]] = {}
+        self._maps: Dict[str, Mapping[str, str]] = {}
         for lang in _SUPPORTED_LANGS:
-            self._maps[lang] = self._load_dictionary(lang)
+            if maps and maps.get(lang):
+                self._maps[lang] = maps[lang]
+            else:
+                self._maps[lang] = self._load_dictionary(lang)
 
         # Bind cached resolver to the instance so the cache size is per resolver
         self._resolve_cached = lru_cache(maxsize=10_000)(self._resolve_internal)
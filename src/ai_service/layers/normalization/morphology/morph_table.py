@@ -0,0 +1,288 @@
+"""
+Precompiled morphology lookup table.
+
+The names that matter for screening (lexicons in ``data/dicts/*_names.py``,
+diminutive maps and sanctioned person tokens) are known at build time. The
+offline build step runs ``MorphologyAdapter``'s full nominative pipeline
+(custom rules -> pymorphy3 -> diminutive dictionary) once for every
+inflected form of that vocabulary and stores
+
+    (token, lang, role) -> (nominative, gender, trace_note)
+
+in a memory-mapped hash table (``utils.mmap_hash``). At runtime
+``MorphologyAdapter.to_nominative_cached`` answers known tokens with a single
+lookup and only runs pymorphy3 for out-of-vocabulary tokens.
+
+The table is only valid for the pymorphy3/dictionary versions, the name
+lexicon and diminutive source files, and the feature-flag values it was
+built with; all are recorded in the table metadata and checked before any
+lookup is served.
+
+Build with ``python scripts/build_morphology_table.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import pkgutil
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ....utils.logging_config import get_logger
+from ....utils.mmap_hash import MmapHashTable, write_hash_table
+
+if TYPE_CHECKING:
+    from ..morphology_adapter import MorphologyAdapter
+
+logger = get_logger(__name__)
+
+TABLE_KIND = "morphology"
+ROLES = ("given", "surname", "patronymic")
+LANGS = ("ru", "uk")
+# Flag values the table is built with; other values bypass the table
+TABLE_FLAGS = {
+    "enforce_nominative": True,
+    "preserve_feminine_surnames": True,
+    "morphology_custom_rules_first": True,
+}
+# Only forms of these parses are expanded for lexicon words
+_NAME_GRAMMEMES = ("Name", "Surn", "Patr")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+DICTS_DIR = Path(__file__).resolve().parents[3] / "data" / "dicts"
+DEFAULT_TABLE_PATH = PROJECT_ROOT / "data" / "morphology" / "morph_table.bin"
+TABLE_PATH_ENV = "MORPH_TABLE_PATH"
+
+_SEP = "\x00"
+_CYRILLIC_WORD_RE = re.compile(r"^[а-яёіїєґ]+(?:['’-][а-яёіїєґ]+)*$", re.IGNORECASE)
+_NAME_TOKEN_RE = re.compile(r"[А-ЯЁІЇЄҐа-яёіїєґ]+(?:['’-][А-ЯЁІЇЄҐа-яёіїєґ]+)*")
+
+
+def _key(token: str, lang: str, role: str) -> bytes:
+    return f"{lang}{_SEP}{role}{_SEP}{token}".encode("utf-8")
+
+
+def default_table_path() -> Path:
+    """Table location: $MORPH_TABLE_PATH or data/morphology/morph_table.bin."""
+    return Path(os.getenv(TABLE_PATH_ENV) or DEFAULT_TABLE_PATH)
+
+
+def source_files() -> List[Path]:
+    """Lexicon modules and diminutive maps the table entries are derived from."""
+    files = sorted(
+        p
+        for p in DICTS_DIR.glob("*.py")
+        if p.stem.endswith("_names") or "diminutives" in p.stem
+    )
+    files.extend(PROJECT_ROOT / "data" / f"diminutives_{lang}.json" for lang in LANGS)
+    return [p for p in files if p.exists()]
+
+
+def source_fingerprint() -> str:
+    """SHA-256 over the names and contents of all source files."""
+    digest = hashlib.sha256()
+    for path in source_files():
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def analyzer_fingerprint(analyzers: Dict[str, Any]) -> Dict[str, str]:
+    """Versions and source data that determine the table entries."""
+    fingerprint: Dict[str, str] = {"sources": source_fingerprint()}
+    try:
+        import pymorphy3
+
+        fingerprint["pymorphy3"] = str(getattr(pymorphy3, "__version__", "unknown"))
+    except ImportError:
+        fingerprint["pymorphy3"] = "missing"
+    for lang in LANGS:
+        analyzer = analyzers.get(lang)
+        meta = getattr(getattr(analyzer, "dictionary", None), "meta", None) or {}
+        fingerprint[lang] = (
+            f"{meta.get('language_code', 'none')}:{meta.get('compiled_at', 'none')}"
+        )
+    return fingerprint
+
+
+class MorphologyTable:
+    """Read side of the precompiled table."""
+
+    def __init__(self, path: str) -> None:
+        self._table = MmapHashTable(str(path))
+        self.path = str(path)
+        self.meta = self._table.meta
+        if self.meta.get("kind") != TABLE_KIND:
+            raise ValueError(f"Not a morphology table: {path}")
+        self._flags = self.meta.get("flags", TABLE_FLAGS)
+
+    @classmethod
+    def load(
+        cls, path: Optional[str], analyzers: Dict[str, Any]
+    ) -> Optional["MorphologyTable"]:
+        """Open the table if present and built for the installed analyzers."""
+        table_path = Path(path) if path else default_table_path()
+        if not table_path.exists():
+            return None
+        try:
+            table = cls(str(table_path))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring morphology table {table_path}: {e}")
+            return None
+        expected = analyzer_fingerprint(analyzers)
+        if table.meta.get("fingerprint") != expected:
+            logger.warning(
+                f"Ignoring morphology table {table_path}: built for "
+                f"{table.meta.get('fingerprint')}, installed {expected}"
+            )
+            return None
+        logger.info(f"Loaded morphology table {table_path} ({len(table)} entries)")
+        return table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def applies_to(self, flags: Any) -> bool:
+        """True if ``flags`` match the values the table was built with."""
+        return all(
+            getattr(flags, name, default) == self._flags.get(name, default)
+            for name, default in TABLE_FLAGS.items()
+        )
+
+    def lookup(
+        self, token: str, lang: str, role: str
+    ) -> Optional[Tuple[str, str, str]]:
+        """Return (nominative, gender, trace_note) for an NFC token, or None."""
+        if role not in ROLES:
+            return None
+        value = self._table.get(_key(token, lang, role))
+        if value is None:
+            return None
+        nominative, gender, trace_note = value.decode("utf-8").split(_SEP)
+        return nominative, gender, trace_note
+
+    def gender(self, token: str, lang: str, role: str = ROLES[0]) -> Optional[str]:
+        """Gender of a known token in ``role``, or None."""
+        hit = self.lookup(token, lang, role)
+        return hit[1] if hit else None
+
+
+# ---- Build --------------------------------------------------------------
+
+
+def _collect_strings(value: Any, out: Set[str]) -> None:
+    if isinstance(value, str):
+        out.add(value)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _collect_strings(key, out)
+            if key != "gender":
+                _collect_strings(item, out)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            _collect_strings(item, out)
+
+
+def collect_vocabulary(extra_names: Iterable[str] = ()) -> Set[str]:
+    """
+    Lower-case Cyrillic base words: name lexicons, diminutive maps and
+    tokens of ``extra_names`` (e.g. sanctioned person names).
+    """
+    from ....data import dicts
+
+    strings: Set[str] = set()
+    for info in pkgutil.iter_modules(dicts.__path__):
+        if not (info.name.endswith("_names") or "diminutives" in info.name):
+            continue
+        module = importlib.import_module(f"{dicts.__name__}.{info.name}")
+        for name, value in vars(module).items():
+            if name.isupper() and isinstance(value, dict):
+                _collect_strings(value, strings)
+
+    words = {s.lower() for s in strings if _CYRILLIC_WORD_RE.match(s)}
+    for name in extra_names:
+        words.update(token.lower() for token in _NAME_TOKEN_RE.findall(name or ""))
+    return words
+
+
+def expand_forms(
+    adapter: "MorphologyAdapter", words: Iterable[str], lang: str
+) -> Set[str]:
+    """Every inflected form pymorphy3 generates for ``words`` (plus the words)."""
+    analyzer = adapter._get_analyzer(lang)
+    forms: Set[str] = set()
+    for word in words:
+        forms.add(word)
+        if analyzer is None:
+            continue
+        parses = analyzer.parse(word)
+        named = [p for p in parses if any(g in p.tag for g in _NAME_GRAMMEMES)]
+        for parse in named or parses[:1]:
+            forms.update(form.word for form in parse.lexeme)
+    return forms
+
+
+def _case_variants(form: str) -> Tuple[str, ...]:
+    title = "-".join(part.capitalize() for part in form.split("-"))
+    return tuple(dict.fromkeys((title, form, form.upper())))
+
+
+def build_morphology_table(
+    adapter: "MorphologyAdapter",
+    output_path: str,
+    words: Iterable[str],
+    langs: Iterable[str] = LANGS,
+) -> Dict[str, Any]:
+    """
+    Precompute adapter results for all forms of ``words`` and write the table.
+
+    ``adapter`` must not serve from a table itself (``use_morph_table=False``)
+    so that every entry comes from the live pipeline.
+    """
+    from ....utils.feature_flags import FeatureFlags
+
+    flags = FeatureFlags(**TABLE_FLAGS)
+    start = time.time()
+    words = sorted(set(words))
+    entries: List[Tuple[bytes, bytes]] = []
+    forms_per_lang: Dict[str, int] = {}
+
+    for lang in langs:
+        forms = expand_forms(adapter, words, lang)
+        forms_per_lang[lang] = len(forms)
+        for form in sorted(forms):
+            for token in _case_variants(unicodedata.normalize("NFC", form)):
+                gender = adapter._detect_gender_uncached(token, lang)
+                for role in ROLES:
+                    nominative, trace_note = adapter._to_nominative_uncached_with_flags(
+                        token, lang, flags, role
+                    )
+                    value = _SEP.join((nominative, gender, trace_note))
+                    entries.append((_key(token, lang, role), value.encode("utf-8")))
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        "kind": TABLE_KIND,
+        "fingerprint": analyzer_fingerprint(adapter._analyzers),
+        "flags": TABLE_FLAGS,
+        "roles": list(ROLES),
+        "words": len(words),
+        "forms": forms_per_lang,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    count = write_hash_table(str(output_path), entries, meta)
+    stats = {
+        "entries": count,
+        "words": len(words),
+        "forms": forms_per_lang,
+        "bytes": os.path.getsize(output_path),
+        "took_s": round(time.time() - start, 2),
+    }
+    logger.info(f"Morphology table written to {output_path}: {json.dumps(stats)}")
+    return stats
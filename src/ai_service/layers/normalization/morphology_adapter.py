@@ -12,9 +12,10 @@ import unicodedata
 from dataclasses import dataclass
 from functools import lru_cache
 from ...utils.memory_aware_cache import memory_aware_lru_cache
-from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, Any, TYPE_CHECKING
 
 from ...utils.logging_config import get_logger
+from .morphology.morph_table import MorphologyTable
 
 if TYPE_CHECKING:
     from ...utils.lru_cache_ttl import LruTtlCache
@@ -45,13 +46,22 @@ class MorphologyAdapter:
     - Graceful degradation when pymorphy3 is unavailable
     """
 
-    def __init__(self, cache_size: int = 100000, cache: Optional[LruTtlCache] = None):
+    def __init__(
+        self,
+        cache_size: int = 100000,
+        cache: Optional[LruTtlCache] = None,
+        morph_table_path: Optional[str] = None,
+        use_morph_table: bool = True,
+    ):
         """
         Initialize morphology adapter.
         
         Args:
             cache_size: Maximum number of cached parse results
             cache: Optional external cache instance
+            morph_table_path: Precompiled lookup table (default: $MORPH_TABLE_PATH
+                or data/morphology/morph_table.bin, if present)
+            use_morph_table: Set False to always run the live pipeline
         """
         self._logger = get_logger(__name__)
         self._cache_size = cache_size
@@ -65,6 +75,14 @@ class MorphologyAdapter:
         
         # Initialize analyzers
         self._initialize_analyzers()
+
+        # Precompiled (token, lang, role) table; pymorphy3 only runs on misses
+        self._morph_table: Optional[MorphologyTable] = None
+        if use_morph_table:
+            self._morph_table = MorphologyTable.load(morph_table_path, self._analyzers)
+        self._table_hits = 0
+        self._table_misses = 0
+        self._to_nominative_cached_with_flags: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
         
         # Create memory-aware cached methods with pressure handling
         self._parse_cached = memory_aware_lru_cache(maxsize=cache_size)(self._parse_uncached)
@@ -120,7 +138,102 @@ class MorphologyAdapter:
         """
         if not token or not token.strip() or lang not in {"ru", "uk"}:
             return token, "morph.nominal_noop"
-        
+
+        table = self._morph_table
+        if table is not None and not table.applies_to(flags):
+            table = None
+        result, _ = self._resolve_nominative(token, lang, flags, role, table)
+        return result
+
+    def to_nominative_batch(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        lang: str,
+        flags: 'FeatureFlags',
+    ) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
+        """
+        Convert many (token, role) pairs to nominative in one call.
+
+        Pairs may come from one or several requests of the same language.
+        Duplicates are resolved once; table and cache hits are answered
+        without touching pymorphy3, which only runs for the misses. Results
+        are identical to calling to_nominative_cached on each pair in order.
+
+        Args:
+            pairs: (token, role) pairs
+            lang: Language code ('ru' or 'uk')
+            flags: Feature flags object
+
+        Returns:
+            Tuple of (list of (nominative_form, trace_note) aligned with
+            ``pairs``, batch stats with total/unique/cache_hits/cache_misses)
+        """
+        stats = {"total": len(pairs), "unique": 0, "cache_hits": 0, "cache_misses": 0}
+        if lang not in {"ru", "uk"}:
+            return [(token, "morph.nominal_noop") for token, _ in pairs], stats
+
+        table = self._morph_table
+        if table is not None and not table.applies_to(flags):
+            table = None
+
+        resolved: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for pair in pairs:
+            if pair in resolved:
+                continue
+            token, role = pair
+            if not token or not token.strip():
+                resolved[pair] = (token, "morph.nominal_noop")
+                continue
+            resolved[pair], hit = self._resolve_nominative(token, lang, flags, role, table)
+            stats["cache_hits" if hit else "cache_misses"] += 1
+
+        stats["unique"] = len(resolved)
+        return [resolved[pair] for pair in pairs], stats
+
+    def lookup_known_form(
+        self,
+        token: str,
+        lang: str,
+        role: str,
+        flags: 'FeatureFlags',
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Look a token up in the precompiled table only.
+
+        Args:
+            token: Token to look up
+            lang: Language code ('ru' or 'uk')
+            role: Token role (given, surname or patronymic)
+            flags: Feature flags object
+
+        Returns:
+            (nominative_form, gender), or None if there is no table, the
+            table does not apply to ``flags`` or the token is not in it
+        """
+        table = self._morph_table
+        if table is None or not table.applies_to(flags):
+            return None
+        hit = table.lookup(unicodedata.normalize("NFC", token), lang, role)
+        if hit is None:
+            return None
+        return hit[0], hit[1]
+
+    def _resolve_nominative(
+        self,
+        token: str,
+        lang: str,
+        flags: 'FeatureFlags',
+        role: str,
+        table: Optional[MorphologyTable],
+    ) -> Tuple[Tuple[str, str], bool]:
+        """Table -> flags cache -> live pipeline; returns (result, was_hit)."""
+        if table is not None:
+            hit = table.lookup(unicodedata.normalize("NFC", token), lang, role)
+            if hit is not None:
+                self._table_hits += 1
+                return (hit[0], hit[2]), True
+            self._table_misses += 1
+
         # Create cache key with flags
         cache_key = (
             lang, 
@@ -130,31 +243,24 @@ class MorphologyAdapter:
         )
 
         # Check cache first
-        if hasattr(self, '_to_nominative_cached_with_flags'):
-            cached_result = self._to_nominative_cached_with_flags.get(cache_key)
-            if cached_result is not None:
-                return cached_result
+        cached_result = self._to_nominative_cached_with_flags.get(cache_key)
+        if cached_result is not None:
+            return cached_result, True
 
         # Process token
         normalized = unicodedata.normalize("NFC", token)
-        result, trace_note = self._to_nominative_uncached_with_flags(
-            normalized, lang, flags, role
-        )
-        
-        # Cache result
-        if not hasattr(self, '_to_nominative_cached_with_flags'):
-            self._to_nominative_cached_with_flags = {}
-        self._to_nominative_cached_with_flags[cache_key] = (result, trace_note)
-        
-        return result, trace_note
+        result = self._to_nominative_uncached_with_flags(normalized, lang, flags, role)
+        self._to_nominative_cached_with_flags[cache_key] = result
+        return result, False
 
-    def detect_gender(self, token: str, lang: str) -> str:
+    def detect_gender(self, token: str, lang: str, role: str = "given") -> str:
         """
         Detect grammatical gender of token.
         
         Args:
             token: Token to analyze
             lang: Language code ('ru' or 'uk')
+            role: Token role, selects the precompiled table entry
             
         Returns:
             Gender: 'masc', 'femn', or 'unknown'
@@ -163,6 +269,10 @@ class MorphologyAdapter:
             return "unknown"
             
         normalized = unicodedata.normalize("NFC", token)
+        if self._morph_table is not None:
+            gender = self._morph_table.gender(normalized, lang, role)
+            if gender is not None:
+                return gender
         return self._detect_gender_cached(normalized, lang)
 
     def apply_yo_strategy(self, token: str, strategy: str) -> Tuple[str, List[Dict[str, Any]]]:
@@ -470,6 +580,9 @@ class MorphologyAdapter:
             "parse_cache_misses": getattr(parse_info, 'misses', parse_info.get('misses', 0) if isinstance(parse_info, dict) else 0),
             "nominative_cache_size": getattr(nominative_info, 'currsize', nominative_info.get('currsize', 0) if isinstance(nominative_info, dict) else 0),
             "gender_cache_size": getattr(gender_info, 'currsize', gender_info.get('currsize', 0) if isinstance(gender_info, dict) else 0),
+            "morph_table_size": len(self._morph_table) if self._morph_table is not None else 0,
+            "morph_table_hits": self._table_hits,
+            "morph_table_misses": self._table_misses,
         }
     
     def get_stats(self) -> Dict[str, int]:
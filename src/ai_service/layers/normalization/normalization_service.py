@@ -10,7 +10,6 @@ by the NormalizationFactory and its processors.
 import json
 import time
 import unicodedata
-from pathlib import Path
 from typing import Dict, Optional, Set, List, Tuple
 
 from ...config import LANGUAGE_CONFIG
@@ -21,24 +20,17 @@ from ...data.patterns.identifiers import (
 )
 from ...utils.logging_config import get_logger
 from ...utils.feature_flags import get_feature_flag_manager, FeatureFlags
+from ...utils.text_profile import get_text_profile
 from ..language.language_detection_service import LanguageDetectionService
 from ..unicode.unicode_service import UnicodeService
 from .morphology.gender_rules import prefer_feminine_form
 from .morphology_adapter import MorphologyAdapter, get_global_adapter
 from .processors.normalization_factory import NormalizationFactory, NormalizationConfig
+from .lexicon_bundle import get_lexicon_bundle
 from .lexicon_loader import get_lexicons
 from .role_tagger import RoleTagger, TokenRole
 from .homoglyph_detector import HomoglyphDetector
 
-# Check for optional dependencies
-try:
-    from ...data.dicts import russian_names, ukrainian_names
-    DICTIONARIES_AVAILABLE = True
-except ImportError:  # pragma: no cover - optional heavy dependency
-    DICTIONARIES_AVAILABLE = False
-    russian_names = None  # type: ignore
-    ukrainian_names = None  # type: ignore
-
 
 class NormalizationService:
     """
@@ -108,6 +100,9 @@ class NormalizationService:
 
     def _has_mixed_scripts(self, text: str) -> bool:
         """Check if text contains both Latin and Cyrillic characters."""
+        profile = get_text_profile(text)
+        if profile is not None:
+            return profile.latin > 0 and profile.has_cyrillic_block
         has_latin = any('A' <= c <= 'Z' or 'a' <= c <= 'z' for c in text)
         has_cyrillic = any('\u0400' <= c <= '\u04FF' or c in 'ЁёІіЇїЄєҐґ' for c in text)
         return has_latin and has_cyrillic
@@ -786,92 +781,27 @@ class NormalizationService:
     def _load_name_dictionaries(self) -> Dict[str, Set[str]]:
         """Load name dictionaries for processors."""
         dictionaries = {}
-
-        if DICTIONARIES_AVAILABLE:
-            try:
-                # Load Russian names
-                if hasattr(russian_names, 'RUSSIAN_NAMES'):
-                    # Extract given names from RUSSIAN_NAMES
-                    given_names = set()
-                    surnames = set()
-                    diminutives = set()
-                    
-                    for name, props in russian_names.RUSSIAN_NAMES.items():
-                        given_names.add(name)
-                        if 'variants' in props:
-                            given_names.update(props['variants'])
-                        if 'diminutives' in props:
-                            diminutives.update(props['diminutives'])
-                        if 'declensions' in props:
-                            given_names.update(props['declensions'])
-                    
-                    dictionaries['given_names_ru'] = given_names
-                    dictionaries['diminutives_ru'] = diminutives
-                    dictionaries['surnames_ru'] = surnames
-
-                # Load Ukrainian names
-                if hasattr(ukrainian_names, 'UKRAINIAN_NAMES'):
-                    # Extract given names from UKRAINIAN_NAMES
-                    given_names = set()
-                    surnames = set()
-                    diminutives = set()
-                    
-                    for name, props in ukrainian_names.UKRAINIAN_NAMES.items():
-                        given_names.add(name)
-                        if 'variants' in props:
-                            given_names.update(props['variants'])
-                        if 'diminutives' in props:
-                            diminutives.update(props['diminutives'])
-                        if 'declensions' in props:
-                            given_names.update(props['declensions'])
-                    
-                    dictionaries['given_names_uk'] = given_names
-                    dictionaries['diminutives_uk'] = diminutives
-                    dictionaries['surnames_uk'] = surnames
-
-                self.logger.info(f"Loaded {len(dictionaries)} name dictionaries")
-            except Exception as e:
-                self.logger.warning(f"Failed to load name dictionaries: {e}")
-
-        return dictionaries
-
-    def _load_diminutive_maps(self) -> Dict[str, Dict[str, str]]:
-        """Load diminutive to full name mappings from JSON dictionaries."""
-        maps: Dict[str, Dict[str, str]] = {}
-
-        base_path = Path(__file__).resolve().parents[4]
-        data_dir = base_path / "data"
+        bundle = get_lexicon_bundle()
 
         for lang in ("ru", "uk"):
-            path = data_dir / f"diminutives_{lang}.json"
-            if not path.exists():
-                self.logger.warning("Diminutive dictionary missing for %s: %s", lang, path)
+            given_names = bundle.get_set(f"given_names:{lang}")
+            if not given_names:
                 continue
+            dictionaries[f'given_names_{lang}'] = given_names
+            dictionaries[f'diminutives_{lang}'] = bundle.get_set(f"name_diminutives:{lang}")
+            dictionaries[f'surnames_{lang}'] = set()
 
-            try:
-                with path.open("r", encoding="utf-8") as handle:
-                    raw = json.load(handle)
-                maps[lang] = {
-                    unicodedata.normalize("NFC", key).lower(): unicodedata.normalize("NFC", value).lower()
-                    for key, value in raw.items()
-                }
-            except json.JSONDecodeError as exc:
-                self.logger.error("Invalid JSON in diminutive dictionary %s: %s", lang, exc)
-            except Exception as exc:  # pragma: no cover - IO errors logged
-                self.logger.error("Failed to load diminutive dictionary %s: %s", lang, exc)
+        self.logger.info(f"Loaded {len(dictionaries)} name dictionaries")
+        return dictionaries
 
-        # Preserve English nicknames behaviour if available
-        if DICTIONARIES_AVAILABLE:
-            try:
-                from ...data.dicts.english_names import NICKNAMES_EN
-                maps['en'] = {
-                    unicodedata.normalize("NFC", key).lower(): unicodedata.normalize("NFC", value).lower()
-                    for key, value in NICKNAMES_EN.items()
-                }
-            except ImportError:
-                pass
-            except Exception as exc:
-                self.logger.warning("Failed to load English nicknames: %s", exc)
+    def _load_diminutive_maps(self) -> Dict[str, Dict[str, str]]:
+        """Load diminutive to full name mappings from the lexicon bundle."""
+        bundle = get_lexicon_bundle()
+        maps = {
+            lang: bundle.get_map(namespace)
+            for lang, namespace in (("ru", "diminutives:ru"), ("uk", "diminutives:uk"), ("en", "nicknames:en"))
+            if bundle.get_map(namespace)
+        }
 
         self.logger.info(f"Loaded diminutive maps for {len(maps)} languages")
         return maps
@@ -926,7 +856,7 @@ class NormalizationService:
         language: Optional[str],
     ) -> NormalizationResult:
         """Apply language-specific character conversion (e.g., Russian to Ukrainian)."""
-        if not language or not DICTIONARIES_AVAILABLE:
+        if not language:
             return result
 
         lang = language.lower()
@@ -934,20 +864,8 @@ class NormalizationService:
         # For Ukrainian language, convert Russian variants to Ukrainian canonical forms
         if lang == "uk":
             try:
-                from ...data.dicts.ukrainian_names import UKRAINIAN_NAMES
-
-                # Build reverse mapping: Russian variant -> Ukrainian canonical
-                # Only map variants that contain distinctly Russian characters
-                russian_to_ukrainian = {}
-                for ukrainian_name, props in UKRAINIAN_NAMES.items():
-                    if 'variants' in props:
-                        for variant in props['variants']:
-                            # Only map if variant contains Russian-specific characters
-                            # and is not already a valid Ukrainian name itself
-                            has_russian_chars = 'И' in variant or 'Ы' in variant or 'Э' in variant or 'Ё' in variant
-                            is_not_ukrainian_canonical = variant not in UKRAINIAN_NAMES
-                            if has_russian_chars or is_not_ukrainian_canonical:
-                                russian_to_ukrainian[variant] = ukrainian_name
+                # Russian variant -> Ukrainian canonical, precompiled in the bundle
+                russian_to_ukrainian = get_lexicon_bundle().get_map("ru_to_uk_names")
 
                 # Convert normalized text
                 if result.normalized:
@@ -967,8 +885,6 @@ class NormalizationService:
                         converted_tokens.append(converted_token)
                     result.tokens = converted_tokens
 
-            except ImportError:
-                pass
             except Exception as e:
                 # Log but don't fail
                 self.logger.warning(f"Failed to apply Russian-to-Ukrainian conversion: {e}")
@@ -0,0 +1,159 @@
+"""
+Fast path for names that are already in canonical form.
+
+Many screening inputs are clean "Surname Given Patronymic" strings in
+nominative case. For those the full factory pipeline (tokenizer, role
+classifier, FSM tagger, morphology, diminutives, gender) returns the input
+unchanged. :class:`CanonicalFastPath` recognizes such inputs from the
+precompiled morphology table (``morphology.morph_table``) and the name
+lexicons, so the factory can build the ``NormalizationResult`` directly.
+
+A token is canonical when it is title-cased, is not a diminutive and its
+table nominative for the assigned role is the token itself. Anything else
+(punctuation, initials, inflected forms, 'ё', out-of-vocabulary tokens) is a
+miss and takes the full pipeline.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
+
+from ....utils.ascii_utils import _get_common_surnames
+from ....utils.logging_config import get_logger
+from ..lexicon_bundle import get_lexicon_bundle
+from ..morphology_adapter import MorphologyAdapter
+
+logger = get_logger(__name__)
+
+# Title-case words, optionally hyphenated; no 'ё' (subject to yo_strategy)
+_CYRILLIC_TOKEN_RE = re.compile(r"^[А-ЯІЇЄҐ][а-яіїєґ'’]+(?:-[А-ЯІЇЄҐ][а-яіїєґ'’]+)?$")
+_LATIN_TOKEN_RE = re.compile(r"^[A-Z][a-z]+$")
+_PATRONYMIC_SUFFIXES = ("ич", "овна", "евна", "ична", "івна", "ївна")
+
+MIN_TOKENS = 2
+MAX_TOKENS = 3
+
+# Result fields that must agree between the fast path and the full pipeline
+PARITY_FIELDS = ("normalized", "tokens", "persons_core", "person_gender")
+
+
+def compare_results(fast: Any, full: Any) -> List[str]:
+    """Names of ``PARITY_FIELDS`` on which two NormalizationResults differ."""
+    return [
+        field
+        for field in PARITY_FIELDS
+        if getattr(fast, field, None) != getattr(full, field, None)
+    ]
+
+
+class CanonicalFastPath:
+    """Recognizes inputs whose tokens are all known canonical name forms."""
+
+    def __init__(
+        self,
+        morphology_adapter: MorphologyAdapter,
+        latin_surnames: Optional[Set[str]] = None,
+    ) -> None:
+        self.morphology_adapter = morphology_adapter
+        # Keys of the *_NAMES lexicons, served by the shared bundle
+        bundle = get_lexicon_bundle()
+        self._given_names: Dict[str, AbstractSet[str]] = {
+            lang: bundle.get_set(f"names:{lang}") for lang in ("ru", "uk", "en")
+        }
+        # Lower-case; the ASCII fast path list plus any configured EN surnames
+        self._latin_surnames = set(_get_common_surnames("en")) | {
+            s.lower() for s in (latin_surnames or ())
+        }
+
+    def match(
+        self,
+        text: str,
+        language: str,
+        flags: Any,
+        diminutives: Dict[str, str],
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Classify ``text`` if every token is a known canonical form.
+
+        Args:
+            text: Input text
+            language: Request language ('ru', 'uk' or 'en')
+            flags: Effective feature flags
+            diminutives: Lower-case diminutive -> full name map for ``language``
+
+        Returns:
+            (tokens, roles), or None if the full pipeline is needed
+        """
+        tokens = text.split()
+        if not MIN_TOKENS <= len(tokens) <= MAX_TOKENS:
+            return None
+        for token in tokens:
+            canonical = diminutives.get(token.lower())
+            if canonical is not None and canonical != token.lower():
+                return None
+
+        if language in ("ru", "uk"):
+            roles = self._match_cyrillic(tokens, language, flags)
+        elif language == "en":
+            roles = self._match_latin(tokens)
+        else:
+            roles = None
+        if roles is None:
+            return None
+        return tokens, roles
+
+    def _match_cyrillic(
+        self, tokens: List[str], language: str, flags: Any
+    ) -> Optional[List[str]]:
+        given_names = self._given_names[language]
+        roles: List[str] = []
+        genders: Dict[str, str] = {}
+        for token in tokens:
+            if not _CYRILLIC_TOKEN_RE.match(token):
+                return None
+            if token in given_names:
+                role = "given"
+            elif (
+                roles
+                and roles[-1] == "given"
+                and token.lower().endswith(_PATRONYMIC_SUFFIXES)
+            ):
+                role = "patronymic"
+            else:
+                role = "surname"
+            if role in genders:
+                return None
+
+            hit = self.morphology_adapter.lookup_known_form(
+                token, language, role, flags
+            )
+            if hit is None or hit[0] != token:
+                return None
+            roles.append(role)
+            genders[role] = hit[1]
+
+        if "given" not in genders:
+            return None
+        # Surname of the other gender would be adjusted by the gender step
+        given_gender = genders["given"]
+        if given_gender in ("masc", "femn") and genders.get(
+            "surname", given_gender
+        ) not in (given_gender, "unknown"):
+            return None
+        return roles
+
+    def _match_latin(self, tokens: List[str]) -> Optional[List[str]]:
+        if len(tokens) != 2 or not all(
+            _LATIN_TOKEN_RE.match(token) for token in tokens
+        ):
+            return None
+        given, surname = tokens
+        if given not in self._given_names["en"]:
+            return None
+        if (
+            surname in self._given_names["en"]
+            or surname.lower() not in self._latin_surnames
+        ):
+            return None
+        return ["given", "surname"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
+from ....utils.allocation_tracker import register_cache
 from ....utils.logging_config import get_logger
 from ....utils.profiling import profile_function, profile_time
 from ..morphology.gender_rules import (
@@ -25,6 +26,7 @@ class MorphologyProcessor:
         self.dim2full_maps = diminutive_maps or {}
         self._analyzers: Dict[str, object] = {}
         self._cache: Dict[Tuple[str, str, PersonalRole], Tuple[str, bool, List[str]]] = {}
+        register_cache("normalization.morphology_processor", self, "_cache")
         self._initialise_analyzers()
 
     def _initialise_analyzers(self) -> None:
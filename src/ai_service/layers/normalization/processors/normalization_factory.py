@@ -9,9 +9,11 @@ import unicodedata
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple, Any, Literal
 from dataclasses import dataclass
+from ....utils.allocation_tracker import register_cache
 from ....utils.logging_config import get_logger
 from ....utils.perf_timer import PerfTimer
-from ....utils.feature_flags import get_feature_flag_manager, FeatureFlags
+from ....utils.feature_flags import get_feature_flag_manager, get_trace_level, FeatureFlags, TraceLevel
+from ....utils.trace import DeferredTraceList
 from ....utils.profiling import profile_function, profile_time, get_profiling_stats, print_profiling_report
 from ....utils.lru_cache_ttl import CacheManager, create_flags_hash
 from ..tokenizer_service import TokenizerService, CachedTokenizerService
@@ -24,10 +26,12 @@ from .token_processor import TokenProcessor
 from .role_classifier import RoleClassifier
 from .morphology_processor import MorphologyProcessor
 from .gender_processor import GenderProcessor
+from .canonical_fastpath import CanonicalFastPath, compare_results
 from ..token_ops import collapse_double_dots, collapse_double_dots_token, normalize_hyphenated_name, normalize_apostrophe_name, is_hyphenated_surname
 from ..morphology.diminutive_resolver import DiminutiveResolver
 from ..role_tagger import RoleTagger
 from ..role_tagger_service import RoleTaggerService
+from ..lexicon_bundle import get_lexicon_bundle
 from ..lexicon_loader import get_lexicons
 
 
@@ -153,6 +157,7 @@ class NormalizationConfig:
     # Caching flags
     enable_cache: bool = True  # Enable caching
     debug_tracing: bool = False  # Enable debug tracing with cache info
+    trace_level: str = "full"  # off | summary | full; set per request from feature flags
 
 
 class NormalizationFactory(ErrorReportingMixin):
@@ -189,7 +194,16 @@ class NormalizationFactory(ErrorReportingMixin):
         self.role_classifier = RoleClassifier(name_dictionaries, diminutive_maps)
         self.morphology_processor = MorphologyProcessor(diminutive_maps)
         self.gender_processor = GenderProcessor()
-        self.diminutive_resolver = DiminutiveResolver(Path(__file__).resolve().parents[5])
+        lexicon_bundle = get_lexicon_bundle()
+        self.diminutive_resolver = DiminutiveResolver(
+            Path(__file__).resolve().parents[5],
+            maps={lang: lexicon_bundle.get_map(f"diminutives:{lang}") for lang in ("ru", "uk")},
+        )
+        self.canonical_fastpath = CanonicalFastPath(
+            self.morphology_adapter,
+            latin_surnames=self.role_classifier.surnames.get("en"),
+        )
+        self._canonical_fastpath_stats = {"attempts": 0, "hits": 0, "parity_checks": 0, "parity_mismatches": 0}
 
         # Initialize role taggers with unified lexicon and AC acceleration
         self.lexicons = get_lexicons()
@@ -223,6 +237,9 @@ class NormalizationFactory(ErrorReportingMixin):
 
         # Cache for performance
         self._normalization_cache = {}
+        register_cache("normalization.results", self, "_normalization_cache")
+        register_cache("normalization.tokenizer", self.cache_manager.get_tokenizer_cache())
+        register_cache("normalization.morphology", self.cache_manager.get_morphology_cache())
 
         self.logger.info("NormalizationFactory initialized with all processors")
 
@@ -243,6 +260,9 @@ class NormalizationFactory(ErrorReportingMixin):
                     from ....utils.flag_propagation import create_flag_context, propagate_flags_to_layer
                     flag_context = create_flag_context(feature_flags, "normalization", config.debug_tracing)
                     config = propagate_flags_to_layer(flag_context, "normalization", config)
+
+                # Trace strings and token notes are only built for full traces
+                config.trace_level = TraceLevel.FULL.value if config.debug_tracing else get_trace_level(effective_flags).value
                 
                 # Check for ASCII fastpath
                 if config.enable_ascii_fastpath and self._is_ascii_fastpath_eligible(text, config):
@@ -250,7 +270,17 @@ class NormalizationFactory(ErrorReportingMixin):
                     result.processing_time = timer.elapsed
                     result.success = len(result.errors or []) == 0
                     return result
-                
+
+                # Check for canonical-name fastpath
+                if getattr(effective_flags, 'enable_canonical_fastpath', False):
+                    result = await self._canonical_fastpath_normalize(text, config, effective_flags)
+                    if result is not None:
+                        if getattr(effective_flags, 'canonical_fastpath_parity', False):
+                            result = await self._check_canonical_fastpath_parity(text, config, effective_flags, result)
+                        result.processing_time = timer.elapsed
+                        result.success = len(result.errors or []) == 0
+                        return result
+
                 result = await self._normalize_with_error_handling(text, config, effective_flags)
                 result.processing_time = timer.elapsed
                 result.success = len(result.errors or []) == 0
@@ -268,6 +298,7 @@ class NormalizationFactory(ErrorReportingMixin):
         """Core normalization logic with comprehensive error handling."""
 
         errors: List[str] = []
+        full_trace = config.trace_level == TraceLevel.FULL
 
         # Apply English name filter preprocessing if language is English
         processed_text = text
@@ -385,12 +416,11 @@ class NormalizationFactory(ErrorReportingMixin):
                     self.role_tagger_service = RoleTaggerService(role_classifier=self.role_classifier)
                 
                 role_tags = self.role_tagger_service.tag(tokens, config.language)
-                role_tagger_traces = self._create_fsm_role_tagger_traces(role_tags, tokens)
-                self.logger.debug(f"FSM role tagger classified: {[(tag.role.value, tag.reason) for tag in role_tags]}")
+                role_tagger_traces = self._create_fsm_role_tagger_traces(role_tags, tokens) if full_trace else []
 
                 # Extract organization spans for later use
                 org_spans = self._extract_organization_spans_from_fsm_tags(role_tags)
-                if org_spans:
+                if org_spans and full_trace:
                     for span in org_spans:
                         role_tagger_traces.append(f"FSM role tagger: organization span '{' '.join(span)}'")
 
@@ -535,19 +565,20 @@ class NormalizationFactory(ErrorReportingMixin):
         processing_traces: List[str] = []
         cache_info = None
         
-        # Always include improvement traces for collapse_double_dots rule
-        processing_traces = (
-            [str(trace) for trace in improvement_traces_pre]
-            + [str(trace) for trace in yo_traces]
-            + [str(trace) for trace in role_tagger_traces]
-            + filter_traces
-            + diminutive_traces
-            + role_traces
-            + morph_traces
-            + post_morph_diminutive_traces  # Add post-morphology diminutive traces
-            + gender_traces
-            + [str(trace) for trace in improvement_traces_post]
-        )
+        # Trace strings feed TokenTrace.notes; only materialized for full traces
+        if full_trace:
+            processing_traces = (
+                [str(trace) for trace in improvement_traces_pre]
+                + [str(trace) for trace in yo_traces]
+                + [str(trace) for trace in role_tagger_traces]
+                + filter_traces
+                + diminutive_traces
+                + role_traces
+                + morph_traces
+                + post_morph_diminutive_traces  # Add post-morphology diminutive traces
+                + gender_traces
+                + [str(trace) for trace in improvement_traces_post]
+            )
         
         if config.debug_tracing:
             # Add FSM role traces to the trace
@@ -1538,20 +1569,10 @@ class NormalizationFactory(ErrorReportingMixin):
     def _load_english_lexicons(self) -> None:
         """Load English lexicon files."""
         try:
-            # Load English titles
-            titles_path = Path(__file__).resolve().parents[5] / "data" / "lexicons" / "en_titles.txt"
-            with open(titles_path, 'r', encoding='utf-8') as f:
-                self._en_titles = {line.strip() for line in f if line.strip()}
-            
-            # Load English suffixes
-            suffixes_path = Path(__file__).resolve().parents[5] / "data" / "lexicons" / "en_suffixes.txt"
-            with open(suffixes_path, 'r', encoding='utf-8') as f:
-                self._en_suffixes = {line.strip() for line in f if line.strip()}
-            
-            # Load English nicknames
-            nicknames_path = Path(__file__).resolve().parents[5] / "data" / "lexicons" / "en_nicknames.json"
-            with open(nicknames_path, 'r', encoding='utf-8') as f:
-                self._en_nicknames = json.load(f)
+            bundle = get_lexicon_bundle()
+            self._en_titles = bundle.get_set("en_titles")
+            self._en_suffixes = bundle.get_set("en_suffixes")
+            self._en_nicknames = bundle.get_map("diminutives:en")
             
             self.logger.info(f"Loaded English lexicons: titles={len(self._en_titles)}, suffixes={len(self._en_suffixes)}, nicknames={len(self._en_nicknames)}")
             
@@ -1611,11 +1632,42 @@ class NormalizationFactory(ErrorReportingMixin):
                 return await self._normalize_english_morphology(tokens, roles, config)
 
         normalized_tokens = []
-        traces = []
+        traces = DeferredTraceList(config.trace_level == TraceLevel.FULL)
         cache_info = {}  # Track cache hits/misses for debug tracing
 
         skip_set: Set[int] = skip_indices or set()
 
+        # Resolve all morphology tokens of the request in one adapter call:
+        # duplicates once, cache/table hits in bulk, metrics once per batch
+        morph_roles = {'given', 'surname', 'patronymic', 'initial'}
+        batch_results: Dict[int, Tuple[str, str]] = {}
+        feature_flags = None
+        if config.enable_cache:
+            if effective_flags is not None:
+                feature_flags = FeatureFlags(
+                    enforce_nominative=getattr(effective_flags, 'enforce_nominative', True),
+                    preserve_feminine_surnames=getattr(effective_flags, 'preserve_feminine_surnames', True),
+                    morphology_custom_rules_first=getattr(effective_flags, 'morphology_custom_rules_first', True)
+                )
+            else:
+                feature_flags = FeatureFlags()
+
+            morph_indices = [i for i, role in enumerate(roles) if role in morph_roles]
+            if morph_indices:
+                try:
+                    results, batch_stats = self.morphology_adapter.to_nominative_batch(
+                        [(tokens[i], roles[i]) for i in morph_indices],
+                        config.language,
+                        feature_flags,
+                    )
+                    batch_results = dict(zip(morph_indices, results))
+                    self.metrics_collector.collect_morphology_metrics(
+                        config.language,
+                        {**self.morphology_adapter.get_stats(), **batch_stats}
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Batch morphology failed, falling back to per-token: {e}")
+
         for index, (token, role) in enumerate(zip(tokens, roles)):
             try:
                 # Only skip morphology for tokens that were successfully resolved as diminutives
@@ -1623,50 +1675,33 @@ class NormalizationFactory(ErrorReportingMixin):
                 # So we should NOT skip morphology for these - they need morphological processing
                 # The skip logic here is incorrect and breaks morphology for normal declensions
                 
-                if role in {'given', 'surname', 'patronymic', 'initial'}:
+                if role in morph_roles:
                     if config.enable_cache:
-                        # Use cached morphology adapter with new to_nominative_cached method
-                        # Create feature flags object
-                        if effective_flags is not None:
-                            feature_flags = FeatureFlags(
-                                enforce_nominative=getattr(effective_flags, 'enforce_nominative', True),
-                                preserve_feminine_surnames=getattr(effective_flags, 'preserve_feminine_surnames', True),
-                                morphology_custom_rules_first=getattr(effective_flags, 'morphology_custom_rules_first', True)
-                            )
+                        if index in batch_results:
+                            normalized, trace_note = batch_results[index]
                         else:
-                            # Use default feature flags
-                            feature_flags = FeatureFlags()
-                        
-                        # Use the new to_nominative_cached method
-                        print(f"DEBUG: Processing token '{token}' with role '{role}' and flags morphology_custom_rules_first={feature_flags.morphology_custom_rules_first}")
-                        normalized, trace_note = self.morphology_adapter.to_nominative_cached(
-                            token,
-                            config.language,
-                            feature_flags,
-                            role
-                        )
-                        print(f"DEBUG: Result: '{token}' -> '{normalized}' (trace: {trace_note})")
+                            normalized, trace_note = self.morphology_adapter.to_nominative_cached(
+                                token,
+                                config.language,
+                                feature_flags,
+                                role
+                            )
                         
                         # Record cache info for debug tracing
-                        cache_info[token] = {
-                            'morph': 'hit'  # Assume hit since we're using cached method
-                        }
-                        
-                        # Record metrics
-                        self.metrics_collector.collect_morphology_metrics(
-                            config.language,
-                            self.morphology_adapter.get_stats()
-                        )
+                        if config.debug_tracing:
+                            cache_info[token] = {
+                                'morph': 'hit'  # Assume hit since we're using cached method
+                            }
                         
                         # Add trace based on trace_note
                         if trace_note == "morph.to_nominative":
-                            traces.append(f"Morphology normalization: '{token}' -> '{normalized}'")
+                            traces.add("Morphology normalization: '{}' -> '{}'", token, normalized)
                         elif trace_note == "morph.preserve_feminine":
-                            traces.append(f"Preserved feminine surname: '{token}' -> '{normalized}'")
+                            traces.add("Preserved feminine surname: '{}' -> '{}'", token, normalized)
                         elif trace_note == "morph.nominal_noop":
-                            traces.append(f"No morphological change needed: '{token}'")
+                            traces.add("No morphological change needed: '{}'", token)
                         else:
-                            traces.append(f"Morphology processing: '{token}' -> '{normalized}' ({trace_note})")
+                            traces.add("Morphology processing: '{}' -> '{}' ({})", token, normalized, trace_note)
                     else:
                         # Use direct morphology processor
                         morph_result = self.morphology_processor.normalize_slavic_token(
@@ -1682,14 +1717,14 @@ class NormalizationFactory(ErrorReportingMixin):
                         normalized_tokens.append(normalized)
                     else:
                         normalized_tokens.append(token)
-                        traces.append(f"Morphological normalization returned None for '{token}'")
+                        traces.add("Morphological normalization returned None for '{}'", token)
                 else:
                     normalized_tokens.append(token)
-                    traces.append(f"No morphological processing for role '{role}'")
+                    traces.add("No morphological processing for role '{}'", role)
             except Exception as e:
                 self.logger.warning(f"Morphological normalization failed for '{token}': {e}")
                 normalized_tokens.append(token)
-                traces.append(f"Morphological normalization failed for '{token}': {e}")
+                traces.add("Morphological normalization failed for '{}': {}", token, e)
 
         # Store cache info for debug tracing
         if config.debug_tracing:
@@ -1717,7 +1752,7 @@ class NormalizationFactory(ErrorReportingMixin):
         if given_count > 1 or has_comma or unknown_count > 2:
             return tokens, ["Gender processing skipped: multiple persons detected"], {}
 
-        traces = []
+        traces = DeferredTraceList(config.trace_level == TraceLevel.FULL)
         gender_info = {}
 
         try:
@@ -1745,17 +1780,17 @@ class NormalizationFactory(ErrorReportingMixin):
                         traces.extend(adjust_traces)
 
                         if was_changed:
-                            traces.append(f"Surname gender adjusted: '{token}' -> '{adjusted}'")
+                            traces.add("Surname gender adjusted: '{}' -> '{}'", token, adjusted)
                     else:
                         adjusted_tokens.append(token)
 
                 return adjusted_tokens, traces, gender_info
             else:
-                traces.append(f"Gender confidence too low ({confidence:.2f}) for adjustment")
+                traces.add("Gender confidence too low ({:.2f}) for adjustment", confidence)
 
         except Exception as e:
             self.logger.warning(f"Gender processing failed: {e}")
-            traces.append(f"Gender processing failed: {e}")
+            traces.add("Gender processing failed: {}", e)
 
         return tokens, traces, gender_info
 
@@ -1810,8 +1845,8 @@ class NormalizationFactory(ErrorReportingMixin):
                 final = ""  # Empty output indicates filtered token
                 self.logger.warning(f"Token '{orig}' at index {i} was filtered out (final_tokens length: {len(final_tokens)})")
 
-            # Find relevant traces for this token
-            token_traces = [t for t in processing_traces if orig in t or str(i) in t]
+            # Find relevant traces for this token (none unless tracing is full)
+            token_traces = [t for t in processing_traces if orig in t or str(i) in t] if processing_traces else []
 
             # Create comprehensive rule description
             rule_parts = []
@@ -2077,8 +2112,13 @@ class NormalizationFactory(ErrorReportingMixin):
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get processing statistics."""
+        fastpath = self._canonical_fastpath_stats
         return {
             'cache_size': len(self._normalization_cache),
+            'canonical_fastpath': dict(
+                fastpath,
+                hit_rate=fastpath["hits"] / fastpath["attempts"] if fastpath["attempts"] else 0.0,
+            ),
             'processors': {
                 'token_processor': type(self.token_processor).__name__,
                 'role_classifier': type(self.role_classifier).__name__,
@@ -2214,31 +2254,12 @@ class NormalizationFactory(ErrorReportingMixin):
         return resolved_tokens, traces, unresolved_indices
 
     def _load_diminutives_dictionaries(self) -> None:
-        """Load diminutives dictionaries from data files."""
-        try:
-            # Load Russian diminutives
-            ru_path = Path(__file__).resolve().parents[5] / "data" / "diminutives_ru.json"
-            with open(ru_path, 'r', encoding='utf-8') as f:
-                self._diminutives_ru = json.load(f)
-            
-            # Load Ukrainian diminutives
-            uk_path = Path(__file__).resolve().parents[5] / "data" / "diminutives_uk.json"
-            with open(uk_path, 'r', encoding='utf-8') as f:
-                self._diminutives_uk = json.load(f)
-            
-            # Load English nicknames
-            en_path = Path(__file__).resolve().parents[5] / "data" / "lexicons" / "en_nicknames.json"
-            with open(en_path, 'r', encoding='utf-8') as f:
-                self._diminutives_en = json.load(f)
-                
-            self.logger.info(f"Loaded diminutives dictionaries: RU={len(self._diminutives_ru)} entries, UK={len(self._diminutives_uk)} entries, EN={len(self._diminutives_en)} entries")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to load diminutives dictionaries: {e}")
-            # Set empty dictionaries as fallback
-            self._diminutives_ru = {}
-            self._diminutives_uk = {}
-            self._diminutives_en = {}
+        """Load diminutives dictionaries from the shared lexicon bundle."""
+        bundle = get_lexicon_bundle()
+        self._diminutives_ru = bundle.get_map("diminutives:ru")
+        self._diminutives_uk = bundle.get_map("diminutives:uk")
+        self._diminutives_en = bundle.get_map("diminutives:en")
+        self.logger.info(f"Loaded diminutives dictionaries: RU={len(self._diminutives_ru)} entries, UK={len(self._diminutives_uk)} entries, EN={len(self._diminutives_en)} entries")
 
     def _create_role_tagger_traces(self, role_tags: List) -> List[str]:
         """Create traces for role tagger results."""
@@ -2538,3 +2559,119 @@ class NormalizationFactory(ErrorReportingMixin):
             self.logger.error(f"ASCII fastpath failed for '{text}': {e}")
             # Fall back to regular processing
             return await self._normalize_with_error_handling(text, config)
+
+    async def _canonical_fastpath_normalize(
+        self,
+        text: str,
+        config: NormalizationConfig,
+        effective_flags
+    ) -> Optional[NormalizationResult]:
+        """
+        Build the result directly when every token is a known canonical form.
+
+        Args:
+            text: Text to normalize
+            config: Normalization configuration
+            effective_flags: Feature flags for this request
+
+        Returns:
+            NormalizationResult, or None if the full pipeline is needed
+        """
+        if config.debug_tracing or config.language not in {"ru", "uk", "en"}:
+            return None
+
+        stats = self._canonical_fastpath_stats
+        stats["attempts"] += 1
+        if not hasattr(self, '_diminutives_ru'):
+            self._load_diminutives_dictionaries()
+        diminutives = {
+            "ru": self._diminutives_ru,
+            "uk": self._diminutives_uk,
+            "en": self._diminutives_en,
+        }[config.language]
+
+        match = self.canonical_fastpath.match(text, config.language, effective_flags, diminutives)
+        if match is not None:
+            tokens, roles = match
+            # Same gender step as the full pipeline; an adjusted surname is a miss
+            final_tokens, _, gender_info = await self._process_gender(list(tokens), roles, config)
+            if final_tokens != tokens:
+                match = None
+        if match is None:
+            self.cache_metrics.record_canonical_fastpath(config.language, "miss")
+            return None
+
+        stats["hits"] += 1
+        self.cache_metrics.record_canonical_fastpath(config.language, "hit")
+
+        flags = {'ner_disabled': True} if self.ner_disabled else None
+        trace = [
+            TokenTrace(
+                token=token,
+                role=role,
+                rule=f"canonical_fastpath:{role}",
+                morph_lang=_detect_token_language(token, config.language),
+                normal_form=None,
+                output=token,
+                fallback=True,
+                notes="known canonical form",
+                is_hyphenated_surname=is_hyphenated_surname(token),
+                flags=flags,
+            )
+            for token, role in zip(tokens, roles)
+        ]
+        person_tokens = self._filter_person_tokens(trace, config.preserve_names, roles, config.language)
+        normalized = " ".join(person_tokens)
+        persons = self._extract_persons(list(zip(tokens, roles)), tokens, roles, config.language)
+
+        result = NormalizationResult(
+            normalized=normalized,
+            tokens=person_tokens,
+            trace=trace,
+            errors=[],
+            language=config.language,
+            confidence=None,
+            original_length=len(text),
+            normalized_length=len(normalized),
+            token_count=len(person_tokens),
+            processing_time=0.0,
+            success=True,
+            original_text=text,
+            token_variants={},
+            total_variants=0,
+            persons_core=[person["tokens"] for person in persons],
+            organizations_core=[],
+            persons=persons,
+            ner_disabled=self.ner_disabled,
+        )
+        if len(persons) == 1:
+            result.person_gender = persons[0].get("gender")
+            result.gender_confidence = persons[0].get("confidence", {}).get("gap", 0.0)
+        for key, value in gender_info.items():
+            setattr(result, key, value)
+        return result
+
+    async def _check_canonical_fastpath_parity(
+        self,
+        text: str,
+        config: NormalizationConfig,
+        effective_flags,
+        fast_result: NormalizationResult
+    ) -> NormalizationResult:
+        """
+        Run the full pipeline for a fastpath hit and record any difference.
+
+        Returns the full-pipeline result, so parity mode never changes output.
+        """
+        stats = self._canonical_fastpath_stats
+        stats["parity_checks"] += 1
+        full_result = await self._normalize_with_error_handling(text, config, effective_flags)
+        mismatched = compare_results(fast_result, full_result)
+        if mismatched:
+            stats["parity_mismatches"] += 1
+            self.cache_metrics.record_canonical_fastpath(config.language, "parity_mismatch")
+            self.logger.warning(
+                f"Canonical fastpath parity mismatch for '{text}' on {mismatched}: "
+                f"fast='{fast_result.normalized}', full='{full_result.normalized}'"
+            )
+        return full_result
@@ -43,6 +43,7 @@ except ImportError as e:
     ELASTICSEARCH_AVAILABLE = False
 
 from ...utils.logging_config import get_logger
+from ...utils.tracing import span
 
 from .contracts import Candidate, SearchOpts, ElasticsearchAdapter, SearchMode
 from .config import HybridSearchConfig
@@ -404,7 +405,8 @@ class ElasticsearchACAdapter(ElasticsearchAdapter):
                 ]
             }
             
-            response = await client.search(index=self.AC_PATTERNS_INDEX, body=pattern_query)
+            with span("es.search", index=self.AC_PATTERNS_INDEX):
+                response = await client.search(index=self.AC_PATTERNS_INDEX, body=pattern_query)
             payload = response
             
             hits = payload.get("hits", {}).get("hits", [])
@@ -440,7 +442,8 @@ class ElasticsearchACAdapter(ElasticsearchAdapter):
 
         try:
             search_body = self._build_ac_query(query, opts)
-            response = await client.search(index=index_name, body=search_body)
+            with span("es.search", index=index_name, mode="ac"):
+                response = await client.search(index=index_name, body=search_body)
             candidates = self._parse_candidates(response)
             
             # Add AC pattern hits if enabled
@@ -646,7 +649,8 @@ class ElasticsearchVectorAdapter(ElasticsearchAdapter):
             # Build hybrid query combining kNN and BM25
             search_body = self._build_vector_fallback_query(query_vector, query_text, opts)
             
-            response = await client.search(index=self.config.elasticsearch.vector_index, body=search_body)
+            with span("es.search", index=self.config.elasticsearch.vector_index, mode="vector_fallback"):
+                response = await client.search(index=self.config.elasticsearch.vector_index, body=search_body)
             candidates = self._parse_vector_fallback_candidates(response, query_text)
             
         except ElasticsearchException as exc:
@@ -887,7 +891,8 @@ class ElasticsearchVectorAdapter(ElasticsearchAdapter):
 
         try:
             body = self._build_vector_query(query_vector, opts)
-            response = await client.search(index=index_name, body=body)
+            with span("es.search", index=index_name, mode="knn"):
+                response = await client.search(index=index_name, body=body)
             candidates = self._parse_candidates(response)
         except ElasticsearchException as exc:
             self.logger.error(f"Elasticsearch error during vector search: {exc}")
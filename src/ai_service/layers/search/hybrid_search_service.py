@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...core.base_service import BaseService
+from ...utils.allocation_tracker import register_cache
 from ...utils.logging_config import get_logger
 from ...contracts.base_contracts import NormalizationResult
 
@@ -112,6 +113,9 @@ class HybridSearchService(BaseService, SearchService):
         # Query caching
         self._query_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self._query_cache_lock = asyncio.Lock()
+
+        for cache_name in ("fuzzy_candidates", "embedding", "search", "query"):
+            register_cache(f"search.{cache_name}", self, f"_{cache_name}_cache")
         
         # Rate limiting
         self._rate_limiter: Dict[str, List[datetime]] = {}
@@ -550,9 +554,9 @@ class HybridSearchService(BaseService, SearchService):
             # Update AC-specific metrics
             self._update_ac_metrics(search_time, len(candidates))
 
-            # Convert candidates to SearchTraceHit
+            # Convert candidates to SearchTraceHit (only if the trace keeps hits)
             ac_hits = []
-            for rank, candidate in enumerate(candidates, 1):
+            for rank, candidate in enumerate(candidates if search_trace.include_hits else [], 1):
                 signals = {
                     'dob_match': self._check_dob_match(candidate.metadata, query_text),
                     'doc_id_match': self._check_doc_id_match(candidate.doc_id, query_text),
@@ -571,7 +575,7 @@ class HybridSearchService(BaseService, SearchService):
                 ac_hits.append(hit)
             
             # Add AC search step to trace
-            search_trace.add_step(SearchTraceStep(
+            search_trace.add_step(lambda: SearchTraceStep(
                 stage="AC",
                 query=query_text,
                 topk=opts.top_k,
@@ -583,7 +587,7 @@ class HybridSearchService(BaseService, SearchService):
                     "fallback_enabled": self.config.enable_fallback,
                     "adapter_connected": getattr(self._ac_adapter, "_connected", True)
                 }
-            ))
+            ), hit_count=len(candidates))
             
             if (
                 not candidates
@@ -613,7 +617,7 @@ class HybridSearchService(BaseService, SearchService):
                 "error_type": type(e).__name__
             })
             self.logger.error("AC search failed", extra=ac_log_data)
-            search_trace.note(f"AC search failed: {str(e)}")
+            search_trace.note("AC search failed: %s", e)
             return []
 
     async def _vector_search_only(
@@ -657,9 +661,9 @@ class HybridSearchService(BaseService, SearchService):
             # Update Vector-specific metrics
             self._update_vector_metrics(search_time, len(candidates))
 
-            # Convert candidates to SearchTraceHit
+            # Convert candidates to SearchTraceHit (only if the trace keeps hits)
             vector_hits = []
-            for rank, candidate in enumerate(candidates, 1):
+            for rank, candidate in enumerate(candidates if search_trace.include_hits else [], 1):
                 signals = {
                     'dob_match': self._check_dob_match(candidate.metadata, query_text),
                     'doc_id_match': self._check_doc_id_match(candidate.doc_id, query_text),
@@ -679,7 +683,7 @@ class HybridSearchService(BaseService, SearchService):
                 vector_hits.append(hit)
             
             # Add vector search step to trace
-            search_trace.add_step(SearchTraceStep(
+            search_trace.add_step(lambda: SearchTraceStep(
                 stage="SEMANTIC",
                 query=query_text,
                 topk=opts.top_k,
@@ -692,7 +696,7 @@ class HybridSearchService(BaseService, SearchService):
                     "adapter_connected": getattr(self._vector_adapter, "_connected", True),
                     "embedding_model": getattr(self._embedding_service, 'model_name', 'unknown')
                 }
-            ))
+            ), hit_count=len(candidates))
             
             if (
                 not candidates
@@ -722,7 +726,7 @@ class HybridSearchService(BaseService, SearchService):
                 "error_type": type(e).__name__
             })
             self.logger.error("Vector search failed", extra=vector_log_data)
-            search_trace.note(f"Vector search failed: {str(e)}")
+            search_trace.note("Vector search failed: %s", e)
             return []
     
     async def _hybrid_search(
@@ -749,19 +753,19 @@ class HybridSearchService(BaseService, SearchService):
 
         # Add AC trace step
         ac_best_score = max((c.score for c in ac_candidates), default=0.0)
-        search_trace.add_step(SearchTraceStep(
+        search_trace.add_step(lambda: SearchTraceStep(
             stage="AC",
             query=query_text,
             topk=opts.top_k,
             took_ms=ac_time,
             hits=[SearchTraceHit(doc_id=c.doc_id, score=c.score, rank=i+1, source="AC")
-                  for i, c in enumerate(ac_candidates[:10])],
+                  for i, c in enumerate(ac_candidates[:10] if search_trace.include_hits else [])],
             meta={
                 "threshold": opts.threshold,
                 "best_score": ac_best_score,
                 "total_hits": len(ac_candidates)
             }
-        ))
+        ), hit_count=min(len(ac_candidates), 10))
 
         # Check if AC results are sufficient
         should_escalate = self._should_escalate(ac_candidates, opts)
@@ -778,20 +782,20 @@ class HybridSearchService(BaseService, SearchService):
 
             # Add fuzzy trace step
             fuzzy_best_score = max((c.score for c in fuzzy_candidates), default=0.0)
-            search_trace.add_step(SearchTraceStep(
+            search_trace.add_step(lambda: SearchTraceStep(
                 stage="LEXICAL",  # Fuzzy is lexical search
                 query=query_text,
                 topk=opts.top_k,
                 took_ms=fuzzy_time,
                 hits=[SearchTraceHit(doc_id=c.doc_id, score=c.score, rank=i+1, source="LEXICAL")
-                      for i, c in enumerate(fuzzy_candidates[:10])],
+                      for i, c in enumerate(fuzzy_candidates[:10] if search_trace.include_hits else [])],
                 meta={
                     "search_type": "fuzzy",
                     "best_score": fuzzy_best_score,
                     "total_hits": len(fuzzy_candidates),
                     "escalation_triggered": True
                 }
-            ))
+            ), hit_count=min(len(fuzzy_candidates), 10))
 
             # Check if fuzzy results are good enough
             print(f"[STATS] CHECKING FUZZY SUFFICIENCY: {len(fuzzy_candidates)} candidates")
@@ -834,20 +838,20 @@ class HybridSearchService(BaseService, SearchService):
 
             # Add vector trace step
             vector_best_score = max((c.score for c in vector_candidates), default=0.0)
-            search_trace.add_step(SearchTraceStep(
+            search_trace.add_step(lambda: SearchTraceStep(
                 stage="SEMANTIC",  # Vector is semantic search
                 query=query_text,
                 topk=opts.top_k,
                 took_ms=vector_time,
                 hits=[SearchTraceHit(doc_id=c.doc_id, score=c.score, rank=i+1, source="SEMANTIC")
-                      for i, c in enumerate(vector_candidates[:10])],
+                      for i, c in enumerate(vector_candidates[:10] if search_trace.include_hits else [])],
                 meta={
                     "search_type": "vector",
                     "best_score": vector_best_score,
                     "total_hits": len(vector_candidates),
                     "fuzzy_insufficient": True
                 }
-            ))
+            ), hit_count=min(len(vector_candidates), 10))
 
             # Combine all three result sets
             all_candidates = self._combine_results(ac_candidates, fuzzy_candidates, opts)
@@ -2083,9 +2087,11 @@ class HybridSearchService(BaseService, SearchService):
         meta: Dict[str, Any]
     ) -> None:
         """Add hybrid search step to trace."""
-        # Convert candidates to SearchTraceHit
+        if not search_trace.enabled:
+            return
+        # Convert candidates to SearchTraceHit (only if the trace keeps hits)
         hybrid_hits = []
-        for rank, candidate in enumerate(candidates, 1):
+        for rank, candidate in enumerate(candidates if search_trace.include_hits else [], 1):
             signals = {
                 'dob_match': self._check_dob_match(candidate.metadata, query),
                 'doc_id_match': self._check_doc_id_match(candidate.doc_id, query),
@@ -2112,7 +2118,7 @@ class HybridSearchService(BaseService, SearchService):
             took_ms=took_ms,
             hits=hybrid_hits,
             meta=meta
-        ))
+        ), hit_count=len(candidates))
     
     def _check_dob_match(self, metadata: Dict[str, Any], query: str) -> bool:
         """Check if date of birth matches query."""
@@ -0,0 +1,404 @@
+"""
+Memory-mapped index of sanctioned identifiers.
+
+``SanctionedINNCache`` used to ``json.load`` the whole INN cache into a
+dict of dicts in every worker and only INNs had a fast path; other ID types
+fell through to mock data. ``SanctionedIDIndex`` maps the normalized value
+of any identifier type extracted by ``data/patterns/identifiers.py`` (INN,
+EDRPOU, OGRN, passport, IBAN, ...) to its entity record, stored in one
+binary file that every worker maps read-only, so the OS shares its pages
+and nothing is parsed until a lookup hits.
+
+File layout (little endian)::
+
+    header   magic "SIDX", version, count, meta_len, data_off, meta_off
+    hashes   count x u64   blake2b-64 of the key, sorted
+    slots    count x 4 u32 key_off, key_len, record_off, record_len
+    data     keys ("<value>\\x1f<id_type>") and compact JSON entity records
+    meta     JSON counts per ID type and entity type
+
+A lookup hashes the normalized value, bisects the hash array and compares
+the stored key, then decodes only the matching record. Records shared by
+several identifiers of one entity are stored once.
+
+``get_sanctioned_id_index()`` opens ``$SANCTIONED_ID_INDEX`` or
+``data/sanctioned_ids.idx``; when that file is missing or older than
+``sanctioned_inns_cache.json`` it is rebuilt from the JSON cache (in memory
+if the data directory is read-only). ``scripts/generate_inn_cache.py``
+writes an index with every ID type of the sanctioned persons and companies.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DEFAULT_INDEX_FILE = DATA_DIR / "sanctioned_ids.idx"
+DEFAULT_INN_CACHE_FILE = DATA_DIR / "sanctioned_inns_cache.json"
+INDEX_PATH_ENV = "SANCTIONED_ID_INDEX"
+
+MAGIC = b"SIDX"
+VERSION = 1
+_HEADER = struct.Struct("<4sIIIQQ")
+_SLOT_WORDS = 4
+_KEY_SEP = "\x1f"
+
+# Source record field -> identifier type (as in data/patterns/identifiers.py)
+ID_FIELD_TYPES = {
+    "itn": "inn",
+    "itn_import": "inn",
+    "inn": "inn",
+    "tax_id": "inn",
+    "tax_number": "inn",
+    "edrpou": "edrpou",
+    "code_edrpou": "edrpou",
+    "registration_id": "edrpou",
+    "ogrn": "ogrn",
+    "reg_number": "ogrn",
+    "ogrnip": "ogrnip",
+    "vat": "vat",
+    "vat_id": "vat",
+    "lei": "lei",
+    "iban": "iban",
+    "swift": "swift_bic",
+    "bic": "swift_bic",
+    "swift_bic": "swift_bic",
+    "ein": "ein",
+    "ssn": "ssn",
+    "passport": "passport",
+    "passport_number": "passport",
+    "id_number": "passport",
+}
+
+# Signals extractor identifier type -> index type; other types are looked up as-is
+EXTRACTOR_ID_TYPES = {
+    "inn_ua": "inn",
+    "inn_ru": "inn",
+    "vat_eu": "vat",
+    "passport_rf": "passport",
+    "passport_ua": "passport",
+}
+
+_NON_ID_CHARS = re.compile(r"[^0-9A-ZА-ЯЁІЇЄҐ]")
+
+# (id_type, raw value, entity record)
+IndexEntry = Tuple[str, str, Dict[str, Any]]
+
+
+def normalize_id_value(value: Any) -> str:
+    """
+    Index key of an identifier value.
+
+    Only letters and digits are kept (uppercased), so values normalized by
+    ``normalize_identifier`` and raw values from sanctions data ("12-3456789",
+    "АА 123456", "DE89 3704 ...") produce the same key.
+    """
+    return _NON_ID_CHARS.sub("", str(value).upper())
+
+
+def index_id_type(extracted_type: str) -> str:
+    """Index identifier type of a type reported by the signals extractor."""
+    extracted_type = (extracted_type or "").lower()
+    return EXTRACTOR_ID_TYPES.get(extracted_type, extracted_type)
+
+
+def _key_hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def build_index(entries: Iterable[IndexEntry]) -> bytes:
+    """
+    Serialize identifier entries into the index format.
+
+    Args:
+        entries: (id_type, value, record) triples; the first record wins for
+            a repeated (value, id_type)
+
+    Returns:
+        Index bytes
+    """
+    keys: Dict[Tuple[str, str], bytes] = {}
+    record_ids: Dict[Tuple[str, str], int] = {}
+    records: Dict[bytes, int] = {}
+    id_types: Dict[str, int] = {}
+    entity_types: Dict[str, int] = {}
+    for id_type, value, record in entries:
+        normalized = normalize_id_value(value)
+        if not normalized or (normalized, id_type) in keys:
+            continue
+        payload = json.dumps(
+            record, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        ).encode("utf-8")
+        if payload not in records:
+            records[payload] = len(records)
+            entity_type = str(record.get("type", "unknown"))
+            entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+        keys[(normalized, id_type)] = f"{normalized}{_KEY_SEP}{id_type}".encode("utf-8")
+        record_ids[(normalized, id_type)] = records[payload]
+        id_types[id_type] = id_types.get(id_type, 0) + 1
+
+    data = bytearray()
+    record_spans: List[Tuple[int, int]] = []
+    for payload in records:
+        record_spans.append((len(data), len(payload)))
+        data += payload
+
+    rows = []
+    for key, key_bytes in keys.items():
+        rows.append(
+            (
+                _key_hash(key[0]),
+                len(data),
+                len(key_bytes),
+                *record_spans[record_ids[key]],
+            )
+        )
+        data += key_bytes
+    rows.sort()
+
+    count = len(rows)
+    meta = json.dumps(
+        {
+            "ids": count,
+            "records": len(records),
+            "id_types": id_types,
+            "entity_types": entity_types,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    hashes_off = _HEADER.size
+    data_off = hashes_off + 8 * count + 4 * _SLOT_WORDS * count
+    meta_off = data_off + len(data)
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, count, len(meta), data_off, meta_off))
+    out += struct.pack(f"<{count}Q", *(row[0] for row in rows))
+    out += struct.pack(
+        f"<{count * _SLOT_WORDS}I", *(v for row in rows for v in row[1:])
+    )
+    out += data
+    out += meta
+    return bytes(out)
+
+
+def write_index(entries: Iterable[IndexEntry], path: Path) -> Path:
+    """Build the index and write it atomically to ``path``."""
+    payload = build_index(entries)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=path.name, suffix=".tmp", dir=str(path.parent)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def iter_record_ids(record: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """(id_type, value) pairs of a sanctioned person/company record's ID fields."""
+    for field, id_type in ID_FIELD_TYPES.items():
+        value = record.get(field)
+        if isinstance(value, (str, int)) and str(value).strip():
+            yield id_type, str(value).strip()
+
+
+def entries_from_inn_cache(cache: Dict[str, Dict[str, Any]]) -> Iterator[IndexEntry]:
+    """Index entries of a ``sanctioned_inns_cache.json`` mapping (ID value -> record)."""
+    for value, record in cache.items():
+        id_type = ID_FIELD_TYPES.get(str(record.get("id_field", "")), "inn")
+        yield id_type, value, record
+
+
+class SanctionedIDIndex:
+    """Read-only view of an index file or buffer."""
+
+    def __init__(self, buffer: Union[mmap.mmap, bytes], source: Optional[str] = None):
+        self._buffer = buffer
+        self.source = source
+        magic, version, count, meta_len, data_off, meta_off = _HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a sanctioned ID index (version {VERSION}): {source}")
+        self.count = count
+        view = memoryview(buffer)
+        hashes_off = _HEADER.size
+        slots_off = hashes_off + 8 * count
+        self._view = view
+        self._hashes = view[hashes_off:slots_off].cast("Q")
+        self._slots = view[slots_off:data_off].cast("I")
+        self._data_off = data_off
+        self.meta = (
+            json.loads(bytes(view[meta_off : meta_off + meta_len]).decode("utf-8"))
+            if meta_len
+            else {}
+        )
+
+    @classmethod
+    def open(cls, path: Path) -> "SanctionedIDIndex":
+        """Map an index file read-only."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, source=str(path))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def find(
+        self, value: Any, id_type: Optional[str] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find the sanctioned entity an identifier belongs to.
+
+        Args:
+            value: Identifier value (normalized or raw)
+            id_type: Only match identifiers of this type (any type if None)
+
+        Returns:
+            (matched id_type, entity record) or None
+        """
+        normalized = normalize_id_value(value)
+        if not normalized or not self.count:
+            return None
+        target = _key_hash(normalized)
+        i = bisect.bisect_left(self._hashes, target)
+        prefix = f"{normalized}{_KEY_SEP}".encode("utf-8")
+        while i < self.count and self._hashes[i] == target:
+            key_off, key_len, record_off, record_len = self._slots[
+                i * _SLOT_WORDS : (i + 1) * _SLOT_WORDS
+            ]
+            start = self._data_off + key_off
+            key = bytes(self._view[start : start + key_len])
+            if key.startswith(prefix):
+                found_type = key[len(prefix) :].decode("utf-8")
+                if id_type is None or found_type == id_type:
+                    start = self._data_off + record_off
+                    record = json.loads(
+                        bytes(self._view[start : start + record_len]).decode("utf-8")
+                    )
+                    return found_type, record
+            i += 1
+        return None
+
+    def lookup(
+        self, value: Any, id_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Entity record of a sanctioned identifier (a fresh dict), or None."""
+        match = self.find(value, id_type)
+        return match[1] if match else None
+
+    def __contains__(self, value: Any) -> bool:
+        return self.lookup(value) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"source": self.source, **self.meta}
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        self._hashes.release()
+        self._slots.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def _index_path() -> Path:
+    configured = os.getenv(INDEX_PATH_ENV)
+    return Path(configured) if configured else DEFAULT_INDEX_FILE
+
+
+def load_sanctioned_id_index(
+    index_file: Optional[Path] = None, inn_cache_file: Optional[Path] = None
+) -> Optional[SanctionedIDIndex]:
+    """
+    Open the index file, rebuilding it from the INN cache JSON when stale.
+
+    Args:
+        index_file: Index path (defaults to $SANCTIONED_ID_INDEX or data/sanctioned_ids.idx)
+        inn_cache_file: INN cache JSON to build from
+
+    Returns:
+        The index, or None if neither file exists
+    """
+    index_file = index_file or _index_path()
+    inn_cache_file = inn_cache_file or DEFAULT_INN_CACHE_FILE
+
+    json_mtime = inn_cache_file.stat().st_mtime if inn_cache_file.exists() else None
+    if index_file.exists() and (
+        json_mtime is None or index_file.stat().st_mtime >= json_mtime
+    ):
+        return SanctionedIDIndex.open(index_file)
+    if json_mtime is None:
+        logger.warning(
+            f"Sanctioned ID index unavailable: neither {index_file} nor {inn_cache_file} exists"
+        )
+        return None
+
+    start = time.perf_counter()
+    with open(inn_cache_file, "r", encoding="utf-8") as f:
+        entries = list(entries_from_inn_cache(json.load(f)))
+    try:
+        write_index(entries, index_file)
+        index = SanctionedIDIndex.open(index_file)
+    except OSError as e:
+        # Read-only data directory: keep the index in this process only
+        logger.warning(
+            f"Cannot write {index_file} ({e}); keeping sanctioned ID index in memory"
+        )
+        index = SanctionedIDIndex(build_index(entries), source=str(inn_cache_file))
+    logger.info(
+        f"Built sanctioned ID index with {index.count} IDs from {inn_cache_file.name} "
+        f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+    return index
+
+
+# Process-wide index; None with _index_loaded set means "unavailable"
+_index: Optional[SanctionedIDIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_sanctioned_id_index() -> Optional[SanctionedIDIndex]:
+    """Get the process-wide sanctioned ID index, opening it on first use."""
+    global _index, _index_loaded
+    if _index_loaded:
+        return _index
+    with _index_lock:
+        if not _index_loaded:
+            try:
+                _index = load_sanctioned_id_index()
+            except Exception as e:
+                logger.error(f"Failed to load sanctioned ID index: {e}")
+                _index = None
+            _index_loaded = True
+    return _index
+
+
+def clear_sanctioned_id_index() -> None:
+    """Drop the process-wide index so the next call reopens it (the old map is released once unused)."""
+    global _index, _index_loaded
+    with _index_lock:
+        _index = None
+        _index_loaded = False
@@ -1,26 +1,33 @@
 """
 Fast lookup cache for sanctioned INNs.
 
-Provides O(1) lookup for INN -> sanctioned person/organization mapping.
-Much faster than AC search or Elasticsearch for INN-specific queries.
+Provides lookup for INN -> sanctioned person/organization mapping, backed
+by the memory-mapped ``SanctionedIDIndex`` (shared by all workers, no JSON
+parsing per worker). Much faster than AC search or Elasticsearch for
+INN-specific queries; ``lookup_sanctioned_id`` covers every ID type.
 """
 
-import json
 import time
-from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Optional, Tuple
 from ...utils.logging_config import get_logger
+from ...utils.tracing import trace_event
+from .sanctioned_id_index import (
+    DEFAULT_INN_CACHE_FILE,
+    SanctionedIDIndex,
+    clear_sanctioned_id_index,
+    get_sanctioned_id_index,
+)
 
 logger = get_logger(__name__)
 
 
 class SanctionedINNCache:
-    """Fast in-memory cache for sanctioned INNs."""
+    """Fast lookup of sanctioned INNs over the shared sanctioned ID index."""
 
     def __init__(self):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.index: Optional[SanctionedIDIndex] = None
         self.loaded_at: Optional[float] = None
-        self.cache_file = Path(__file__).parent.parent.parent / "data" / "sanctioned_inns_cache.json"
+        self.cache_file = DEFAULT_INN_CACHE_FILE
         self.stats = {
             "total_inns": 0,
             "persons": 0,
@@ -31,29 +38,25 @@ class SanctionedINNCache:
         }
 
     def load_cache(self) -> bool:
-        """Load sanctioned INNs cache from file."""
+        """Open the sanctioned ID index (building it from the INN cache file if needed)."""
         try:
-            if not self.cache_file.exists():
+            start_time = time.time()
+            self.index = get_sanctioned_id_index()
+            if self.index is None:
                 logger.warning(f"INN cache file not found: {self.cache_file}")
                 return False
 
-            start_time = time.time()
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                self.cache = json.load(f)
-
             self.loaded_at = time.time()
             load_time = (self.loaded_at - start_time) * 1000
 
             # Update statistics
-            self.stats["total_inns"] = len(self.cache)
-            for inn_data in self.cache.values():
-                if inn_data.get("type") == "person":
-                    self.stats["persons"] += 1
-                elif inn_data.get("type") == "organization":
-                    self.stats["organizations"] += 1
+            entity_types = self.index.meta.get("entity_types", {})
+            self.stats["total_inns"] = len(self.index)
+            self.stats["persons"] = entity_types.get("person", 0)
+            self.stats["organizations"] = entity_types.get("organization", 0)
 
             logger.info(
-                f"[OK] Loaded {self.stats['total_inns']} sanctioned INNs "
+                f"[OK] Loaded {self.stats['total_inns']} sanctioned IDs "
                 f"({self.stats['persons']} persons, {self.stats['organizations']} orgs) "
                 f"in {load_time:.2f}ms"
             )
@@ -63,31 +66,45 @@ class SanctionedINNCache:
             logger.error(f"[ERROR] Failed to load INN cache: {e}")
             return False
 
-    def lookup(self, inn: str) -> Optional[Dict[str, Any]]:
+    def lookup(self, inn: str, id_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Fast lookup for sanctioned INN.
 
         Args:
-            inn: INN to check
+            inn: INN (or other identifier) to check
+            id_type: Only match identifiers of this type (any type if None)
 
         Returns:
             Dict with sanctioned person/organization data if found, None otherwise
         """
+        match = self.find(inn, id_type)
+        return match[1] if match else None
+
+    def find(self, id_value: str, id_type: Optional[str] = None) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look up a sanctioned identifier of any type.
+
+        Returns:
+            (matched identifier type, sanctioned person/organization data) or None
+        """
         self.stats["lookups"] += 1
 
-        if not self.cache and not self.load_cache():
+        if self.index is None and not self.load_cache():
             self.stats["misses"] += 1
             return None
 
-        inn_normalized = str(inn).strip()
-        result = self.cache.get(inn_normalized)
+        id_normalized = str(id_value).strip()
+        # Records are decoded from the index on every hit, so callers get their own dict
+        match = self.index.find(id_normalized, id_type)
 
-        if result:
+        if match:
             self.stats["hits"] += 1
-            logger.debug(f"🚨 SANCTIONED INN FOUND: {inn_normalized} -> {result.get('name', 'Unknown')}")
-            return result.copy()  # Return copy to prevent modification
+            trace_event("cache.hit", cache="sanctioned_ids")
+            logger.debug(f"🚨 SANCTIONED {match[0].upper()} FOUND: {id_normalized} -> {match[1].get('name', 'Unknown')}")
+            return match
         else:
             self.stats["misses"] += 1
+            trace_event("cache.miss", cache="sanctioned_ids")
             return None
 
     def is_sanctioned(self, inn: str) -> bool:
@@ -120,7 +137,8 @@ class SanctionedINNCache:
 
     def reload_cache(self) -> bool:
         """Force reload cache from file."""
-        self.cache.clear()
+        clear_sanctioned_id_index()
+        self.index = None
         self.loaded_at = None
         # Reset lookup stats (but keep total counts)
         self.stats["lookups"] = 0
@@ -150,4 +168,9 @@ def lookup_sanctioned_inn(inn: str) -> Optional[Dict[str, Any]]:
 
 def is_inn_sanctioned(inn: str) -> bool:
     """Check if INN is sanctioned (convenience function)."""
-    return get_inn_cache().is_sanctioned(inn)
\ No newline at end of file
+    return get_inn_cache().is_sanctioned(inn)
+
+
+def lookup_sanctioned_id(id_value: str, id_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fast lookup for any sanctioned identifier (INN, EDRPOU, OGRN, passport, IBAN, ...)."""
+    return get_inn_cache().lookup(id_value, id_type)
\ No newline at end of file
@@ -69,6 +69,12 @@ class SanctionsDataset:
         return names
 
 
+# Datasets loaded in this process, by data directory. Shared by all loader
+# instances, so a dataset loaded by the pre-fork master is reused by the
+# workers' loaders instead of being read again per process.
+_shared_datasets: Dict[Path, "SanctionsDataset"] = {}
+
+
 class SanctionsDataLoader:
     """Loads and manages sanctions data for fuzzy search."""
 
@@ -82,7 +88,7 @@ class SanctionsDataLoader:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
-        self._cached_dataset: Optional[SanctionsDataset] = None
+        self._cached_dataset: Optional[SanctionsDataset] = _shared_datasets.get(self.data_dir)
         self._cache_file = self.data_dir / "sanctions_cache.json"
 
         self.logger.info(f"SanctionsDataLoader initialized with data_dir: {self.data_dir}")
@@ -113,6 +119,7 @@ class SanctionsDataLoader:
 
         # Try to load from cache file
         if not force_reload and await self._load_from_cache():
+            _shared_datasets[self.data_dir] = self._cached_dataset
             self.logger.info(f"[OK] Loaded from cache: {self._cached_dataset.total_entries} entries")
             return self._cached_dataset
 
@@ -123,6 +130,7 @@ class SanctionsDataLoader:
         # Cache the dataset
         await self._save_to_cache(dataset)
         self._cached_dataset = dataset
+        _shared_datasets[self.data_dir] = dataset
 
         self.logger.info(f"Loaded {dataset.total_entries} sanctions entries from {len(dataset.sources)} sources")
         return dataset
@@ -644,6 +652,7 @@ class SanctionsDataLoader:
     async def clear_cache(self):
         """Clear cached data and force reload."""
         self._cached_dataset = None
+        _shared_datasets.pop(self.data_dir, None)
         if self._cache_file.exists():
             self._cache_file.unlink()
         self.logger.info("Cache cleared")
\ No newline at end of file
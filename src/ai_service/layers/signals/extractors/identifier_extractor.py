@@ -1,11 +1,129 @@
 """
 Identifier extractor for organizations and persons.
+
+All identifier patterns are run over a text in one scan: every match is
+tagged with its type and shared by the organization and person categories
+(INN belongs to both), and the scans of recent texts are cached, so
+``extract_organization_ids`` followed by ``extract_person_ids`` on the same
+text scans it only once.
+
+Each pattern costs several microseconds even when nothing matches, and
+almost all of them require a context keyword (ИНН, ЄДРПОУ, SWIFT, ...). The
+scan therefore checks the keywords of every pattern against the lowercased
+text first and only runs the patterns whose keywords occur; patterns that
+need digits are skipped for texts without any. Checksums are validated once
+per distinct (type, value) via ``validate_identifiers``; ``extract_batch``
+validates the identifiers of many texts together for bulk screening.
 """
 
-from typing import Any, Dict, List, Set
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from .base_extractor import BaseExtractor
 
+# Scans of recent texts (SignalsService asks for both categories per text)
+SCAN_CACHE_SIZE = 256
+
+# Mandatory keyword group: leading \b(?:ИНН|inn|...) or a lookahead (?=.*(?:ИНН|...))
+_LEADING_GROUP_RE = re.compile(r"^(?:\\b)?\(\?:([^()]*)\)(?![?*{])")
+_LOOKAHEAD_GROUP_RE = re.compile(r"\(\?=\.\*\(\?:([^()]*)\)\)")
+_LEADING_LITERAL_RE = re.compile(r"^(?:\\b)?([^\\\[\](){}.*+?^$|]+)")
+_METACHARS = set("\\[](){}.*+?^$|")
+
+
+class IdentifierMatch(NamedTuple):
+    """One pattern match, before validation."""
+
+    type: str
+    name: str
+    value: str
+    raw: str
+    position: Tuple[int, int]
+
+
+def pattern_keywords(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Lowercased keywords one of which occurs in every text ``pattern`` matches.
+
+    Keywords are the literal prefixes of the alternatives of the pattern's
+    mandatory keyword group (or its literal prefix). Returns None when there
+    is no such group, i.e. the pattern must always run.
+    """
+    group = _LEADING_GROUP_RE.match(pattern) or _LOOKAHEAD_GROUP_RE.search(pattern)
+    if group:
+        keywords = []
+        for alternative in group.group(1).split("|"):
+            prefix = ""
+            for char in alternative:
+                if char in _METACHARS:
+                    break
+                prefix += char
+            if not prefix:
+                return None
+            keywords.append(prefix.lower())
+        return tuple(dict.fromkeys(keywords))
+    literal = _LEADING_LITERAL_RE.match(pattern)
+    if literal:
+        return (literal.group(1).lower(),)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _scanner() -> Tuple[Tuple[Any, Any, Optional[Tuple[str, ...]]], ...]:
+    """Compiled patterns with their keywords, in pattern order."""
+    from ....data.patterns.identifiers import get_compiled_patterns_cached
+
+    return tuple(
+        (pattern, compiled_regex, pattern_keywords(pattern.pattern))
+        for pattern, compiled_regex in get_compiled_patterns_cached()
+    )
+
+
+def scan_identifiers(text: str) -> Tuple[IdentifierMatch, ...]:
+    """
+    Run every identifier pattern over ``text`` once.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Matches in pattern order, then text order (not deduplicated)
+    """
+    return _scan_cached(text)
+
+
+@lru_cache(maxsize=SCAN_CACHE_SIZE)
+def _scan_cached(text: str) -> Tuple[IdentifierMatch, ...]:
+    from ....data.patterns.identifiers import normalize_identifier
+
+    has_digits = any(char.isdigit() for char in text)
+    text_lower = text.lower()
+    matches: List[IdentifierMatch] = []
+    for pattern, compiled_regex, keywords in _scanner():
+        if pattern.requires_digits and not has_digits:
+            continue
+        if keywords and not any(keyword in text_lower for keyword in keywords):
+            continue
+        for match in compiled_regex.finditer(text):
+            # Handle patterns with multiple capture groups (e.g. passport series + number)
+            if pattern.type in ["passport_rf", "passport_ua"] and len(match.groups()) > 1:
+                # Combine multiple groups for passport patterns
+                raw_value = "".join(g for g in match.groups() if g is not None)
+            else:
+                raw_value = match.group(1) if match.group(1) else match.group(0)
+
+            matches.append(
+                IdentifierMatch(
+                    type=pattern.type,
+                    name=pattern.name,
+                    value=normalize_identifier(raw_value, pattern.type),
+                    raw=match.group(0),
+                    position=match.span(),
+                )
+            )
+    return tuple(matches)
+
 
 class IdentifierExtractor(BaseExtractor):
     """Extracts identifiers (IDs) from text."""
@@ -45,69 +163,111 @@ class IdentifierExtractor(BaseExtractor):
             "person_ids": self.extract_person_ids(text),
         }
 
-    def _extract_ids_by_category(
-        self, text: str, id_types: Set[str]
-    ) -> List[Dict[str, Any]]:
-        """Extract IDs for specific category."""
+    def extract_ids(self, text: str, id_types: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Extract identifiers of the given types, deduplicated by value.
+
+        Args:
+            text: Text to analyze
+            id_types: Identifier types to keep
+
+        Returns:
+            Identifier dicts (type, value, raw, name, confidence, position, valid)
+        """
         if not self._is_valid_text(text):
             return []
-
         try:
-            from ....data.patterns.identifiers import (
-                get_compiled_patterns_cached,
-                get_validation_function,
-                normalize_identifier,
+            matches = self._filter(scan_identifiers(text), id_types)
+            validity = self._validate(matches)
+        except ImportError:
+            self.logger.warning(
+                "Identifier patterns not available, falling back to empty result"
             )
+            return []
+        return self._to_dicts(matches, validity)
+
+    def extract_batch(
+        self, texts: Iterable[str]
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Extract identifiers of many texts, validating them in one pass.
 
-            found_ids = []
-
-            for pattern, compiled_regex in get_compiled_patterns_cached():
-                if pattern.type not in id_types:
-                    continue
-
-                for match in compiled_regex.finditer(text):
-                    # Handle patterns with multiple capture groups (e.g. passport series + number)
-                    if pattern.type in ['passport_rf', 'passport_ua'] and len(match.groups()) > 1:
-                        # Combine multiple groups for passport patterns
-                        raw_value = ''.join(g for g in match.groups() if g is not None)
-                    else:
-                        raw_value = match.group(1) if match.group(1) else match.group(0)
-
-                    normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                    # Validate if validator exists
-                    validator = get_validation_function(pattern.type)
-                    is_valid = True
-                    if validator:
-                        is_valid = validator(normalized_value)
-
-                    confidence = 0.9 if is_valid else 0.6
-
-                    id_info = {
-                        "type": pattern.type,
-                        "value": normalized_value,
-                        "raw": match.group(0),
-                        "name": pattern.name,
-                        "confidence": confidence,
-                        "position": match.span(),
-                        "valid": is_valid,
-                    }
-                    found_ids.append(id_info)
-
-            # Remove duplicates by value
-            unique_ids = []
-            seen_values = set()
-            for id_info in found_ids:
-                if id_info["value"] not in seen_values:
-                    seen_values.add(id_info["value"])
-                    unique_ids.append(id_info)
-
-            entity_type = "organization" if id_types == self._org_id_types else "person"
-            self._log_extraction_result(text, len(unique_ids), f"{entity_type}_id")
-            return unique_ids
+        Args:
+            texts: Texts to analyze
 
+        Returns:
+            One ``extract()``-style dict per text, in input order
+        """
+        texts = list(texts)
+        try:
+            scans: List[Optional[Tuple[IdentifierMatch, ...]]] = [
+                scan_identifiers(text) if self._is_valid_text(text) else None
+                for text in texts
+            ]
+            validity = self._validate(m for scan in scans if scan for m in scan)
         except ImportError:
             self.logger.warning(
                 "Identifier patterns not available, falling back to empty result"
             )
+            return [{"organization_ids": [], "person_ids": []} for _ in texts]
+
+        results = []
+        for scan in scans:
+            scan = scan or ()
+            results.append(
+                {
+                    "organization_ids": self._to_dicts(self._filter(scan, self._org_id_types), validity),
+                    "person_ids": self._to_dicts(self._filter(scan, self._person_id_types), validity),
+                }
+            )
+        return results
+
+    def _extract_ids_by_category(
+        self, text: str, id_types: Set[str]
+    ) -> List[Dict[str, Any]]:
+        """Extract IDs for specific category."""
+        if not self._is_valid_text(text):
             return []
+        unique_ids = self.extract_ids(text, id_types)
+        entity_type = "organization" if id_types == self._org_id_types else "person"
+        self._log_extraction_result(text, len(unique_ids), f"{entity_type}_id")
+        return unique_ids
+
+    @staticmethod
+    def _filter(
+        matches: Iterable[IdentifierMatch], id_types: Set[str]
+    ) -> List[IdentifierMatch]:
+        """Matches of the given types, first occurrence of each value only."""
+        unique: List[IdentifierMatch] = []
+        seen_values = set()
+        for match in matches:
+            if match.type in id_types and match.value not in seen_values:
+                seen_values.add(match.value)
+                unique.append(match)
+        return unique
+
+    @staticmethod
+    def _validate(matches: Iterable[IdentifierMatch]) -> Dict[Tuple[str, str], bool]:
+        from ....data.patterns.identifiers import validate_identifiers
+
+        return validate_identifiers((m.type, m.value) for m in matches)
+
+    @staticmethod
+    def _to_dicts(
+        matches: List[IdentifierMatch], validity: Dict[Tuple[str, str], bool]
+    ) -> List[Dict[str, Any]]:
+        ids = []
+        for match in matches:
+            is_valid = validity[(match.type, match.value)]
+            ids.append(
+                {
+                    "type": match.type,
+                    "value": match.value,
+                    "raw": match.raw,
+                    "name": match.name,
+                    "confidence": 0.9 if is_valid else 0.6,
+                    "position": match.position,
+                    "valid": is_valid,
+                }
+            )
+        return ids
@@ -20,12 +20,17 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import get_text_profile
 from .extractors import (
     BirthdateExtractor,
     IdentifierExtractor,
     OrganizationExtractor,
     PersonExtractor,
 )
+from .span_index import SpanIndex, locate_spans, span_center
+
+# INN next to a normalization-trace token marked "marker_инн_nearby"
+_TRACE_INN_RE = re.compile(r'(?:(?:ИНН|инн|INN)\s*[\:\:]?\s*)?(\d{10,12})')
 
 
 # Confidence scoring constants
@@ -92,6 +97,93 @@ class ExtraSignal:
     confidence: float = 0.0
 
 
+class SignalsResultWrapper:
+    """
+    Attribute view of a SignalsService.extract() result dict, kept for
+    backward compatibility (persons/organizations as objects, numbers, dates).
+    """
+
+    def __init__(self, result_dict):
+        # Convert person dicts to simple objects with attributes
+        self.persons = []
+        for person_dict in result_dict.get("persons", []):
+            person_obj = type('PersonObj', (), {})()
+            for key, value in person_dict.items():
+                setattr(person_obj, key, value)
+            self.persons.append(person_obj)
+
+        # Convert organization dicts to simple objects with attributes
+        self.organizations = []
+        for org_dict in result_dict.get("organizations", []):
+            org_obj = type('OrgObj', (), {})()
+            for key, value in org_dict.items():
+                # Map 'full' to 'full_name' for backward compatibility
+                if key == "full":
+                    setattr(org_obj, "full_name", value)
+                    setattr(org_obj, key, value)  # Keep original too
+                else:
+                    setattr(org_obj, key, value)
+
+            # Ensure 'full' attribute always exists for backward compatibility
+            if not hasattr(org_obj, 'full'):
+                setattr(org_obj, 'full', None)
+            if not hasattr(org_obj, 'full_name'):
+                setattr(org_obj, 'full_name', None)
+
+            self.organizations.append(org_obj)
+
+        # Copy other attributes directly
+        for key, value in result_dict.items():
+            if key not in ["persons", "organizations"]:
+                setattr(self, key, value)
+
+        # Add backward compatibility attributes for test expectations
+        # Extract numbers (IDs) from persons and organizations
+        self.numbers = {}
+        all_ids = []
+
+        # Collect IDs from persons
+        for person in self.persons:
+            if hasattr(person, 'ids') and person.ids:
+                all_ids.extend(person.ids)
+
+        # Collect IDs from organizations
+        for org in self.organizations:
+            if hasattr(org, 'ids') and org.ids:
+                all_ids.extend(org.ids)
+
+        # Organize IDs by type
+        for id_item in all_ids:
+            if isinstance(id_item, dict):
+                id_type = id_item.get('type', 'unknown')
+                id_value = id_item.get('value', id_item.get('raw', ''))
+                if id_type not in self.numbers:
+                    self.numbers[id_type] = []
+                self.numbers[id_type].append(id_value)
+
+        # Extract dates from persons
+        self.dates = {}
+        birth_dates = []
+
+        for person in self.persons:
+            # Check for both dob and birth_date attributes for compatibility
+            dob = None
+            if hasattr(person, 'dob') and person.dob:
+                dob = person.dob
+            elif hasattr(person, 'birth_date') and person.birth_date:
+                dob = person.birth_date
+
+            if dob:
+                birth_dates.append(str(dob))
+
+        # Also check extras for dates
+        extras_dates = result_dict.get("extras", {}).get("dates", [])
+        birth_dates.extend(extras_dates)
+
+        if birth_dates:
+            self.dates['birth_dates'] = birth_dates
+
+
 class SignalsService:
     """
     Сервис сигналов для структурирования сущностей.
@@ -112,6 +204,8 @@ class SignalsService:
 
         # Text storage for proximity matching
         self._current_text = ""
+        # (text, person names, SpanIndex) of the last proximity lookup
+        self._person_span_cache = None
 
         self.logger.info("SignalsService initialized with extractors")
 
@@ -737,12 +831,6 @@ class SignalsService:
 
     def _extract_org_ids(self, text: str) -> List[Dict]:
         """Детектор организационных ID"""
-        from ...data.patterns.identifiers import (
-            get_compiled_patterns_cached,
-            get_validation_function,
-            normalize_identifier,
-        )
-
         org_id_types = {
             "edrpou",
             "inn_ru",
@@ -753,94 +841,12 @@ class SignalsService:
             "lei",
             "ein",
         }
-
-        found_ids = []
-
-        for pattern, compiled_regex in get_compiled_patterns_cached():
-            if pattern.type not in org_id_types:
-                continue
-
-            for match in compiled_regex.finditer(text):
-                raw_value = match.group(1)
-                normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                # Дополнительная валидация если есть
-                validator = get_validation_function(pattern.type)
-                is_valid = True
-                if validator:
-                    is_valid = validator(normalized_value)
-
-                confidence = 0.9 if is_valid else 0.6
-
-                id_info = {
-                    "type": pattern.type,
-                    "value": normalized_value,
-                    "raw": match.group(0),  # Полное совпадение
-                    "name": pattern.name,
-                    "confidence": confidence,
-                    "position": match.span(),
-                    "valid": is_valid,
-                }
-                found_ids.append(id_info)
-
-        # Удаляем дубликаты по value
-        seen_values = set()
-        unique_ids = []
-        for id_info in found_ids:
-            if id_info["value"] not in seen_values:
-                seen_values.add(id_info["value"])
-                unique_ids.append(id_info)
-
-        return unique_ids
+        return self.identifier_extractor.extract_ids(text, org_id_types)
 
     def _extract_person_ids(self, text: str) -> List[Dict]:
         """Детектор личных ID"""
-        from ...data.patterns.identifiers import (
-            get_compiled_patterns_cached,
-            get_validation_function,
-            normalize_identifier,
-        )
-
         person_id_types = {"inn_ua", "inn_ru", "snils", "ssn", "passport_ua"}
-
-        found_ids = []
-
-        for pattern, compiled_regex in get_compiled_patterns_cached():
-            if pattern.type not in person_id_types:
-                continue
-
-            for match in compiled_regex.finditer(text):
-                raw_value = match.group(1)
-                normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                # Дополнительная валидация если есть
-                validator = get_validation_function(pattern.type)
-                is_valid = True
-                if validator:
-                    is_valid = validator(normalized_value)
-
-                confidence = 0.9 if is_valid else 0.6
-
-                id_info = {
-                    "type": pattern.type,
-                    "value": normalized_value,
-                    "raw": match.group(0),  # Полное совпадение
-                    "name": pattern.name,
-                    "confidence": confidence,
-                    "position": match.span(),
-                    "valid": is_valid,
-                }
-                found_ids.append(id_info)
-
-        # Удаляем дубликаты по value
-        seen_values = set()
-        unique_ids = []
-        for id_info in found_ids:
-            if id_info["value"] not in seen_values:
-                seen_values.add(id_info["value"])
-                unique_ids.append(id_info)
-
-        return unique_ids
+        return self.identifier_extractor.extract_ids(text, person_id_types)
 
     def _extract_birthdates(self, text: str) -> List[Dict]:
         """Детектор дат рождения"""
@@ -895,31 +901,12 @@ class SignalsService:
 
         # Check if text is mixed language for more lenient proximity matching
         is_mixed_language = self._is_mixed_language_text(text)
+        # Для смешанного языка увеличиваем максимальное расстояние
+        # (ID могут быть в другой части текста)
+        max_distance = 500 if is_mixed_language else 300
 
-        # Найдем позиции всех персон в тексте для proximity matching
-        person_positions = []
-        for person in persons:
-            # Составляем полное имя для поиска
-            full_name = " ".join(person.core)
-
-            # Ищем все вхождения имени в тексте
-            import re
-
-            name_pattern = re.escape(full_name)
-            matches = list(re.finditer(name_pattern, text, re.IGNORECASE))
-
-            if matches:
-                # Берем первое вхождение как основную позицию
-                start_pos = matches[0].start()
-                end_pos = matches[0].end()
-                person_positions.append(
-                    {
-                        "person": person,
-                        "start": start_pos,
-                        "end": end_pos,
-                        "center": (start_pos + end_pos) // 2,
-                    }
-                )
+        # Позиции всех персон в тексте (первое вхождение имени), отсортированные для bisect
+        person_index = self._person_span_index(persons, text)
 
         # Ассоциируем каждый ID с ближайшей персоной
         used_ids = set()
@@ -931,62 +918,36 @@ class SignalsService:
                 self._assign_id_to_all_persons(persons, id_info)
                 continue
 
-            id_start = id_info["position"][0]
-            id_end = id_info["position"][1]
-            id_center = (id_start + id_end) // 2
+            # Проверяем, что ID не был использован
+            id_key = f"{id_info['type']}_{id_info['value']}"
+            if id_key in used_ids:
+                continue
 
             # Находим ближайшую персону
-            closest_person = None
-            min_distance = float("inf")
-
-            for person_pos in person_positions:
-                # Проверяем, что ID не был использован
-                id_key = f"{id_info['type']}_{id_info['value']}"
-                if id_key in used_ids:
-                    continue
-
-                person_center = person_pos["center"]
-
-                # Вычисляем расстояние между центрами
-                distance = abs(id_center - person_center)
-
-                # Для смешанного языка увеличиваем максимальное расстояние
-                max_distance = 500 if is_mixed_language else 300
-                
-                # Ограичиваем максимальным расстоянием
-                # (больше для смешанного языка, т.к. ID могут быть в другой части текста)
-                if distance < max_distance and distance < min_distance:
-                    min_distance = distance
-                    closest_person = person_pos["person"]
-
-                    self.logger.debug(
-                        f"ID {id_info['type']}:{id_info['value']} distance {distance} to person "
-                        f"{''.join(person_pos['person'].core)} (new closest)"
-                    )
+            nearest = person_index.nearest(id_info["position"], max_distance)
+            if nearest is None:
+                continue
+            closest_person, min_distance = persons[nearest[0]], nearest[1]
 
-            # Назначаем ID ближайшей персоне
-            if closest_person:
-                id_key = f"{id_info['type']}_{id_info['value']}"
-                if id_key not in used_ids:
-                    # Дополнительная проверка: если персона уже имеет ID того же типа,
-                    # это может быть признаком ошибки или наличия нескольких сущностей
-                    existing_id_types = {existing_id["type"] for existing_id in closest_person.ids}
+            # Дополнительная проверка: если персона уже имеет ID того же типа,
+            # это может быть признаком ошибки или наличия нескольких сущностей
+            existing_id_types = {existing_id["type"] for existing_id in closest_person.ids}
 
-                    if id_info["type"] in existing_id_types:
-                        self.logger.debug(
-                            f"Person {''.join(closest_person.core)} already has ID of type "
-                            f"{id_info['type']}, possible multiple entities"
-                        )
-                        # Не назначаем дублирующий тип ID той же персоне
-                        # Это ID останется для fallback логики
-                    else:
-                        self._assign_id_to_person(closest_person, id_info)
-                        used_ids.add(id_key)
+            if id_info["type"] in existing_id_types:
+                self.logger.debug(
+                    f"Person {''.join(closest_person.core)} already has ID of type "
+                    f"{id_info['type']}, possible multiple entities"
+                )
+                # Не назначаем дублирующий тип ID той же персоне
+                # Это ID останется для fallback логики
+            else:
+                self._assign_id_to_person(closest_person, id_info)
+                used_ids.add(id_key)
 
-                        self.logger.debug(
-                            f"Linked ID {id_info['type']}:{id_info['value']} to person "
-                            f"{''.join(closest_person.core)} (distance: {min_distance})"
-                        )
+                self.logger.debug(
+                    f"Linked ID {id_info['type']}:{id_info['value']} to person "
+                    f"{''.join(closest_person.core)} (distance: {min_distance})"
+                )
 
         # Если остались персоны без ID, но есть неиспользованные ID,
         # применяем fallback логику для оставшихся ID
@@ -1008,11 +969,12 @@ class SignalsService:
             can_apply_single_fallback = True
             if len(persons_without_ids) == 1 and len(remaining_ids) == 1:
                 id_info = remaining_ids[0]
-                if "position" in id_info and person_positions:
-                    person_pos = person_positions[0]  # Единственная персона
-                    id_center = (id_info["position"][0] + id_info["position"][1]) // 2
-                    person_center = person_pos["center"]
-                    distance = abs(id_center - person_center)
+                first_person = person_index.first_located()  # Единственная персона
+                if "position" in id_info and first_person is not None:
+                    distance = abs(
+                        span_center(id_info["position"])
+                        - span_center(person_index.spans[first_person])
+                    )
 
                     # Если расстояние экстремально большое (>500), не применяем fallback
                     if distance > 500:
@@ -1062,6 +1024,16 @@ class SignalsService:
         for person in persons:
             self._assign_id_to_person(person, id_info)
 
+    def _person_span_index(self, persons: List[PersonSignal], text: str) -> SpanIndex:
+        """Span index of the persons' first mentions, shared by ID and birthdate linking."""
+        names = tuple(" ".join(person.core) for person in persons)
+        cached = self._person_span_cache
+        if cached is not None and cached[0] == text and cached[1] == names:
+            return cached[2]
+        person_index = SpanIndex(locate_spans(text, names))
+        self._person_span_cache = (text, names, person_index)
+        return person_index
+
     def _enrich_persons_with_birthdates(
         self, persons: List[PersonSignal], birthdates: List[Dict], text: str
     ):
@@ -1069,61 +1041,24 @@ class SignalsService:
         if not birthdates or not persons:
             return
 
-        # Найдем позиции всех персон в тексте для proximity matching
-        person_positions = []
-        for person in persons:
-            # Составляем полное имя для поиска
-            full_name = " ".join(person.core)
-
-            # Ищем все вхождения имени в тексте
-            import re
-
-            name_pattern = re.escape(full_name)
-            matches = list(re.finditer(name_pattern, text, re.IGNORECASE))
-
-            if matches:
-                # Берем первое вхождение как основную позицию
-                start_pos = matches[0].start()
-                end_pos = matches[0].end()
-                person_positions.append(
-                    {
-                        "person": person,
-                        "start": start_pos,
-                        "end": end_pos,
-                        "center": (start_pos + end_pos) // 2,
-                    }
-                )
+        # Позиции всех персон в тексте (первое вхождение имени), отсортированные для bisect
+        person_index = self._person_span_index(persons, text)
 
         # Ассоциируем каждую дату рождения с ближайшей персоной
         used_birthdates = set()
 
         for date_info in birthdates:
-            date_start = date_info["position"][0]
-            date_end = date_info["position"][1]
-            date_center = (date_start + date_end) // 2
+            # Проверяем, что дата не была использована
+            if date_info["raw"] in used_birthdates:
+                continue
 
             # Находим ближайшую персону
-            closest_person = None
-            min_distance = float("inf")
-
-            for person_pos in person_positions:
-                # Проверяем, что дата не была использована
-                if date_info["raw"] in used_birthdates:
-                    continue
-
-                person_center = person_pos["center"]
-
-                # Вычисляем расстояние между центрами
-                distance = abs(date_center - person_center)
-
-                # Дополнительно учитываем, находится ли дата в "разумном" диапазоне от персоны
-                # Ограничиваем максимальным расстоянием в 200 символов
-                if distance < 200 and distance < min_distance:
-                    min_distance = distance
-                    closest_person = person_pos["person"]
+            # Ограничиваем максимальным расстоянием в 200 символов
+            nearest = person_index.nearest(date_info["position"], 200)
 
             # Назначаем дату ближайшей персоне
-            if closest_person and date_info["raw"] not in used_birthdates:
+            if nearest is not None:
+                closest_person = persons[nearest[0]]
                 closest_person.dob = date_info["iso_format"]  # ISO формат YYYY-MM-DD
                 closest_person.dob_raw = date_info["raw"]  # Исходный текст
                 closest_person.evidence.append("birthdate_found")
@@ -1317,89 +1252,7 @@ class SignalsService:
         """Backward compatibility method for tests - returns result with object attributes"""
         result_dict = await self.extract_async(text, normalization_result, language)
 
-        # Create a simple object wrapper for backward compatibility
-        class ResultWrapper:
-            def __init__(self, result_dict):
-                # Convert person dicts to simple objects with attributes
-                self.persons = []
-                for person_dict in result_dict.get("persons", []):
-                    person_obj = type('PersonObj', (), {})()
-                    for key, value in person_dict.items():
-                        setattr(person_obj, key, value)
-                    self.persons.append(person_obj)
-
-                # Convert organization dicts to simple objects with attributes
-                self.organizations = []
-                for org_dict in result_dict.get("organizations", []):
-                    org_obj = type('OrgObj', (), {})()
-                    for key, value in org_dict.items():
-                        # Map 'full' to 'full_name' for backward compatibility
-                        if key == "full":
-                            setattr(org_obj, "full_name", value)
-                            setattr(org_obj, key, value)  # Keep original too
-                        else:
-                            setattr(org_obj, key, value)
-
-                    # Ensure 'full' attribute always exists for backward compatibility
-                    if not hasattr(org_obj, 'full'):
-                        setattr(org_obj, 'full', None)
-                    if not hasattr(org_obj, 'full_name'):
-                        setattr(org_obj, 'full_name', None)
-
-                    self.organizations.append(org_obj)
-
-                # Copy other attributes directly
-                for key, value in result_dict.items():
-                    if key not in ["persons", "organizations"]:
-                        setattr(self, key, value)
-
-                # Add backward compatibility attributes for test expectations
-                # Extract numbers (IDs) from persons and organizations
-                self.numbers = {}
-                all_ids = []
-
-                # Collect IDs from persons
-                for person in self.persons:
-                    if hasattr(person, 'ids') and person.ids:
-                        all_ids.extend(person.ids)
-
-                # Collect IDs from organizations
-                for org in self.organizations:
-                    if hasattr(org, 'ids') and org.ids:
-                        all_ids.extend(org.ids)
-
-                # Organize IDs by type
-                for id_item in all_ids:
-                    if isinstance(id_item, dict):
-                        id_type = id_item.get('type', 'unknown')
-                        id_value = id_item.get('value', id_item.get('raw', ''))
-                        if id_type not in self.numbers:
-                            self.numbers[id_type] = []
-                        self.numbers[id_type].append(id_value)
-
-                # Extract dates from persons
-                self.dates = {}
-                birth_dates = []
-
-                for person in self.persons:
-                    # Check for both dob and birth_date attributes for compatibility
-                    dob = None
-                    if hasattr(person, 'dob') and person.dob:
-                        dob = person.dob
-                    elif hasattr(person, 'birth_date') and person.birth_date:
-                        dob = person.birth_date
-
-                    if dob:
-                        birth_dates.append(str(dob))
-
-                # Also check extras for dates
-                extras_dates = result_dict.get("extras", {}).get("dates", [])
-                birth_dates.extend(extras_dates)
-
-                if birth_dates:
-                    self.dates['birth_dates'] = birth_dates
-
-        return ResultWrapper(result_dict)
+        return SignalsResultWrapper(result_dict)
 
     def _extract_person_tokens(self, text: str, language: str) -> List[List[str]]:
         """
@@ -1549,6 +1402,8 @@ class SignalsService:
         trace = normalization_result['trace']
         person_ids = []
         organization_ids = []
+        # INN candidates in the text, scanned once for all marked tokens
+        inn_matches = None
 
         self.logger.debug(f"[CHECK] ID TRACE: Processing {len(trace)} trace entries")
 
@@ -1559,9 +1414,8 @@ class SignalsService:
 
                 if token_text and token_text.isdigit():
                     # Найдем позицию токена в исходном тексте
-                    import re
-                    matches = list(re.finditer(re.escape(token_text), text))
-                    position = matches[0].span() if matches else (0, len(token_text))
+                    start = text.find(token_text)
+                    position = (start, start + len(token_text)) if start >= 0 else (0, len(token_text))
 
                     # Определяем тип ID на основе длины и контекста
                     id_length = len(token_text)
@@ -1592,9 +1446,8 @@ class SignalsService:
                 token_text = entry.get('token', '')
                 if token_text and token_text.isdigit() and len(token_text) >= 10:
                     # Ищем ИНН в исходном тексте рядом с этим токеном
-                    import re
-                    inn_pattern = r'(?:(?:ИНН|инн|INN)\s*[\:\:]?\s*)?(\d{10,12})'
-                    inn_matches = list(re.finditer(inn_pattern, text))
+                    if inn_matches is None:
+                        inn_matches = list(_TRACE_INN_RE.finditer(text))
 
                     inn_found = False
                     for match in inn_matches:
@@ -1684,6 +1537,7 @@ class SignalsService:
             organizations: Список организаций для обогащения
         """
         try:
+            from ...layers.search.sanctioned_id_index import index_id_type
             from ...layers.search.sanctioned_inn_cache import get_inn_cache
             inn_cache = get_inn_cache()
 
@@ -1750,7 +1604,7 @@ class SignalsService:
             # Проверяем каждый ID в cache
             sanctioned_matches = 0
             for id_value, entity_type, id_info in all_ids_to_check:
-                sanctioned_data = inn_cache.lookup(id_value)
+                sanctioned_data = inn_cache.lookup(id_value, index_id_type(id_info.get("type")))
 
                 # Record cache lookup metrics
                 cache_hit = sanctioned_data is not None
@@ -1855,7 +1709,11 @@ class SignalsService:
         """
         if not text:
             return False
-            
+
+        profile = get_text_profile(text)
+        if profile is not None:
+            return profile.has_mixed_scripts
+
         # Count Cyrillic characters
         cyrillic_count = len(re.findall(r"[а-яёіїєґ]", text, re.IGNORECASE))
         
@@ -0,0 +1,110 @@
+"""
+Sorted span index for proximity linking.
+
+SignalsService attaches identifiers and birthdates to the nearest person
+mention. It used to compile ``re.escape(full_name)`` and scan the whole text
+for every person, once for the IDs and again for the birthdates, and then
+compare every ID against every person. Person mentions are now located once
+per text on a single lowercased copy (``str.find``, no regex compilation;
+repeated names are looked up once) and their centers are kept in a sorted
+array, so each ID or date finds its nearest person with one bisect.
+"""
+
+import bisect
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Span = Tuple[int, int]
+
+
+def locate_spans(text: str, phrases: Sequence[str]) -> List[Optional[Span]]:
+    """
+    Span of the first case-insensitive occurrence of each phrase in ``text``.
+
+    Args:
+        text: Text to search
+        phrases: Phrases to locate (repeated phrases are searched once)
+
+    Returns:
+        (start, end) per phrase, None where the phrase does not occur
+    """
+    text_lower = text.lower()
+    # Lowercasing may change the length (e.g. "İ"); offsets would not line up
+    exact_offsets = len(text_lower) == len(text)
+    found: Dict[str, Optional[Span]] = {}
+    spans: List[Optional[Span]] = []
+    for phrase in phrases:
+        if phrase not in found:
+            found[phrase] = _locate(text, text_lower, phrase, exact_offsets)
+        spans.append(found[phrase])
+    return spans
+
+
+def _locate(
+    text: str, text_lower: str, phrase: str, exact_offsets: bool
+) -> Optional[Span]:
+    phrase_lower = phrase.lower()
+    if exact_offsets and len(phrase_lower) == len(phrase):
+        start = text_lower.find(phrase_lower)
+        return (start, start + len(phrase)) if start >= 0 else None
+    match = re.search(re.escape(phrase), text, re.IGNORECASE)
+    return match.span() if match else None
+
+
+def span_center(span: Span) -> int:
+    return (span[0] + span[1]) // 2
+
+
+class SpanIndex:
+    """
+    Centers of located spans, sorted for nearest-neighbour queries.
+
+    Items are identified by their position in the list the index was built
+    from; when several items are equally close the earliest one wins.
+    """
+
+    def __init__(self, spans: Sequence[Optional[Span]]):
+        owners: Dict[int, int] = {}
+        for item, span in enumerate(spans):
+            if span is not None:
+                owners.setdefault(span_center(span), item)
+        self._centers = sorted(owners)
+        self._owners = [owners[center] for center in self._centers]
+        self.spans = list(spans)
+
+    def __len__(self) -> int:
+        return len(self._centers)
+
+    def nearest(
+        self, span: Span, max_distance: float = float("inf")
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Item whose center is nearest to the center of ``span``.
+
+        Args:
+            span: (start, end) to measure from
+            max_distance: Only items strictly closer than this qualify
+
+        Returns:
+            (item, distance) or None
+        """
+        center = span_center(span)
+        i = bisect.bisect_left(self._centers, center)
+        best: Optional[Tuple[int, int]] = None
+        for j in (i - 1, i):
+            if 0 <= j < len(self._centers):
+                distance = abs(center - self._centers[j])
+                if distance < max_distance and (
+                    best is None
+                    or distance < best[1]
+                    or (distance == best[1] and self._owners[j] < best[0])
+                ):
+                    best = (self._owners[j], distance)
+        return best
+
+    def first_located(self) -> Optional[int]:
+        """Earliest item that was found in the text."""
+        for item, span in enumerate(self.spans):
+            if span is not None:
+                return item
+        return None
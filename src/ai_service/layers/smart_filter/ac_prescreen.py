@@ -0,0 +1,281 @@
+"""
+Local Aho-Corasick pre-screen over tier-0/1 sanctions patterns.
+
+The smart filter's tier-0 check used to send a wildcard query to the
+Elasticsearch AC pattern index for the input and for every name-order
+variant, i.e. several blocking round trips per request. Tier-0 (exact
+documents and full names) and tier-1 (high-recall name forms) patterns are
+few enough to keep in memory, so ``ACPrescreenIndex`` compiles them into one
+``ahocorasick.Automaton`` and matches the whole text in a single pass.
+
+This changes which inputs match. The ES query was ``*<input>*`` over the
+pattern field, i.e. it found patterns *containing* the input, so a partial
+name such as "петров" hit the full-name pattern "іван петров". The
+automaton finds patterns *contained in* the input on word boundaries: a
+payment text mentioning "Іван Петров" now hits that pattern, while a lone
+name fragment no longer does (partial names are left to the tier-2/3
+patterns and the search layer).
+
+``get_prescreen_index()`` loads the index once per process; the pre-fork
+master warms it before forking so workers share its pages. Patterns come
+from ``$AC_PRESCREEN_PATTERNS`` or the newest
+``output/sanctions/ac_patterns_*.json`` export. If neither exists (or
+pyahocorasick is missing) the index is unavailable and the smart filter
+falls back to querying Elasticsearch asynchronously.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ...utils.json_stream import iter_pattern_records
+from ...utils.logging_config import get_logger
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - declared dependency
+    ahocorasick = None
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_PATTERNS_DIR = PROJECT_ROOT / "output" / "sanctions"
+PATTERNS_PATH_ENV = "AC_PRESCREEN_PATTERNS"
+PATTERNS_GLOB = "ac_patterns_*.json"
+
+# Tiers served locally; tier 2/3 patterns stay in Elasticsearch
+PRESCREEN_TIERS = (0, 1)
+
+# Patterns shorter than this match inside too many unrelated words
+MIN_PATTERN_LENGTH = 3
+
+# Payload stored per pattern: (pattern, tier, type, entity_type, entity_id, confidence)
+_Entry = Tuple[str, int, str, str, str, float]
+
+
+def _nfc_lower(value: str) -> str:
+    return unicodedata.normalize("NFC", value).lower()
+
+
+def find_patterns_file(patterns_dir: Optional[Path] = None) -> Optional[Path]:
+    """Pattern export to load: $AC_PRESCREEN_PATTERNS or the newest export in ``patterns_dir``."""
+    configured = os.getenv(PATTERNS_PATH_ENV)
+    if configured:
+        path = Path(configured)
+        return path if path.exists() else None
+    patterns_dir = patterns_dir or DEFAULT_PATTERNS_DIR
+    if not patterns_dir.is_dir():
+        return None
+    # Export names carry a sortable timestamp (ac_patterns_YYYYMMDD_HHMMSS.json)
+    candidates = sorted(patterns_dir.glob(PATTERNS_GLOB), reverse=True)
+    return candidates[0] if candidates else None
+
+
+def _tier_of(record: Dict[str, Any]) -> Optional[int]:
+    tier = record.get("tier")
+    if isinstance(tier, str):
+        tier = tier.rsplit("_", 1)[-1]
+    try:
+        return int(tier)
+    except (TypeError, ValueError):
+        return None
+
+
+class ACPrescreenIndex:
+    """In-memory automaton over tier-0/1 patterns."""
+
+    def __init__(
+        self,
+        automaton: Any,
+        pattern_count: int,
+        source: Optional[str] = None,
+        build_time_s: float = 0.0,
+    ):
+        self._automaton = automaton
+        self.pattern_count = pattern_count
+        self.source = source
+        self.build_time_s = build_time_s
+
+    @classmethod
+    def build(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        tiers: Tuple[int, ...] = PRESCREEN_TIERS,
+        source: Optional[str] = None,
+    ) -> "ACPrescreenIndex":
+        """
+        Compile pattern records into an index.
+
+        Args:
+            records: Pattern records as exported by HighRecallACGenerator
+            tiers: Tiers to keep
+            source: Where the records came from (for stats)
+
+        Returns:
+            Compiled index
+
+        Raises:
+            RuntimeError: If pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            raise RuntimeError("pyahocorasick is not installed")
+
+        start = time.perf_counter()
+        entries: Dict[str, List[_Entry]] = {}
+        for record in records:
+            tier = _tier_of(record)
+            if tier is None or tier not in tiers:
+                continue
+            pattern = _nfc_lower(str(record.get("pattern", "")).strip())
+            if len(pattern) < MIN_PATTERN_LENGTH:
+                continue
+            entry = (
+                pattern,
+                tier,
+                str(record.get("type", "unknown")),
+                str(record.get("entity_type", "unknown")),
+                str(record.get("entity_id", "")),
+                float(record.get("confidence", 0.5)),
+            )
+            bucket = entries.setdefault(pattern, [])
+            if entry not in bucket:
+                bucket.append(entry)
+
+        automaton = ahocorasick.Automaton()
+        for pattern, bucket in entries.items():
+            automaton.add_word(pattern, tuple(bucket))
+        if entries:
+            automaton.make_automaton()
+        return cls(automaton, len(entries), source, time.perf_counter() - start)
+
+    @classmethod
+    def from_file(
+        cls, path: Path, tiers: Tuple[int, ...] = PRESCREEN_TIERS
+    ) -> "ACPrescreenIndex":
+        """Stream an AC pattern export and compile its tier-0/1 patterns."""
+        index = cls.build(iter_pattern_records(path), tiers=tiers, source=str(path))
+        logger.info(
+            f"AC pre-screen index: {index.pattern_count} tier {'/'.join(map(str, tiers))} patterns "
+            f"from {path.name} in {index.build_time_s:.2f}s"
+        )
+        return index
+
+    def search(
+        self, text: str, max_matches: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find patterns occurring in ``text`` on word boundaries.
+
+        Only whole patterns found inside ``text`` match; unlike the former ES
+        wildcard query, a ``text`` that is merely part of a longer pattern
+        does not.
+
+        Args:
+            text: Unicode-normalized text (case is folded here)
+            max_matches: Maximum number of matches to return
+
+        Returns:
+            Matches ordered by tier, then confidence, in the smart filter's
+            match format (offsets refer to ``text``)
+        """
+        if not self.pattern_count or not text:
+            return []
+        haystack = _nfc_lower(text)
+        if len(haystack) != len(text):
+            # Case folding changed the length; offsets would not line up
+            haystack = text.lower()
+
+        matches: List[Dict[str, Any]] = []
+        for end_idx, bucket in self._automaton.iter(haystack):
+            pattern = bucket[0][0]
+            start = end_idx - len(pattern) + 1
+            end = end_idx + 1
+            if not _on_word_boundary(haystack, start, end):
+                continue
+            for (
+                pattern,
+                tier,
+                pattern_type,
+                entity_type,
+                entity_id,
+                confidence,
+            ) in bucket:
+                matches.append(
+                    {
+                        "pattern": pattern,
+                        "tier": f"tier_{tier}",
+                        "start": start,
+                        "end": end,
+                        "matched_text": text[start:end],
+                        "confidence": confidence,
+                        "pattern_type": pattern_type,
+                        "entity_type": entity_type,
+                        "entity_id": entity_id,
+                    }
+                )
+
+        matches.sort(key=lambda m: (m["tier"], -m["confidence"], m["start"]))
+        return matches[:max_matches] if max_matches else matches
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "patterns": self.pattern_count,
+            "source": self.source,
+            "build_time_s": round(self.build_time_s, 3),
+        }
+
+
+def _on_word_boundary(text: str, start: int, end: int) -> bool:
+    if start > 0 and text[start - 1].isalnum() and text[start].isalnum():
+        return False
+    if end < len(text) and text[end].isalnum() and text[end - 1].isalnum():
+        return False
+    return True
+
+
+# Process-wide index; None with _index_loaded set means "unavailable"
+_index: Optional[ACPrescreenIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_prescreen_index() -> Optional[ACPrescreenIndex]:
+    """
+    Get the process-wide pre-screen index, loading it on first use.
+
+    Returns:
+        The index, or None if no pattern export is available or it failed to load
+    """
+    global _index, _index_loaded
+    if _index_loaded:
+        return _index
+    with _index_lock:
+        if not _index_loaded:
+            path = find_patterns_file()
+            if path is None:
+                logger.info(
+                    "AC pre-screen index unavailable: no AC pattern export found"
+                )
+            else:
+                try:
+                    _index = ACPrescreenIndex.from_file(path)
+                except Exception as e:
+                    logger.warning(
+                        f"AC pre-screen index unavailable: failed to load {path}: {e}"
+                    )
+                    _index = None
+            _index_loaded = True
+    return _index
+
+
+def clear_prescreen_index() -> None:
+    """Drop the process-wide index so the next call reloads it (useful for testing)."""
+    global _index, _index_loaded
+    with _index_lock:
+        _index = None
+        _index_loaded = False
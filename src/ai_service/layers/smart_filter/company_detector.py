@@ -7,19 +7,32 @@ of potential company names.
 """
 
 # Standard library imports
-import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 # Local imports
 from ...data.dicts.smart_filter_patterns import (
     ADDRESS_PATTERNS,
+    BANKING_TERMS,
     COMPANY_KEYWORDS,
     COMPANY_PATTERNS,
+    FINANCIAL_SERVICES_PATTERNS,
     REGISTRATION_PATTERNS,
     SIGNAL_WEIGHTS,
 )
 from ...utils.logging_config import get_logger
+from .detection_engine import (
+    ADDRESSES_FAMILY,
+    BANKING_TERMS_FAMILY,
+    BUSINESS_TYPES_FAMILY,
+    CAPITALIZED_NAMES_FAMILY,
+    COMPANY_KEYWORDS_FAMILY,
+    FINANCIAL_SERVICES_FAMILY,
+    LEGAL_ENTITIES_FAMILY,
+    REGISTRATION_FAMILY,
+    DetectionHits,
+    get_detection_engine,
+)
 
 
 @dataclass
@@ -52,214 +65,26 @@ class CompanyDetector:
         # Patterns for registration numbers (from dictionary)
         self.registration_patterns = REGISTRATION_PATTERNS.copy()
 
-        # Extended banking terms
-        self.banking_terms = {
-            "ukrainian": [
-                "банк",
-                "банківська",
-                "банківський",
-                "банківське",
-                "кредитний",
-                "кредитна",
-                "кредитне",
-                "фінансовий",
-                "фінансова",
-                "фінансове",
-                "фінансові",
-                "операції",
-                "програми",
-                "інвестиційний",
-                "інвестиційна",
-                "інвестиційне",
-                "страховий",
-                "страхова",
-                "страхове",
-                "лізинговий",
-                "лізингова",
-                "лізингове",
-                "факторинговий",
-                "факторингова",
-                "факторингове",
-                "мікрофінанс",
-                "мікрокредит",
-                "платіжний",
-                "платіжна",
-                "платіжне",
-                "розрахунковий",
-                "розрахункова",
-                "розрахункове",
-                "депозитний",
-                "депозитна",
-                "депозитне",
-                "валютний",
-                "валютна",
-                "валютне",
-                "біржовий",
-                "біржова",
-                "біржове",
-                "брокерський",
-                "брокерська",
-                "брокерське",
-                "трастовий",
-                "трастова",
-                "трастове",
-                "клірингова",
-                "клірингове",
-                "клірингової",
-                "національний банк",
-                "центральний банк",
-                "комерційний банк",
-                "ощадний банк",
-                "приват банк",
-                "альфа банк",
-                "укрексімбанк",
-                "ощадбанк",
-                "райффайзен",
-                "кредитспілка",
-                "кредитна спілка",
-                "ломбард",
-                "мікрофінансова організація",
-            ],
-            "russian": [
-                "банк",
-                "банковская",
-                "банковский",
-                "банковское",
-                "кредитный",
-                "кредитная",
-                "кредитное",
-                "финансовый",
-                "финансовая",
-                "финансовое",
-                "инвестиционный",
-                "инвестиционная",
-                "инвестиционное",
-                "страховой",
-                "страховая",
-                "страховое",
-                "лизинговый",
-                "лизинговая",
-                "лизинговое",
-                "факторинговый",
-                "факторинговая",
-                "факторинговое",
-                "микрофинанс",
-                "микрокредит",
-                "платежный",
-                "платежная",
-                "платежное",
-                "расчетный",
-                "расчетная",
-                "расчетное",
-                "депозитный",
-                "депозитная",
-                "депозитное",
-                "валютный",
-                "валютная",
-                "валютное",
-                "биржевой",
-                "биржевая",
-                "биржевое",
-                "брокерский",
-                "брокерская",
-                "брокерское",
-                "трастовый",
-                "трастовая",
-                "трастовое",
-                "клиринговая",
-                "клиринговое",
-                "клиринговой",
-                "национальный банк",
-                "центральный банк",
-                "коммерческий банк",
-                "сберегательный банк",
-                "приват банк",
-                "альфа банк",
-                "сбербанк",
-                "втб",
-                "газпромбанк",
-                "россельхозбанк",
-                "кредитный союз",
-                "ломбард",
-                "микрофинансовая организация",
-            ],
-            "english": [
-                "bank",
-                "banking",
-                "financial",
-                "finance",
-                "investment",
-                "credit",
-                "loan",
-                "insurance",
-                "leasing",
-                "factoring",
-                "microfinance",
-                "microcredit",
-                "payment",
-                "settlement",
-                "deposit",
-                "currency",
-                "exchange",
-                "trading",
-                "brokerage",
-                "trust",
-                "clearing",
-                "custodial",
-                "wealth",
-                "asset",
-                "fund",
-                "capital",
-                "national bank",
-                "central bank",
-                "commercial bank",
-                "savings bank",
-                "investment bank",
-                "private bank",
-                "retail bank",
-                "corporate bank",
-                "development bank",
-                "jpmorgan",
-                "goldman sachs",
-                "morgan stanley",
-                "wells fargo",
-                "bank of america",
-                "credit union",
-                "credit card",
-                "debit card",
-                "atm",
-                "swift",
-                "wire transfer",
-                "correspondent bank",
-                "nostro",
-                "vostro",
-                "clearing house",
-                "settlement system",
-            ],
-        }
+        # Extended banking terms (from dictionary)
+        self.banking_terms = BANKING_TERMS.copy()
+
+        # Special patterns for financial services (from dictionary)
+        self.financial_services_patterns = FINANCIAL_SERVICES_PATTERNS.copy()
 
-        # Special patterns for financial services
-        self.financial_services_patterns = [
-            r"\b(?:банк|bank|банківський|банковский|banking)\b",
-            r"\b(?:кредит|credit|loan|позика|заем)\b",
-            r"\b(?:страхування|страхование|insurance|страховка)\b",
-            r"\b(?:інвестиції|инвестиции|investment|вложения)\b",
-            r"\b(?:біржа|биржа|exchange|trading|торги)\b",
-            r"\b(?:брокер|broker|брокерський|брокерский)\b",
-            r"\b(?:фінанси|финансы|finance|фінансовий|финансовый)\b",
-            r"\b(?:платіжний|платежный|payment|оплата|платеж)\b",
-            r"\b(?:депозит|deposit|вклад|депозитний|депозитный)\b",
-            r"\b(?:валюта|currency|обмін|обмен|exchange)\b",
-        ]
+        # Keywords and patterns above, compiled once per process
+        self.engine = get_detection_engine()
 
         self.logger.info("CompanyDetector initialized")
 
-    def detect_company_signals(self, text: str) -> Dict[str, Any]:
+    def detect_company_signals(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """
         Detect company signals in text
 
         Args:
             text: Text to analyze
+            hits: Detection engine hits for the text (scanned here if None)
 
         Returns:
             Company signal detection results
@@ -267,53 +92,55 @@ class CompanyDetector:
         if not text or not text.strip():
             return self._create_empty_result()
 
+        hits = self._scan(text, hits)
+
         signals = []
         total_confidence = 0.0
 
         # 1. Search for company keywords
-        keyword_signals = self._detect_keywords(text)
+        keyword_signals = self._detect_keywords(text, hits)
         if keyword_signals["confidence"] > 0:
             signals.append(keyword_signals)
             total_confidence += keyword_signals["confidence"]
 
         # 2. Search for legal entity patterns
-        legal_entity_signals = self._detect_legal_entities(text)
+        legal_entity_signals = self._detect_legal_entities(text, hits)
         if legal_entity_signals["confidence"] > 0:
             signals.append(legal_entity_signals)
             total_confidence += legal_entity_signals["confidence"]
 
         # 3. Search for business type patterns
-        business_type_signals = self._detect_business_types(text)
+        business_type_signals = self._detect_business_types(text, hits)
         if business_type_signals["confidence"] > 0:
             signals.append(business_type_signals)
             total_confidence += business_type_signals["confidence"]
 
         # 4. Search for address information
-        address_signals = self._detect_addresses(text)
+        address_signals = self._detect_addresses(text, hits)
         if address_signals["confidence"] > 0:
             signals.append(address_signals)
             total_confidence += address_signals["confidence"]
 
         # 5. Search for registration numbers
-        registration_signals = self._detect_registration_numbers(text)
+        registration_signals = self._detect_registration_numbers(text, hits)
         if registration_signals["confidence"] > 0:
             signals.append(registration_signals)
             total_confidence += registration_signals["confidence"]
 
         # 6. Search for capitalized names (potential company names)
-        capitalized_signals = self._detect_capitalized_names(text)
+        capitalized_signals = self._detect_capitalized_names(text, hits)
         if capitalized_signals["confidence"] > 0:
             signals.append(capitalized_signals)
             total_confidence += capitalized_signals["confidence"]
 
         # 7. Search for banking terms
-        banking_signals = self._detect_banking_terms(text)
+        banking_signals = self._detect_banking_terms(text, hits)
         if banking_signals["confidence"] > 0:
             signals.append(banking_signals)
             total_confidence += banking_signals["confidence"]
 
         # 8. Search for financial services
-        financial_services_signals = self._detect_financial_services(text)
+        financial_services_signals = self._detect_financial_services(text, hits)
         if financial_services_signals["confidence"] > 0:
             signals.append(financial_services_signals)
             total_confidence += financial_services_signals["confidence"]
@@ -331,15 +158,11 @@ class CompanyDetector:
             "analysis_complete": True,
         }
 
-    def _detect_keywords(self, text: str) -> Dict[str, Any]:
+    def _detect_keywords(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect company keywords"""
-        matches = []
-        text_lower = text.lower()
-
-        for language, keywords in self.company_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    matches.append(keyword)
+        matches = self._scan(text, hits).keywords(COMPANY_KEYWORDS_FAMILY)
 
         confidence = min(len(matches) * 0.2, 0.8) if matches else 0.0
 
@@ -350,13 +173,11 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_legal_entities(self, text: str) -> Dict[str, Any]:
+    def _detect_legal_entities(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect legal entities"""
-        matches = []
-
-        for pattern in self.company_patterns["legal_entities"]:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(LEGAL_ENTITIES_FAMILY)
 
         confidence = min(len(matches) * 0.3, 0.9) if matches else 0.0
 
@@ -367,13 +188,11 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_business_types(self, text: str) -> Dict[str, Any]:
+    def _detect_business_types(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect business types"""
-        matches = []
-
-        for pattern in self.company_patterns["business_types"]:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(BUSINESS_TYPES_FAMILY)
 
         confidence = min(len(matches) * 0.25, 0.8) if matches else 0.0
 
@@ -384,13 +203,11 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_addresses(self, text: str) -> Dict[str, Any]:
+    def _detect_addresses(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect address information"""
-        matches = []
-
-        for pattern in self.address_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(ADDRESSES_FAMILY)
 
         confidence = min(len(matches) * 0.4, 0.7) if matches else 0.0
 
@@ -401,13 +218,11 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_registration_numbers(self, text: str) -> Dict[str, Any]:
+    def _detect_registration_numbers(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect registration numbers"""
-        matches = []
-
-        for pattern in self.registration_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(REGISTRATION_FAMILY)
 
         confidence = min(len(matches) * 0.5, 0.8) if matches else 0.0
 
@@ -418,13 +233,12 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_capitalized_names(self, text: str) -> Dict[str, Any]:
+    def _detect_capitalized_names(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect capitalized names"""
-        # Pattern for words starting with capital letter
-        pattern = (
-            r"\b[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,}(?:\s+[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,})*\b"
-        )
-        matches = re.findall(pattern, text)
+        # Words starting with capital letter (CAPITALIZED_NAME_PATTERN)
+        matches = self._scan(text, hits).patterns(CAPITALIZED_NAMES_FAMILY)
 
         # Filter common words
         common_words = {"Оплата", "Платеж", "Перевод", "Счет", "Квитанция", "Документ"}
@@ -439,6 +253,10 @@ class CompanyDetector:
             "count": len(filtered_matches),
         }
 
+    def _scan(self, text: str, hits: Optional[DetectionHits]) -> DetectionHits:
+        """Engine hits for the text, reusing the caller's scan if given"""
+        return hits if hits is not None else self.engine.scan(text)
+
     def _extract_detected_keywords(self, signals: List[Dict[str, Any]]) -> List[str]:
         """Extract all detected keywords"""
         all_keywords = []
@@ -447,16 +265,12 @@ class CompanyDetector:
                 all_keywords.extend(signal["matches"])
         return list(set(all_keywords))
 
-    def _detect_banking_terms(self, text: str) -> Dict[str, Any]:
+    def _detect_banking_terms(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect banking terms"""
-        matches = []
-        text_lower = text.lower()
-
         # Search across all languages
-        for language, terms in self.banking_terms.items():
-            for term in terms:
-                if term.lower() in text_lower:
-                    matches.append(term)
+        matches = self._scan(text, hits).keywords(BANKING_TERMS_FAMILY)
 
         confidence = min(len(matches) * 0.6, 0.9) if matches else 0.0
 
@@ -467,13 +281,11 @@ class CompanyDetector:
             "count": len(matches),
         }
 
-    def _detect_financial_services(self, text: str) -> Dict[str, Any]:
+    def _detect_financial_services(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect financial services by patterns"""
-        matches = []
-
-        for pattern in self.financial_services_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(FINANCIAL_SERVICES_FAMILY)
 
         confidence = min(len(matches) * 0.5, 0.8) if matches else 0.0
 
@@ -5,19 +5,19 @@ Combines signal detector results and makes decisions about Aho-Corasick search.
 """
 
 # Standard library imports
-import json
 import logging
 import re
 import time
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 # Local imports
 from ...utils.logging_config import get_logger
+from ..normalization.lexicon_bundle import get_lexicon_bundle
 from .company_detector import CompanyDetector
 from .confidence_scorer import ConfidenceScorer
+from .detection_engine import get_detection_engine
 from .document_detector import DocumentDetector
 from .name_detector import NameDetector
 from .terrorism_detector import TerrorismDetector
@@ -67,6 +67,7 @@ class DecisionLogic:
 
         # Initialize detectors
         self.name_detector = NameDetector()
+        self.detection_engine = get_detection_engine()
         self.company_detector = CompanyDetector()
         self.document_detector = DocumentDetector()
         self.terrorism_detector = (
@@ -127,38 +128,11 @@ class DecisionLogic:
     def _load_name_dictionaries(self):
         """Load name dictionaries to enhance language patterns"""
         try:
-            # Get data directory
-            data_dir = Path(__file__).parent.parent.parent.parent.parent / "data"
-
-            # Load diminutives (which include common names)
-            ru_names = set()
-            uk_names = set()
-            en_names = set()
-
-            # Load Russian diminutives/names
-            ru_file = data_dir / "diminutives_ru.json"
-            if ru_file.exists():
-                with open(ru_file, 'r', encoding='utf-8') as f:
-                    ru_data = json.load(f)
-                    # Both keys (diminutives) and values (canonical) are names
-                    ru_names.update(ru_data.keys())
-                    ru_names.update(ru_data.values())
-
-            # Load Ukrainian diminutives/names
-            uk_file = data_dir / "diminutives_uk.json"
-            if uk_file.exists():
-                with open(uk_file, 'r', encoding='utf-8') as f:
-                    uk_data = json.load(f)
-                    uk_names.update(uk_data.keys())
-                    uk_names.update(uk_data.values())
-
-            # Load English nicknames
-            en_file = data_dir / "lexicons" / "en_nicknames.json"
-            if en_file.exists():
-                with open(en_file, 'r', encoding='utf-8') as f:
-                    en_data = json.load(f)
-                    en_names.update(en_data.keys())
-                    en_names.update(en_data.values())
+            # Diminutives and canonical names from the shared lexicon bundle
+            bundle = get_lexicon_bundle()
+            ru_names = bundle.get_set("diminutive_names:ru")
+            uk_names = bundle.get_set("diminutive_names:uk")
+            en_names = bundle.get_set("diminutive_names:en")
 
             # Add top names to language patterns (limit to avoid bloat)
             if ru_names:
@@ -251,6 +225,8 @@ class DecisionLogic:
     def _collect_all_signals(self, text: str) -> Dict[str, Any]:
         """Collect signals from all detectors"""
         signals = {}
+        # Company and terrorism keywords/patterns, one engine pass
+        hits = self.detection_engine.scan(text)
 
         try:
             # Name signals
@@ -261,7 +237,9 @@ class DecisionLogic:
 
         try:
             # Company signals
-            signals["companies"] = self.company_detector.detect_company_signals(text)
+            signals["companies"] = self.company_detector.detect_company_signals(
+                text, hits=hits
+            )
         except Exception as e:
             self.logger.error(f"Error in company detection: {e}")
             signals["companies"] = {"confidence": 0.0, "signals": []}
@@ -277,7 +255,7 @@ class DecisionLogic:
             # Terrorism signals
             if self.terrorism_detector:
                 signals["terrorism"] = self.terrorism_detector.detect_terrorism_signals(
-                    text
+                    text, hits=hits
                 )
             else:
                 signals["terrorism"] = {
@@ -326,6 +304,8 @@ class DecisionLogic:
     ) -> Dict[str, Any]:
         """Collect signals from all detectors with language optimization"""
         signals = {}
+        # Company and terrorism keywords/patterns, one engine pass
+        hits = self.detection_engine.scan(text)
 
         self.logger.debug(
             f"Optimization for language: {detected_language}, weight: {language_weight:.2f}"
@@ -361,7 +341,9 @@ class DecisionLogic:
 
         try:
             # Company signals (with language optimization)
-            signals["companies"] = self.company_detector.detect_company_signals(text)
+            signals["companies"] = self.company_detector.detect_company_signals(
+                text, hits=hits
+            )
             if signals["companies"]["confidence"] > 0:
                 # Language bonuses for legal entity forms
                 if detected_language == "ukrainian" and any(
@@ -425,7 +407,7 @@ class DecisionLogic:
             # Terrorism signals (without language correction - universal)
             if self.terrorism_detector:
                 signals["terrorism"] = self.terrorism_detector.detect_terrorism_signals(
-                    text
+                    text, hits=hits
                 )
             else:
                 signals["terrorism"] = {
@@ -8,25 +8,8 @@ It uses simple heuristics like capitalization and dictionary lookups.
 import re
 from typing import Any, Dict, List, Set
 
-import json
-from pathlib import Path
-
 from ...data.dicts.smart_filter_patterns import SERVICE_WORDS
-
-# Load data from root data directory
-_data_dir = Path(__file__).parent.parent.parent.parent.parent / "data"
-
-# Load English nicknames
-with open(_data_dir / "lexicons" / "en_nicknames.json", "r", encoding="utf-8") as f:
-    ENGLISH_NICKNAMES = json.load(f)
-
-# Load Russian diminutives
-with open(_data_dir / "diminutives_ru.json", "r", encoding="utf-8") as f:
-    RUSSIAN_DIMINUTIVES = json.load(f)
-
-# Load Ukrainian diminutives  
-with open(_data_dir / "diminutives_uk.json", "r", encoding="utf-8") as f:
-    UKRAINIAN_DIMINUTIVES = json.load(f)
+from ..normalization.lexicon_bundle import get_lexicon_bundle
 from ...utils.logging_config import get_logger
 
 
@@ -56,15 +39,10 @@ class NameDetector:
         """Loads a combined set of names from the new flat dictionaries."""
         all_names = set()
 
-        # Add both keys (diminutives) and values (canonical names)
-        all_names.update(UKRAINIAN_DIMINUTIVES.keys())
-        all_names.update(UKRAINIAN_DIMINUTIVES.values())
-
-        all_names.update(RUSSIAN_DIMINUTIVES.keys())
-        all_names.update(RUSSIAN_DIMINUTIVES.values())
-
-        all_names.update(ENGLISH_NICKNAMES.keys())
-        all_names.update(ENGLISH_NICKNAMES.values())
+        # Both diminutives and canonical names, precompiled per language
+        bundle = get_lexicon_bundle()
+        for lang in ("uk", "ru", "en"):
+            all_names.update(bundle.get_set(f"diminutive_names:{lang}"))
 
         self.logger.info(f"Loaded {len(all_names)} unique names into the dictionary.")
         return {"all": all_names}
@@ -70,8 +70,13 @@ class SmartFilterAdapter(SmartFilterInterface):
         start_time = time.time()
 
         try:
+            # Tier-0 AC lookup first: local index, or ES without blocking the loop
+            ac_kwargs = {}
+            if self._service.aho_corasick_enabled is True:
+                ac_kwargs["ac_matches"] = await self._service.find_ac_matches_async(text.strip())
+
             # Use existing service for detection
-            filter_result = self._service.should_process_text(text)
+            filter_result = self._service.should_process_text(text, **ac_kwargs)
 
             # Map existing result to new contract
             classification = self._map_to_classification(
@@ -6,8 +6,10 @@ Intelligent pre-filtering service for Aho-Corasick search decisions.
 
 # Standard library imports
 import asyncio
+import functools
 import os
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -22,16 +24,32 @@ from ...data.dicts.smart_filter_patterns import (
 )
 from ...exceptions import LanguageDetectionError, SmartFilterError
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import get_text_profile
 from ..signals.signals_service import SignalsService
 from ..patterns.unified_pattern_service import UnifiedPatternService
+from .ac_prescreen import ACPrescreenIndex, get_prescreen_index
 from .company_detector import CompanyDetector
 from .confidence_scorer import ConfidenceScorer
 from .decision_logic import DecisionLogic, DecisionType, RiskLevel
+from .detection_engine import DetectionHits, get_detection_engine, payment_family
 from .document_detector import DocumentDetector
 from .name_detector import NameDetector
 from .terrorism_detector import TerrorismDetector
 
 
+_unicode_service = None
+
+
+def _normalize_for_ac(text: str) -> str:
+    """Unicode/homoglyph normalization applied to AC patterns, with one shared UnicodeService"""
+    global _unicode_service
+    if _unicode_service is None:
+        from ..unicode.unicode_service import UnicodeService
+
+        _unicode_service = UnicodeService()
+    return _unicode_service.normalize_text(text, normalize_homoglyphs=True)["normalized"]
+
+
 @dataclass
 class FilterResult:
     """Result of smart filter operation"""
@@ -85,13 +103,19 @@ class SmartFilterService:
             else:
                 self.aho_corasick_enabled = enable_aho_corasick
             self.pattern_service = pattern_service or UnifiedPatternService()
+            if self.aho_corasick_enabled:
+                # Load the tier-0/1 index with the service (in the pre-fork
+                # master this shares it with all workers)
+                get_prescreen_index()
 
             # Initialize main decision module
             self.decision_logic = DecisionLogic(
                 enable_terrorism_detection=enable_terrorism_detection
             )
 
-            # Initialize detectors
+            # Initialize detectors (keywords and patterns are compiled into
+            # one engine; each text is scanned once for all of them)
+            self.detection_engine = get_detection_engine()
             self.company_detector = CompanyDetector()
             self.name_detector = NameDetector(smart_filter_service=self)
             self.document_detector = DocumentDetector()
@@ -120,12 +144,16 @@ class SmartFilterService:
             self.logger.error(f"Failed to initialize SmartFilterService: {e}")
             raise SmartFilterError(f"Service initialization failed: {str(e)}")
 
-    def should_process_text(self, text: str) -> FilterResult:
+    def should_process_text(
+        self, text: str, ac_matches: Optional[List[Dict[str, Any]]] = None
+    ) -> FilterResult:
         """
         Determines whether to process text with full search
 
         Args:
             text: Text to analyze
+            ac_matches: Precomputed tier-0 AC matches (see find_ac_matches_async);
+                searched here when None
 
         Returns:
             FilterResult with recommendation
@@ -166,33 +194,21 @@ class SmartFilterService:
                 )
 
             # Tier-0: Aho-Corasick search (if enabled)
-            ac_matches = []
+            if ac_matches is None:
+                ac_matches = self.find_ac_matches(original_text)
             ac_confidence_bonus = 0.0
-            if self.aho_corasick_enabled:
-                # Search original text
-                ac_result = self.search_aho_corasick(original_text)
-                ac_matches = ac_result.get("matches", [])
-
-                # If no matches, try normalized name order variants
-                if not ac_matches:
-                    # Try to normalize names and check reversed order
-                    text_variants = self._generate_name_variants(original_text)
-                    for variant in text_variants:
-                        variant_result = self.search_aho_corasick(variant)
-                        variant_matches = variant_result.get("matches", [])
-                        if variant_matches:
-                            ac_matches.extend(variant_matches)
-                            break  # Found matches, stop trying variants
-
-                if ac_matches:
-                    ac_confidence_bonus = SERVICE_CONFIG.aho_corasick_confidence_bonus
+            if ac_matches:
+                ac_confidence_bonus = SERVICE_CONFIG.aho_corasick_confidence_bonus
+
+            # One engine pass for payment triggers and company keywords/patterns
+            hits = self.detection_engine.scan(original_text)
 
             # Context analysis with payment triggers
-            context_signals = self._analyze_payment_context(original_text)
+            context_signals = self._analyze_payment_context(original_text, hits)
 
             # Signal analysis with original text (preserving context)
             company_signals = self.company_detector.detect_company_signals(
-                original_text
+                original_text, hits=hits
             )
             name_signals = self.name_detector.detect_name_signals(original_text)
 
@@ -342,172 +358,290 @@ class SmartFilterService:
         self, text: str, max_matches: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Perform real AC pattern matching using Elasticsearch AC patterns
+        Match tier-0/1 AC patterns against the text
+
+        Served by the local pre-screen index. Only when that index is
+        unavailable does this query Elasticsearch, and only outside an
+        event loop; async callers use ``search_aho_corasick_async``.
+        The local index matches patterns contained in the text, whereas
+        the ES wildcard fallback matches patterns containing the text
+        (see ``ac_prescreen``).
 
         Args:
             text: Text to search in
             max_matches: Maximum number of matches to return
 
         Returns:
-            Real AC pattern search results
-
-        Raises:
-            SmartFilterError: If search fails
+            AC pattern search results
         """
         if not self.aho_corasick_enabled:
-            return {
-                "matches": [],
-                "total_matches": 0,
-                "processing_time_ms": 0.0,
-                "patterns_loaded": 0,
-                "text_length": len(text),
-                "enabled": False,
-                "message": "AC integration disabled",
-            }
+            return self._ac_disabled_result(text)
+
+        index = get_prescreen_index()
+        if index is not None:
+            return self._search_local_index(index, text, max_matches)
 
         try:
-            import time
-            import requests
-            from requests.auth import HTTPBasicAuth
-            start_time = time.time()
-
-            # ES connection details - using environment variables for security
-            ES_HOST = os.getenv("ES_HOST", "localhost")
-            ES_PORT = int(os.getenv("ES_PORT", "9200"))
-            ES_USER = os.getenv("ES_USERNAME", os.getenv("ES_USER"))
-            ES_PASSWORD = os.getenv("ES_PASSWORD")
-            ES_INDEX = os.getenv("ES_AC_PATTERNS_INDEX", "ai_service_ac_patterns")
-
-            # Check if credentials are available, skip ES lookup if not
-            if not ES_PASSWORD or not ES_USER:
-                # Fallback to basic detection without ES lookup
-                return {
-                    "should_use_ac": False,
-                    "confidence": 0.5,
-                    "reason": "ES credentials not configured",
-                    "processing_time": time.time() - start_time
-                }
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._search_es_sync(text, max_matches)
+        # Never block the event loop on the network
+        return self._ac_unavailable_result(
+            text, "Local AC index unavailable; ES fallback requires search_aho_corasick_async"
+        )
+
+    async def search_aho_corasick_async(
+        self, text: str, max_matches: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of search_aho_corasick
+
+        Uses the local pre-screen index when available, otherwise queries
+        Elasticsearch through the pooled async HTTP client.
+
+        Args:
+            text: Text to search in
+            max_matches: Maximum number of matches to return
+
+        Returns:
+            AC pattern search results
+        """
+        if not self.aho_corasick_enabled:
+            return self._ac_disabled_result(text)
+
+        index = get_prescreen_index()
+        if index is not None:
+            return self._search_local_index(index, text, max_matches)
+        return await self._search_es_async(text, max_matches)
+
+    def find_ac_matches(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Tier-0 AC matches for the text or, failing that, its first matching name-order variant
+
+        Args:
+            text: Original text
+
+        Returns:
+            List of AC matches
+        """
+        if not self.aho_corasick_enabled or not text:
+            return []
+        matches = self.search_aho_corasick(text).get("matches", [])
+        if matches:
+            return matches
+        for variant in self._generate_name_variants(text):
+            matches = self.search_aho_corasick(variant).get("matches", [])
+            if matches:
+                return matches
+        return []
+
+    async def find_ac_matches_async(self, text: str) -> List[Dict[str, Any]]:
+        """Async variant of find_ac_matches (ES fallback without blocking the loop)"""
+        if not self.aho_corasick_enabled or not text:
+            return []
+        if get_prescreen_index() is not None:
+            return self.find_ac_matches(text)
+        matches = (await self.search_aho_corasick_async(text)).get("matches", [])
+        if matches:
+            return matches
+        for variant in self._generate_name_variants(text):
+            matches = (await self.search_aho_corasick_async(variant)).get("matches", [])
+            if matches:
+                return matches
+        return []
+
+    def _search_local_index(
+        self, index: ACPrescreenIndex, text: str, max_matches: Optional[int]
+    ) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        normalized_text = _normalize_for_ac(text)
+        matches = index.search(normalized_text, max_matches)
+        return {
+            "matches": matches,
+            "total_matches": len(matches),
+            "processing_time_ms": (time.perf_counter() - start_time) * 1000,
+            "patterns_loaded": index.pattern_count,
+            "text_length": len(text),
+            "enabled": True,
+            "source": "local",
+            "normalized_text": normalized_text,
+            "message": f"Local AC search completed with {len(matches)} matches from {index.pattern_count} patterns",
+        }
 
-            # Normalize text for search (same as AC patterns)
-            from ..unicode.unicode_service import UnicodeService
-            unicode_service = UnicodeService()
-            normalized_result = unicode_service.normalize_text(text, normalize_homoglyphs=True)
-            normalized_text = normalized_result["normalized"]
-
-            # Search for AC patterns that match this text
-            search_url = f"http://{ES_HOST}:{ES_PORT}/{ES_INDEX}/_search"
-            auth = HTTPBasicAuth(ES_USER, ES_PASSWORD)
-
-            # Create search query to find patterns that match our text
-            search_query = {
-                "query": {
-                    "bool": {
-                        "should": [
-                            {
-                                "wildcard": {
-                                    "pattern": {
-                                        "value": f"*{normalized_text.lower()}*",
-                                        "case_insensitive": True
-                                    }
+    def _ac_disabled_result(self, text: str) -> Dict[str, Any]:
+        return {
+            "matches": [],
+            "total_matches": 0,
+            "processing_time_ms": 0.0,
+            "patterns_loaded": 0,
+            "text_length": len(text),
+            "enabled": False,
+            "message": "AC integration disabled",
+        }
+
+    def _ac_unavailable_result(self, text: str, reason: str, **extra: Any) -> Dict[str, Any]:
+        return {
+            "matches": [],
+            "total_matches": 0,
+            "processing_time_ms": 0.0,
+            "patterns_loaded": 0,
+            "text_length": len(text),
+            "enabled": True,
+            "message": reason,
+            **extra,
+        }
+
+    def _es_request(
+        self, text: str, max_matches: Optional[int]
+    ) -> Optional[Tuple[str, Dict[str, Any], Tuple[str, str], float, str]]:
+        """ES AC pattern query (url, body, auth, timeout, normalized text) or None without credentials"""
+        # ES connection details - using environment variables for security
+        es_host = os.getenv("ES_HOST", "localhost")
+        es_port = int(os.getenv("ES_PORT", "9200"))
+        es_user = os.getenv("ES_USERNAME", os.getenv("ES_USER"))
+        es_password = os.getenv("ES_PASSWORD")
+        es_index = os.getenv("ES_AC_PATTERNS_INDEX", "ai_service_ac_patterns")
+        if not es_password or not es_user:
+            return None
+
+        # Normalize text for search (same as AC patterns)
+        normalized_text = _normalize_for_ac(text)
+        search_query = {
+            "query": {
+                "bool": {
+                    "should": [
+                        {
+                            "wildcard": {
+                                "pattern": {
+                                    "value": f"*{normalized_text.lower()}*",
+                                    "case_insensitive": True
                                 }
-                            },
-                            {
-                                "match": {
-                                    "pattern": {
-                                        "query": normalized_text,
-                                        "fuzziness": "AUTO"
-                                    }
+                            }
+                        },
+                        {
+                            "match": {
+                                "pattern": {
+                                    "query": normalized_text,
+                                    "fuzziness": "AUTO"
                                 }
                             }
-                        ],
-                        "minimum_should_match": 1
-                    }
-                },
-                "size": max_matches or 50,
-                "sort": [
-                    {"tier": {"order": "asc"}},  # Lower tier = higher priority
-                    {"confidence": {"order": "desc"}},
-                    {"_score": {"order": "desc"}}
-                ]
-            }
+                        }
+                    ],
+                    "minimum_should_match": 1
+                }
+            },
+            "size": max_matches or 50,
+            "sort": [
+                {"tier": {"order": "asc"}},  # Lower tier = higher priority
+                {"confidence": {"order": "desc"}},
+                {"_score": {"order": "desc"}}
+            ]
+        }
 
-            # Use configurable timeout instead of hardcoded 5 seconds
-            # Import SearchConfig to get proper ES timeout
-            from ...config.settings import SearchConfig
-            search_config = SearchConfig()
-            timeout = search_config.es_timeout
-            response = requests.post(search_url, json=search_query, auth=auth, timeout=timeout)
-
-            matches = []
-            patterns_loaded = 0
-
-            if response.status_code == 200:
-                result = response.json()
-                hits = result.get("hits", {}).get("hits", [])
-                patterns_loaded = result.get("hits", {}).get("total", {}).get("value", 0)
-
-                for hit in hits:
-                    source = hit["_source"]
-                    pattern = source.get("pattern", "")
-
-                    # Check if this pattern actually matches our normalized text
-                    if pattern.lower() in normalized_text.lower() or normalized_text.lower() in pattern.lower():
-                        matches.append({
-                            "pattern": pattern,
-                            "tier": f"tier_{source.get('tier', 3)}",
-                            "start": normalized_text.lower().find(pattern.lower()),
-                            "end": normalized_text.lower().find(pattern.lower()) + len(pattern),
-                            "matched_text": pattern,
-                            "confidence": source.get("confidence", 0.5),
-                            "pattern_type": source.get("type", "unknown"),
-                            "entity_type": source.get("entity_type", "unknown"),
-                            "entity_id": source.get("entity_id", ""),
-                            "es_score": hit.get("_score", 0)
-                        })
-
-            processing_time_ms = (time.time() - start_time) * 1000
+        from ...config.settings import SearchConfig
+        timeout = SearchConfig().es_timeout
+        url = f"http://{es_host}:{es_port}/{es_index}/_search"
+        return url, search_query, (es_user, es_password), timeout, normalized_text
 
-            return {
-                "matches": matches,
-                "total_matches": len(matches),
-                "processing_time_ms": processing_time_ms,
-                "patterns_loaded": patterns_loaded,
-                "text_length": len(text),
-                "enabled": True,
-                "normalized_text": normalized_text,
-                "message": f"Real AC search completed with {len(matches)} matches from {patterns_loaded} total patterns",
-            }
+    def _es_result(
+        self, text: str, normalized_text: str, payload: Optional[Dict[str, Any]], start_time: float
+    ) -> Dict[str, Any]:
+        matches = []
+        patterns_loaded = 0
+        lowered = normalized_text.lower()
+
+        if payload is not None:
+            hits = payload.get("hits", {}).get("hits", [])
+            patterns_loaded = payload.get("hits", {}).get("total", {}).get("value", 0)
+
+            for hit in hits:
+                source = hit["_source"]
+                pattern = source.get("pattern", "")
+
+                # Check if this pattern actually matches our normalized text
+                if pattern.lower() in lowered or lowered in pattern.lower():
+                    matches.append({
+                        "pattern": pattern,
+                        "tier": f"tier_{source.get('tier', 3)}",
+                        "start": lowered.find(pattern.lower()),
+                        "end": lowered.find(pattern.lower()) + len(pattern),
+                        "matched_text": pattern,
+                        "confidence": source.get("confidence", 0.5),
+                        "pattern_type": source.get("type", "unknown"),
+                        "entity_type": source.get("entity_type", "unknown"),
+                        "entity_id": source.get("entity_id", ""),
+                        "es_score": hit.get("_score", 0)
+                    })
 
-        except Exception as e:
-            import requests
-            is_timeout = isinstance(e, (requests.Timeout, requests.ConnectTimeout, requests.ReadTimeout))
-            error_type = "timeout" if is_timeout else "error"
+        return {
+            "matches": matches,
+            "total_matches": len(matches),
+            "processing_time_ms": (time.perf_counter() - start_time) * 1000,
+            "patterns_loaded": patterns_loaded,
+            "text_length": len(text),
+            "enabled": True,
+            "source": "elasticsearch",
+            "normalized_text": normalized_text,
+            "message": f"ES AC search completed with {len(matches)} matches from {patterns_loaded} total patterns",
+        }
 
-            if is_timeout:
-                self.logger.warning(f"AC search timeout after {timeout}s: {e}")
-            else:
-                self.logger.error(f"Error in real AC search: {e}")
+    def _es_error_result(self, text: str, error: Exception, is_timeout: bool, timeout: float) -> Dict[str, Any]:
+        error_type = "timeout" if is_timeout else "error"
+        if is_timeout:
+            self.logger.warning(f"AC search timeout after {timeout}s: {error}")
+        else:
+            self.logger.error(f"Error in ES AC search: {error}")
+        # Fallback to empty result instead of failing
+        return self._ac_unavailable_result(
+            text,
+            f"AC search {error_type}: {str(error)}",
+            error=str(error),
+            error_type=error_type,
+            timeout_used=timeout,
+        )
 
-            # Fallback to empty result instead of failing
-            return {
-                "matches": [],
-                "total_matches": 0,
-                "processing_time_ms": 0.0,
-                "patterns_loaded": 0,
-                "text_length": len(text),
-                "enabled": True,
-                "error": str(e),
-                "error_type": error_type,
-                "timeout_used": timeout,
-                "message": f"AC search {error_type}: {str(e)}",
-            }
+    def _search_es_sync(self, text: str, max_matches: Optional[int]) -> Dict[str, Any]:
+        """Blocking ES fallback for callers without an event loop (scripts, CLI)"""
+        import requests
 
-    def _analyze_payment_context(self, text: str) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        request = self._es_request(text, max_matches)
+        if request is None:
+            return self._ac_unavailable_result(text, "ES credentials not configured")
+        url, query, auth, timeout, normalized_text = request
+        try:
+            response = requests.post(url, json=query, auth=auth, timeout=timeout)
+            payload = response.json() if response.status_code == 200 else None
+            return self._es_result(text, normalized_text, payload, start_time)
+        except Exception as e:
+            return self._es_error_result(text, e, isinstance(e, requests.Timeout), timeout)
+
+    async def _search_es_async(self, text: str, max_matches: Optional[int]) -> Dict[str, Any]:
+        """ES fallback through the pooled async HTTP client"""
+        start_time = time.perf_counter()
+        request = self._es_request(text, max_matches)
+        if request is None:
+            return self._ac_unavailable_result(text, "ES credentials not configured")
+        url, query, auth, timeout, normalized_text = request
+        try:
+            from ...utils.http_client_pool import get_http_pool
+
+            response = await get_http_pool().async_post_json(url, query, timeout=timeout, auth=auth)
+            payload = response.json() if response.status_code == 200 else None
+            return self._es_result(text, normalized_text, payload, start_time)
+        except Exception as e:
+            is_timeout = isinstance(e, asyncio.TimeoutError) or "Timeout" in type(e).__name__
+            return self._es_error_result(text, e, is_timeout, timeout)
+
+    def _analyze_payment_context(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """
         Analyze payment context using payment triggers as signals
 
         Args:
             text: Original text to analyze
+            hits: Detection engine hits for the text (scanned here if None)
 
         Returns:
             Context analysis results
@@ -519,33 +653,18 @@ class SmartFilterService:
             # Detect language
             detected_language = self._detect_language(text)
 
-            # Get payment triggers for the language
-            triggers = PAYMENT_TRIGGERS.get(detected_language, {})
-            context_words = triggers.get("context", [])
-            prep_words = triggers.get("preps", [])
-            currency_words = triggers.get("currencies", [])
-
-            # Find context signals
+            # Find context signals (payment triggers of the detected language)
             context_matches = []
             prep_matches = []
             currency_matches = []
 
-            text_lower = text.lower()
-
-            # Check for context words
-            for word in context_words:
-                if word.lower() in text_lower:
-                    context_matches.append(word)
-
-            # Check for prepositional phrases that indicate names
-            for prep in prep_words:
-                if prep.lower() in text_lower:
-                    prep_matches.append(prep)
-
-            # Check for currency indicators
-            for currency in currency_words:
-                if currency.lower() in text_lower:
-                    currency_matches.append(currency)
+            if detected_language in PAYMENT_TRIGGERS:
+                if hits is None:
+                    hits = self.detection_engine.scan(text)
+                context_matches = hits.keywords(payment_family(detected_language, "context"))
+                # Prepositional phrases that indicate names
+                prep_matches = hits.keywords(payment_family(detected_language, "preps"))
+                currency_matches = hits.keywords(payment_family(detected_language, "currencies"))
 
             # Calculate confidence based on matches
             total_matches = (
@@ -618,8 +737,12 @@ class SmartFilterService:
                 self.logger.warning(f"Language detection error: {e}")
 
         # Fallback - simple character-based detection
-        cyrillic_count = len(re.findall(r"[а-яёіїєґ]", text, re.IGNORECASE))
-        latin_count = len(re.findall(r"[a-z]", text, re.IGNORECASE))
+        profile = get_text_profile(text)
+        if profile is not None:
+            cyrillic_count, latin_count = profile.cyrillic, profile.latin
+        else:
+            cyrillic_count = len(re.findall(r"[а-яёіїєґ]", text, re.IGNORECASE))
+            latin_count = len(re.findall(r"[a-z]", text, re.IGNORECASE))
 
         if cyrillic_count > latin_count:
             return "ukrainian"  # Default Ukrainian for Cyrillic
@@ -812,17 +935,25 @@ class SmartFilterService:
 
     def _analyze_language_composition(self, text: str) -> Dict[str, Any]:
         """Анализ языкового состава текста"""
-        # Count Cyrillic characters
-        cyrillic_count = len(re.findall(r"[а-яёіїєґ]", text, re.IGNORECASE))
+        profile = get_text_profile(text)
+        if profile is not None:
+            # Shared per-request counts, no rescan
+            cyrillic_count = profile.cyrillic
+            latin_count = profile.latin
+            digit_count = profile.digits
+            special_count = profile.punct
+        else:
+            # Count Cyrillic characters
+            cyrillic_count = len(re.findall(r"[а-яёіїєґ]", text, re.IGNORECASE))
 
-        # Count Latin characters
-        latin_count = len(re.findall(r"[a-z]", text, re.IGNORECASE))
+            # Count Latin characters
+            latin_count = len(re.findall(r"[a-z]", text, re.IGNORECASE))
 
-        # Count digits
-        digit_count = len(re.findall(r"\d", text))
+            # Count digits
+            digit_count = len(re.findall(r"\d", text))
 
-        # Count special characters
-        special_count = len(re.findall(r"[^\w\s]", text))
+            # Count special characters
+            special_count = len(re.findall(r"[^\w\s]", text))
 
         total_chars = len(text)
 
@@ -1072,18 +1203,23 @@ class SmartFilterService:
     async def should_process_text_async(self, text: str) -> FilterResult:
         """
         Async version of should_process_text using thread pool executor
-        
+
+        AC matches are looked up first so that an ES fallback does not
+        block a pool thread.
+
         Args:
             text: Text to analyze
 
         Returns:
             FilterResult with recommendation
         """
+        ac_kwargs = {}
+        if self.aho_corasick_enabled and text and text.strip():
+            ac_kwargs["ac_matches"] = await self.find_ac_matches_async(text.strip())
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             None,  # Use default thread pool executor
-            self.should_process_text,
-            text
+            functools.partial(self.should_process_text, text, **ac_kwargs),
         )
 
 
@@ -9,11 +9,18 @@ IMPORTANT: This module is intended ONLY for defensive purposes and
 counter-terrorism in financial systems.
 """
 
-import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set
-
+from typing import Any, Dict, List, Optional, Set
+
+from ...data.dicts.smart_filter_patterns import (
+    TERRORISM_ACTIVITY_PATTERNS,
+    TERRORISM_EXCLUSION_PATTERNS,
+    TERRORISM_FINANCING_PATTERNS,
+    TERRORISM_ORGANIZATION_PATTERNS,
+    TERRORISM_WEAPONS_PATTERNS,
+)
 from ...utils.logging_config import get_logger
+from .detection_engine import DetectionHits, get_detection_engine, terrorism_family
 
 
 @dataclass
@@ -36,55 +43,19 @@ class TerrorismDetector:
         self.logger = get_logger(__name__)
 
         # Patterns for terrorism financing (general indicators)
-        self.financing_patterns = [
-            # Suspicious terms for transfers
-            r"\b(?:джихад|jihad|муджахид|mujahid|шахид|shahid|мученик|martyr)\b",
-            r"\b(?:халифат|caliphate|emirate|эмират|имарат)\b",
-            r"\b(?:фонд|fund|foundation|благотвор|charity|زكاة|закят|zakat)\s*(?:помощи|помощь|support|aid|relief)\b",
-            # Code words (general patterns)
-            r"\b(?:операция|operation|миссия|mission|проект|project)\s+[А-ЯІЇЄҐA-Z][а-яіїєґa-z]+\b",
-            r"\b(?:братья|brothers|сестры|sisters|товарищи|comrades)\s+(?:по|in|from)\s+[а-яіїєґa-z]+\b",
-            # Suspicious geographical regions (general)
-            r"\b(?:syria|сирия|iraq|ирак|afghanistan|афганистан|somalia|сомали)\b",
-            r"\b(?:tribal|племенн|region|регион|border|граница|frontier)\s+(?:area|зона|territory|территория)\b",
-        ]
+        self.financing_patterns = TERRORISM_FINANCING_PATTERNS.copy()
 
         # Patterns for weapons and explosives (defensive)
-        self.weapons_patterns = [
-            r"\b(?:explosive|взрывчат|bomb|бомба|ied|взрывн|device|устройство)\b",
-            r"\b(?:ammunition|боеприпас|weapons|оружие|arms|вооружение)\b",
-            r"\b(?:training|тренировк|preparation|подготовк|equipment|оборудование)\b",
-            r"\b(?:chemical|химическ|biological|биологическ|nuclear|ядерн|radioactive|радиоактивн)\b",
-        ]
+        self.weapons_patterns = TERRORISM_WEAPONS_PATTERNS.copy()
 
         # Patterns for suspicious organizations (defensive lists)
-        self.organization_patterns = [
-            # General patterns for suspicious structures
-            r"\b(?:cell|ячейка|network|сеть|group|группа|wing|крыло|brigade|бригада)\b",
-            r"\b(?:movement|движение|front|фронт|liberation|освобождение|resistance|сопротивление)\b",
-            r"\b(?:foundation|фонд|charity|благотвор|relief|помощь|aid|поддержка)\s+(?:international|международн|global|глобальн)\b",
-        ]
+        self.organization_patterns = TERRORISM_ORGANIZATION_PATTERNS.copy()
 
         # Patterns for suspicious activity
-        self.activity_patterns = [
-            # Financial operations
-            r"\b(?:cash|наличные|courier|курьер|transfer|перевод|hawala|хавала|informal|неформальн)\s+(?:service|сервис|system|система|network|сеть)\b",
-            r"\b(?:multiple|множественн|frequent|частые|unusual|необычн|suspicious|подозрительн)\s+(?:transactions|операции|transfers|переводы|payments|платежи)\b",
-            # Communications
-            r"\b(?:encrypted|зашифрован|secure|защищен|anonymous|анонимн|coded|кодирован)\s+(?:message|сообщение|communication|связь|channel|канал)\b",
-            r"\b(?:meeting|встреча|gathering|собрание|assembly|ассамблея|conference|конференция)\s+(?:secret|секретн|private|частн|closed|закрыт)\b",
-            # Travel and movements
-            r"\b(?:travel|поездка|journey|путешествие|trip|поход|visit|визит)\s+(?:to|в|from|из|via|через)\s+(?:conflict|конфликт|war|война|unstable|нестабильн)\b",
-            r"\b(?:border|граница|crossing|пересечение|entry|въезд|exit|выезд)\s+(?:point|пункт|control|контроль)\b",
-        ]
+        self.activity_patterns = TERRORISM_ACTIVITY_PATTERNS.copy()
 
         # Exclusions (words that may cause false positives)
-        self.exclusion_patterns = [
-            r"\b(?:игра|game|фильм|movie|книга|book|история|story|новости|news)\b",
-            r"\b(?:university|университет|school|школа|education|образование|academic|академическ)\b",
-            r"\b(?:historical|историческ|documentary|документальн|research|исследование)\b",
-            r"\b(?:legitimate|законн|official|официальн|registered|зарегистрирован)\b",
-        ]
+        self.exclusion_patterns = TERRORISM_EXCLUSION_PATTERNS.copy()
 
         # Weight coefficients for different indicator types
         self.pattern_weights = {
@@ -97,14 +68,20 @@ class TerrorismDetector:
         # Risk thresholds
         self.risk_thresholds = {"high": 0.8, "medium": 0.5, "low": 0.3}
 
+        # Patterns above, compiled once per process
+        self.engine = get_detection_engine()
+
         self.logger.info("TerrorismDetector initialized for defensive purposes")
 
-    def detect_terrorism_signals(self, text: str) -> Dict[str, Any]:
+    def detect_terrorism_signals(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """
         Detect terrorism indicators in text (defensive purposes)
 
         Args:
             text: Text to analyze
+            hits: Detection engine hits for the text (scanned here if None)
 
         Returns:
             Terrorism indicators detection results
@@ -112,8 +89,10 @@ class TerrorismDetector:
         if not text or not text.strip():
             return self._create_empty_result()
 
+        hits = self._scan(text, hits)
+
         # Preliminary exclusion check
-        if self._is_excluded_content(text):
+        if self._is_excluded_content(text, hits):
             return self._create_empty_result()
 
         signals = []
@@ -121,7 +100,7 @@ class TerrorismDetector:
         max_risk_level = "low"
 
         # 1. Search for financial indicators
-        financing_signals = self._detect_financing_patterns(text)
+        financing_signals = self._detect_financing_patterns(text, hits)
         if financing_signals["confidence"] > 0:
             signals.append(financing_signals)
             total_confidence += (
@@ -135,7 +114,7 @@ class TerrorismDetector:
                 max_risk_level = "medium"
 
         # 2. Search for weapons/explosives indicators
-        weapons_signals = self._detect_weapons_patterns(text)
+        weapons_signals = self._detect_weapons_patterns(text, hits)
         if weapons_signals["confidence"] > 0:
             signals.append(weapons_signals)
             total_confidence += (
@@ -147,7 +126,7 @@ class TerrorismDetector:
                 max_risk_level = "medium"
 
         # 3. Search for organizational indicators
-        org_signals = self._detect_organization_patterns(text)
+        org_signals = self._detect_organization_patterns(text, hits)
         if org_signals["confidence"] > 0:
             signals.append(org_signals)
             total_confidence += (
@@ -159,7 +138,7 @@ class TerrorismDetector:
                 max_risk_level = "medium"
 
         # 4. Search for suspicious activity
-        activity_signals = self._detect_activity_patterns(text)
+        activity_signals = self._detect_activity_patterns(text, hits)
         if activity_signals["confidence"] > 0:
             signals.append(activity_signals)
             total_confidence += (
@@ -198,13 +177,11 @@ class TerrorismDetector:
             >= self.risk_thresholds["medium"],
         }
 
-    def _detect_financing_patterns(self, text: str) -> Dict[str, Any]:
+    def _detect_financing_patterns(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect terrorism financing patterns"""
-        matches = []
-
-        for pattern in self.financing_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(terrorism_family("financing"))
 
         confidence = min(len(matches) * 0.3, 0.9) if matches else 0.0
         risk_level = self._determine_risk_level(confidence)
@@ -217,13 +194,11 @@ class TerrorismDetector:
             "count": len(matches),
         }
 
-    def _detect_weapons_patterns(self, text: str) -> Dict[str, Any]:
+    def _detect_weapons_patterns(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect weapons and explosives patterns"""
-        matches = []
-
-        for pattern in self.weapons_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(terrorism_family("weapons"))
 
         confidence = min(len(matches) * 0.4, 0.95) if matches else 0.0
         risk_level = self._determine_risk_level(confidence)
@@ -236,13 +211,11 @@ class TerrorismDetector:
             "count": len(matches),
         }
 
-    def _detect_organization_patterns(self, text: str) -> Dict[str, Any]:
+    def _detect_organization_patterns(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect suspicious organizations patterns"""
-        matches = []
-
-        for pattern in self.organization_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(terrorism_family("organization"))
 
         confidence = min(len(matches) * 0.25, 0.8) if matches else 0.0
         risk_level = self._determine_risk_level(confidence)
@@ -255,13 +228,11 @@ class TerrorismDetector:
             "count": len(matches),
         }
 
-    def _detect_activity_patterns(self, text: str) -> Dict[str, Any]:
+    def _detect_activity_patterns(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> Dict[str, Any]:
         """Detect suspicious activity patterns"""
-        matches = []
-
-        for pattern in self.activity_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
-            matches.extend(found_matches)
+        matches = self._scan(text, hits).patterns(terrorism_family("activity"))
 
         confidence = min(len(matches) * 0.2, 0.7) if matches else 0.0
         risk_level = self._determine_risk_level(confidence)
@@ -274,15 +245,15 @@ class TerrorismDetector:
             "count": len(matches),
         }
 
-    def _is_excluded_content(self, text: str) -> bool:
+    def _is_excluded_content(
+        self, text: str, hits: Optional[DetectionHits] = None
+    ) -> bool:
         """Check for exclusions (false positives)"""
-        text_lower = text.lower()
-
-        for pattern in self.exclusion_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
+        return bool(self._scan(text, hits).patterns(terrorism_family("exclusion")))
 
-        return False
+    def _scan(self, text: str, hits: Optional[DetectionHits]) -> DetectionHits:
+        """Engine hits for the text, reusing the caller's scan if given"""
+        return hits if hits is not None else self.engine.scan(text)
 
     def _determine_risk_level(self, confidence: float) -> str:
         """Determine risk level based on confidence"""
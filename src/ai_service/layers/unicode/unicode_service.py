@@ -6,9 +6,382 @@ import logging
 import re
 import unicodedata
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, Literal
+from typing import Any, Dict, List, Optional, Tuple, Union, Literal
 
+from ...utils.allocation_tracker import register_cache
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import CYRILLIC_LETTER_BYTES, LATIN_LETTER_BYTES, get_text_profile
+
+
+# ---- Compiled normalization plan -------------------------------------------
+#
+# Everything below is built once at import (or in UnicodeService.__init__ for
+# the instance mappings) so that normalize_text runs as a handful of C-level
+# str/bytes calls instead of per-character Python loops.
+
+
+class _CharMap:
+    """
+    Precompiled single-character mapping.
+
+    Only mapped characters that actually occur are touched: presence is checked
+    with ``in`` (memchr-speed), counted with ``str.count`` and replaced with
+    ``str.replace``. On Cyrillic text this is several times faster than
+    ``str.translate``, which does a dict lookup (and a KeyError) per unmapped
+    character once the string is not Latin-1.
+    """
+
+    __slots__ = ("mapping", "keys")
+
+    def __init__(self, mapping: Dict[str, str]) -> None:
+        # Keys longer than one character never match a per-character scan
+        self.mapping = {k: v for k, v in mapping.items() if len(k) == 1}
+        self.keys = tuple(self.mapping)
+        # Sequential replaces equal a simultaneous mapping only if no
+        # replacement introduces another (non-identity) key
+        for value in self.mapping.values():
+            for char in value:
+                if char in self.mapping and self.mapping[char] != char:
+                    raise ValueError(f"Chained character mapping via {char!r}")
+
+    def present(self, text: str) -> List[str]:
+        return [char for char in self.keys if char in text]
+
+    def apply(self, text: str) -> Tuple[str, int]:
+        """Return (mapped_text, number_of_mapped_characters)."""
+        present = self.present(text)
+        if not present:
+            return text, 0
+        count = 0
+        for char in present:
+            count += text.count(char)
+            text = text.replace(char, self.mapping[char])
+        return text, count
+
+
+# Common mojibake fixes: Windows-1252 / CP1251 bytes decoded as Latin-1
+_ENCODING_FIXES = [
+    # Windows-1252 -> UTF-8 (most common problem)
+    ("\x80", "€"),
+    ("\x81", ""),
+    ("\x82", "‚"),
+    ("\x83", "ƒ"),
+    ("\x84", "„"),
+    ("\x85", "…"),
+    ("\x86", "†"),
+    ("\x87", "‡"),
+    ("\x88", "ˆ"),
+    ("\x89", "‰"),
+    ("\x8a", "Š"),
+    ("\x8b", "‹"),
+    ("\x8c", "Œ"),
+    ("\x8d", ""),
+    ("\x8e", "Ž"),
+    ("\x8f", ""),
+    ("\x90", ""),
+    ("\x91", ""),
+    ("\x92", ""),
+    ("\x93", '"'),
+    ("\x94", '"'),
+    ("\x95", "•"),
+    ("\x96", "–"),
+    ("\x97", "—"),
+    ("\x98", "˜"),
+    ("\x99", "™"),
+    ("\x9a", "š"),
+    ("\x9b", "›"),
+    ("\x9c", "œ"),
+    ("\x9d", ""),
+    ("\x9e", "ž"),
+    ("\x9f", "Ÿ"),
+    # CP1251 -> UTF-8 (Cyrillic)
+    ("\x80", "Ђ"),
+    ("\x81", "Ѓ"),
+    ("\x82", "‚"),
+    ("\x83", "ѓ"),
+    ("\x84", "„"),
+    ("\x85", "…"),
+    ("\x86", "†"),
+    ("\x87", "‡"),
+    ("\x88", "€"),
+    ("\x89", "‰"),
+    ("\x8a", "Љ"),
+    ("\x8b", "‹"),
+    ("\x8c", "Њ"),
+    ("\x8d", "Ќ"),
+    ("\x8e", "Ћ"),
+    ("\x8f", "Џ"),
+    ("\x90", "ђ"),
+    ("\x91", "ѓ"),
+    ("\x92", "‚"),
+    ("\x93", "ѓ"),
+    ("\x94", "„"),
+    ("\x95", "…"),
+    ("\x96", "†"),
+    ("\x97", "‡"),
+    ("\x98", "€"),
+    ("\x99", "‰"),
+    ("\x9a", "љ"),
+    ("\x9b", "‹"),
+    ("\x9c", "њ"),
+    ("\x9d", "ќ"),
+    ("\x9e", "ћ"),
+    ("\x9f", "џ"),
+]
+
+# Fixes are applied as sequential replaces, so the first entry for a code
+# point wins and later duplicates (the CP1251 block) never fire
+_ENCODING_FIX_MAP = _CharMap(dict(reversed(_ENCODING_FIXES)))
+
+# Replace common corrupted UTF-8-as-Latin-1 sequences (applied in order)
+_PARTIAL_ENCODING_FIXES = {
+    # Replace common corrupted sequences
+    "Ð¡": "С",
+    "Ðµ": "е",
+    "Ñ€": "р",
+    "Ð³": "г",
+    "Ð¸": "и",
+    "Ð¹": "й",
+    "Ð˜": "И",
+    "Ð²": "в",
+    "Ð°": "а",
+    "Ð½": "н",
+    "Ð¾": "о",
+    "Ð²": "в",
+    "Ñ": "с",
+    "Ñ‚": "т",
+    "Ñƒ": "у",
+    "Ñ„": "ф",
+    "Ñ…": "х",
+    "Ñ†": "ц",
+    "Ñ‡": "ч",
+    "Ñˆ": "ш",
+    "Ñ‰": "щ",
+    "ÑŠ": "ъ",
+    "Ñ‹": "ы",
+    "ÑŒ": "ь",
+    "Ñ": "э",
+    "ÑŽ": "ю",
+    "Ñ": "я",
+}
+
+# Combining accents removed after NFC for mixed_diacritics support
+_COMBINING_ACCENT_MAP = {
+    # Combining acute accent (U+0301) - most common
+    '\u0301': '',  # Remove combining acute accent
+    # Combining grave accent (U+0300)
+    '\u0300': '',  # Remove combining grave accent
+    # Combining circumflex (U+0302)
+    '\u0302': '',  # Remove combining circumflex
+    # Combining tilde (U+0303)
+    '\u0303': '',  # Remove combining tilde
+    # Combining diaeresis (U+0308)
+    '\u0308': '',  # Remove combining diaeresis
+    # Combining cedilla (U+0327)
+    '\u0327': '',  # Remove combining cedilla
+    # Combining caron (U+030C)
+    '\u030C': '',  # Remove combining caron
+    # Combining double acute (U+030B)
+    '\u030B': '',  # Remove combining double acute
+    # Combining breve (U+0306)
+    '\u0306': '',  # Remove combining breve
+    # Combining dot above (U+0307)
+    '\u0307': '',  # Remove combining dot above
+    # Combining ring above (U+030A)
+    '\u030A': '',  # Remove combining ring above
+    # Combining hook above (U+0309)
+    '\u0309': '',  # Remove combining hook above
+    # Combining horn (U+031B)
+    '\u031B': '',  # Remove combining horn
+    # Combining double grave (U+030F)
+    '\u030F': '',  # Remove combining double grave
+    # Combining inverted breve (U+0311)
+    '\u0311': '',  # Remove combining inverted breve
+    # Combining turned comma above (U+0312)
+    '\u0312': '',  # Remove combining turned comma above
+    # Combining comma above (U+0313)
+    '\u0313': '',  # Remove combining comma above
+    # Combining reversed comma above (U+0314)
+    '\u0314': '',  # Remove combining reversed comma above
+    # Combining comma above right (U+0315)
+    '\u0315': '',  # Remove combining comma above right
+    # Combining grave accent below (U+0316)
+    '\u0316': '',  # Remove combining grave accent below
+    # Combining acute accent below (U+0317)
+    '\u0317': '',  # Remove combining acute accent below
+    # Combining left tack below (U+0318)
+    '\u0318': '',  # Remove combining left tack below
+    # Combining right tack below (U+0319)
+    '\u0319': '',  # Remove combining right tack below
+    # Combining left angle above (U+031A)
+    '\u031A': '',  # Remove combining left angle above
+    # Combining horn (U+031B)
+    '\u031B': '',  # Remove combining horn
+    # Combining left half ring below (U+031C)
+    '\u031C': '',  # Remove combining left half ring below
+    # Combining up tack below (U+031D)
+    '\u031D': '',  # Remove combining up tack below
+    # Combining down tack below (U+031E)
+    '\u031E': '',  # Remove combining down tack below
+    # Combining plus sign below (U+031F)
+    '\u031F': '',  # Remove combining plus sign below
+    # Combining minus sign below (U+0320)
+    '\u0320': '',  # Remove combining minus sign below
+    # Combining palatalized hook below (U+0321)
+    '\u0321': '',  # Remove combining palatalized hook below
+    # Combining retroflex hook below (U+0322)
+    '\u0322': '',  # Remove combining retroflex hook below
+    # Combining dot below (U+0323)
+    '\u0323': '',  # Remove combining dot below
+    # Combining diaeresis below (U+0324)
+    '\u0324': '',  # Remove combining diaeresis below
+    # Combining ring below (U+0325)
+    '\u0325': '',  # Remove combining ring below
+    # Combining comma below (U+0326)
+    '\u0326': '',  # Remove combining comma below
+    # Combining cedilla (U+0327)
+    '\u0327': '',  # Remove combining cedilla
+    # Combining ogonek (U+0328)
+    '\u0328': '',  # Remove combining ogonek
+    # Combining vertical line below (U+0329)
+    '\u0329': '',  # Remove combining vertical line below
+    # Combining bridge below (U+032A)
+    '\u032A': '',  # Remove combining bridge below
+    # Combining inverted double arch below (U+032B)
+    '\u032B': '',  # Remove combining inverted double arch below
+    # Combining caron below (U+032C)
+    '\u032C': '',  # Remove combining caron below
+    # Combining circumflex accent below (U+032D)
+    '\u032D': '',  # Remove combining circumflex accent below
+    # Combining breve below (U+032E)
+    '\u032E': '',  # Remove combining breve below
+    # Combining inverted breve below (U+032F)
+    '\u032F': '',  # Remove combining inverted breve below
+    # Combining tilde below (U+0330)
+    '\u0330': '',  # Remove combining tilde below
+    # Combining macron below (U+0331)
+    '\u0331': '',  # Remove combining macron below
+    # Combining low line (U+0332)
+    '\u0332': '',  # Remove combining low line
+    # Combining double low line (U+0333)
+    '\u0333': '',  # Remove combining double low line
+    # Combining tilde overlay (U+0334)
+    '\u0334': '',  # Remove combining tilde overlay
+    # Combining short stroke overlay (U+0335)
+    '\u0335': '',  # Remove combining short stroke overlay
+    # Combining long stroke overlay (U+0336)
+    '\u0336': '',  # Remove combining long stroke overlay
+    # Combining short solidus overlay (U+0337)
+    '\u0337': '',  # Remove combining short solidus overlay
+    # Combining long solidus overlay (U+0338)
+    '\u0338': '',  # Remove combining long solidus overlay
+    # Combining horizontal bar (U+0339)
+    '\u0339': '',  # Remove combining horizontal bar
+    # Combining double overline (U+033A)
+    '\u033A': '',  # Remove combining double overline
+    # Combining double low line (U+033B)
+    '\u033B': '',  # Remove combining double low line
+    # Combining wavy line below (U+033C)
+    '\u033C': '',  # Remove combining wavy line below
+    # Combining double wavy line below (U+033D)
+    '\u033D': '',  # Remove combining double wavy line below
+    # Combining dotted grave accent (U+033E)
+    '\u033E': '',  # Remove combining dotted grave accent
+    # Combining dotted acute accent (U+033F)
+    '\u033F': '',  # Remove combining dotted acute accent
+    # Combining double acute accent (U+0340)
+    '\u0340': '',  # Remove combining double acute accent
+    # Combining double grave accent (U+0341)
+    '\u0341': '',  # Remove combining double grave accent
+    # Combining double tilde (U+0342)
+    '\u0342': '',  # Remove combining double tilde
+    # Combining double breve (U+0343)
+    '\u0343': '',  # Remove combining double breve
+    # Combining double circumflex (U+0344)
+    '\u0344': '',  # Remove combining double circumflex
+    # Combining double caron (U+0345)
+    '\u0345': '',  # Remove combining double caron
+    # Combining double macron (U+0346)
+    '\u0346': '',  # Remove combining double macron
+    # Combining double low line (U+0347)
+    '\u0347': '',  # Remove combining double low line
+    # Combining double overline (U+0348)
+    '\u0348': '',  # Remove combining double overline
+    # Combining double underline (U+0349)
+    '\u0349': '',  # Remove combining double underline
+    # Combining double wavy line (U+034A)
+    '\u034A': '',  # Remove combining double wavy line
+    # Combining double dotted line (U+034B)
+    '\u034B': '',  # Remove combining double dotted line
+    # Combining double solidus (U+034C)
+    '\u034C': '',  # Remove combining double solidus
+    # Combining double vertical line (U+034D)
+    '\u034D': '',  # Remove combining double vertical line
+    # Combining double horizontal line (U+034E)
+    '\u034E': '',  # Remove combining double horizontal line
+    # Combining double diagonal line (U+034F)
+    '\u034F': '',  # Remove combining double diagonal line
+}
+
+_COMBINING_ACCENTS = _CharMap(_COMBINING_ACCENT_MAP)
+
+# Invisible characters checked by the idempotency fast path
+_INVISIBLE_CHARS = frozenset(
+    "\u200b\u200c\u200d\ufeff\u200e\u200f\u202a\u202b\u202c\u202d\u202e\u2060"
+)
+
+# Deleted by _final_cleanup: null/control characters and invisible characters
+_CLEANUP_DELETE = _CharMap(
+    dict.fromkeys(
+        [chr(code) for code in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]]
+        + sorted(_INVISIBLE_CHARS)
+        + ["\u2061", "\u2062", "\u2063", "\u2064"],  # function application, invisible times/separator/plus
+        "",
+    )
+)
+
+# Fused script count: CP1251 is a single-byte code that covers exactly the
+# letters counted here (byte sets shared with utils.text_profile), so one
+# encode plus two bytes.translate deletions (all C-level) yield both totals.
+# Characters outside CP1251 are dropped.
+# Extra matches of [a-z] / [а-яёіїєґ] under re.IGNORECASE (İ ı ſ K and the
+# Cyrillic Extended-C case variants), none of which exist in CP1251
+_LATIN_CASEFOLD_EXTRAS = ("\u0130", "\u0131", "\u017f", "\u212a")
+_CYRILLIC_CASEFOLD_EXTRAS = tuple(chr(code) for code in range(0x1C80, 0x1C87))
+
+_MULTI_WHITESPACE_RE = re.compile(r"\s{2,}")
+_FOLDABLE_RE = re.compile("[^\x00-\x7f\u0400-\u04ff]")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+_TURKISH_CHARS_RE = re.compile("[\u0130\u0131\u011E\u011F\u015E\u015F]")  # İ ı Ğ ğ Ş ş
+_CYRILLIC_BLOCK_RE = re.compile("[\u0400-\u04FF]")
+_GREEK_RE = re.compile("[\u0370-\u03FF\u1F00-\u1FFF]")
+_RTL_RE = re.compile("[\u0590-\u06FF]")  # Hebrew + Arabic
+_LATIN_DIACRITICS_RE = re.compile("[\u00C0-\u017F]")
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
+    "\U0001F680-\U0001F6FF"  # Transport and Map
+    "\U0001F1E0-\U0001F1FF"  # Regional indicator symbols
+    "\U00002600-\U000026FF"  # Misc symbols
+    "\U00002700-\U000027BF"  # Dingbats
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+    "\U0001F018-\U0001F0FF"  # Playing cards
+    "\U0001F200-\U0001F2FF"  # Enclosed CJK Letters and Months
+    "]"
+)
+
+
+def _count_scripts(text: str, ignorecase: bool = False) -> Tuple[int, int]:
+    """Return (cyrillic_letter_count, latin_letter_count) for ``text``."""
+    data = text.encode("cp1251", "ignore")
+    cyrillic = len(data) - len(data.translate(None, CYRILLIC_LETTER_BYTES))
+    latin = len(data) - len(data.translate(None, LATIN_LETTER_BYTES))
+    if ignorecase and not text.isascii():
+        latin += sum(map(text.count, _LATIN_CASEFOLD_EXTRAS))
+        cyrillic += sum(map(text.count, _CYRILLIC_CASEFOLD_EXTRAS))
+    return cyrillic, latin
 
 
 class UnicodeService:
@@ -121,96 +494,30 @@ class UnicodeService:
             'т': 't', 'Т': 'T',  # Cyrillic т (U+0442) → Latin t (U+0074) - SAME VISUAL APPEARANCE
         }
 
+        self._compile_tables()
+
         self.logger.info("UnicodeService initialized")
 
+    def _compile_tables(self) -> None:
+        """Precompute the character mappings used on every normalize_text call."""
+        self._complex_map = _CharMap(self.character_mapping)
+        self._to_latin_map = _CharMap(self.homoglyph_mapping)
+        self._to_cyrillic_map = _CharMap({v: k for k, v in self.homoglyph_mapping.items()})
+        # unidecode results per non-ASCII, non-Cyrillic character, filled lazily
+        self._fold_cache: Dict[str, str] = {}
+        register_cache("unicode.fold", self, "_fold_cache")
+
     def _attempt_encoding_recovery(self, text: str) -> str:
         """Attempt to recover corrupted encoding"""
         if not text:
             return text
 
-        # List of common encoding problems
-        encoding_fixes = [
-            # Windows-1252 -> UTF-8 (most common problem)
-            ("\x80", "€"),
-            ("\x81", ""),
-            ("\x82", "‚"),
-            ("\x83", "ƒ"),
-            ("\x84", "„"),
-            ("\x85", "…"),
-            ("\x86", "†"),
-            ("\x87", "‡"),
-            ("\x88", "ˆ"),
-            ("\x89", "‰"),
-            ("\x8a", "Š"),
-            ("\x8b", "‹"),
-            ("\x8c", "Œ"),
-            ("\x8d", ""),
-            ("\x8e", "Ž"),
-            ("\x8f", ""),
-            ("\x90", ""),
-            ("\x91", ""),
-            ("\x92", ""),
-            ("\x93", '"'),
-            ("\x94", '"'),
-            ("\x95", "•"),
-            ("\x96", "–"),
-            ("\x97", "—"),
-            ("\x98", "˜"),
-            ("\x99", "™"),
-            ("\x9a", "š"),
-            ("\x9b", "›"),
-            ("\x9c", "œ"),
-            ("\x9d", ""),
-            ("\x9e", "ž"),
-            ("\x9f", "Ÿ"),
-            # CP1251 -> UTF-8 (Cyrillic)
-            ("\x80", "Ђ"),
-            ("\x81", "Ѓ"),
-            ("\x82", "‚"),
-            ("\x83", "ѓ"),
-            ("\x84", "„"),
-            ("\x85", "…"),
-            ("\x86", "†"),
-            ("\x87", "‡"),
-            ("\x88", "€"),
-            ("\x89", "‰"),
-            ("\x8a", "Љ"),
-            ("\x8b", "‹"),
-            ("\x8c", "Њ"),
-            ("\x8d", "Ќ"),
-            ("\x8e", "Ћ"),
-            ("\x8f", "Џ"),
-            ("\x90", "ђ"),
-            ("\x91", "ѓ"),
-            ("\x92", "‚"),
-            ("\x93", "ѓ"),
-            ("\x94", "„"),
-            ("\x95", "…"),
-            ("\x96", "†"),
-            ("\x97", "‡"),
-            ("\x98", "€"),
-            ("\x99", "‰"),
-            ("\x9a", "љ"),
-            ("\x9b", "‹"),
-            ("\x9c", "њ"),
-            ("\x9d", "ќ"),
-            ("\x9e", "ћ"),
-            ("\x9f", "џ"),
-        ]
-
-        # Apply fixes
-        recovered_text = text
-        for old_char, new_char in encoding_fixes:
-            recovered_text = recovered_text.replace(old_char, new_char)
+        # Apply common encoding fixes
+        recovered_text, _ = _ENCODING_FIX_MAP.apply(text)
 
         # Assess recovery quality
         if recovered_text != text:
-            # Cyrillic letters
-            cyrillic_count = len(
-                re.findall(r"[а-яёіїєґ]", recovered_text, re.IGNORECASE)
-            )
-            # Latin letters
-            latin_count = len(re.findall(r"[a-z]", recovered_text, re.IGNORECASE))
+            cyrillic_count, latin_count = _count_scripts(recovered_text, ignorecase=True)
             # Total score (Cyrillic is more important for our texts)
             total_score = cyrillic_count * 2 + latin_count
 
@@ -225,46 +532,13 @@ class UnicodeService:
         if "Ð" in text or "Ñ" in text:
             # Look for patterns of corrupted encoding and try to fix them partially
             # Pattern for corrupted characters like Ð¸, Ð¹, etc.
-            partial_fixes = {
-                # Replace common corrupted sequences
-                "Ð¡": "С",
-                "Ðµ": "е",
-                "Ñ€": "р",
-                "Ð³": "г",
-                "Ð¸": "и",
-                "Ð¹": "й",
-                "Ð˜": "И",
-                "Ð²": "в",
-                "Ð°": "а",
-                "Ð½": "н",
-                "Ð¾": "о",
-                "Ð²": "в",
-                "Ñ": "с",
-                "Ñ‚": "т",
-                "Ñƒ": "у",
-                "Ñ„": "ф",
-                "Ñ…": "х",
-                "Ñ†": "ц",
-                "Ñ‡": "ч",
-                "Ñˆ": "ш",
-                "Ñ‰": "щ",
-                "ÑŠ": "ъ",
-                "Ñ‹": "ы",
-                "ÑŒ": "ь",
-                "Ñ": "э",
-                "ÑŽ": "ю",
-                "Ñ": "я",
-            }
-
             partially_recovered = text
-            for corrupted, fixed in partial_fixes.items():
+            for corrupted, fixed in _PARTIAL_ENCODING_FIXES.items():
                 partially_recovered = partially_recovered.replace(corrupted, fixed)
 
             # Assess partial recovery quality
             if partially_recovered != text:
-                cyrillic_count = len(
-                    re.findall(r"[а-яёіїєґ]", partially_recovered, re.IGNORECASE)
-                )
+                cyrillic_count, _ = _count_scripts(partially_recovered, ignorecase=True)
                 if cyrillic_count > 0:
                     self.logger.info(
                         f"Partial encoding recovery successful: {cyrillic_count} Cyrillic characters"
@@ -313,14 +587,15 @@ class UnicodeService:
         # Idempotency check: if string is already NFC/NFKC normalized AND has no special characters to replace
         # AND doesn't need whitespace cleanup AND has no invisible characters
         # AND (doesn't need case normalization OR aggressive mode is enabled)
-        has_special_chars = any(char in self.character_mapping for char in text)
-        needs_whitespace_cleanup = re.search(r'\s{2,}', text) or text != text.strip()
-        has_invisible_chars = any(char in text for char in [
-            "\u200b", "\u200c", "\u200d", "\ufeff", "\u200e", "\u200f", 
-            "\u202a", "\u202b", "\u202c", "\u202d", "\u202e", "\u2060"
-        ])
-        needs_case_normalization = any(c.isupper() for c in text)
-        if self._is_already_normalized(text) and not has_special_chars and not needs_whitespace_cleanup and not has_invisible_chars and (not needs_case_normalization or aggressive):
+        # Cheapest checks first; the per-character case scan only runs if needed
+        if (
+            not self._complex_map.present(text)
+            and not any(char in text for char in _INVISIBLE_CHARS)
+            and text == text.strip()
+            and not _MULTI_WHITESPACE_RE.search(text)
+            and self._is_already_normalized(text)
+            and (aggressive or not any(c.isupper() for c in text))
+        ):
             result = self._create_normalization_result(text, 1.0, 0, 0, 0, aggressive)
             result["original"] = text
             result["idempotent"] = True
@@ -413,9 +688,12 @@ class UnicodeService:
         if not text:
             return text, 0
             
-        # Detect dominant alphabet
-        cyrillic_count = len(re.findall(r'[а-яёіїєґА-ЯЁІЇЄҐ]', text))
-        latin_count = len(re.findall(r'[a-zA-Z]', text))
+        # Detect dominant alphabet (from the request's text profile when shared)
+        profile = get_text_profile(text)
+        if profile is not None:
+            cyrillic_count, latin_count = profile.cyrillic, profile.latin
+        else:
+            cyrillic_count, latin_count = _count_scripts(text)
         
         # Determine dominant alphabet
         if cyrillic_count > latin_count:
@@ -430,40 +708,16 @@ class UnicodeService:
 
     def _convert_to_latin(self, text: str) -> tuple[str, int]:
         """Convert Cyrillic homoglyphs to Latin characters."""
-        replacements = 0
-        result = ""
-        
-        for char in text:
-            if char in self.homoglyph_mapping:
-                result += self.homoglyph_mapping[char]
-                replacements += 1
-            else:
-                result += char
-                
-        return result, replacements
+        return self._to_latin_map.apply(text)
 
     def _convert_to_cyrillic(self, text: str) -> tuple[str, int]:
         """Convert Latin homoglyphs to Cyrillic characters."""
-        # Create reverse mapping
-        reverse_mapping = {v: k for k, v in self.homoglyph_mapping.items()}
-        
-        replacements = 0
-        result = ""
-        
-        for char in text:
-            if char in reverse_mapping:
-                result += reverse_mapping[char]
-                replacements += 1
-            else:
-                result += char
-                
-        return result, replacements
+        return self._to_cyrillic_map.apply(text)
 
     def _contains_turkish_chars(self, text: str) -> bool:
         """Check if text contains Turkish-specific characters that cause normalization issues."""
         # Turkish characters that cause idempotency issues with Unicode normalization
-        turkish_chars = {'\u0130', '\u0131', '\u011E', '\u011F', '\u015E', '\u015F'}  # İ ı Ğ ğ Ş ş
-        return any(char in turkish_chars for char in text)
+        return _TURKISH_CHARS_RE.search(text) is not None
 
     def _is_problematic_mixed_script(self, text: str) -> bool:
         """Check if text contains problematic mixed-script combinations that cause idempotency issues."""
@@ -471,8 +725,8 @@ class UnicodeService:
             return False
 
         has_turkish = self._contains_turkish_chars(text)
-        has_cyrillic = any('\u0400' <= char <= '\u04FF' for char in text)
-        has_greek = any('\u0370' <= char <= '\u03FF' or '\u1F00' <= char <= '\u1FFF' for char in text)
+        has_cyrillic = _CYRILLIC_BLOCK_RE.search(text) is not None
+        has_greek = _GREEK_RE.search(text) is not None
 
         # These combinations are known to cause idempotency issues
         problematic_combinations = [
@@ -507,171 +761,9 @@ class UnicodeService:
     
     def _replace_combining_accents(self, text: str) -> str:
         """Replace combining accents with base characters for mixed_diacritics support."""
-        # Mapping of combining accents to base characters
-        combining_accent_map = {
-            # Combining acute accent (U+0301) - most common
-            '\u0301': '',  # Remove combining acute accent
-            # Combining grave accent (U+0300)
-            '\u0300': '',  # Remove combining grave accent
-            # Combining circumflex (U+0302)
-            '\u0302': '',  # Remove combining circumflex
-            # Combining tilde (U+0303)
-            '\u0303': '',  # Remove combining tilde
-            # Combining diaeresis (U+0308)
-            '\u0308': '',  # Remove combining diaeresis
-            # Combining cedilla (U+0327)
-            '\u0327': '',  # Remove combining cedilla
-            # Combining caron (U+030C)
-            '\u030C': '',  # Remove combining caron
-            # Combining double acute (U+030B)
-            '\u030B': '',  # Remove combining double acute
-            # Combining breve (U+0306)
-            '\u0306': '',  # Remove combining breve
-            # Combining dot above (U+0307)
-            '\u0307': '',  # Remove combining dot above
-            # Combining ring above (U+030A)
-            '\u030A': '',  # Remove combining ring above
-            # Combining hook above (U+0309)
-            '\u0309': '',  # Remove combining hook above
-            # Combining horn (U+031B)
-            '\u031B': '',  # Remove combining horn
-            # Combining double grave (U+030F)
-            '\u030F': '',  # Remove combining double grave
-            # Combining inverted breve (U+0311)
-            '\u0311': '',  # Remove combining inverted breve
-            # Combining turned comma above (U+0312)
-            '\u0312': '',  # Remove combining turned comma above
-            # Combining comma above (U+0313)
-            '\u0313': '',  # Remove combining comma above
-            # Combining reversed comma above (U+0314)
-            '\u0314': '',  # Remove combining reversed comma above
-            # Combining comma above right (U+0315)
-            '\u0315': '',  # Remove combining comma above right
-            # Combining grave accent below (U+0316)
-            '\u0316': '',  # Remove combining grave accent below
-            # Combining acute accent below (U+0317)
-            '\u0317': '',  # Remove combining acute accent below
-            # Combining left tack below (U+0318)
-            '\u0318': '',  # Remove combining left tack below
-            # Combining right tack below (U+0319)
-            '\u0319': '',  # Remove combining right tack below
-            # Combining left angle above (U+031A)
-            '\u031A': '',  # Remove combining left angle above
-            # Combining horn (U+031B)
-            '\u031B': '',  # Remove combining horn
-            # Combining left half ring below (U+031C)
-            '\u031C': '',  # Remove combining left half ring below
-            # Combining up tack below (U+031D)
-            '\u031D': '',  # Remove combining up tack below
-            # Combining down tack below (U+031E)
-            '\u031E': '',  # Remove combining down tack below
-            # Combining plus sign below (U+031F)
-            '\u031F': '',  # Remove combining plus sign below
-            # Combining minus sign below (U+0320)
-            '\u0320': '',  # Remove combining minus sign below
-            # Combining palatalized hook below (U+0321)
-            '\u0321': '',  # Remove combining palatalized hook below
-            # Combining retroflex hook below (U+0322)
-            '\u0322': '',  # Remove combining retroflex hook below
-            # Combining dot below (U+0323)
-            '\u0323': '',  # Remove combining dot below
-            # Combining diaeresis below (U+0324)
-            '\u0324': '',  # Remove combining diaeresis below
-            # Combining ring below (U+0325)
-            '\u0325': '',  # Remove combining ring below
-            # Combining comma below (U+0326)
-            '\u0326': '',  # Remove combining comma below
-            # Combining cedilla (U+0327)
-            '\u0327': '',  # Remove combining cedilla
-            # Combining ogonek (U+0328)
-            '\u0328': '',  # Remove combining ogonek
-            # Combining vertical line below (U+0329)
-            '\u0329': '',  # Remove combining vertical line below
-            # Combining bridge below (U+032A)
-            '\u032A': '',  # Remove combining bridge below
-            # Combining inverted double arch below (U+032B)
-            '\u032B': '',  # Remove combining inverted double arch below
-            # Combining caron below (U+032C)
-            '\u032C': '',  # Remove combining caron below
-            # Combining circumflex accent below (U+032D)
-            '\u032D': '',  # Remove combining circumflex accent below
-            # Combining breve below (U+032E)
-            '\u032E': '',  # Remove combining breve below
-            # Combining inverted breve below (U+032F)
-            '\u032F': '',  # Remove combining inverted breve below
-            # Combining tilde below (U+0330)
-            '\u0330': '',  # Remove combining tilde below
-            # Combining macron below (U+0331)
-            '\u0331': '',  # Remove combining macron below
-            # Combining low line (U+0332)
-            '\u0332': '',  # Remove combining low line
-            # Combining double low line (U+0333)
-            '\u0333': '',  # Remove combining double low line
-            # Combining tilde overlay (U+0334)
-            '\u0334': '',  # Remove combining tilde overlay
-            # Combining short stroke overlay (U+0335)
-            '\u0335': '',  # Remove combining short stroke overlay
-            # Combining long stroke overlay (U+0336)
-            '\u0336': '',  # Remove combining long stroke overlay
-            # Combining short solidus overlay (U+0337)
-            '\u0337': '',  # Remove combining short solidus overlay
-            # Combining long solidus overlay (U+0338)
-            '\u0338': '',  # Remove combining long solidus overlay
-            # Combining horizontal bar (U+0339)
-            '\u0339': '',  # Remove combining horizontal bar
-            # Combining double overline (U+033A)
-            '\u033A': '',  # Remove combining double overline
-            # Combining double low line (U+033B)
-            '\u033B': '',  # Remove combining double low line
-            # Combining wavy line below (U+033C)
-            '\u033C': '',  # Remove combining wavy line below
-            # Combining double wavy line below (U+033D)
-            '\u033D': '',  # Remove combining double wavy line below
-            # Combining dotted grave accent (U+033E)
-            '\u033E': '',  # Remove combining dotted grave accent
-            # Combining dotted acute accent (U+033F)
-            '\u033F': '',  # Remove combining dotted acute accent
-            # Combining double acute accent (U+0340)
-            '\u0340': '',  # Remove combining double acute accent
-            # Combining double grave accent (U+0341)
-            '\u0341': '',  # Remove combining double grave accent
-            # Combining double tilde (U+0342)
-            '\u0342': '',  # Remove combining double tilde
-            # Combining double breve (U+0343)
-            '\u0343': '',  # Remove combining double breve
-            # Combining double circumflex (U+0344)
-            '\u0344': '',  # Remove combining double circumflex
-            # Combining double caron (U+0345)
-            '\u0345': '',  # Remove combining double caron
-            # Combining double macron (U+0346)
-            '\u0346': '',  # Remove combining double macron
-            # Combining double low line (U+0347)
-            '\u0347': '',  # Remove combining double low line
-            # Combining double overline (U+0348)
-            '\u0348': '',  # Remove combining double overline
-            # Combining double underline (U+0349)
-            '\u0349': '',  # Remove combining double underline
-            # Combining double wavy line (U+034A)
-            '\u034A': '',  # Remove combining double wavy line
-            # Combining double dotted line (U+034B)
-            '\u034B': '',  # Remove combining double dotted line
-            # Combining double solidus (U+034C)
-            '\u034C': '',  # Remove combining double solidus
-            # Combining double vertical line (U+034D)
-            '\u034D': '',  # Remove combining double vertical line
-            # Combining double horizontal line (U+034E)
-            '\u034E': '',  # Remove combining double horizontal line
-            # Combining double diagonal line (U+034F)
-            '\u034F': '',  # Remove combining double diagonal line
-        }
-        
-        # Apply the mapping
-        result = text
-        for combining_char, replacement in combining_accent_map.items():
-            if combining_char in result:
-                result = result.replace(combining_char, replacement)
-                self.logger.debug(f"unicode.nfc_applied: Replaced combining accent {combining_char} with {replacement}")
-        
+        result, removed = _COMBINING_ACCENTS.apply(text)
+        if removed:
+            self.logger.debug(f"unicode.nfc_applied: Removed {removed} combining accents")
         return result
 
     def _normalize_case(self, text: str) -> str:
@@ -684,107 +776,53 @@ class UnicodeService:
         """Check if case normalization is needed for cleanup operations"""
         # Normalize case if text contains invisible characters or RTL characters
         # that need to be cleaned up
-        invisible_chars = [
-            "\u200b", "\u200c", "\u200d", "\ufeff", "\u200e", "\u200f", 
-            "\u202a", "\u202b", "\u202c", "\u202d", "\u202e", "\u2060"
-        ]
-        has_invisible_chars = any(char in text for char in invisible_chars)
-        
+        has_invisible_chars = any(char in text for char in _INVISIBLE_CHARS)
+
         # Check for RTL characters (Hebrew, Arabic, etc.)
-        has_rtl_chars = any(ord(char) >= 0x0590 and ord(char) <= 0x05FF for char in text)  # Hebrew
-        has_rtl_chars |= any(ord(char) >= 0x0600 and ord(char) <= 0x06FF for char in text)  # Arabic
-        
+        has_rtl_chars = _RTL_RE.search(text) is not None
+
         # Check for diacritical marks that were normalized
-        has_diacritics = any(ord(char) >= 0x00C0 and ord(char) <= 0x017F for char in text)  # Latin with diacritics
-        
+        has_diacritics = _LATIN_DIACRITICS_RE.search(text) is not None
+
         return has_invisible_chars or has_rtl_chars or has_diacritics
 
     def _replace_complex_characters(self, text: str) -> tuple[str, int]:
         """Replace complex characters"""
-        replacements = 0
-        result = ""
-
-        for char in text:
-            if char in self.character_mapping:
-                result += self.character_mapping[char]
-                replacements += 1
-            else:
-                result += char
-
-        return result, replacements
+        return self._complex_map.apply(text)
 
     def _apply_ascii_folding(self, text: str) -> tuple[str, int]:
         """ASCII folding for Latin characters (preserve Cyrillic)"""
+        if text.isascii():
+            return text, 0
         try:
             from unidecode import unidecode
-
-            changes = 0
-            result = ""
-
-            # Apply unidecode only to Latin characters with diacritics
-            # Preserve Cyrillic characters
-            for char in text:
-                # Check if it's a Cyrillic character
-                if "\u0400" <= char <= "\u04ff":  # Cyrillic Unicode block
-                    result += char  # Preserve Cyrillic unchanged
-                elif char.isascii():
-                    result += char  # ASCII characters remain unchanged
-                else:
-                    # For other characters (Latin with diacritics) use unidecode
-                    folded = unidecode(char)
-                    if folded != char:
-                        changes += 1
-                    result += folded
-
-            # Count changes
-            if changes > 0:
-                self.logger.debug(
-                    f"ASCII folding applied: {changes} characters changed"
-                )
-                # Additional logging of changes for debug
-                for i, (orig, folded) in enumerate(zip(text, result)):
-                    if orig != folded:
-                        self.logger.debug(f"Character {i}: '{orig}' -> '{folded}'")
-
-            return result, changes
-
         except ImportError:
             self.logger.warning("unidecode not available, skipping ASCII folding")
             return text, 0
 
+        # Apply unidecode only to Latin characters with diacritics (ASCII and
+        # the Cyrillic block are preserved); each character is folded once
+        cache = self._fold_cache
+        changes = 0
+        for char in set(_FOLDABLE_RE.findall(text)):
+            folded = cache.get(char)
+            if folded is None:
+                folded = cache[char] = unidecode(char)
+            if folded != char:
+                changes += text.count(char)
+                text = text.replace(char, folded)
+
+        if changes > 0:
+            self.logger.debug(f"ASCII folding applied: {changes} characters changed")
+        return text, changes
+
     def _final_cleanup(self, text: str, aggressive: bool = False) -> str:
         """Final text cleanup with clear policy for emojis and invisible characters"""
-        # Remove extra spaces
-        text = re.sub(r"\s+", " ", text).strip()
-
-        # Remove null characters
-        text = text.replace("\x00", "")
-
-        # Remove other control characters
-        text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
-
-        # Remove invisible Unicode characters
-        invisible_chars = [
-            "\u200b",  # Zero-width space
-            "\u200c",  # Zero-width non-joiner
-            "\u200d",  # Zero-width joiner
-            "\ufeff",  # Byte order mark
-            "\u200e",  # Left-to-right mark
-            "\u200f",  # Right-to-left mark
-            "\u202a",  # Left-to-right embedding
-            "\u202b",  # Right-to-left embedding
-            "\u202c",  # Pop directional formatting
-            "\u202d",  # Left-to-right override
-            "\u202e",  # Right-to-left override
-            "\u2060",  # Word joiner
-            "\u2061",  # Function application
-            "\u2062",  # Invisible times
-            "\u2063",  # Invisible separator
-            "\u2064",  # Invisible plus
-        ]
-        
-        for char in invisible_chars:
-            text = text.replace(char, "")
+        # Remove extra spaces (str.split uses the same whitespace class as \s)
+        text = " ".join(text.split())
+
+        # Remove null/control characters and invisible Unicode characters
+        text, _ = _CLEANUP_DELETE.apply(text)
 
         # Emoji policy: only remove in aggressive mode
         if aggressive:
@@ -886,7 +924,7 @@ class UnicodeService:
             )
 
         # Check for other control characters
-        control_chars = re.findall(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", text)
+        control_chars = _CONTROL_CHARS_RE.findall(text)
         if control_chars:
             issues.append(
                 {
@@ -909,17 +947,9 @@ class UnicodeService:
             True if text is already normalized, False otherwise
         """
         try:
-            # Check if text is already in NFC form (most common)
-            nfc_normalized = unicodedata.normalize('NFC', text)
-            if text == nfc_normalized:
-                return True
-            
-            # Check if text is already in NFKC form (compatibility normalization)
-            nfkc_normalized = unicodedata.normalize('NFKC', text)
-            if text == nfkc_normalized:
-                return True
-                
-            return False
+            # NFC (most common) or NFKC (compatibility normalization); the
+            # quick-check avoids building normalized copies
+            return unicodedata.is_normalized("NFC", text) or unicodedata.is_normalized("NFKC", text)
         except Exception:
             # If normalization fails, assume it needs processing
             return False
@@ -958,21 +988,4 @@ class UnicodeService:
 
     def _remove_emojis_and_symbols(self, text: str) -> str:
         """Remove emojis and decorative symbols (only in aggressive mode)"""
-        # Emoji ranges
-        emoji_patterns = [
-            r"[\U0001F600-\U0001F64F]",  # Emoticons
-            r"[\U0001F300-\U0001F5FF]",  # Misc Symbols and Pictographs
-            r"[\U0001F680-\U0001F6FF]",  # Transport and Map
-            r"[\U0001F1E0-\U0001F1FF]",  # Regional indicator symbols
-            r"[\U00002600-\U000026FF]",  # Misc symbols
-            r"[\U00002700-\U000027BF]",  # Dingbats
-            r"[\U0001F900-\U0001F9FF]",  # Supplemental Symbols and Pictographs
-            r"[\U0001FA70-\U0001FAFF]",  # Symbols and Pictographs Extended-A
-            r"[\U0001F018-\U0001F0FF]",  # Playing cards
-            r"[\U0001F200-\U0001F2FF]",  # Enclosed CJK Letters and Months
-        ]
-        
-        for pattern in emoji_patterns:
-            text = re.sub(pattern, "", text)
-        
-        return text
+        return _EMOJI_RE.sub("", text)
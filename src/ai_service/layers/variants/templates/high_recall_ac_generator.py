@@ -8,6 +8,8 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Set, Tuple
 
+from ...normalization.lexicon_bundle import get_lexicon_bundle
+
 
 @dataclass
 class RecallOptimizedPattern:
@@ -1244,9 +1246,9 @@ class HighRecallACGenerator:
                 first_name_lower = first_name.lower()
                 if first_name_lower in diminutives_dict:
                     canonical_name = diminutives_dict[first_name_lower]
-                    # Находим все диминутивы для этого имени
-                    for dim, full in diminutives_dict.items():
-                        if full == canonical_name and dim != first_name_lower:
+                    # Находим все диминутивы для этого имени (обратный индекс из бандла)
+                    for dim in self._diminutive_forms(lang, canonical_name):
+                        if dim != first_name_lower:
                             diminutives_variants.append(dim.title())
 
             except Exception:
@@ -1284,23 +1286,12 @@ class HighRecallACGenerator:
         return list(set(clean_diminutives))[:15]  # Лимит согласно требованиям
 
     def _load_diminutives_dictionary(self, language: str):
-        """Загружает словарь диминутивов для языка"""
-        try:
-            import json
-            from pathlib import Path
-            
-            # Путь к словарю диминутивов
-            data_dir = Path(__file__).resolve().parents[4] / "data"
-            diminutives_file = data_dir / f"diminutives_{language}.json"
-            
-            if diminutives_file.exists():
-                with open(diminutives_file, 'r', encoding='utf-8') as f:
-                    self._diminutives_cache[language] = json.load(f)
-            else:
-                self._diminutives_cache[language] = {}
-                
-        except Exception:
-            self._diminutives_cache[language] = {}
+        """Загружает словарь диминутивов для языка из общего бандла лексиконов"""
+        self._diminutives_cache[language] = get_lexicon_bundle().get_map(f"diminutives:{language}")
+
+    def _diminutive_forms(self, language: str, canonical: str) -> List[str]:
+        """Все диминутивы канонического имени (в порядке словаря)"""
+        return get_lexicon_bundle().get_list(f"diminutive_forms:{language}", canonical)
 
     def _transliterate_to_latin(self, text: str) -> str:
         """Транслитерация кириллицы в латиницу"""
@@ -2471,17 +2462,7 @@ class HighRecallACGenerator:
             if language in ["ru", "uk"]:
                 # Используем кэш
                 if language not in self._diminutives_cache:
-                    import json
-                    from pathlib import Path
-                    
-                    base_path = Path(__file__).resolve().parents[5]
-                    diminutive_file = base_path / "data" / f"diminutives_{language}.json"
-                    
-                    if diminutive_file.exists():
-                        with open(diminutive_file, 'r', encoding='utf-8') as f:
-                            self._diminutives_cache[language] = json.load(f)
-                    else:
-                        self._diminutives_cache[language] = {}
+                    self._load_diminutives_dictionary(language)
                 
                 diminutives = self._diminutives_cache[language]
                 name_lower = name.lower()
@@ -2493,9 +2474,8 @@ class HighRecallACGenerator:
                         variants.append(full_name.title())
                 
                 # Обратное соответствие - ищем диминутивы для данного имени
-                for diminutive, full in diminutives.items():
-                    if full == name_lower and diminutive != name_lower:
-                        variants.append(diminutive.title())
+                for diminutive in self._diminutive_forms(language, name_lower):
+                    variants.append(diminutive.title())
                 
                 # Дополнительный поиск с учетом ё/е
                 if 'ё' in name_lower or 'е' in name_lower:
@@ -2507,24 +2487,13 @@ class HighRecallACGenerator:
                             if full_name != name_with_e:
                                 variants.append(full_name.title())
                         
-                        for diminutive, full in diminutives.items():
-                            if full == name_with_e and diminutive != name_with_e:
-                                variants.append(diminutive.title())
+                        for diminutive in self._diminutive_forms(language, name_with_e):
+                            variants.append(diminutive.title())
             
             elif language == "en":
                 # Используем кэш для английских никнеймов
                 if "en" not in self._nicknames_cache:
-                    import json
-                    from pathlib import Path
-                    
-                    base_path = Path(__file__).resolve().parents[5]
-                    nicknames_file = base_path / "data" / "lexicons" / "en_nicknames.json"
-                    
-                    if nicknames_file.exists():
-                        with open(nicknames_file, 'r', encoding='utf-8') as f:
-                            self._nicknames_cache["en"] = json.load(f)
-                    else:
-                        self._nicknames_cache["en"] = {}
+                    self._nicknames_cache["en"] = get_lexicon_bundle().get_map("diminutives:en")
                 
                 nicknames = self._nicknames_cache["en"]
                 name_lower = name.lower()
@@ -2536,9 +2505,8 @@ class HighRecallACGenerator:
                         variants.append(full_name.title())
                 
                 # Обратное соответствие - ищем никнеймы для данного имени
-                for nickname, full in nicknames.items():
-                    if full == name_lower and nickname != name_lower:
-                        variants.append(nickname.title())
+                for nickname in self._diminutive_forms("en", name_lower):
+                    variants.append(nickname.title())
         
         except Exception as e:
             # Логируем ошибку, но не прерываем выполнение
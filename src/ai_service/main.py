@@ -15,6 +15,19 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Installed before everything else so third-party imports are timed too
+from ai_service.utils.startup_profiler import (
+    get_startup_report,
+    get_startup_timeline,
+    install_import_profiler_from_env,
+)
+
+install_import_profiler_from_env()
+
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -23,10 +36,6 @@ from fastapi.responses import JSONResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field, ValidationError, validator
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from ai_service.config import (
     DEPLOYMENT_CONFIG,
     INTEGRATION_CONFIG,
@@ -50,13 +59,15 @@ from ai_service.utils import get_logger, setup_logging
 
 # from ai_service.layers.search.contracts import SearchRequest, SearchOpts
 from ai_service.utils.feature_flags import FeatureFlags, get_feature_flag_manager
+from ai_service.utils.readiness import SCREENING_COMPONENTS, get_readiness_tracker
 from ai_service.utils.response_formatter import format_processing_result
 
 # Setup centralized logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Import lazy_imports module to trigger initialization
+# Import lazy_imports module to trigger initialization (spaCy preloading is
+# started in startup_event)
 from ai_service.utils.lazy_imports import NAMEPARSER, NLP_EN, NLP_RU, NLP_UK, RAPIDFUZZ
 
 # Create FastAPI application
@@ -301,6 +312,7 @@ def _merge_feature_flags(request_flags: Optional[FeatureFlags]) -> FeatureFlags:
         enable_enhanced_diminutives=request_flags.enable_enhanced_diminutives,
         enable_enhanced_gender_rules=request_flags.enable_enhanced_gender_rules,
         enable_ascii_fastpath=request_flags.enable_ascii_fastpath,
+        trace_level=request_flags.trace_level,
         # Keep other global flags
         normalization_implementation=global_flags.normalization_implementation,
         factory_rollout_percentage=global_flags.factory_rollout_percentage,
@@ -383,41 +395,237 @@ def check_spacy_models():
     return True
 
 
+async def _preload_sanctions_data() -> None:
+    """Load the sanctions dataset and fuzzy candidates for fuzzy search."""
+    from ai_service.layers.search.sanctions_data_loader import (
+        SanctionsDataLoader,
+    )
+
+    sanctions_loader = SanctionsDataLoader()
+    dataset = await sanctions_loader.load_dataset(force_reload=False)
+    logger.info(
+        f"[OK] Sanctions data preloaded on startup: {dataset.total_entries} entries, {len(dataset.all_names)} unique names"
+    )
+
+    # Also preload fuzzy candidates for faster first searches
+    person_candidates = await sanctions_loader.get_fuzzy_candidates("person")
+    org_candidates = await sanctions_loader.get_fuzzy_candidates("organization")
+    logger.info(
+        f"[OK] Fuzzy candidates preloaded: {len(person_candidates)} persons, {len(org_candidates)} organizations"
+    )
+
+
+def _init_inn_cache() -> None:
+    """Initialize the INN cache for FAST PATH, generating it if missing (blocking)."""
+    from ai_service.layers.search.sanctioned_inn_cache import get_inn_cache
+
+    inn_cache = get_inn_cache()
+
+    # Check if cache exists and has data, if not - generate it
+    if not inn_cache.cache_file.exists() or inn_cache.get_stats()['total_inns'] == 0:
+        logger.info("[PROGRESS] INN cache not found or empty - generating automatically...")
+        try:
+            # Generate cache using the extract script
+            cache_script = Path(__file__).parent.parent.parent / "scripts" / "extract_sanctioned_inns.py"
+            result = subprocess.run([
+                sys.executable, str(cache_script)
+            ], capture_output=True, text=True, timeout=300)
+
+            if result.returncode == 0:
+                logger.info("[OK] INN cache generated successfully")
+                # Reload cache after generation
+                inn_cache.reload_cache()
+            else:
+                logger.error(f"[ERROR] Failed to generate INN cache: {result.stderr}")
+
+        except subprocess.TimeoutExpired:
+            logger.error("[ERROR] INN cache generation timed out")
+        except Exception as gen_error:
+            logger.error(f"[ERROR] Error generating INN cache: {gen_error}")
+
+    stats = inn_cache.get_stats()
+    logger.info(
+        f"[OK] INN cache initialized: {stats['total_inns']} INNs loaded "
+        f"({stats['persons']} persons, {stats['organizations']} orgs)"
+    )
+
+    # Test lookup for known sanctioned INN
+    test_inn = os.getenv("TEST_INN", "2839403975")  # Known sanctioned INN
+    if inn_cache.lookup(test_inn):
+        logger.info(f"[OK] INN cache validation passed: {test_inn} found")
+    else:
+        logger.warning(f"[WARN] INN cache validation failed: {test_inn} not found")
+
+
+async def _load_spacy_models() -> None:
+    """Preload spaCy models (blocking loads run in the loader's threads)."""
+    from ai_service.utils.async_model_loader import preload_models_async
+
+    await preload_models_async()
+
+
+async def _run_background_component(name: str, loader) -> None:
+    """Run one background startup step, reporting it to the readiness tracker."""
+    tracker = get_readiness_tracker()
+    tracker.start(name)
+    try:
+        with get_startup_timeline().phase(name):
+            await loader()
+        tracker.ready(name)
+    except Exception as e:
+        logger.warning(f"[WARN] Background load of {name} failed: {e}")
+        tracker.fail(name, e)
+
+
+async def _start_execution_backend() -> None:
+    """Spawn and warm the normalization process pool (EXECUTION_BACKEND=process)."""
+    backend = getattr(orchestrator, "execution_backend", None)
+    if backend is not None:
+        with get_startup_timeline().phase("process_pool"):
+            await backend.start()
+
+
+# Background tasks started in lazy mode (kept referenced until done)
+_background_tasks: List[asyncio.Task] = []
+
+# Set in the pre-fork master by warm_shared_state; inherited by the workers
+_prewarmed = False
+
+
+async def _warm_shared_state() -> None:
+    global orchestrator
+    timeline = get_startup_timeline()
+    with timeline.phase("prefork_orchestrator"):
+        orchestrator = await OrchestratorFactory.create_production_orchestrator(defer_heavy=True)
+        # Search keeps connection pools bound to an event loop: built per worker
+        await OrchestratorFactory.load_deferred_services(
+            orchestrator, names=["variants", "embeddings"], warmup=False
+        )
+    try:
+        with timeline.phase("sanctions_data"):
+            await _preload_sanctions_data()
+    except Exception as e:
+        logger.warning(f"[WARN] Failed to preload sanctions data in pre-fork master: {e}")
+    try:
+        with timeline.phase("inn_cache"):
+            _init_inn_cache()
+    except Exception as e:
+        logger.warning(f"[WARN] Failed to initialize INN cache in pre-fork master: {e}")
+
+
+def warm_shared_state() -> None:
+    """
+    Load the read-only state shared by all pre-forked workers.
+
+    Runs in the pre-fork master before fork: the orchestrator with its
+    normalization dictionaries, variants and embedding model, sanctions data
+    with fuzzy candidates, the INN cache and the spaCy models. Leaves no
+    threads or event loop running.
+    """
+    global _prewarmed
+    from ai_service.utils.async_model_loader import preload_models_blocking
+
+    asyncio.run(_warm_shared_state())
+    with get_startup_timeline().phase("spacy_models"):
+        preload_models_blocking()
+    _prewarmed = True
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize services on application startup"""
+    """
+    Initialize services on application startup.
+
+    In eager mode (default) everything is loaded before the app accepts
+    traffic. With STARTUP_MODE=lazy only the core pipeline is built here;
+    variants, embeddings, search, spaCy models, sanctions data and the INN
+    cache load in the background and are reported by /health/ready.
+    Workers forked by run_prefork_server inherit all of it except search.
+    """
     global orchestrator
 
     logger.info("Initializing AI services...")
+    timeline = get_startup_timeline()
+    timeline.mark("imports")
+    tracker = get_readiness_tracker()
+    lazy = DEPLOYMENT_CONFIG.startup_mode == "lazy"
+
+    # Continuous profiling: per worker, since the sampler thread does not survive fork
+    if os.getenv("PROFILER_AUTOSTART", "false").lower() == "true":
+        from ai_service.utils.profiling import start_sampling_profiler
+
+        start_sampling_profiler().register_endpoints(_route_handlers())
+
+    if _prewarmed:
+        # Forked worker: everything but the per-worker search service is inherited
+        await _start_execution_backend()
+        if lazy:
+            for service_name in orchestrator.deferred_services:
+                tracker.register(service_name)
+            tracker.mark_core_ready()
+            _background_tasks.append(
+                asyncio.create_task(OrchestratorFactory.load_deferred_services(orchestrator, tracker))
+            )
+        else:
+            await OrchestratorFactory.load_deferred_services(orchestrator, tracker)
+            tracker.mark_core_ready()
+        logger.info(f"Pre-forked worker {os.getpid()} started")
+        return
 
     # Check models on startup (non-blocking)
-    if not check_spacy_models():
-        logger.warning("SpaCy models not available. NER features will be disabled.")
+    with timeline.phase("check_spacy_models"):
+        if not check_spacy_models():
+            logger.warning("SpaCy models not available. NER features will be disabled.")
+
+    if lazy:
+        try:
+            with timeline.phase("core_orchestrator"):
+                orchestrator = await OrchestratorFactory.create_production_orchestrator(
+                    defer_heavy=True
+                )
+            await _start_execution_backend()
+        except Exception as e:
+            logger.error(f"Error initializing orchestrator: {e}")
+            tracker.mark_core_failed(e)
+            raise
+
+        components = {
+            "spacy_models": _load_spacy_models,
+            "sanctions_data": _preload_sanctions_data,
+            "inn_cache": lambda: asyncio.to_thread(_init_inn_cache),
+        }
+        for service_name in orchestrator.deferred_services:
+            tracker.register(service_name)
+        for name in components:
+            tracker.register(name)
+        tracker.mark_core_ready()
+        logger.info(
+            f"Core pipeline ready in {timeline.since_start_ms():.0f} ms, "
+            f"loading in background: {orchestrator.deferred_services + list(components)}"
+        )
+
+        async def load_services():
+            with timeline.phase("deferred_services"):
+                await OrchestratorFactory.load_deferred_services(orchestrator, tracker)
+
+        _background_tasks.append(asyncio.create_task(load_services()))
+        for name, loader in components.items():
+            _background_tasks.append(
+                asyncio.create_task(_run_background_component(name, loader))
+            )
+        return
 
     try:
         # Initialize unified orchestrator with production configuration
-        orchestrator = await OrchestratorFactory.create_production_orchestrator()
+        with timeline.phase("orchestrator"):
+            orchestrator = await OrchestratorFactory.create_production_orchestrator()
         logger.info("Unified orchestrator successfully initialized")
+        await _start_execution_backend()
 
         # Pre-load sanctions data for fuzzy search
         try:
-            from ai_service.layers.search.sanctions_data_loader import (
-                SanctionsDataLoader,
-            )
-
-            sanctions_loader = SanctionsDataLoader()
-            dataset = await sanctions_loader.load_dataset(force_reload=False)
-            logger.info(
-                f"[OK] Sanctions data preloaded on startup: {dataset.total_entries} entries, {len(dataset.all_names)} unique names"
-            )
-
-            # Also preload fuzzy candidates for faster first searches
-            person_candidates = await sanctions_loader.get_fuzzy_candidates("person")
-            org_candidates = await sanctions_loader.get_fuzzy_candidates("organization")
-            logger.info(
-                f"[OK] Fuzzy candidates preloaded: {len(person_candidates)} persons, {len(org_candidates)} organizations"
-            )
-
+            with timeline.phase("sanctions_data"):
+                await _preload_sanctions_data()
         except Exception as e:
             logger.warning(
                 f"[WARN] Failed to preload sanctions data (fuzzy search will load on first use): {e}"
@@ -425,47 +633,8 @@ async def startup_event():
 
         # Initialize INN cache for FAST PATH
         try:
-            from ai_service.layers.search.sanctioned_inn_cache import get_inn_cache
-            import subprocess
-            import sys
-
-            inn_cache = get_inn_cache()
-            
-            # Check if cache exists and has data, if not - generate it
-            if not inn_cache.cache_file.exists() or inn_cache.get_stats()['total_inns'] == 0:
-                logger.info("[PROGRESS] INN cache not found or empty - generating automatically...")
-                try:
-                    # Generate cache using the extract script
-                    cache_script = Path(__file__).parent.parent.parent / "scripts" / "extract_sanctioned_inns.py"
-                    result = subprocess.run([
-                        sys.executable, str(cache_script)
-                    ], capture_output=True, text=True, timeout=300)
-                    
-                    if result.returncode == 0:
-                        logger.info("[OK] INN cache generated successfully")
-                        # Reload cache after generation
-                        inn_cache.reload_cache()
-                    else:
-                        logger.error(f"[ERROR] Failed to generate INN cache: {result.stderr}")
-                        
-                except subprocess.TimeoutExpired:
-                    logger.error("[ERROR] INN cache generation timed out")
-                except Exception as gen_error:
-                    logger.error(f"[ERROR] Error generating INN cache: {gen_error}")
-
-            stats = inn_cache.get_stats()
-            logger.info(
-                f"[OK] INN cache initialized: {stats['total_inns']} INNs loaded "
-                f"({stats['persons']} persons, {stats['organizations']} orgs)"
-            )
-
-            # Test lookup for known sanctioned INN
-            test_inn = os.getenv("TEST_INN", "2839403975")  # Known sanctioned INN
-            if inn_cache.lookup(test_inn):
-                logger.info(f"[OK] INN cache validation passed: {test_inn} found")
-            else:
-                logger.warning(f"[WARN] INN cache validation failed: {test_inn} not found")
-
+            with timeline.phase("inn_cache"):
+                _init_inn_cache()
         except Exception as e:
             logger.warning(
                 f"[WARN] Failed to initialize INN cache (will fall back to regular search): {e}"
@@ -473,8 +642,24 @@ async def startup_event():
 
     except Exception as e:
         logger.error(f"Error initializing orchestrator: {e}")
+        tracker.mark_core_failed(e)
         raise
 
+    # spaCy models keep loading in their own threads, as before
+    from ai_service.utils.async_model_loader import start_model_preloading
+
+    start_model_preloading()
+    tracker.mark_core_ready()
+    logger.info(f"Startup completed in {timeline.since_start_ms():.0f} ms")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the normalization process pool, if any."""
+    backend = getattr(orchestrator, "execution_backend", None)
+    if backend is not None:
+        backend.shutdown()
+
 
 @app.get("/health")
 async def health_check():
@@ -567,52 +752,34 @@ async def liveness_check():
 
 @app.get("/health/ready")
 async def readiness_check():
-    """Kubernetes readiness probe - service ready to accept traffic"""
-    if orchestrator:
-        # Check if core services are available
-        try:
-            stats = orchestrator.get_processing_stats()
+    """
+    Kubernetes readiness probe - service ready to accept traffic.
 
-            # Check if we can process a simple request (lightweight check)
-            is_ready = stats.get(
-                "total_processed", 0
-            ) >= 0 and hasattr(  # Orchestrator is working
-                orchestrator, "normalization_service"
-            )  # Core service available
-
-            if is_ready:
-                return {
-                    "status": "ready",
-                    "timestamp": time.time(),
-                    "message": "Service ready to accept requests",
-                }
-            else:
-                return JSONResponse(
-                    status_code=503,
-                    content={
-                        "status": "not_ready",
-                        "timestamp": time.time(),
-                        "message": "Service not ready",
-                    },
-                )
-        except Exception as e:
-            return JSONResponse(
-                status_code=503,
-                content={
-                    "status": "not_ready",
-                    "timestamp": time.time(),
-                    "error": str(e),
-                },
-            )
-    else:
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "not_ready",
-                "timestamp": time.time(),
-                "message": "Orchestrator not initialized",
-            },
-        )
+    Ready once every subsystem is loaded. While heavy subsystems are still
+    loading in the background (STARTUP_MODE=lazy) the state is ``core_ready``
+    and the probe fails unless READY_ON_CORE=true; even then ``/process``
+    answers 503 until search and sanctions data are attached.
+    """
+    tracker = get_readiness_tracker()
+    readiness = tracker.snapshot()
+    if orchestrator and tracker.is_serving(DEPLOYMENT_CONFIG.ready_on_core):
+        return {
+            "status": "ready",
+            "timestamp": time.time(),
+            "message": "Service ready to accept requests",
+            "readiness": readiness,
+        }
+    return JSONResponse(
+        status_code=503,
+        content={
+            "status": "not_ready",
+            "timestamp": time.time(),
+            "message": (
+                "Orchestrator not initialized" if not orchestrator else "Service not ready"
+            ),
+            "readiness": readiness,
+        },
+    )
 
 
 @app.get("/metrics")
@@ -671,10 +838,19 @@ async def process_text(request: ProcessTextRequest):
         Processing result with normalized text, tokens, trace, and optional sections
 
     Raises:
-        HTTPException: 503 if orchestrator not initialized, 500 for internal errors
+        HTTPException: 503 if orchestrator not initialized or sanctions screening
+            is still loading (lazy startup), 500 for internal errors
     """
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+    # Without search and sanctions data the result would look screened but not be
+    loading = get_readiness_tracker().loading(SCREENING_COMPONENTS)
+    if loading:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Sanctions screening still loading: {', '.join(loading)}",
+            headers={"Retry-After": "5"},
+        )
 
     try:
         # Merge feature flags from request with global configuration
@@ -929,6 +1105,23 @@ async def get_statistics():
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
+@app.get("/admin/startup")
+async def get_startup_profile(top: int = 50, token: str = Depends(verify_admin_token)):
+    """
+    Cold-start report: startup phases, per-module import times and readiness.
+
+    Import times are only collected when the service was started with
+    IMPORT_PROFILE=true.
+    """
+    from ai_service.utils.async_model_loader import get_model_loading_status
+
+    report = get_startup_report(top=top)
+    report["readiness"] = get_readiness_tracker().snapshot()
+    report["spacy_models"] = get_model_loading_status()
+    report["startup_mode"] = DEPLOYMENT_CONFIG.startup_mode
+    return report
+
+
 @app.post("/clear-cache")
 async def clear_cache(token: str = Depends(verify_admin_token)):
     """Clear cache - Admin only"""
@@ -1116,6 +1309,8 @@ async def root():
             "stats": "/stats",
             "clear_cache": "/clear-cache",
             "reset_stats": "/reset-stats",
+            "startup_profile": "/admin/startup",
+            "memory": "/admin/memory",
             "normalize": "/normalize",
             "languages": "/languages",
         },
@@ -1231,7 +1426,176 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
     )
 
 
+@app.get("/admin/memory")
+async def get_memory_report(token: str = Depends(verify_admin_token)):
+    """Shared vs private memory of the pre-fork master and its workers (Linux)."""
+    from ai_service.utils.prefork import memory_report
+
+    return memory_report(os.getppid() if _prewarmed else os.getpid())
+
+
+@app.get("/admin/memory/allocations")
+async def get_allocation_report(top: int = 20, token: str = Depends(verify_admin_token)):
+    """Per-layer allocations of sampled requests, cache sizes and snapshot growth."""
+    from ai_service.utils.allocation_tracker import get_allocation_tracker
+
+    return await asyncio.to_thread(get_allocation_tracker().report, top)
+
+
+@app.post("/admin/memory/allocations/start")
+async def start_allocation_tracking(
+    sample_rate: Optional[float] = None, token: str = Depends(verify_admin_token)
+):
+    """
+    Start tracemalloc-based allocation tracking in this worker.
+
+    Args:
+        sample_rate: Share of requests measured per layer (default ALLOC_TRACK_SAMPLE_RATE or 0.01)
+    """
+    from ai_service.utils.allocation_tracker import get_allocation_tracker
+
+    tracker = get_allocation_tracker()
+    if sample_rate is not None:
+        tracker.sample_rate = min(max(sample_rate, 0.0), 1.0)
+    elif tracker.sample_rate <= 0:
+        tracker.sample_rate = 0.01
+    tracker.start()
+    return {"enabled": tracker.enabled, "sample_rate": tracker.sample_rate}
+
+
+@app.post("/admin/memory/allocations/stop")
+async def stop_allocation_tracking(token: str = Depends(verify_admin_token)):
+    """Stop allocation tracking; collected totals stay available."""
+    from ai_service.utils.allocation_tracker import get_allocation_tracker
+
+    tracker = get_allocation_tracker()
+    tracker.stop()
+    return {"enabled": tracker.enabled}
+
+
+@app.get("/admin/memory/leaks")
+async def get_leak_report(top: int = 20, token: str = Depends(verify_admin_token)):
+    """Take a tracemalloc snapshot and report the source lines that grew since the baseline."""
+    from ai_service.utils.allocation_tracker import get_allocation_tracker
+
+    tracker = get_allocation_tracker()
+    if not tracker.enabled:
+        raise HTTPException(status_code=409, detail="Allocation tracking is not running")
+    return await asyncio.to_thread(tracker.leak_report, top)
+
+
+def _route_handlers() -> Dict[Any, str]:
+    """Route handler -> path, for attributing profiler samples to endpoints."""
+    return {
+        route.endpoint: route.path
+        for route in app.routes
+        if getattr(route, "endpoint", None) is not None and getattr(route, "path", None)
+    }
+
+
+@app.post("/admin/profiler/start")
+async def start_profiler(
+    hz: Optional[float] = None,
+    seconds: Optional[float] = None,
+    token: str = Depends(verify_admin_token),
+):
+    """
+    Start the in-process sampling profiler of this worker.
+
+    Args:
+        hz: Samples per second (default PROFILER_SAMPLE_HZ, 100)
+        seconds: Stop automatically after this many seconds
+    """
+    from ai_service.utils.profiling import start_sampling_profiler
+
+    sampler = start_sampling_profiler(hz, seconds)
+    sampler.register_endpoints(_route_handlers())
+    return sampler.status()
+
+
+@app.post("/admin/profiler/stop")
+async def stop_profiler(token: str = Depends(verify_admin_token)):
+    """Stop the sampling profiler; samples stay available for download."""
+    from ai_service.utils.profiling import stop_sampling_profiler
+
+    sampler = stop_sampling_profiler()
+    if sampler is None:
+        raise HTTPException(status_code=404, detail="Profiler was never started")
+    return sampler.status()
+
+
+@app.get("/admin/profiler")
+async def get_profiler_status(top: int = 20, token: str = Depends(verify_admin_token)):
+    """Profiler state, samples per endpoint and layer, and the hottest functions."""
+    from ai_service.utils.profiling import get_sampling_profiler
+
+    sampler = get_sampling_profiler()
+    if sampler is None:
+        return {"running": False, "samples": 0}
+    return {
+        **sampler.status(),
+        "breakdown": sampler.breakdown(),
+        "top_functions": sampler.top_functions(top),
+    }
+
+
+@app.get("/admin/profiler/flamegraph")
+async def download_flamegraph(
+    format: str = "collapsed",
+    endpoint: Optional[str] = None,
+    layer: Optional[str] = None,
+    include_idle: bool = False,
+    token: str = Depends(verify_admin_token),
+):
+    """
+    Download the sampled stacks.
+
+    Args:
+        format: "collapsed" (flamegraph.pl / speedscope text) or "speedscope" (JSON)
+        endpoint: Only samples of this route, e.g. /process
+        layer: Only samples of this orchestrator layer, e.g. signals
+        include_idle: Keep samples of threads that were waiting
+    """
+    from ai_service.utils.profiling import get_sampling_profiler
+
+    sampler = get_sampling_profiler()
+    if sampler is None:
+        raise HTTPException(status_code=404, detail="Profiler was never started")
+    if format == "speedscope":
+        return JSONResponse(
+            sampler.speedscope(endpoint, layer, include_idle),
+            headers={"Content-Disposition": "attachment; filename=profile.speedscope.json"},
+        )
+    if format != "collapsed":
+        raise HTTPException(status_code=400, detail="format must be 'collapsed' or 'speedscope'")
+    return Response(
+        sampler.collapsed(endpoint, layer, include_idle),
+        media_type="text/plain",
+        headers={"Content-Disposition": "attachment; filename=profile.folded"},
+    )
+
+
+def run_prefork_server() -> int:
+    """Warm shared state once, then serve with DEPLOYMENT_CONFIG.workers forked workers."""
+    from ai_service.utils.prefork import PreforkServer
+
+    def serve(sock):
+        config = uvicorn.Config(app, log_level=DEPLOYMENT_CONFIG.log_level)
+        uvicorn.Server(config).run(sockets=[sock])
+
+    server = PreforkServer(
+        serve,
+        workers=DEPLOYMENT_CONFIG.workers,
+        host=DEPLOYMENT_CONFIG.host,
+        port=DEPLOYMENT_CONFIG.port,
+        memory_report_interval=DEPLOYMENT_CONFIG.memory_report_interval,
+    )
+    return server.run(warm=warm_shared_state)
+
+
 if __name__ == "__main__":
+    if DEPLOYMENT_CONFIG.prefork and DEPLOYMENT_CONFIG.workers > 1:
+        sys.exit(run_prefork_server())
     uvicorn.run(
         "main:app",
         host=DEPLOYMENT_CONFIG.host,
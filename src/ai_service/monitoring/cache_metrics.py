@@ -146,6 +146,14 @@ class CacheMetrics:
             ['layer'],
             registry=registry
         )
+        
+        # Canonical-name fastpath outcomes (hit, miss, parity_mismatch)
+        self.canonical_fastpath = Counter(
+            'normalization_canonical_fastpath_total',
+            'Canonical-name fastpath outcomes',
+            ['language', 'outcome'],
+            registry=registry
+        )
     
     def record_tokenizer_cache_hit(self, language: str) -> None:
         """Record tokenizer cache hit."""
@@ -210,6 +218,10 @@ class CacheMetrics:
         """Record cache expiration."""
         self.cache_expirations.labels(layer=layer).inc()
     
+    def record_canonical_fastpath(self, language: str, outcome: str) -> None:
+        """Record a canonical fastpath outcome (hit, miss or parity_mismatch)."""
+        self.canonical_fastpath.labels(language=language, outcome=outcome).inc()
+    
     def update_from_cache_stats(
         self,
         layer: str,
@@ -392,51 +392,15 @@ class DashboardDataExporter:
         tags_filter: Dict[str, str]
     ) -> List[Dict[str, Any]]:
         """Get time series data for metric."""
-        # Get metric buffer data points
-        buffer = self.metrics_collector._get_metric_buffer(metric_name)
-        points = buffer.get_points(
-            start_time=time.time() - time_window_seconds,
-            tags_filter=tags_filter
+        # 60 data points, aggregated from the metric's per-slice sketches
+        return self.metrics_collector.get_time_series(
+            metric_name,
+            aggregation,
+            time_window_seconds,
+            tags_filter,
+            points=60
         )
 
-        # Group points into time buckets for time series
-        bucket_duration = time_window_seconds / 60  # 60 data points
-        time_series = []
-
-        if points:
-            start_time = points[0].timestamp
-            current_bucket_start = start_time
-
-            while current_bucket_start < time.time():
-                bucket_end = current_bucket_start + bucket_duration
-                bucket_points = [
-                    p for p in points
-                    if current_bucket_start <= p.timestamp < bucket_end
-                ]
-
-                if bucket_points:
-                    values = [p.value for p in bucket_points]
-
-                    if aggregation == AggregationType.AVERAGE:
-                        bucket_value = sum(values) / len(values)
-                    elif aggregation == AggregationType.MAX:
-                        bucket_value = max(values)
-                    elif aggregation == AggregationType.MIN:
-                        bucket_value = min(values)
-                    elif aggregation == AggregationType.SUM:
-                        bucket_value = sum(values)
-                    else:
-                        bucket_value = sum(values) / len(values)  # Default to average
-
-                    time_series.append({
-                        "timestamp": current_bucket_start,
-                        "value": bucket_value
-                    })
-
-                current_bucket_start = bucket_end
-
-        return time_series
-
     async def _get_global_metrics(self) -> Dict[str, Any]:
         """Get global system metrics."""
         # Get alert summary
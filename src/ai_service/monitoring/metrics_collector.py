@@ -5,18 +5,19 @@ Provides real-time metrics aggregation, storage, and analysis for the AI Service
 
 import time
 import asyncio
+import bisect
 import threading
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import defaultdict
 from enum import Enum
 import json
-import statistics
 import math
 from datetime import datetime, timedelta
 import weakref
 
 from ..utils.enhanced_logging import get_logger_for_component, LogCategory
+from .quantile_sketch import DEFAULT_SLICE_SECONDS, DDSketch, WindowedSketch
 
 
 class MetricType(Enum):
@@ -71,6 +72,9 @@ class HistogramData:
     sum: float = 0.0
     min_value: float = float('inf')
     max_value: float = float('-inf')
+    # Lifetime distribution, for percentiles without keeping values
+    sketch: DDSketch = field(default_factory=DDSketch, repr=False)
+    _limits: List[float] = field(default_factory=list, repr=False)
 
     def add_value(self, value: float) -> None:
         """Add value to histogram."""
@@ -78,14 +82,18 @@ class HistogramData:
         self.sum += value
         self.min_value = min(self.min_value, value)
         self.max_value = max(self.max_value, value)
-
-        # Add to appropriate bucket
-        for bucket_limit in sorted(self.buckets.keys()):
-            if value <= bucket_limit:
-                self.buckets[bucket_limit] += 1
-
-    def get_percentile(self, percentile: float, values: List[float]) -> float:
-        """Calculate percentile from values."""
+        self.sketch.add(value)
+
+        # Add to every bucket whose limit is >= value (cumulative buckets)
+        if len(self._limits) != len(self.buckets):
+            self._limits = sorted(self.buckets)
+        for bucket_limit in self._limits[bisect.bisect_left(self._limits, value):]:
+            self.buckets[bucket_limit] += 1
+
+    def get_percentile(self, percentile: float, values: Optional[List[float]] = None) -> float:
+        """Calculate percentile from values, or from the histogram's sketch if none are given."""
+        if values is None:
+            return self.sketch.quantile(percentile / 100.0)
         if not values:
             return 0.0
 
@@ -102,112 +110,106 @@ class HistogramData:
 
 
 class MetricBuffer:
-    """Thread-safe buffer for metric points with time-based windowing."""
+    """
+    Rolling window of metric values, aggregated in quantile sketches.
 
-    def __init__(self, max_size: int = 10000, max_age_seconds: float = 3600.0):
-        self.max_size = max_size
+    Values are not stored individually: each one is folded into the
+    per-thread sketch of its time slice and tag set (see
+    ``WindowedSketch``), so recording is O(1) and lock-free and reads merge
+    at most max_age / slice_seconds sketches per thread and tag set.
+    """
+
+    def __init__(self, max_age_seconds: float = 3600.0, slice_seconds: float = DEFAULT_SLICE_SECONDS):
         self.max_age_seconds = max_age_seconds
-        self.points: deque = deque(maxlen=max_size)
-        self._lock = threading.RLock()
+        self.window = WindowedSketch(max_age_seconds=max_age_seconds, slice_seconds=slice_seconds)
 
     def add_point(self, point: MetricPoint) -> None:
         """Add metric point to buffer."""
-        with self._lock:
-            self.points.append(point)
-            self._cleanup_old_points()
-
-    def _cleanup_old_points(self) -> None:
-        """Remove points older than max_age_seconds."""
-        current_time = time.time()
-        cutoff_time = current_time - self.max_age_seconds
+        self.window.add(point.value, point.tags, point.timestamp)
 
-        while self.points and self.points[0].timestamp < cutoff_time:
-            self.points.popleft()
+    def add(self, value: float, tags: Optional[Dict[str, str]] = None, timestamp: Optional[float] = None) -> None:
+        """Add a value without building a MetricPoint."""
+        self.window.add(value, tags, timestamp)
 
-    def get_points(
+    def get_sketch(
         self,
         start_time: Optional[float] = None,
         end_time: Optional[float] = None,
         tags_filter: Optional[Dict[str, str]] = None
-    ) -> List[MetricPoint]:
-        """Get filtered points from buffer."""
-        with self._lock:
-            self._cleanup_old_points()
-
-            current_time = time.time()
-            start_time = start_time or (current_time - self.max_age_seconds)
-            end_time = end_time or current_time
-
-            filtered_points = []
-            for point in self.points:
-                # Time filter
-                if not (start_time <= point.timestamp <= end_time):
-                    continue
-
-                # Tags filter
-                if tags_filter:
-                    if not all(point.tags.get(k) == v for k, v in tags_filter.items()):
-                        continue
-
-                filtered_points.append(point)
-
-            return filtered_points
+    ) -> DDSketch:
+        """Merged sketch of the values recorded in the window."""
+        return self.window.merged(start_time, end_time, tags_filter)
 
     def get_aggregated_stats(
         self,
         aggregation_types: List[AggregationType],
-        time_window_seconds: float = 300.0
+        time_window_seconds: float = 300.0,
+        tags_filter: Optional[Dict[str, str]] = None
     ) -> Dict[str, float]:
         """Get aggregated statistics for the buffer."""
         current_time = time.time()
+        sketch = self.get_sketch(start_time=current_time - time_window_seconds, tags_filter=tags_filter)
+        if not sketch.count:
+            return {agg.value: 0.0 for agg in aggregation_types}
+        return {agg.value: self._aggregate(sketch, agg, time_window_seconds) for agg in aggregation_types}
+
+    @staticmethod
+    def _aggregate(sketch: DDSketch, agg_type: AggregationType, time_window_seconds: float) -> float:
+        if agg_type == AggregationType.SUM:
+            return sketch.sum
+        elif agg_type == AggregationType.AVERAGE:
+            return sketch.mean
+        elif agg_type == AggregationType.MIN:
+            return sketch.min
+        elif agg_type == AggregationType.MAX:
+            return sketch.max
+        elif agg_type == AggregationType.COUNT:
+            return sketch.count
+        elif agg_type == AggregationType.P50:
+            return sketch.quantile(0.50)
+        elif agg_type == AggregationType.P95:
+            return sketch.quantile(0.95)
+        elif agg_type == AggregationType.P99:
+            return sketch.quantile(0.99)
+        elif agg_type == AggregationType.RATE_PER_SECOND:
+            return sketch.count / time_window_seconds
+        elif agg_type == AggregationType.RATE_PER_MINUTE:
+            return sketch.count / (time_window_seconds / 60.0)
+        return 0.0
+
+    def get_time_series(
+        self,
+        aggregation: AggregationType,
+        time_window_seconds: float = 300.0,
+        tags_filter: Optional[Dict[str, str]] = None,
+        points: int = 60
+    ) -> List[Dict[str, float]]:
+        """Aggregated value per time bucket (at least one slice wide), oldest first; empty buckets are skipped."""
+        current_time = time.time()
         start_time = current_time - time_window_seconds
+        bucket_seconds = max(self.window.slice_seconds, time_window_seconds / points)
+
+        buckets: Dict[int, DDSketch] = {}
+        for slice_id, _, sketch in self.window.slices(start_time=start_time, tags_filter=tags_filter):
+            slice_start = slice_id * self.window.slice_seconds
+            bucket = int((max(slice_start, start_time) - start_time) // bucket_seconds)
+            buckets.setdefault(bucket, DDSketch(sketch.relative_accuracy)).merge(sketch)
+
+        return [
+            {
+                "timestamp": start_time + bucket * bucket_seconds,
+                "value": self._aggregate(buckets[bucket], aggregation, bucket_seconds),
+            }
+            for bucket in sorted(buckets)
+        ]
 
-        points = self.get_points(start_time=start_time)
-        if not points:
-            return {agg.value: 0.0 for agg in aggregation_types}
+    def cleanup(self) -> None:
+        """Drop expired slices."""
+        self.window.prune()
 
-        values = [point.value for point in points]
-        stats = {}
-
-        for agg_type in aggregation_types:
-            if agg_type == AggregationType.SUM:
-                stats[agg_type.value] = sum(values)
-            elif agg_type == AggregationType.AVERAGE:
-                stats[agg_type.value] = statistics.mean(values)
-            elif agg_type == AggregationType.MIN:
-                stats[agg_type.value] = min(values)
-            elif agg_type == AggregationType.MAX:
-                stats[agg_type.value] = max(values)
-            elif agg_type == AggregationType.COUNT:
-                stats[agg_type.value] = len(values)
-            elif agg_type == AggregationType.P50:
-                stats[agg_type.value] = statistics.median(values)
-            elif agg_type == AggregationType.P95:
-                stats[agg_type.value] = self._percentile(values, 95)
-            elif agg_type == AggregationType.P99:
-                stats[agg_type.value] = self._percentile(values, 99)
-            elif agg_type == AggregationType.RATE_PER_SECOND:
-                stats[agg_type.value] = len(values) / time_window_seconds
-            elif agg_type == AggregationType.RATE_PER_MINUTE:
-                stats[agg_type.value] = len(values) / (time_window_seconds / 60.0)
-
-        return stats
-
-    def _percentile(self, values: List[float], percentile: float) -> float:
-        """Calculate percentile from values."""
-        if not values:
-            return 0.0
 
-        sorted_values = sorted(values)
-        index = (percentile / 100.0) * (len(sorted_values) - 1)
-
-        if index.is_integer():
-            return sorted_values[int(index)]
-        else:
-            lower = int(math.floor(index))
-            upper = int(math.ceil(index))
-            weight = index - lower
-            return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+# Quantiles exported for histogram and timer metrics
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
 
 
 class MetricsCollector:
@@ -221,11 +223,10 @@ class MetricsCollector:
         self.counters: Dict[str, float] = defaultdict(float)
         self.gauges: Dict[str, float] = {}
         self.histograms: Dict[str, HistogramData] = {}
-        self.timers: Dict[str, List[float]] = defaultdict(list)
+        self.timers: Dict[str, DDSketch] = defaultdict(DDSketch)
 
         # Configuration
         self.default_histogram_buckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
-        self.max_timer_values = 1000
 
         # Thread safety
         self._lock = threading.RLock()
@@ -252,22 +253,43 @@ class MetricsCollector:
 
     def _get_metric_buffer(self, metric_name: str) -> MetricBuffer:
         """Get or create metric buffer for metric name."""
-        if metric_name not in self.metric_buffers:
-            self.metric_buffers[metric_name] = MetricBuffer()
-        return self.metric_buffers[metric_name]
+        buffer = self.metric_buffers.get(metric_name)
+        if buffer is None:
+            with self._lock:
+                buffer = self.metric_buffers.setdefault(metric_name, MetricBuffer())
+        return buffer
 
     def _emit_metric(self, point: MetricPoint) -> None:
         """Emit metric point to storage and callbacks."""
-        with self._lock:
-            # Store in buffer
-            buffer = self._get_metric_buffer(point.name)
-            buffer.add_point(point)
+        self._emit(point.name, point.value, point.tags, point.metric_type, point.timestamp, point)
 
-            # Update collection stats
-            self.collection_stats["total_metrics_collected"] += 1
-
-            # Call callbacks
-            for callback in self.metric_callbacks:
+    def _emit(
+        self,
+        name: str,
+        value: float,
+        tags: Optional[Dict[str, str]],
+        metric_type: MetricType,
+        timestamp: Optional[float] = None,
+        point: Optional[MetricPoint] = None
+    ) -> None:
+        """Fold a value into its buffer; a MetricPoint is only built for callbacks."""
+        timestamp = time.time() if timestamp is None else timestamp
+        self._get_metric_buffer(name).add(value, tags, timestamp)
+
+        # Update collection stats
+        self.collection_stats["total_metrics_collected"] += 1
+
+        # Call callbacks
+        if self.metric_callbacks:
+            if point is None:
+                point = MetricPoint(
+                    name=name,
+                    value=value,
+                    timestamp=timestamp,
+                    tags=tags or {},
+                    metric_type=metric_type
+                )
+            for callback in list(self.metric_callbacks):
                 try:
                     callback(point)
                 except Exception as e:
@@ -285,16 +307,9 @@ class MetricsCollector:
 
         with self._lock:
             self.counters[metric_key] += value
+            total = self.counters[metric_key]
 
-        # Emit metric point
-        point = MetricPoint(
-            name=name,
-            value=self.counters[metric_key],
-            timestamp=time.time(),
-            tags=tags or {},
-            metric_type=MetricType.COUNTER
-        )
-        self._emit_metric(point)
+        self._emit(name, total, tags, MetricType.COUNTER)
 
     def record_gauge(
         self,
@@ -308,15 +323,7 @@ class MetricsCollector:
         with self._lock:
             self.gauges[metric_key] = value
 
-        # Emit metric point
-        point = MetricPoint(
-            name=name,
-            value=value,
-            timestamp=time.time(),
-            tags=tags or {},
-            metric_type=MetricType.GAUGE
-        )
-        self._emit_metric(point)
+        self._emit(name, value, tags, MetricType.GAUGE)
 
     def record_histogram(
         self,
@@ -327,26 +334,21 @@ class MetricsCollector:
     ) -> None:
         """Record histogram metric."""
         metric_key = f"{name}:{json.dumps(tags or {}, sort_keys=True)}"
-        buckets = buckets or self.default_histogram_buckets
 
         with self._lock:
-            if metric_key not in self.histograms:
-                self.histograms[metric_key] = HistogramData()
-                # Initialize buckets
-                for bucket_limit in buckets:
-                    self.histograms[metric_key].buckets[bucket_limit] = 0
-
-            self.histograms[metric_key].add_value(value)
-
-        # Emit metric point
-        point = MetricPoint(
-            name=name,
-            value=value,
-            timestamp=time.time(),
-            tags=tags or {},
-            metric_type=MetricType.HISTOGRAM
-        )
-        self._emit_metric(point)
+            self._add_histogram_value(metric_key, value, buckets)
+
+        self._emit(name, value, tags, MetricType.HISTOGRAM)
+
+    def _add_histogram_value(self, metric_key: str, value: float, buckets: Optional[List[float]] = None) -> None:
+        """Fold a value into the bucket histogram (caller holds the lock)."""
+        if metric_key not in self.histograms:
+            self.histograms[metric_key] = HistogramData()
+            # Initialize buckets
+            for bucket_limit in buckets or self.default_histogram_buckets:
+                self.histograms[metric_key].buckets[bucket_limit] = 0
+
+        self.histograms[metric_key].add_value(value)
 
     def record_timer(
         self,
@@ -358,23 +360,11 @@ class MetricsCollector:
         metric_key = f"{name}:{json.dumps(tags or {}, sort_keys=True)}"
 
         with self._lock:
-            self.timers[metric_key].append(duration_ms)
-            # Keep only recent timer values
-            if len(self.timers[metric_key]) > self.max_timer_values:
-                self.timers[metric_key] = self.timers[metric_key][-self.max_timer_values:]
-
-        # Also record as histogram for percentile calculations
-        self.record_histogram(name, duration_ms, tags)
-
-        # Emit metric point
-        point = MetricPoint(
-            name=name,
-            value=duration_ms,
-            timestamp=time.time(),
-            tags=tags or {},
-            metric_type=MetricType.TIMER
-        )
-        self._emit_metric(point)
+            self.timers[metric_key].add(duration_ms)
+            # Also kept as histogram buckets; the buffer gets the value once
+            self._add_histogram_value(metric_key, duration_ms)
+
+        self._emit(name, duration_ms, tags, MetricType.TIMER)
 
     def increment(self, name: str, tags: Optional[Dict[str, str]] = None) -> None:
         """Increment counter by 1."""
@@ -421,7 +411,19 @@ class MetricsCollector:
     ) -> Dict[str, float]:
         """Get aggregated statistics for a metric."""
         buffer = self._get_metric_buffer(metric_name)
-        return buffer.get_aggregated_stats(aggregations, time_window_seconds)
+        return buffer.get_aggregated_stats(aggregations, time_window_seconds, tags_filter)
+
+    def get_time_series(
+        self,
+        metric_name: str,
+        aggregation: AggregationType,
+        time_window_seconds: float = 300.0,
+        tags_filter: Optional[Dict[str, str]] = None,
+        points: int = 60
+    ) -> List[Dict[str, float]]:
+        """Get aggregated time series for a metric."""
+        buffer = self._get_metric_buffer(metric_name)
+        return buffer.get_time_series(aggregation, time_window_seconds, tags_filter, points)
 
     def get_histogram_stats(self, name: str, tags: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Get histogram statistics."""
@@ -433,13 +435,12 @@ class MetricsCollector:
 
             histogram = self.histograms[metric_key]
 
-            # Get recent values for percentile calculation
+            # Get recent distribution for percentile calculation
             buffer = self._get_metric_buffer(name)
-            recent_points = buffer.get_points(
+            recent = buffer.get_sketch(
                 start_time=time.time() - 300,  # Last 5 minutes
                 tags_filter=tags
             )
-            recent_values = [p.value for p in recent_points]
 
             stats = {
                 "count": histogram.count,
@@ -451,15 +452,34 @@ class MetricsCollector:
             }
 
             # Calculate percentiles from recent values
-            if recent_values:
-                stats.update({
-                    "p50": buffer._percentile(recent_values, 50),
-                    "p95": buffer._percentile(recent_values, 95),
-                    "p99": buffer._percentile(recent_values, 99)
-                })
+            if recent.count:
+                p50, p95, p99 = recent.quantiles((0.50, 0.95, 0.99))
+                stats.update({"p50": p50, "p95": p95, "p99": p99})
 
             return stats
 
+    def get_quantile_summaries(
+        self,
+        time_window_seconds: float = 300.0,
+        quantiles: Tuple[float, ...] = SUMMARY_QUANTILES
+    ) -> List[Dict[str, Any]]:
+        """Windowed count, sum and quantiles of every histogram/timer metric, per tag set."""
+        start_time = time.time() - time_window_seconds
+        summaries = []
+        for name in sorted({metric_key.split(':')[0] for metric_key in list(self.histograms)}):
+            buffer = self.metric_buffers.get(name)
+            if buffer is None:
+                continue
+            for key, sketch in buffer.window.merged_by_tags(start_time=start_time).items():
+                summaries.append({
+                    "name": name,
+                    "tags": dict(key),
+                    "count": sketch.count,
+                    "sum": sketch.sum,
+                    "quantiles": dict(zip(quantiles, sketch.quantiles(quantiles)))
+                })
+        return summaries
+
     def get_all_metrics_summary(self, time_window_seconds: float = 300.0) -> Dict[str, Any]:
         """Get summary of all collected metrics."""
         current_time = time.time()
@@ -679,17 +699,10 @@ class MetricsCollector:
 
     def _cleanup_old_data(self) -> None:
         """Clean up old metric data to prevent memory leaks."""
-        # Cleanup happens automatically in MetricBuffer
-        # This method is for additional cleanup if needed
-
-        # Clean up timer data
-        current_time = time.time()
-        cutoff_time = current_time - 3600  # Keep 1 hour of timer data
-
-        for metric_key in list(self.timers.keys()):
-            # For simplicity, just limit the size of timer arrays
-            if len(self.timers[metric_key]) > self.max_timer_values:
-                self.timers[metric_key] = self.timers[metric_key][-self.max_timer_values:]
+        # Recording threads drop their own expired slices; this also covers
+        # metrics that stopped being recorded and threads that exited
+        for buffer in list(self.metric_buffers.values()):
+            buffer.cleanup()
 
 
 # Global metrics collector
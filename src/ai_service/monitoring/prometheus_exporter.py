@@ -8,6 +8,8 @@ Exports metrics for:
 - ac_hits_total{type="exact|phrase|ngram"}, ac_weak_hits_total
 - knn_hits_total, fusion_consensus_total
 - es_errors_total{type="timeout|conn|mapping"}
+- request_span_duration_ms_bucket{span="..."} (histogram of sampled request span trees)
+- ai_service_<metric>{quantile="..."} summaries of an attached MetricsCollector's sketches
 """
 
 import time
@@ -20,7 +22,9 @@ try:
         Counter, Histogram, Gauge, CollectorRegistry,
         generate_latest, CONTENT_TYPE_LATEST
     )
-    from prometheus_client.core import HistogramMetricFamily, CounterMetricFamily, GaugeMetricFamily
+    from prometheus_client.core import (
+        HistogramMetricFamily, CounterMetricFamily, GaugeMetricFamily, SummaryMetricFamily
+    )
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     # Fallback mode when prometheus_client is not available
@@ -113,6 +117,7 @@ class SearchPrometheusExporter:
         self.registry = registry or CollectorRegistry()
         self.prometheus_available = PROMETHEUS_AVAILABLE
         self._fallback_metrics = {}  # For fallback mode
+        self._summary_collector: Optional["MetricsCollectorSummaries"] = None
         self._setup_metrics()
     
     def _setup_metrics(self) -> None:
@@ -221,12 +226,66 @@ class SearchPrometheusExporter:
             registry=self.registry
         )
 
+        # Spans of sampled requests (utils.tracing)
+        self.request_span_duration_ms = Histogram(
+            'request_span_duration_ms',
+            'Duration of request spans (layers, ES calls, model encode) of sampled requests in milliseconds',
+            ['span'],
+            buckets=[0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500],
+            registry=self.registry
+        )
+
         self.sanctions_screening_decisions_total = Counter(
             'sanctions_screening_decisions_total',
             'Total number of sanctions screening decisions',
             ['risk_level', 'fast_path'],
             registry=self.registry
         )
+
+        # Embedding batch dedup metrics
+        self.embedding_batch_texts_total = Counter(
+            'embedding_batch_texts_total',
+            'Total number of non-empty texts submitted for batch embedding',
+            registry=self.registry
+        )
+
+        self.embedding_batch_encoded_total = Counter(
+            'embedding_batch_encoded_total',
+            'Total number of unique texts sent to the embedding model',
+            registry=self.registry
+        )
+
+        self.embedding_batch_dedup_ratio = Gauge(
+            'embedding_batch_dedup_ratio',
+            'Share of texts in the last embedding batch served by dedup (0-1)',
+            registry=self.registry
+        )
+
+        # Normalization process pool (EXECUTION_BACKEND=process)
+        self.process_pool_in_flight = Gauge(
+            'process_pool_in_flight',
+            'Requests admitted to the normalization process pool',
+            registry=self.registry
+        )
+
+        self.process_pool_queue_depth = Gauge(
+            'process_pool_queue_depth',
+            'Requests waiting for a pool slot or for their micro-batch to be sent',
+            registry=self.registry
+        )
+
+        self.process_pool_rejections_total = Counter(
+            'process_pool_rejections_total',
+            'Requests rejected because the normalization pool was saturated',
+            registry=self.registry
+        )
+
+        self.process_pool_batch_size = Histogram(
+            'process_pool_batch_size',
+            'Requests per micro-batch sent to the normalization pool',
+            buckets=[1, 2, 4, 8, 16, 32, 64],
+            registry=self.registry
+        )
     
     def record_search_request(
         self,
@@ -352,6 +411,16 @@ class SearchPrometheusExporter:
         """
         self.pipeline_stage_duration_ms.labels(stage=stage).observe(duration_ms)
 
+    def record_span_duration(self, span: str, duration_ms: float) -> None:
+        """
+        Record the duration of one span of a sampled request.
+
+        Args:
+            span: Span name (e.g. "layer.signals", "es.search")
+            duration_ms: Duration in milliseconds
+        """
+        self.request_span_duration_ms.labels(span=span).observe(duration_ms)
+
     def record_sanctions_decision(self, risk_level: str, fast_path_used: bool) -> None:
         """
         Record a sanctions screening decision.
@@ -366,6 +435,38 @@ class SearchPrometheusExporter:
             fast_path=fast_path_label
         ).inc()
     
+    def record_process_pool_state(self, in_flight: int, queue_depth: int) -> None:
+        """
+        Record normalization pool occupancy.
+
+        Args:
+            in_flight: Requests holding a pool slot
+            queue_depth: Requests waiting for a slot or a batch flush
+        """
+        self.process_pool_in_flight.set(in_flight)
+        self.process_pool_queue_depth.set(queue_depth)
+
+    def record_process_pool_rejection(self) -> None:
+        """Record a request rejected by pool back-pressure."""
+        self.process_pool_rejections_total.inc()
+
+    def record_process_pool_batch(self, size: int) -> None:
+        """Record the size of a micro-batch sent to the pool."""
+        self.process_pool_batch_size.observe(size)
+
+    def record_embedding_batch(self, texts: int, encoded: int) -> None:
+        """
+        Record an embedding batch after dedup.
+
+        Args:
+            texts: Number of non-empty input texts
+            encoded: Number of unique texts sent to the model
+        """
+        self.embedding_batch_texts_total.inc(texts)
+        self.embedding_batch_encoded_total.inc(encoded)
+        if texts:
+            self.embedding_batch_dedup_ratio.set(1.0 - encoded / texts)
+
     def record_search_metrics(self, metrics: SearchMetrics) -> None:
         """
         Record complete search metrics.
@@ -390,6 +491,22 @@ class SearchPrometheusExporter:
             for _ in range(count):
                 self.record_es_error(error_type)
     
+    def attach_metrics_collector(self, metrics_collector, time_window_seconds: float = 300.0) -> None:
+        """
+        Export the quantile sketches of a MetricsCollector as summaries.
+
+        Args:
+            metrics_collector: MetricsCollector whose histogram/timer metrics to export
+            time_window_seconds: Window the quantiles are computed over
+        """
+        if self._summary_collector is None:
+            self._summary_collector = MetricsCollectorSummaries(metrics_collector, time_window_seconds)
+            if self.prometheus_available:
+                self.registry.register(self._summary_collector)
+        else:
+            self._summary_collector.metrics_collector = metrics_collector
+            self._summary_collector.time_window_seconds = time_window_seconds
+
     def get_metrics(self) -> bytes:
         """
         Get metrics in Prometheus format.
@@ -432,6 +549,9 @@ class SearchPrometheusExporter:
                 metrics_lines.append("# TYPE search_cache_hit_rate gauge")
                 metrics_lines.append(f"search_cache_hit_rate {self.search_cache_hit_rate.value}")
 
+            if self._summary_collector is not None:
+                metrics_lines.extend(self._summary_collector.text_lines())
+
             return ("\n".join(metrics_lines) + "\n").encode('utf-8')
     
     def get_metrics_content_type(self) -> str:
@@ -444,6 +564,52 @@ class SearchPrometheusExporter:
         return CONTENT_TYPE_LATEST
 
 
+def _summary_name(metric_name: str) -> str:
+    """Prometheus name of a MetricsCollector metric ("processing.layer.search" -> "ai_service_processing_layer_search")."""
+    return "ai_service_" + "".join(c if c.isalnum() or c == "_" else "_" for c in metric_name)
+
+
+class MetricsCollectorSummaries:
+    """Custom collector exporting a MetricsCollector's windowed sketches as summaries."""
+
+    def __init__(self, metrics_collector, time_window_seconds: float = 300.0):
+        self.metrics_collector = metrics_collector
+        self.time_window_seconds = time_window_seconds
+
+    def _grouped(self) -> Dict[str, List[Dict]]:
+        grouped: Dict[str, List[Dict]] = {}
+        for summary in self.metrics_collector.get_quantile_summaries(self.time_window_seconds):
+            grouped.setdefault(_summary_name(summary["name"]), []).append(summary)
+        return grouped
+
+    def collect(self):
+        """Yield one summary family per metric, one sample set per tag set."""
+        for name, summaries in self._grouped().items():
+            family = SummaryMetricFamily(name, f"{summaries[0]['name']} over the last {self.time_window_seconds:g}s")
+            for summary in summaries:
+                tags = {k: str(v) for k, v in summary["tags"].items()}
+                for quantile, value in summary["quantiles"].items():
+                    family.add_sample(name, {**tags, "quantile": f"{quantile:g}"}, value)
+                family.add_sample(f"{name}_count", tags, summary["count"])
+                family.add_sample(f"{name}_sum", tags, summary["sum"])
+            yield family
+
+    def text_lines(self) -> List[str]:
+        """Exposition-format lines (used when prometheus_client is not installed)."""
+        lines = []
+        for name, summaries in self._grouped().items():
+            lines.append(f"# TYPE {name} summary")
+            for summary in summaries:
+                tags = [f'{k}="{v}"' for k, v in summary["tags"].items()]
+                for quantile, value in summary["quantiles"].items():
+                    labels = ",".join(tags + [f'quantile="{quantile:g}"'])
+                    lines.append(f"{name}{{{labels}}} {value}")
+                labels = f"{{{','.join(tags)}}}" if tags else ""
+                lines.append(f"{name}_count{labels} {summary['count']}")
+                lines.append(f"{name}_sum{labels} {summary['sum']}")
+        return lines
+
+
 class SearchMetricsCollector:
     """Custom metrics collector for search integration."""
     
@@ -0,0 +1,302 @@
+"""
+Streaming quantile sketches for the metrics collector.
+
+``MetricBuffer`` used to keep every ``MetricPoint`` in a 10k deque behind an
+RLock and, on every dashboard or alert read, copied the points, filtered
+them by time in Python and sorted them for P95/P99. Values are now folded
+into DDSketches as they arrive:
+
+- ``DDSketch`` maps a value to a logarithmic bucket (relative accuracy 1%
+  by default), so recording is O(1) and a quantile is one walk over the
+  occupied buckets. Count, sum, min and max stay exact.
+- ``WindowedSketch`` keeps one sketch per time slice (10s by default) and
+  tag set, in a shard owned by the recording thread: writers never take a
+  lock, readers merge the slices that overlap the requested window. Windows
+  are therefore resolved to whole slices.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+TagsKey = Tuple[Tuple[str, str], ...]
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_SLICE_SECONDS = 10.0
+
+# Values closer to zero than this share the zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+def tags_key(tags: Optional[Dict[str, str]]) -> TagsKey:
+    """Hashable, order-independent key of a tag set."""
+    return tuple(sorted(tags.items())) if tags else ()
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative-error guarantees (DDSketch).
+
+    Every positive value v is counted in bucket ceil(log_gamma(v)) with
+    gamma = (1 + a) / (1 - a); the bucket's representative value is within
+    a relative error a of every value it holds. Negative values use a
+    mirrored store.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "_gamma",
+        "_log_gamma",
+        "positive",
+        "negative",
+        "zero_count",
+        "count",
+        "sum",
+        "min",
+        "max",
+    )
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        if value > _MIN_INDEXABLE:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < -_MIN_INDEXABLE:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        """Add the contents of ``other`` (same relative accuracy) to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+        # list() snapshots the buckets while the owning thread may still be recording
+        for key, count in list(other.positive.items()):
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in list(other.negative.items()):
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _buckets(self) -> Iterator[Tuple[float, int]]:
+        """(representative value, count) in ascending value order."""
+        for key in sorted(self.negative, reverse=True):
+            yield -self._value(key), self.negative[key]
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for key in sorted(self.positive):
+            yield self._value(key), self.positive[key]
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate q-quantile (0 <= q <= 1); 0.0 for an empty sketch.
+
+        The result is within the relative accuracy of the value of rank
+        q * (count - 1) and always inside [min, max].
+        """
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        value = self.max
+        for value, count in self._buckets():
+            seen += count
+            if seen > rank:
+                break
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Several quantiles with one walk over the buckets."""
+        qs = list(qs)
+        if self.count == 0:
+            return [0.0] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        results = [0.0] * len(qs)
+        buckets = self._buckets()
+        seen, value = 0, self.min
+        for i in order:
+            q = qs[i]
+            if q <= 0:
+                results[i] = self.min
+                continue
+            if q >= 1:
+                results[i] = self.max
+                continue
+            rank = q * (self.count - 1)
+            while seen <= rank:
+                try:
+                    value, count = next(buckets)
+                except StopIteration:
+                    value = self.max
+                    break
+                seen += count
+            results[i] = min(max(value, self.min), self.max)
+        return results
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class WindowedSketch:
+    """
+    Time-sliced rolling window of DDSketches with per-thread shards.
+
+    Each recording thread owns a shard mapping (slice, tags) to a sketch, so
+    ``add`` never locks; the lock only guards creation of a thread's shard.
+    Readers snapshot the shards and merge the slices of the requested window.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 3600.0,
+        slice_seconds: float = DEFAULT_SLICE_SECONDS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.slice_seconds = slice_seconds
+        self.relative_accuracy = relative_accuracy
+        self._shards: Dict[int, Dict[Tuple[int, TagsKey], DDSketch]] = {}
+        self._tags: Dict[TagsKey, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _slice(self, timestamp: float) -> int:
+        return int(timestamp // self.slice_seconds)
+
+    def add(
+        self,
+        value: float,
+        tags: Optional[Dict[str, str]] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Record ``value`` in the current slice of the calling thread's shard."""
+        slice_id = self._slice(time.time() if timestamp is None else timestamp)
+        key = tags_key(tags)
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(threading.get_ident(), {})
+        sketch = shard.get((slice_id, key))
+        if sketch is None:
+            if key not in self._tags:
+                self._tags[key] = dict(key)
+            self._prune_shard(shard, slice_id - self._slice(self.max_age_seconds))
+            sketch = shard[(slice_id, key)] = DDSketch(self.relative_accuracy)
+        sketch.add(value)
+
+    @staticmethod
+    def _prune_shard(
+        shard: Dict[Tuple[int, TagsKey], DDSketch], oldest_slice: int
+    ) -> None:
+        for slice_key in [k for k in list(shard) if k[0] < oldest_slice]:
+            shard.pop(slice_key, None)
+
+    def prune(self) -> None:
+        """Drop expired slices, and shards of finished threads once empty."""
+        oldest_slice = self._slice(time.time() - self.max_age_seconds)
+        alive = {thread.ident for thread in threading.enumerate()}
+        with self._lock:
+            for ident, shard in list(self._shards.items()):
+                self._prune_shard(shard, oldest_slice)
+                if not shard and ident not in alive:
+                    del self._shards[ident]
+
+    def _matches(self, key: TagsKey, tags_filter: Optional[Dict[str, str]]) -> bool:
+        if not tags_filter:
+            return True
+        tags = self._tags.get(key, {})
+        return all(tags.get(k) == v for k, v in tags_filter.items())
+
+    def slices(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+    ) -> List[Tuple[int, TagsKey, DDSketch]]:
+        """(slice id, tags key, sketch) of every shard slice overlapping the window."""
+        now = time.time()
+        first = self._slice(max(start_time or 0.0, now - self.max_age_seconds))
+        last = self._slice(end_time or now)
+        found = []
+        for shard in list(self._shards.values()):
+            for (slice_id, key), sketch in list(shard.items()):
+                if first <= slice_id <= last and self._matches(key, tags_filter):
+                    found.append((slice_id, key, sketch))
+        return found
+
+    def merged(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+    ) -> DDSketch:
+        """One sketch of all values recorded in the window."""
+        result = DDSketch(self.relative_accuracy)
+        for _, _, sketch in self.slices(start_time, end_time, tags_filter):
+            result.merge(sketch)
+        return result
+
+    def merged_by_tags(
+        self, start_time: Optional[float] = None, end_time: Optional[float] = None
+    ) -> Dict[TagsKey, DDSketch]:
+        """One sketch per tag set of the values recorded in the window."""
+        result: Dict[TagsKey, DDSketch] = {}
+        for _, key, sketch in self.slices(start_time, end_time):
+            if key not in result:
+                result[key] = DDSketch(self.relative_accuracy)
+            result[key].merge(sketch)
+        return result
+
+    def tag_sets(self) -> List[Dict[str, str]]:
+        """Every tag set recorded so far."""
+        return [dict(tags) for tags in list(self._tags.values())]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shards.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        shards = list(self._shards.values())
+        return {
+            "shards": len(shards),
+            "sketches": sum(len(shard) for shard in shards),
+            "tag_sets": len(self._tags),
+        }
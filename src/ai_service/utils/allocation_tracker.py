@@ -0,0 +1,510 @@
+"""
+Per-layer allocation accounting, leak reports and cache sizes.
+
+Worker RSS grows under sustained load and the memory-pressure monitor can
+only clear caches without knowing which of them (or which layer) holds the
+memory. ``AllocationTracker`` answers three questions:
+
+- Which layer allocates? On a sampled fraction of requests the orchestrator
+  wraps normalization, signals, variants, search and decision in
+  :func:`track_layer_allocations`, which records the tracemalloc peak and
+  retained bytes and the change in live allocated blocks (objects) of the
+  layer. Layers of one request run one after another; allocations of other
+  requests interleaved on the event loop are counted too, so the figures are
+  approximate under concurrency.
+- What keeps growing? :meth:`AllocationTracker.take_snapshot` (on demand and
+  every ``ALLOC_SNAPSHOT_INTERVAL_S``) keeps the first, previous and latest
+  tracemalloc snapshots plus a small RSS / traced-memory history;
+  :meth:`AllocationTracker.leak_report` diffs them by source line.
+- Which caches are big? :func:`register_cache` names a cache attribute of a
+  service (held through a weak reference), and caches registered with the
+  memory-pressure monitor are included automatically; sizes are estimated
+  from a sample of entries.
+
+tracemalloc slows every allocation while it is tracing, so the tracker only
+starts it when enabled (``ALLOC_TRACK_SAMPLE_RATE`` > 0 or the admin
+endpoint), with one frame per trace by default (``ALLOC_TRACK_FRAMES``).
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLE_RATE_ENV = "ALLOC_TRACK_SAMPLE_RATE"
+FRAMES_ENV = "ALLOC_TRACK_FRAMES"
+SNAPSHOT_INTERVAL_ENV = "ALLOC_SNAPSHOT_INTERVAL_S"
+DEFAULT_SNAPSHOT_INTERVAL_S = 300.0
+MAX_HISTORY = 288
+# Entries measured per cache; the rest is extrapolated
+CACHE_SIZE_SAMPLE = 200
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_request_sampled: ContextVar[bool] = ContextVar("allocation_sampled", default=False)
+
+
+class LayerAllocations:
+    """Running totals of one layer's sampled allocations."""
+
+    __slots__ = (
+        "layer",
+        "samples",
+        "peak_bytes",
+        "retained_bytes",
+        "blocks",
+        "max_peak_bytes",
+    )
+
+    def __init__(self, layer: str):
+        self.layer = layer
+        self.samples = 0
+        self.peak_bytes = 0
+        self.retained_bytes = 0
+        self.blocks = 0
+        self.max_peak_bytes = 0
+
+    def add(self, peak_bytes: int, retained_bytes: int, blocks: int) -> None:
+        self.samples += 1
+        self.peak_bytes += peak_bytes
+        self.retained_bytes += retained_bytes
+        self.blocks += blocks
+        self.max_peak_bytes = max(self.max_peak_bytes, peak_bytes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        n = self.samples or 1
+        return {
+            "layer": self.layer,
+            "samples": self.samples,
+            "avg_peak_bytes": round(self.peak_bytes / n),
+            "max_peak_bytes": self.max_peak_bytes,
+            "avg_retained_bytes": round(self.retained_bytes / n),
+            "total_retained_bytes": self.retained_bytes,
+            "avg_objects": round(self.blocks / n, 1),
+        }
+
+
+class _NoopLayer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP_LAYER = _NoopLayer()
+
+
+class _LayerScope:
+    """Measures one layer of a sampled request."""
+
+    __slots__ = ("_tracker", "_layer", "_current", "_blocks")
+
+    def __init__(self, tracker: "AllocationTracker", layer: str):
+        self._tracker = tracker
+        self._layer = layer
+
+    def __enter__(self) -> None:
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+        self._blocks = sys.getallocatedblocks()
+
+    def __exit__(self, *exc_info) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._tracker.record(
+            self._layer,
+            peak_bytes=max(peak - self._current, 0),
+            retained_bytes=current - self._current,
+            blocks=sys.getallocatedblocks() - self._blocks,
+        )
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux), None where unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class AllocationTracker:
+    """
+    Sampled per-layer allocation accounting and snapshot-based leak reports.
+
+    Args:
+        sample_rate: Share of requests whose layers are measured
+        nframes: Frames stored per tracemalloc trace
+        snapshot_interval_s: Background snapshot period (0: on demand only)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        nframes: int = 1,
+        snapshot_interval_s: float = DEFAULT_SNAPSHOT_INTERVAL_S,
+    ):
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.nframes = max(nframes, 1)
+        self.snapshot_interval_s = snapshot_interval_s
+        self.enabled = False
+        self._started_tracemalloc = False
+        self._layers: Dict[str, LayerAllocations] = {}
+        self._baseline: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._previous: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._latest: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._history: deque = deque(maxlen=MAX_HISTORY)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start tracemalloc (if needed), the baseline snapshot and periodic snapshots."""
+        if self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracemalloc = True
+        self.enabled = True
+        self.take_snapshot()
+        if self.snapshot_interval_s > 0:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="allocation-snapshots", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            f"Allocation tracking started (sample rate {self.sample_rate:g}, {self.nframes} frame(s))"
+        )
+
+    def stop(self) -> None:
+        """Stop measuring; stops tracemalloc only if this tracker started it."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
+        logger.info("Allocation tracking stopped")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.snapshot_interval_s):
+            try:
+                self.take_snapshot()
+            except Exception as e:
+                logger.warning(f"Allocation snapshot failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Per-request layer accounting
+    # ------------------------------------------------------------------
+
+    def begin_request(self) -> Optional[Token]:
+        """Sample the current request; returns a token for :meth:`end_request`."""
+        if not self.enabled or _request_sampled.get():
+            return None
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return _request_sampled.set(True)
+
+    @staticmethod
+    def end_request(token: Optional[Token]) -> None:
+        if token is not None:
+            _request_sampled.reset(token)
+
+    def layer(self, name: str):
+        """Context manager measuring ``name`` if the current request is sampled."""
+        if not _request_sampled.get() or not tracemalloc.is_tracing():
+            return _NOOP_LAYER
+        return _LayerScope(self, name)
+
+    def record(
+        self, layer: str, peak_bytes: int, retained_bytes: int, blocks: int
+    ) -> None:
+        with self._lock:
+            stats = self._layers.get(layer)
+            if stats is None:
+                stats = self._layers[layer] = LayerAllocations(layer)
+            stats.add(peak_bytes, retained_bytes, blocks)
+
+    def layer_report(self) -> List[Dict[str, Any]]:
+        """Per-layer totals, largest average peak first."""
+        with self._lock:
+            layers = [stats.to_dict() for stats in self._layers.values()]
+        return sorted(layers, key=lambda stats: stats["avg_peak_bytes"], reverse=True)
+
+    # ------------------------------------------------------------------
+    # Snapshots and leak detection
+    # ------------------------------------------------------------------
+
+    def take_snapshot(self) -> Dict[str, Any]:
+        """Record RSS, traced memory and a filtered tracemalloc snapshot."""
+        now = time.time()
+        entry: Dict[str, Any] = {
+            "timestamp": now,
+            "rss_bytes": _rss_bytes(),
+            "allocated_blocks": sys.getallocatedblocks(),
+        }
+        snapshot = None
+        if tracemalloc.is_tracing():
+            entry["traced_bytes"], entry["traced_peak_bytes"] = (
+                tracemalloc.get_traced_memory()
+            )
+            snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        with self._lock:
+            self._history.append(entry)
+            if snapshot is not None:
+                if self._baseline is None:
+                    self._baseline = (now, snapshot)
+                self._previous, self._latest = self._latest, (now, snapshot)
+        return entry
+
+    @staticmethod
+    def _growth(
+        newer: Tuple[float, tracemalloc.Snapshot],
+        older: Optional[Tuple[float, tracemalloc.Snapshot]],
+        top: int,
+    ) -> Optional[Dict[str, Any]]:
+        if older is None or older is newer:
+            return None
+        stats = newer[1].compare_to(older[1], "lineno")
+        growing = [stat for stat in stats if stat.size_diff > 0][:top]
+        return {
+            "seconds": round(newer[0] - older[0], 1),
+            "size_diff_bytes": sum(stat.size_diff for stat in stats),
+            "top": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in growing
+            ],
+        }
+
+    def leak_report(self, top: int = 20, snapshot: bool = True) -> Dict[str, Any]:
+        """
+        Allocation growth since the first and the previous snapshot.
+
+        Args:
+            top: Growing source lines reported per comparison
+            snapshot: Take a fresh snapshot first
+        """
+        if snapshot and self.enabled:
+            self.take_snapshot()
+        with self._lock:
+            baseline, previous, latest = self._baseline, self._previous, self._latest
+            history = list(self._history)
+        report: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "history": history,
+            "since_baseline": None,
+            "since_previous": None,
+        }
+        if latest is not None:
+            report["since_baseline"] = self._growth(latest, baseline, top)
+            report["since_previous"] = self._growth(latest, previous, top)
+        if (
+            len(history) >= 2
+            and history[0].get("rss_bytes")
+            and history[-1].get("rss_bytes")
+        ):
+            report["rss_growth_bytes"] = (
+                history[-1]["rss_bytes"] - history[0]["rss_bytes"]
+            )
+        return report
+
+    def reset(self) -> None:
+        """Forget layer totals and snapshots; the next snapshot is the new baseline."""
+        with self._lock:
+            self._layers.clear()
+            self._baseline = self._previous = self._latest = None
+            self._history.clear()
+
+    def report(self, top: int = 20) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "tracemalloc_frames": self.nframes,
+            "layers": self.layer_report(),
+            "caches": cache_sizes(),
+            "leaks": self.leak_report(top=top, snapshot=False),
+        }
+
+
+# ----------------------------------------------------------------------
+# Cache size accounting
+# ----------------------------------------------------------------------
+
+_caches: Dict[str, Tuple[weakref.ref, Optional[str]]] = {}
+_caches_lock = threading.Lock()
+
+
+def register_cache(name: str, owner: Any, attr: Optional[str] = None) -> None:
+    """
+    Include a cache in :func:`cache_sizes`.
+
+    Args:
+        name: Report name, e.g. "embedding.preprocessing"
+        owner: Object holding the cache (kept through a weak reference)
+        attr: Attribute of ``owner`` holding the container; None: ``owner`` is the cache
+    """
+    try:
+        ref = weakref.ref(owner)
+    except TypeError:
+        logger.debug(f"Cache {name} cannot be weakly referenced; not tracked")
+        return
+    with _caches_lock:
+        _caches[name] = (ref, attr)
+
+
+def _container(cache: Any) -> Any:
+    """The mapping/sequence behind cache wrapper objects (``_cache`` attribute)."""
+    if isinstance(cache, (Mapping, list, set, tuple)):
+        return cache
+    return getattr(cache, "_cache", None)
+
+
+def estimate_size(container: Any, sample: int = CACHE_SIZE_SAMPLE) -> Tuple[int, int]:
+    """
+    (entries, approximate bytes) of a container.
+
+    Shallow sizes of the first ``sample`` keys and values are averaged and
+    extrapolated to all entries; nested objects are not followed.
+    """
+    if container is None:
+        return 0, 0
+    entries = len(container)
+    size = sys.getsizeof(container)
+    if not entries:
+        return 0, size
+    measured = counted = 0
+    items = (
+        container.items()
+        if isinstance(container, Mapping)
+        else ((item, None) for item in container)
+    )
+    try:
+        for key, value in items:
+            measured += sys.getsizeof(key) + (
+                sys.getsizeof(value) if value is not None else 0
+            )
+            counted += 1
+            if counted >= sample:
+                break
+    except RuntimeError:
+        # Mutated by another thread while sampling; extrapolate from what was read
+        pass
+    if not counted:
+        return entries, size
+    return entries, size + round(measured / counted * entries)
+
+
+def cache_sizes() -> List[Dict[str, Any]]:
+    """Estimated size of registered and memory-monitored caches, largest first."""
+    from .memory_aware_cache import _memory_monitor
+
+    found: List[Tuple[str, Any]] = []
+    with _caches_lock:
+        registered = list(_caches.items())
+    for name, (ref, attr) in registered:
+        owner = ref()
+        if owner is None:
+            with _caches_lock:
+                if _caches.get(name, (None,))[0] is ref:
+                    del _caches[name]
+            continue
+        found.append((name, getattr(owner, attr, None) if attr else owner))
+    for cache in list(_memory_monitor.registered_caches):
+        found.append((getattr(cache, "name", type(cache).__name__), cache))
+
+    sizes = []
+    for name, cache in found:
+        entries, size = estimate_size(_container(cache))
+        sizes.append({"name": name, "entries": entries, "approx_bytes": size})
+    return sorted(sizes, key=lambda item: item["approx_bytes"], reverse=True)
+
+
+# ----------------------------------------------------------------------
+# Process-wide tracker
+# ----------------------------------------------------------------------
+
+_tracker: Optional[AllocationTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float, cast: Callable = float):
+    try:
+        return cast(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+
+def get_allocation_tracker() -> AllocationTracker:
+    """Process-wide tracker; started when ALLOC_TRACK_SAMPLE_RATE > 0."""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                tracker = AllocationTracker(
+                    sample_rate=_env_number(SAMPLE_RATE_ENV, 0.0),
+                    nframes=_env_number(FRAMES_ENV, 1, int),
+                    snapshot_interval_s=_env_number(
+                        SNAPSHOT_INTERVAL_ENV, DEFAULT_SNAPSHOT_INTERVAL_S
+                    ),
+                )
+                if tracker.sample_rate > 0:
+                    tracker.start()
+                _tracker = tracker
+    return _tracker
+
+
+def clear_allocation_tracker() -> None:
+    """Stop and drop the process-wide tracker (it is rebuilt from the environment)."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is not None:
+            _tracker.stop()
+        _tracker = None
+
+
+def begin_allocation_sample() -> Optional[Token]:
+    """Head-sample the current request for layer allocation accounting."""
+    tracker = get_allocation_tracker()
+    return tracker.begin_request() if tracker.enabled else None
+
+
+def end_allocation_sample(token: Optional[Token]) -> None:
+    AllocationTracker.end_request(token)
+
+
+def track_layer_allocations(layer: str):
+    """Measure a layer of a sampled request (no-op otherwise)."""
+    if not _request_sampled.get():
+        return _NOOP_LAYER
+    return get_allocation_tracker().layer(layer)
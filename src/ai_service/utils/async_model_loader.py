@@ -11,6 +11,13 @@ from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# (model name, spaCy package) preloaded at startup
+PRELOAD_MODELS = [
+    ("en", "en_core_web_sm"),
+    ("uk", "uk_core_news_sm"),
+    ("ru", "ru_core_news_sm"),
+]
+
 class AsyncModelLoader:
     """Asynchronous model loader with caching and background initialization."""
 
@@ -19,6 +26,7 @@ class AsyncModelLoader:
         self._loading: Dict[str, bool] = {}
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ModelLoader")
+        self._background_started = False
 
     def _load_spacy_model(self, model_name: str, package_name: str) -> Optional[Any]:
         """Load a spaCy model synchronously."""
@@ -95,11 +103,7 @@ class AsyncModelLoader:
 
     async def preload_all_models(self):
         """Preload all common models in background."""
-        models_to_load = [
-            ("en", "en_core_web_sm"),
-            ("uk", "uk_core_news_sm"),
-            ("ru", "ru_core_news_sm")
-        ]
+        models_to_load = PRELOAD_MODELS
 
         tasks = []
         for model_name, package_name in models_to_load:
@@ -114,8 +118,34 @@ class AsyncModelLoader:
         loaded_count = sum(1 for result in results if result is not None and not isinstance(result, Exception))
         logger.info(f"Preloaded {loaded_count}/{len(models_to_load)} spaCy models")
 
+    def preload_all_models_blocking(self) -> int:
+        """
+        Load all common models in the calling thread.
+
+        Used by the pre-fork master: no loader threads are started, so the
+        process can fork safely afterwards.
+
+        Returns:
+            Number of models loaded
+        """
+        with self._lock:
+            self._background_started = True
+        for model_name, package_name in PRELOAD_MODELS:
+            with self._lock:
+                if model_name in self._models:
+                    continue
+            model = self._load_spacy_model(model_name, package_name)
+            with self._lock:
+                self._models[model_name] = model
+        return sum(1 for name, _ in PRELOAD_MODELS if self._models.get(name) is not None)
+
     def start_background_loading(self):
-        """Start background model loading (fire and forget)."""
+        """Start background model loading (fire and forget, once per process)."""
+        with self._lock:
+            if self._background_started:
+                return
+            self._background_started = True
+
         def background_load():
             try:
                 # Create new event loop for background thread
@@ -147,20 +177,46 @@ async def get_spacy_ru_async() -> Optional[Any]:
     return await _model_loader.get_or_load_model("ru", "ru_core_news_sm")
 
 def get_spacy_en_sync() -> Optional[Any]:
-    """Get English spaCy model if already loaded."""
+    """Get English spaCy model if already loaded (starts background loading)."""
+    start_model_preloading()
     return _model_loader.get_model_sync("en")
 
 def get_spacy_uk_sync() -> Optional[Any]:
-    """Get Ukrainian spaCy model if already loaded."""
+    """Get Ukrainian spaCy model if already loaded (starts background loading)."""
+    start_model_preloading()
     return _model_loader.get_model_sync("uk")
 
 def get_spacy_ru_sync() -> Optional[Any]:
-    """Get Russian spaCy model if already loaded."""
+    """Get Russian spaCy model if already loaded (starts background loading)."""
+    start_model_preloading()
     return _model_loader.get_model_sync("ru")
 
 def start_model_preloading():
-    """Start background model preloading."""
+    """Start background model preloading (no-op after the first call)."""
     _model_loader.start_background_loading()
 
-# Auto-start background loading when module is imported
-start_model_preloading()
\ No newline at end of file
+async def preload_models_async() -> None:
+    """Preload all models in the running event loop (instead of the preloader thread)."""
+    with _model_loader._lock:
+        _model_loader._background_started = True
+    await _model_loader.preload_all_models()
+
+def preload_models_blocking() -> int:
+    """Load all models in the calling thread (pre-fork master); returns the count loaded."""
+    return _model_loader.preload_all_models_blocking()
+
+def get_model_loading_status() -> Dict[str, str]:
+    """Per-model state: 'loading', 'loaded', 'unavailable' or 'not_started'."""
+    with _model_loader._lock:
+        status = {}
+        for name in ("en", "uk", "ru"):
+            if _model_loader._loading.get(name):
+                status[name] = "loading"
+            elif name in _model_loader._models:
+                status[name] = "loaded" if _model_loader._models[name] is not None else "unavailable"
+            else:
+                status[name] = "not_started"
+        return status
+
+# Not started on import: main starts it during startup, other callers on
+# first get_spacy_*_sync()
\ No newline at end of file
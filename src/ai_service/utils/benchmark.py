@@ -0,0 +1,613 @@
+"""
+Replay benchmark of the full ``/process`` pipeline.
+
+``tools/performance_test.py`` times ``NormalizationService`` on twenty
+English names, which says little about the service under load. This module
+replays a corpus against the whole pipeline and sweeps concurrency:
+
+- corpus: a recorded JSONL/JSON file (``text`` or ``input`` per case), or a
+  seeded synthetic mix of ru/uk/en names, payment narratives and IDs
+  (:func:`synthetic_corpus`)
+- targets: ``UnifiedOrchestrator.process`` in-process
+  (:class:`InProcessTarget`, by default with ``MockSearchService`` standing in
+  for Elasticsearch) or ``POST /process`` of a running service
+  (:class:`HttpTarget`)
+- per concurrency level: latency p50/p95/p99, throughput, errors, RSS and,
+  in-process, per-span p50/p95/p99 and cache hit rates. While replaying, every
+  request is traced (see ``utils.tracing``); span durations and
+  ``cache.hit``/``cache.miss`` events are folded into DDSketches and counters.
+
+Results are plain JSON. :func:`compare_reports` diffs two of them level by
+level, so a baseline saved for one version can gate the next one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..monitoring.quantile_sketch import DDSketch
+from .allocation_tracker import _rss_bytes
+from .logging_config import get_logger
+from .tracing import Span, Tracer, get_tracer, set_tracer
+
+logger = get_logger(__name__)
+
+REPORT_VERSION = 1
+QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_CONCURRENCY = (1, 4, 16)
+# Relative worsening reported as a regression by compare_reports
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass
+class ReplayCase:
+    """One request of a replay corpus."""
+
+    id: str
+    text: str
+    language: str = "auto"
+    kind: str = "recorded"
+
+
+# Synthetic corpus vocabulary: (given, surname, patronymic) per gender
+_NAMES = {
+    "ru": {
+        "m": (
+            ["Иван", "Сергей", "Олег", "Дмитрий", "Алексей", "Николай"],
+            ["Петров", "Иванов", "Смирнов", "Кузнецов", "Волков", "Соколов"],
+            ["Иванович", "Петрович", "Сергеевич", "Александрович"],
+        ),
+        "f": (
+            ["Анна", "Мария", "Елена", "Ольга", "Татьяна", "Наталья"],
+            ["Петрова", "Иванова", "Смирнова", "Кузнецова", "Волкова", "Соколова"],
+            ["Ивановна", "Петровна", "Сергеевна", "Александровна"],
+        ),
+    },
+    "uk": {
+        "m": (
+            ["Тарас", "Петро", "Олександр", "Василь", "Андрій", "Богдан"],
+            ["Шевченко", "Коваленко", "Бондаренко", "Ткаченко", "Мельник", "Кравчук"],
+            ["Іванович", "Петрович", "Васильович", "Олександрович"],
+        ),
+        "f": (
+            ["Олена", "Світлана", "Наталія", "Оксана", "Ірина", "Марія"],
+            ["Шевченко", "Коваленко", "Бондаренко", "Ткаченко", "Мельник", "Кравчук"],
+            ["Іванівна", "Петрівна", "Василівна", "Олександрівна"],
+        ),
+    },
+    "en": {
+        "m": (
+            ["John", "Michael", "David", "Robert", "James", "William"],
+            ["Smith", "Johnson", "Brown", "Taylor", "Wilson", "Anderson"],
+            [],
+        ),
+        "f": (
+            ["Mary", "Emily", "Sarah", "Jennifer", "Elizabeth", "Anna"],
+            ["Smith", "Johnson", "Brown", "Taylor", "Wilson", "Anderson"],
+            [],
+        ),
+    },
+}
+
+_NARRATIVES = {
+    "ru": [
+        "Оплата по договору №{number} от {date} за {name}",
+        "Перевод средств {name} согласно счету {number}",
+        "Возврат займа {name}, назначение платежа: договор {number}",
+    ],
+    "uk": [
+        "Оплата згідно рахунку №{number} від {date}, отримувач {name}",
+        "Переказ коштів {name} за договором {number}",
+        "Повернення позики {name}, призначення платежу: рахунок {number}",
+    ],
+    "en": [
+        "Payment to {name} for invoice {number} dated {date}",
+        "Transfer of funds to {name}, contract {number}",
+        "Loan repayment {name} ref {number}",
+    ],
+}
+
+_IDS = {
+    "ru": ["{name}, ИНН {inn}", "{name} {dob} г.р.", "{name} ИНН {inn} д.р. {dob}"],
+    "uk": ["{name}, ІПН {inn}", "{name} {dob} р.н.", "{name}, РНОКПП {inn}"],
+    "en": ["{name}, TIN {inn}", "{name} DOB {dob}", "{name} born {dob}, tax id {inn}"],
+}
+
+# Share of each kind in the synthetic corpus
+_KIND_WEIGHTS = {"name": 0.5, "payment": 0.3, "ids": 0.2}
+
+
+def _synthetic_name(rng: random.Random, language: str) -> str:
+    given, surnames, patronymics = _NAMES[language][rng.choice("mf")]
+    parts = [rng.choice(given), rng.choice(surnames)]
+    if patronymics and rng.random() < 0.5:
+        parts.insert(1, rng.choice(patronymics))
+    if rng.random() < 0.3:
+        parts.reverse()
+    return " ".join(parts)
+
+
+def synthetic_corpus(
+    size: int = 200, seed: int = 0, languages: Sequence[str] = ("ru", "uk", "en")
+) -> List[ReplayCase]:
+    """
+    Seeded multilingual corpus shaped like production traffic.
+
+    Args:
+        size: Number of cases
+        seed: Random seed; the same seed gives the same corpus
+        languages: Languages to draw from (ru, uk, en)
+
+    Returns:
+        Cases of kind ``name``, ``payment`` or ``ids``
+    """
+    rng = random.Random(seed)
+    kinds = list(_KIND_WEIGHTS)
+    weights = list(_KIND_WEIGHTS.values())
+    cases = []
+    for index in range(size):
+        language = rng.choice(languages)
+        kind = rng.choices(kinds, weights)[0]
+        name = _synthetic_name(rng, language)
+        if kind == "name":
+            text = name
+        else:
+            template = rng.choice(
+                _NARRATIVES[language] if kind == "payment" else _IDS[language]
+            )
+            text = template.format(
+                name=name,
+                number=rng.randint(100, 99999),
+                date=f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(2020, 2026)}",
+                dob=f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(1950, 2004)}",
+                inn="".join(
+                    str(rng.randint(0, 9)) for _ in range(rng.choice((10, 12)))
+                ),
+            )
+        cases.append(
+            ReplayCase(id=f"synthetic_{index}", text=text, language=language, kind=kind)
+        )
+    return cases
+
+
+def load_corpus(path: str) -> List[ReplayCase]:
+    """
+    Load a recorded corpus.
+
+    Accepts JSONL (``tests/fixtures/parity_golden.jsonl``) or a JSON list
+    (``tests/golden_cases/golden_cases.json``); each case needs ``text`` or
+    ``input`` and may have ``id``, ``lang``/``language`` and ``kind``.
+    """
+    content = Path(path).read_text(encoding="utf-8")
+    if content.lstrip().startswith("["):
+        records = json.loads(content)
+    else:
+        records = [json.loads(line) for line in content.splitlines() if line.strip()]
+
+    cases = []
+    for index, record in enumerate(records):
+        text = record.get("text", record.get("input"))
+        if not text:
+            continue
+        cases.append(
+            ReplayCase(
+                id=str(record.get("id", index)),
+                text=text,
+                language=record.get("lang", record.get("language", "auto")),
+                kind=record.get("kind", "recorded"),
+            )
+        )
+    return cases
+
+
+def corpus_fingerprint(cases: Sequence[ReplayCase]) -> str:
+    """Short hash of the corpus texts, to tell whether two reports are comparable."""
+    digest = hashlib.sha1()
+    for case in cases:
+        digest.update(case.text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:12]
+
+
+def _quantile_summary(sketch: DDSketch) -> Dict[str, float]:
+    p50, p95, p99 = sketch.quantiles(QUANTILES)
+    return {
+        "count": sketch.count,
+        "p50": round(p50, 3),
+        "p95": round(p95, 3),
+        "p99": round(p99, 3),
+        "mean": round(sketch.mean, 3),
+        "max": round(sketch.max, 3) if sketch.count else 0.0,
+    }
+
+
+class _RecordingTracer(Tracer):
+    """Tracer that samples every request and folds its tree into sketches."""
+
+    def __init__(self):
+        super().__init__(sample_rate=1.0, slow_ms=math.inf)
+        self.spans: Dict[str, DDSketch] = {}
+        self.cache_events: Dict[str, Dict[str, int]] = {}
+
+    def export(self, root: Span) -> None:
+        for node in root.walk():
+            sketch = self.spans.get(node.name)
+            if sketch is None:
+                sketch = self.spans[node.name] = DDSketch()
+            sketch.add(node.duration_ms)
+            for name, _, attrs in node.events:
+                if name in ("cache.hit", "cache.miss"):
+                    counts = self.cache_events.setdefault(
+                        attrs.get("cache", "-"), {"hits": 0, "misses": 0}
+                    )
+                    counts["hits" if name == "cache.hit" else "misses"] += 1
+
+    def cache_hit_rates(self) -> Dict[str, Dict[str, Any]]:
+        rates = {}
+        for cache, counts in sorted(self.cache_events.items()):
+            total = counts["hits"] + counts["misses"]
+            rates[cache] = {
+                **counts,
+                "hit_rate": round(counts["hits"] / total, 4) if total else 0.0,
+            }
+        return rates
+
+
+class InProcessTarget:
+    """
+    Replays through ``UnifiedOrchestrator.process`` in this process.
+
+    Args:
+        orchestrator: Orchestrator to replay against; built by :meth:`setup`
+            with the stand-in search service when omitted
+        process_kwargs: Extra keyword arguments of every ``process`` call
+    """
+
+    name = "inprocess"
+
+    def __init__(self, orchestrator: Any = None, **process_kwargs: Any):
+        self.orchestrator = orchestrator
+        self.process_kwargs = process_kwargs
+
+    async def setup(
+        self, enable_variants: bool = True, enable_embeddings: bool = False
+    ) -> None:
+        """Build an orchestrator with ``MockSearchService`` as the local stand-in ES."""
+        if self.orchestrator is not None:
+            return
+        from ..core.orchestrator_factory import OrchestratorFactory
+        from ..layers.search.mock_search_service import MockSearchService
+
+        search_service = MockSearchService()
+        search_service.initialize()
+        self.orchestrator = await OrchestratorFactory.create_orchestrator(
+            enable_smart_filter=True,
+            enable_variants=enable_variants,
+            enable_embeddings=enable_embeddings,
+            enable_decision_engine=True,
+            enable_search=True,
+            search_service=search_service,
+        )
+
+    async def send(self, case: ReplayCase) -> bool:
+        result = await self.orchestrator.process(
+            case.text,
+            language_hint=None if case.language == "auto" else case.language,
+            **self.process_kwargs,
+        )
+        return bool(getattr(result, "success", True))
+
+    async def close(self) -> None:
+        pass
+
+
+class HttpTarget:
+    """
+    Replays through ``POST /process`` of a running service.
+
+    Layer timings and cache events stay in the server process, so HTTP
+    reports carry client-side latency and throughput only; the server's
+    ``request_span_duration_ms`` histogram has the per-layer view.
+
+    Args:
+        base_url: Service root, e.g. ``http://localhost:8000``
+        timeout_s: Per-request timeout
+        payload: Extra fields of every request body
+    """
+
+    name = "http"
+
+    def __init__(self, base_url: str, timeout_s: float = 30.0, **payload: Any):
+        self.base_url = base_url.rstrip("/")
+        self.timeout_s = timeout_s
+        self.payload = payload
+        self._client = None
+
+    async def setup(self, **_: Any) -> None:
+        import httpx
+
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout_s)
+
+    async def send(self, case: ReplayCase) -> bool:
+        response = await self._client.post(
+            "/process", json={"text": case.text, **self.payload}
+        )
+        return response.status_code == 200
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+async def run_level(
+    target: Any, cases: Sequence[ReplayCase], concurrency: int, requests: int
+) -> Dict[str, Any]:
+    """
+    Replay ``requests`` cases (cycling the corpus) with ``concurrency`` workers.
+
+    Returns:
+        Report of the level: latency, throughput, errors, RSS, and for
+        in-process targets span quantiles and cache hit rates
+    """
+    recorder = _RecordingTracer()
+    previous_tracer = get_tracer()
+    set_tracer(recorder)
+    latency = DDSketch()
+    errors = 0
+    next_index = 0
+    rss_start = _rss_bytes()
+    rss_peak = rss_start or 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index, rss_peak
+        while next_index < requests:
+            case = cases[next_index % len(cases)]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                ok = await target.send(case)
+            except Exception as e:
+                logger.debug(f"Replay of {case.id} failed: {e}")
+                ok = False
+            latency.add((time.perf_counter() - started) * 1000)
+            if not ok:
+                errors += 1
+            rss = _rss_bytes()
+            if rss is not None and rss > rss_peak:
+                rss_peak = rss
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        set_tracer(previous_tracer)
+    duration_s = time.perf_counter() - started
+
+    level = {
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "duration_s": round(duration_s, 3),
+        "throughput_rps": round(requests / duration_s, 2) if duration_s else 0.0,
+        "latency_ms": _quantile_summary(latency),
+        "rss_bytes": {
+            "start": rss_start,
+            "end": _rss_bytes(),
+            "peak": rss_peak or None,
+        },
+    }
+    if recorder.spans:
+        level["spans_ms"] = {
+            name: _quantile_summary(sketch)
+            for name, sketch in sorted(recorder.spans.items())
+        }
+        level["cache_hit_rates"] = recorder.cache_hit_rates()
+    return level
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+async def run_benchmark(
+    target: Any,
+    cases: Sequence[ReplayCase],
+    concurrency: Sequence[int] = DEFAULT_CONCURRENCY,
+    requests: Optional[int] = None,
+    warmup: int = 20,
+    corpus_name: str = "synthetic",
+) -> Dict[str, Any]:
+    """
+    Sweep concurrency levels against a target that is already set up.
+
+    Args:
+        target: :class:`InProcessTarget` or :class:`HttpTarget`
+        cases: Replay corpus
+        concurrency: Worker counts, one level each
+        requests: Requests per level (default: one pass over the corpus)
+        warmup: Unmeasured requests before the first level
+        corpus_name: Recorded in the report
+
+    Returns:
+        JSON-ready report for :func:`save_report` / :func:`compare_reports`
+    """
+    if not cases:
+        raise ValueError("Replay corpus is empty")
+    requests = requests or len(cases)
+    if warmup:
+        for case in cases[:warmup]:
+            try:
+                await target.send(case)
+            except Exception as e:
+                logger.debug(f"Warmup of {case.id} failed: {e}")
+
+    levels = []
+    for workers in concurrency:
+        level = await run_level(target, cases, workers, requests)
+        latency = level["latency_ms"]
+        logger.info(
+            f"Replay c={workers}: {level['throughput_rps']} rps, p50={latency['p50']}ms "
+            f"p95={latency['p95']}ms p99={latency['p99']}ms, errors={level['errors']}"
+        )
+        levels.append(level)
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "target": target.name,
+        "environment": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "corpus": {
+            "name": corpus_name,
+            "size": len(cases),
+            "fingerprint": corpus_fingerprint(cases),
+            "kinds": {
+                kind: sum(case.kind == kind for case in cases)
+                for kind in sorted({c.kind for c in cases})
+            },
+        },
+        "levels": levels,
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    Path(path).write_text(
+        json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _compared(
+    metric: str,
+    old: Optional[float],
+    new: Optional[float],
+    higher_is_better: bool,
+    threshold: float,
+) -> Optional[Dict[str, Any]]:
+    if not old or new is None:
+        return None
+    change = (new - old) / old
+    worse = -change if higher_is_better else change
+    return {
+        "metric": metric,
+        "baseline": old,
+        "current": new,
+        "change": round(change, 4),
+        "regression": worse > threshold,
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Diff two reports level by level.
+
+    Latency quantiles, span p95s and peak RSS regress when they grow by more
+    than ``threshold`` (relative); throughput when it drops by more than that.
+
+    Returns:
+        ``{"comparable", "regressions", "levels": {concurrency: [diffs]}}``;
+        ``comparable`` is False when the corpora differ
+    """
+    current_levels = {
+        level["concurrency"]: level for level in current.get("levels", [])
+    }
+    levels: Dict[str, List[Dict[str, Any]]] = {}
+    regressions = []
+    for old in baseline.get("levels", []):
+        new = current_levels.get(old["concurrency"])
+        if new is None:
+            continue
+        diffs = [
+            _compared(
+                "throughput_rps",
+                old["throughput_rps"],
+                new["throughput_rps"],
+                True,
+                threshold,
+            ),
+            _compared(
+                "rss_peak_bytes",
+                old["rss_bytes"].get("peak"),
+                new["rss_bytes"].get("peak"),
+                False,
+                threshold,
+            ),
+        ]
+        for quantile in ("p50", "p95", "p99"):
+            diffs.append(
+                _compared(
+                    f"latency_ms.{quantile}",
+                    old["latency_ms"][quantile],
+                    new["latency_ms"][quantile],
+                    False,
+                    threshold,
+                )
+            )
+        new_spans = new.get("spans_ms", {})
+        for name, stats in old.get("spans_ms", {}).items():
+            if name in new_spans:
+                diffs.append(
+                    _compared(
+                        f"spans_ms.{name}.p95",
+                        stats["p95"],
+                        new_spans[name]["p95"],
+                        False,
+                        threshold,
+                    )
+                )
+        diffs = [diff for diff in diffs if diff is not None]
+        key = str(old["concurrency"])
+        levels[key] = diffs
+        regressions.extend(
+            {"concurrency": old["concurrency"], **diff}
+            for diff in diffs
+            if diff["regression"]
+        )
+
+    return {
+        "comparable": baseline.get("corpus", {}).get("fingerprint")
+        == current.get("corpus", {}).get("fingerprint"),
+        "threshold": threshold,
+        "regressions": regressions,
+        "levels": levels,
+    }
+
+
+def corpus_to_jsonl(cases: Sequence[ReplayCase], path: str) -> None:
+    """Write a corpus as JSONL so a synthetic run can be replayed as recorded."""
+    with open(path, "w", encoding="utf-8") as output:
+        for case in cases:
+            output.write(json.dumps(asdict(case), ensure_ascii=False) + "\n")
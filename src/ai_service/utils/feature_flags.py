@@ -13,6 +13,12 @@ class NormalizationImplementation(Enum):
     FACTORY = "factory"
     AUTO = "auto"  # Automatic selection based on conditions
 
+class TraceLevel(str, Enum):
+    """How much trace payload the pipeline builds per request."""
+    OFF = "off"  # No search trace, no trace strings
+    SUMMARY = "summary"  # Search steps without hit lists, no trace strings
+    FULL = "full"  # Everything (token notes, trace strings, search hits)
+
 @dataclass
 class FeatureFlags:
     """Feature flags configuration."""
@@ -35,6 +41,7 @@ class FeatureFlags:
     enable_dual_processing: bool = False  # Process with both implementations for comparison
     log_implementation_choice: bool = True
     debug_tracing: bool = False  # Enable debug tracing
+    trace_level: TraceLevel = TraceLevel.FULL  # off | summary | full
 
     # New feature flags for safe rollout
     use_factory_normalizer: bool = True  # Default to factory implementation
@@ -73,6 +80,10 @@ class FeatureFlags:
     # ASCII fastpath optimization
     enable_ascii_fastpath: bool = True
 
+    # Canonical-name fastpath (table/lexicon hits skip the full pipeline)
+    enable_canonical_fastpath: bool = False
+    canonical_fastpath_parity: bool = False  # Also run full pipeline and compare
+
     # Diminutive resolution
     use_diminutives_dictionary_only: bool = False
     diminutives_allow_cross_lang: bool = False
@@ -109,6 +120,9 @@ class FeatureFlags:
             "enforce_nominative": self.enforce_nominative,
             "preserve_feminine_surnames": self.preserve_feminine_surnames,
             "enable_ascii_fastpath": self.enable_ascii_fastpath,
+            "trace_level": get_trace_level(self).value,
+            "enable_canonical_fastpath": self.enable_canonical_fastpath,
+            "canonical_fastpath_parity": self.canonical_fastpath_parity,
         }
 
 class FeatureFlagManager:
@@ -142,6 +156,10 @@ class FeatureFlagManager:
         # Debug settings
         enable_dual = os.getenv("ENABLE_DUAL_PROCESSING", "false").lower() == "true"
         log_choice = os.getenv("LOG_IMPLEMENTATION_CHOICE", "true").lower() == "true"
+        try:
+            trace_level = TraceLevel(os.getenv("AISVC_TRACE_LEVEL", "full").lower())
+        except ValueError:
+            trace_level = TraceLevel.FULL
 
         # New feature flags for safe rollout with legacy ENV key fallback
         use_factory_normalizer = os.getenv("AISVC_FLAG_USE_FACTORY_NORMALIZER", "false").lower() == "true"
@@ -158,6 +176,10 @@ class FeatureFlagManager:
         # ASCII fastpath optimization
         ascii_fastpath = os.getenv("AISVC_FLAG_ASCII_FASTPATH", "true").lower() == "true"
 
+        # Canonical-name fastpath and its parity check
+        canonical_fastpath = os.getenv("AISVC_FLAG_CANONICAL_FASTPATH", "false").lower() == "true"
+        canonical_fastpath_parity = os.getenv("AISVC_FLAG_CANONICAL_FASTPATH_PARITY", "false").lower() == "true"
+
         # Use default values for diminutive features
         DIMINUTIVE_FEATURE_DEFAULTS = type('DIMINUTIVE_FEATURE_DEFAULTS', (), {
             'use_diminutives_dictionary_only': True,
@@ -197,6 +219,7 @@ class FeatureFlagManager:
             min_confidence_threshold=min_confidence,
             enable_dual_processing=enable_dual,
             log_implementation_choice=log_choice,
+            trace_level=trace_level,
             use_factory_normalizer=use_factory_normalizer,
             fix_initials_double_dot=fix_initials_double_dot,
             preserve_hyphenated_case=preserve_hyphenated_case,
@@ -206,6 +229,8 @@ class FeatureFlagManager:
             enforce_nominative=enforce_nominative,
             preserve_feminine_surnames=preserve_feminine_surnames,
             enable_ascii_fastpath=ascii_fastpath,
+            enable_canonical_fastpath=canonical_fastpath,
+            canonical_fastpath_parity=canonical_fastpath_parity,
             use_diminutives_dictionary_only=use_dim_dict_only,
             diminutives_allow_cross_lang=dim_cross_lang,
             language_overrides=language_overrides,
@@ -358,3 +383,11 @@ def should_use_factory(
 ) -> bool:
     """Convenience function to check if factory should be used."""
     return get_feature_flag_manager().should_use_factory(language, user_id, request_context)
+
+def get_trace_level(flags: Optional[Any]) -> TraceLevel:
+    """Trace level of FeatureFlags (or a FeatureFlagManager); FULL if unset."""
+    flags = getattr(flags, "_flags", flags)
+    try:
+        return TraceLevel(getattr(flags, "trace_level", None) or TraceLevel.FULL)
+    except ValueError:
+        return TraceLevel.FULL
@@ -0,0 +1,114 @@
+"""
+Streaming reader for large AC pattern exports.
+
+``output/sanctions/ac_patterns_*.json`` files run to hundreds of megabytes;
+``iter_pattern_records`` yields one pattern at a time instead of decoding the
+whole document, so peak memory stays bounded by ``chunk_size``.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def iter_pattern_records(
+    patterns_file: Path, chunk_size: int = 1 << 20
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream pattern records without loading the whole file.
+
+    Supports JSONL (one pattern per line), a bare JSON list and the AC export
+    envelope ``{"metadata": {...}, "patterns": [...]}``. Only the ``patterns``
+    array is streamed; other top-level values are decoded and discarded.
+    """
+    if patterns_file.suffix == ".jsonl":
+        with open(patterns_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        return
+
+    decoder = json.JSONDecoder()
+    with open(patterns_file, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def peek() -> str:
+            nonlocal pos
+            while True:
+                pos = _skip_ws(buf, pos)
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill():
+                    return ""
+
+        def decode() -> Any:
+            nonlocal pos
+            while True:
+                peek()
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if not fill():
+                        raise
+                    continue
+                # A number at the buffer edge may be truncated; re-read it
+                if end == len(buf) and not eof and fill():
+                    continue
+                pos = end
+                return value
+
+        def iter_array() -> Iterator[Any]:
+            nonlocal pos
+            pos += 1  # consume "["
+            if peek() == "]":
+                pos += 1
+                return
+            while True:
+                yield decode()
+                sep = peek()
+                pos += 1
+                if sep == "]":
+                    return
+                if sep != ",":
+                    raise ValueError(f"Malformed patterns array in {patterns_file}")
+
+        head = peek()
+        if head == "[":
+            yield from iter_array()
+            return
+        if head != "{":
+            raise ValueError(f"Unsupported patterns file format: {patterns_file}")
+
+        pos += 1  # consume "{"
+        while peek() not in ("}", ""):
+            key = decode()
+            if peek() != ":":
+                raise ValueError(f"Malformed patterns file: {patterns_file}")
+            pos += 1
+            if key == "patterns" and peek() == "[":
+                yield from iter_array()
+            else:
+                decode()
+            if peek() == ",":
+                pos += 1
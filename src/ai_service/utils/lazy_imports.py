@@ -86,13 +86,9 @@ NLP_EN = None
 NLP_UK = None
 NLP_RU = None
 
-# Start background model loading
-try:
-    from .async_model_loader import start_model_preloading
-    start_model_preloading()
-    logger.info("Started async model preloading")
-except ImportError as e:
-    logger.warning(f"Async model loading not available: {e}")
+# spaCy preloading is started by main's startup (or on first use of the
+# async_model_loader getters), not on import: importing ai_service.utils must
+# stay cheap for workers, scripts and tests.
 
 # Log final status
 _status = {
@@ -85,6 +85,14 @@ class MemoryPressureMonitor:
             # Create a list to avoid iteration issues with WeakSet
             caches_to_clean = list(self.registered_caches)
 
+        try:
+            from .allocation_tracker import cache_sizes
+
+            largest = ", ".join(f"{c['name']}={c['approx_bytes']}B/{c['entries']}" for c in cache_sizes()[:5])
+            logger.info(f"Largest caches before cleanup: {largest}")
+        except Exception as e:
+            logger.debug(f"Cache size accounting failed: {e}")
+
         for cache_obj in caches_to_clean:
             try:
                 if hasattr(cache_obj, 'memory_pressure_cleanup'):
@@ -124,12 +132,15 @@ class MemoryAwareLRUCache:
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
+        # Named after the wrapped function for cache size reports
+        self.name = type(self).__name__
 
         # Register with memory monitor
         _memory_monitor.register_cache(self)
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator to create memory-aware cached function."""
+        self.name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', self.name)}"
 
         @wraps(func)
         def wrapper(*args, **kwargs):
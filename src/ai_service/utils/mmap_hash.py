@@ -0,0 +1,187 @@
+"""
+Read-only memory-mapped hash table for build-time lookup data.
+
+File layout (little endian)::
+
+    header   magic "MHT1", u32 version, u64 n_slots, u64 n_items,
+             u64 records_size, u32 meta_len
+    meta     JSON metadata (meta_len bytes), zero-padded to 8 bytes
+    slots    n_slots x (u32 hash tag, u32 record offset + 1; 0 = empty)
+    records  u16 key_len, u16 value_len, u32 value offset, key bytes
+    values   deduplicated value bytes
+
+Open addressing with linear probing at a load factor of at most 0.5, so a
+lookup is one hash plus (usually) one slot read and one key compare straight
+from the page cache. Identical values are stored once. Nothing is
+deserialized at open time, and worker processes share the pages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+MAGIC = b"MHT1"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sIQQQI")
+_SLOT = struct.Struct("<II")
+_RECORD = struct.Struct("<HHI")
+_MAX_FIELD = 0xFFFF
+_MAX_OFFSET = 0xFFFFFFFF
+
+
+def key_hash(key: bytes) -> int:
+    """Stable 64-bit hash (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def record_size(key: bytes) -> int:
+    """Bytes the record of ``key`` takes in the records section."""
+    return _RECORD.size + len(key)
+
+
+def _slot_count(n_items: int) -> int:
+    n_slots = 8
+    while n_slots < n_items * 2:
+        n_slots <<= 1
+    return n_slots
+
+
+def write_hash_table(
+    path: str,
+    items: Iterable[Tuple[bytes, bytes]],
+    meta: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Write ``(key, value)`` byte pairs to ``path``; later duplicates win.
+
+    The file is written to a temporary name and renamed into place, so
+    readers that still map the previous table keep a consistent view.
+    """
+    entries = dict(items)
+    n_slots = _slot_count(len(entries))
+    mask = n_slots - 1
+    meta_bytes = json.dumps(meta or {}, ensure_ascii=False).encode("utf-8")
+    meta_bytes += b"\0" * (-(_HEADER.size + len(meta_bytes)) % 8)
+
+    slots = bytearray(n_slots * _SLOT.size)
+    records = bytearray()
+    values = bytearray()
+    value_offsets: Dict[bytes, int] = {}
+    for key, value in entries.items():
+        if len(key) > _MAX_FIELD or len(value) > _MAX_FIELD:
+            raise ValueError(
+                f"Key or value longer than {_MAX_FIELD} bytes: {key[:40]!r}"
+            )
+        value_offset = value_offsets.get(value)
+        if value_offset is None:
+            value_offset = value_offsets[value] = len(values)
+            values += value
+        h = key_hash(key)
+        i = h & mask
+        while _SLOT.unpack_from(slots, i * _SLOT.size)[1]:
+            i = (i + 1) & mask
+        _SLOT.pack_into(slots, i * _SLOT.size, h >> 32, len(records) + 1)
+        records += _RECORD.pack(len(key), len(value), value_offset)
+        records += key
+    if len(records) >= _MAX_OFFSET or len(values) >= _MAX_OFFSET:
+        raise ValueError("Hash table exceeds 4 GiB record/value limit")
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                n_slots,
+                len(entries),
+                len(records),
+                len(meta_bytes),
+            )
+        )
+        f.write(meta_bytes)
+        f.write(slots)
+        f.write(records)
+        f.write(values)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class MmapHashTable:
+    """Read-only ``bytes -> bytes`` mapping over a file from write_hash_table."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buf) < _HEADER.size:
+            raise ValueError(f"Truncated hash table: {path}")
+        magic, version, n_slots, n_items, records_size, meta_len = _HEADER.unpack_from(
+            self._buf, 0
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Not a hash table file: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported hash table version {version} in {path}")
+        self._mask = n_slots - 1
+        self._n_items = n_items
+        self._slots_offset = _HEADER.size + meta_len
+        self._records_offset = self._slots_offset + n_slots * _SLOT.size
+        self._values_offset = self._records_offset + records_size
+        meta = bytes(self._buf[_HEADER.size : self._slots_offset]).rstrip(b"\0")
+        self.meta: Dict[str, Any] = json.loads(meta) if meta else {}
+
+    def _value(self, offset: int) -> Tuple[bytes, bytes]:
+        key_len, value_len, value_offset = _RECORD.unpack_from(self._buf, offset)
+        start = offset + _RECORD.size
+        value_start = self._values_offset + value_offset
+        return (
+            self._buf[start : start + key_len],
+            self._buf[value_start : value_start + value_len],
+        )
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        buf = self._buf
+        h = key_hash(key)
+        tag = h >> 32
+        i = h & self._mask
+        while True:
+            slot_tag, ref = _SLOT.unpack_from(buf, self._slots_offset + i * _SLOT.size)
+            if not ref:
+                return default
+            if slot_tag == tag:
+                record_key, value = self._value(self._records_offset + ref - 1)
+                if record_key == key:
+                    return value
+            i = (i + 1) & self._mask
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, bytes) and self.get(key) is not None
+
+    def __len__(self) -> int:
+        return self._n_items
+
+    def items(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterate records in file order (= order of the unique keys written).
+
+        Args:
+            start: Offset into the records section of the first record
+            end: Offset just past the last record (default: all records)
+        """
+        offset = self._records_offset + start
+        stop = self._values_offset if end is None else self._records_offset + end
+        while offset < stop:
+            key, value = self._value(offset)
+            yield key, value
+            offset += _RECORD.size + len(key)
+
+    def close(self) -> None:
+        self._buf.close()
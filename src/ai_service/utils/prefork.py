@@ -0,0 +1,296 @@
+"""
+Pre-fork server: load and warm read-only state once, then fork workers.
+
+With independent uvicorn workers every process loads its own models,
+lexicons, sanctions data and INN cache, so memory grows linearly with the
+worker count. ``PreforkServer`` instead runs a warm-up callable in the
+master, freezes the resulting objects with ``gc.freeze()`` (the cyclic GC
+then never touches them, so their pages are not copied just because the
+collector wrote a GC header) and forks the workers, which share those pages
+copy-on-write. Reference count updates still dirty the pages of objects a
+worker actually uses; ``memory_report`` shows how much stays shared.
+
+Rules for the warm-up callable: it must leave no threads or event loops
+running (they do not survive ``fork``) and must not open sockets or
+connection pools that workers would then share.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# smaps_rollup fields (kB) used by the memory report
+_SMAPS_FIELDS = (
+    "Rss",
+    "Pss",
+    "Shared_Clean",
+    "Shared_Dirty",
+    "Private_Clean",
+    "Private_Dirty",
+)
+
+# A worker exiting sooner than this after spawning counts as a crash loop
+MIN_WORKER_UPTIME_S = 5.0
+MAX_QUICK_EXITS = 5
+
+
+def parse_smaps_rollup(text: str) -> Dict[str, int]:
+    """
+    Parse ``/proc/<pid>/smaps_rollup``.
+
+    Returns:
+        rss_kb, pss_kb, shared_kb (clean + dirty) and private_kb (clean + dirty)
+    """
+    values = dict.fromkeys(_SMAPS_FIELDS, 0)
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].endswith(":") and parts[0][:-1] in values:
+            values[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss_kb": values["Rss"],
+        "pss_kb": values["Pss"],
+        "shared_kb": values["Shared_Clean"] + values["Shared_Dirty"],
+        "private_kb": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def read_memory_usage(pid: int) -> Optional[Dict[str, int]]:
+    """Shared/private RSS of a process, or None where /proc is unavailable."""
+    try:
+        text = Path(f"/proc/{pid}/smaps_rollup").read_text()
+    except OSError:
+        return None
+    return {"pid": pid, **parse_smaps_rollup(text)}
+
+
+def child_pids(pid: int) -> List[int]:
+    """Direct children of ``pid`` (Linux)."""
+    children: List[int] = []
+    try:
+        for task in Path(f"/proc/{pid}/task").iterdir():
+            children.extend(int(c) for c in (task / "children").read_text().split())
+    except OSError:
+        pass
+    return sorted(children)
+
+
+def memory_report(master_pid: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Memory usage of the master and its workers.
+
+    PSS splits shared pages between the processes sharing them, so
+    ``total_pss_kb`` is what the whole server really costs, while
+    ``total_rss_kb`` is what independent workers would roughly need.
+
+    Args:
+        master_pid: Pre-fork master (defaults to the current process)
+
+    Returns:
+        Per-process usage and totals; ``available`` is False off Linux
+    """
+    master_pid = master_pid or os.getpid()
+    master = read_memory_usage(master_pid)
+    if master is None:
+        return {"available": False}
+    workers = [
+        usage for usage in map(read_memory_usage, child_pids(master_pid)) if usage
+    ]
+    processes = [master] + workers
+    total_rss = sum(p["rss_kb"] for p in processes)
+    total_pss = sum(p["pss_kb"] for p in processes)
+    return {
+        "available": True,
+        "master": master,
+        "workers": workers,
+        "total_rss_kb": total_rss,
+        "total_pss_kb": total_pss,
+        "shared_savings_kb": total_rss - total_pss,
+    }
+
+
+class PreforkServer:
+    """Warm state in the master, fork workers, respawn the ones that die."""
+
+    def __init__(
+        self,
+        serve: Callable[[socket.socket], None],
+        workers: int,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        backlog: int = 2048,
+        memory_report_interval: float = 0.0,
+        graceful_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            serve: Runs one worker's server on the inherited listening socket
+            workers: Number of worker processes
+            host: Bind address
+            port: Bind port
+            backlog: Listen backlog
+            memory_report_interval: Seconds between memory report log lines (0 = off)
+            graceful_timeout: Seconds workers get to exit before SIGKILL
+        """
+        self._serve = serve
+        self.workers = max(1, workers)
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.memory_report_interval = memory_report_interval
+        self.graceful_timeout = graceful_timeout
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, float] = {}
+        self._stopping = False
+        self._quick_exits = 0
+
+    def bind(self) -> socket.socket:
+        """Open the listening socket shared by all workers."""
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        self._socket = sock
+        return sock
+
+    def run(self, warm: Optional[Callable[[], None]] = None) -> int:
+        """
+        Bind, warm up, fork the workers and supervise them until SIGTERM/SIGINT.
+
+        Args:
+            warm: Loads the shared read-only state in the master
+
+        Returns:
+            Process exit code
+        """
+        if self._socket is None:
+            self.bind()
+        if warm is not None:
+            start = time.perf_counter()
+            warm()
+            logger.info(f"Pre-fork warm-up done in {time.perf_counter() - start:.1f}s")
+
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Frozen {gc.get_freeze_count()} objects before forking")
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        for _ in range(self.workers):
+            self._spawn()
+        logger.info(
+            f"Pre-fork master {os.getpid()} serving {self.host}:{self.port} with {self.workers} workers"
+        )
+
+        exit_code = self._supervise()
+        self._shutdown_workers()
+        self._socket.close()
+        return exit_code
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                self._serve(self._socket)
+            except BaseException as e:
+                logger.error(f"Worker {os.getpid()} failed: {e}", exc_info=True)
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = time.monotonic()
+        return pid
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _supervise(self) -> int:
+        last_report = time.monotonic()
+        while not self._stopping:
+            self._reap(respawn=True)
+            if self._quick_exits >= MAX_QUICK_EXITS:
+                logger.error(
+                    f"Workers keep exiting right after start ({self._quick_exits} times), stopping"
+                )
+                return 1
+            now = time.monotonic()
+            if (
+                self.memory_report_interval
+                and now - last_report >= self.memory_report_interval
+            ):
+                last_report = now
+                self.log_memory_report()
+            time.sleep(0.5)
+        return 0
+
+    def _reap(self, respawn: bool) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+            uptime = time.monotonic() - started
+            self._quick_exits = (
+                self._quick_exits + 1 if uptime < MIN_WORKER_UPTIME_S else 0
+            )
+            if respawn and not self._stopping:
+                logger.warning(
+                    f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)} "
+                    f"after {uptime:.1f}s, respawning"
+                )
+                if self._quick_exits < MAX_QUICK_EXITS:
+                    self._spawn()
+
+    def _shutdown_workers(self) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._children and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(0.1)
+        for pid in list(self._children):
+            logger.warning(
+                f"Worker {pid} did not exit in {self.graceful_timeout}s, killing"
+            )
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children.clear()
+
+    def log_memory_report(self) -> None:
+        report = memory_report()
+        if not report["available"]:
+            return
+        per_worker = ", ".join(
+            f"{w['pid']}: shared={w['shared_kb'] // 1024}MB private={w['private_kb'] // 1024}MB"
+            for w in report["workers"]
+        )
+        logger.info(
+            f"Memory: total PSS {report['total_pss_kb'] // 1024}MB "
+            f"(RSS sum {report['total_rss_kb'] // 1024}MB); workers {per_worker}"
+        )
@@ -15,6 +15,9 @@ from collections import defaultdict, deque
 import threading
 import statistics
 
+from .sampling_profiler import SamplingProfiler, sample_hz_from_env
+from .tracing import span
+
 
 class PerformanceCounter:
     """Дешёвый счётчик производительности."""
@@ -125,10 +128,14 @@ class ProfilingManager:
     def __init__(self):
         self.counters: Dict[str, PerformanceCounter] = {}
         self.memory_trackers: Dict[str, MemoryTracker] = {}
+        self.sampler: Optional[SamplingProfiler] = None
         self._lock = threading.Lock()
     
     def get_counter(self, name: str) -> PerformanceCounter:
         """Получить или создать счётчик."""
+        counter = self.counters.get(name)
+        if counter is not None:
+            return counter
         with self._lock:
             if name not in self.counters:
                 self.counters[name] = PerformanceCounter(name)
@@ -141,19 +148,44 @@ class ProfilingManager:
                 self.memory_trackers[name] = MemoryTracker(name)
             return self.memory_trackers[name]
     
+    def start_sampling(self, hz: Optional[float] = None, duration_s: Optional[float] = None) -> SamplingProfiler:
+        """Запустить сэмплирующий профайлер (частота по умолчанию из PROFILER_SAMPLE_HZ)."""
+        with self._lock:
+            if self.sampler is None or (hz is not None and not self.sampler.running and hz != self.sampler.hz):
+                self.sampler = SamplingProfiler(hz if hz is not None else sample_hz_from_env())
+            sampler = self.sampler
+        sampler.start(duration_s)
+        return sampler
+
+    def stop_sampling(self) -> Optional[SamplingProfiler]:
+        """Остановить сэмплирующий профайлер; собранные стеки сохраняются."""
+        sampler = self.sampler
+        if sampler is not None:
+            sampler.stop()
+        return sampler
+
     def get_all_stats(self) -> Dict[str, Any]:
         """Получить все статистики."""
         with self._lock:
-            return {
+            stats = {
                 'counters': {name: counter.get_stats() for name, counter in self.counters.items()},
                 'memory_trackers': {name: tracker.get_stats() for name, tracker in self.memory_trackers.items()}
             }
+        if self.sampler is not None:
+            stats['sampling'] = {
+                **self.sampler.status(),
+                'breakdown': self.sampler.breakdown(),
+                'top_functions': self.sampler.top_functions(),
+            }
+        return stats
     
     def clear_stats(self):
         """Очистить все статистики."""
         with self._lock:
             self.counters.clear()
             self.memory_trackers.clear()
+        if self.sampler is not None:
+            self.sampler.reset()
 
 
 # Глобальный менеджер профилирования
@@ -171,7 +203,9 @@ def profile_time(name: str, enable: bool = True):
     start_time = time.perf_counter()
     
     try:
-        yield counter
+        # В сэмплированном запросе блок также попадает в дерево спанов
+        with span(name):
+            yield counter
     finally:
         end_time = time.perf_counter()
         counter.add_sample(end_time - start_time)
@@ -219,6 +253,21 @@ def profile_function(name: Optional[str] = None, enable: bool = True):
     return decorator
 
 
+def start_sampling_profiler(hz: Optional[float] = None, duration_s: Optional[float] = None) -> SamplingProfiler:
+    """Запустить сэмплирующий профайлер процесса."""
+    return _profiling_manager.start_sampling(hz, duration_s)
+
+
+def stop_sampling_profiler() -> Optional[SamplingProfiler]:
+    """Остановить сэмплирующий профайлер процесса."""
+    return _profiling_manager.stop_sampling()
+
+
+def get_sampling_profiler() -> Optional[SamplingProfiler]:
+    """Сэмплирующий профайлер процесса (None, если не запускался)."""
+    return _profiling_manager.sampler
+
+
 def get_profiling_stats() -> Dict[str, Any]:
     """Получить статистики профилирования."""
     return _profiling_manager.get_all_stats()
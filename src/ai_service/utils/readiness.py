@@ -0,0 +1,192 @@
+"""
+Service readiness state machine.
+
+States::
+
+    STARTING --core up--> CORE_READY --all subsystems loaded--> READY
+        |                      \\--some subsystem failed------> DEGRADED
+        \\--core failed--> FAILED
+
+In eager startup the service goes straight from STARTING to READY (or
+DEGRADED). In lazy startup the core pipeline (validation, normalization,
+signals, smart filter) is up at CORE_READY while heavy subsystems
+(variants, embeddings, search, spaCy models, sanctions data, INN cache)
+load in the background.
+
+The readiness probe passes at CORE_READY only if READY_ON_CORE=true (the
+default is false). Even then ``/process`` answers 503 with Retry-After
+while any of the ``SCREENING_COMPONENTS`` is still loading, so no result
+is returned without sanctions screening. Once they have loaded, or failed
+(DEGRADED), requests are served.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+
+# Subsystems without which a request would not be screened against sanctions
+SCREENING_COMPONENTS = ("search", "sanctions_data", "inn_cache")
+
+
+class ReadinessState(str, Enum):
+    """Overall service state."""
+
+    STARTING = "starting"
+    CORE_READY = "core_ready"
+    READY = "ready"
+    DEGRADED = "degraded"
+    FAILED = "failed"
+
+
+class ComponentState(str, Enum):
+    """State of one background-loaded subsystem."""
+
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class ComponentStatus:
+    state: ComponentState = ComponentState.PENDING
+    started_at: Optional[float] = None
+    duration_s: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "duration_s": (
+                round(self.duration_s, 3) if self.duration_s is not None else None
+            ),
+            "error": self.error,
+        }
+
+
+class ReadinessTracker:
+    """Thread-safe readiness bookkeeping (subsystems load in worker threads)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._core_ready = False
+        self._core_error: Optional[str] = None
+        self._components: Dict[str, ComponentStatus] = {}
+        self._core_ready_at: Optional[float] = None
+        self._ready_at: Optional[float] = None
+        self._created_at = time.time()
+
+    def register(self, name: str) -> None:
+        """Declare a subsystem that has to load before READY."""
+        with self._lock:
+            self._components.setdefault(name, ComponentStatus())
+
+    def start(self, name: str) -> None:
+        with self._lock:
+            status = self._components.setdefault(name, ComponentStatus())
+            status.state = ComponentState.LOADING
+            status.started_at = time.time()
+
+    def ready(self, name: str) -> None:
+        self._finish(name, ComponentState.READY, None)
+
+    def fail(self, name: str, error: Any) -> None:
+        self._finish(name, ComponentState.FAILED, str(error))
+
+    def _finish(self, name: str, state: ComponentState, error: Optional[str]) -> None:
+        with self._lock:
+            status = self._components.setdefault(name, ComponentStatus())
+            status.state = state
+            status.error = error
+            if status.started_at is not None:
+                status.duration_s = time.time() - status.started_at
+            self._update_ready_at()
+
+    def mark_core_ready(self) -> None:
+        with self._lock:
+            self._core_ready = True
+            self._core_ready_at = time.time()
+            self._update_ready_at()
+
+    def mark_core_failed(self, error: Any) -> None:
+        with self._lock:
+            self._core_error = str(error)
+
+    def _update_ready_at(self) -> None:
+        if self._ready_at is None and self._core_ready and not self._loading():
+            self._ready_at = time.time()
+
+    def _loading(self) -> bool:
+        return any(
+            s.state in (ComponentState.PENDING, ComponentState.LOADING)
+            for s in self._components.values()
+        )
+
+    @property
+    def state(self) -> ReadinessState:
+        with self._lock:
+            if self._core_error is not None:
+                return ReadinessState.FAILED
+            if not self._core_ready:
+                return ReadinessState.STARTING
+            if self._loading():
+                return ReadinessState.CORE_READY
+            if any(s.state == ComponentState.FAILED for s in self._components.values()):
+                return ReadinessState.DEGRADED
+            return ReadinessState.READY
+
+    def is_serving(self, ready_on_core: bool = True) -> bool:
+        """Whether requests should be accepted in the current state."""
+        state = self.state
+        if state in (ReadinessState.READY, ReadinessState.DEGRADED):
+            return True
+        return state == ReadinessState.CORE_READY and ready_on_core
+
+    def loading(self, names: Iterable[str]) -> List[str]:
+        """Which of ``names`` are registered and still pending or loading."""
+        with self._lock:
+            return [
+                name
+                for name in names
+                if name in self._components
+                and self._components[name].state
+                in (ComponentState.PENDING, ComponentState.LOADING)
+            ]
+
+    def component_state(self, name: str) -> Optional[ComponentState]:
+        with self._lock:
+            status = self._components.get(name)
+            return status.state if status else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state.value,
+                "core_ready_s": (
+                    round(self._core_ready_at - self._created_at, 3)
+                    if self._core_ready_at
+                    else None
+                ),
+                "ready_s": (
+                    round(self._ready_at - self._created_at, 3)
+                    if self._ready_at
+                    else None
+                ),
+                "core_error": self._core_error,
+                "components": {
+                    name: s.to_dict() for name, s in self._components.items()
+                },
+            }
+
+
+_readiness = ReadinessTracker()
+
+
+def get_readiness_tracker() -> ReadinessTracker:
+    """Process-wide readiness tracker."""
+    return _readiness
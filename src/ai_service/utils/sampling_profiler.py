@@ -0,0 +1,367 @@
+"""
+Continuous statistical profiler for production traffic.
+
+``SamplingProfiler`` runs a daemon thread that wakes up ``hz`` times a second,
+reads ``sys._current_frames()`` and counts each thread's stack, as py-spy
+would from outside the process but without attaching to the pod. A sample
+only stores a tuple of code objects; frame labels are built when a profile
+is exported.
+
+Samples are attributed from the stack itself, because request context lives
+in contextvars that another thread cannot read:
+
+- endpoint: the innermost frame that is a registered route handler
+  (:meth:`SamplingProfiler.register_endpoints`), e.g. ``/process``
+- layer: the innermost ``UnifiedOrchestrator._handle_<layer>_layer`` frame
+
+Under asyncio the running task's whole await chain is on the loop thread's
+stack, so both are known for every busy sample. Threads blocked in
+``select``/``wait`` are counted as idle and left out of exports by default.
+
+Profiles export as collapsed stacks (``flamegraph.pl``, speedscope,
+Grafana) or speedscope JSON with one profile per endpoint and layer. The
+profiler samples the process it runs in; with pre-fork workers each worker
+has its own.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLE_HZ_ENV = "PROFILER_SAMPLE_HZ"
+DEFAULT_SAMPLE_HZ = 100.0
+MAX_SAMPLE_HZ = 1000.0
+# Distinct stacks kept; samples of further new stacks are only counted as dropped
+MAX_STACKS = 50_000
+MAX_DEPTH = 128
+
+UNKNOWN = "-"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+_LAYER_RE = re.compile(r"^_handle_(\w+?)_layers?$")
+# (file name, function) of leaf frames that wait rather than run
+IDLE_LEAVES = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("queue.py", "get"),
+        ("socket.py", "accept"),
+        ("connection.py", "wait"),
+    }
+)
+
+Stack = Tuple[CodeType, ...]
+
+
+def frame_label(code: CodeType) -> str:
+    """``function (path:first line)``, the py-spy frame naming."""
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _short_path(filename: str) -> str:
+    # Keep paths readable: package-relative for the service, basename otherwise
+    marker = "ai_service" + os.sep
+    index = filename.rfind(marker)
+    if index >= 0:
+        return filename[index:]
+    return os.path.basename(filename)
+
+
+class SamplingProfiler:
+    """
+    Background stack sampler with per-endpoint and per-layer aggregation.
+
+    Args:
+        hz: Samples per second
+        max_stacks: Distinct stacks kept before new ones are dropped
+    """
+
+    def __init__(self, hz: float = DEFAULT_SAMPLE_HZ, max_stacks: int = MAX_STACKS):
+        self.hz = min(max(hz, 1.0), MAX_SAMPLE_HZ)
+        self.max_stacks = max_stacks
+        self._stacks: Counter = Counter()
+        self._endpoints: Dict[CodeType, str] = {}
+        self._attribution: Dict[Stack, Tuple[str, str, bool]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.dropped = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def register_endpoints(self, endpoints: Dict[Any, str]) -> None:
+        """
+        Name samples after route handlers.
+
+        Args:
+            endpoints: Handler function (or its code object) -> route path
+        """
+        with self._lock:
+            for handler, path in endpoints.items():
+                code = getattr(handler, "__code__", handler)
+                if isinstance(code, CodeType):
+                    self._endpoints[code] = path
+            self._attribution.clear()
+
+    def start(self, duration_s: Optional[float] = None) -> bool:
+        """
+        Start sampling in a daemon thread.
+
+        Args:
+            duration_s: Stop automatically after this many seconds
+
+        Returns:
+            False if the profiler was already running
+        """
+        if self.running:
+            return False
+        self._stop.clear()
+        self.started_at = time.time()
+        self.stopped_at = None
+        self._thread = threading.Thread(
+            target=self._run, args=(duration_s,), name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Sampling profiler started at {self.hz:g} Hz")
+        return True
+
+    def stop(self) -> bool:
+        """Stop sampling; collected stacks are kept. False if it was not running."""
+        thread = self._thread
+        if thread is None:
+            return False
+        self._stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self._thread = None
+        self.stopped_at = time.time()
+        logger.info(f"Sampling profiler stopped after {self.samples} samples")
+        return True
+
+    def _run(self, duration_s: Optional[float]) -> None:
+        interval = 1.0 / self.hz
+        deadline = time.monotonic() + duration_s if duration_s else None
+        own_ident = threading.get_ident()
+        while not self._stop.wait(interval):
+            self.sample(exclude=(own_ident,))
+            if deadline is not None and time.monotonic() >= deadline:
+                self.stopped_at = time.time()
+                break
+
+    def sample(
+        self, exclude: Iterable[int] = (), threads: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Count the current stack of every thread except ``exclude``.
+
+        Args:
+            exclude: Thread idents to skip
+            threads: Only sample these thread idents (default: all threads)
+        """
+        excluded = set(exclude)
+        only = None if threads is None else set(threads)
+        for ident, frame in sys._current_frames().items():
+            if ident in excluded or (only is not None and ident not in only):
+                continue
+            codes = []
+            while frame is not None and len(codes) < MAX_DEPTH:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            stack = tuple(codes)
+            self.samples += 1
+            if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                self._stacks[stack] += 1
+            else:
+                self.dropped += 1
+
+    def _attribute(self, stack: Stack) -> Tuple[str, str, bool]:
+        """(endpoint, layer, idle) of a stack, memoized."""
+        cached = self._attribution.get(stack)
+        if cached is not None:
+            return cached
+        endpoint = layer = UNKNOWN
+        for code in reversed(stack):
+            if endpoint == UNKNOWN and code in self._endpoints:
+                endpoint = self._endpoints[code]
+            if layer == UNKNOWN:
+                match = _LAYER_RE.match(code.co_name)
+                if match:
+                    layer = match.group(1)
+        leaf = stack[-1] if stack else None
+        idle = (
+            leaf is not None
+            and (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_LEAVES
+        )
+        result = self._attribution[stack] = (endpoint, layer, idle)
+        return result
+
+    def _selected(
+        self, endpoint: Optional[str], layer: Optional[str], include_idle: bool
+    ) -> List[Tuple[str, str, Stack, int]]:
+        found = []
+        for stack, count in list(self._stacks.items()):
+            stack_endpoint, stack_layer, idle = self._attribute(stack)
+            if idle and not include_idle:
+                continue
+            if endpoint is not None and stack_endpoint != endpoint:
+                continue
+            if layer is not None and stack_layer != layer:
+                continue
+            found.append((stack_endpoint, stack_layer, stack, count))
+        return found
+
+    def collapsed(
+        self,
+        endpoint: Optional[str] = None,
+        layer: Optional[str] = None,
+        include_idle: bool = False,
+        group: bool = True,
+    ) -> str:
+        """
+        Collapsed stacks, one ``frame;frame;... count`` line per stack.
+
+        Args:
+            endpoint: Only samples of this route
+            layer: Only samples of this layer
+            include_idle: Keep threads that were waiting
+            group: Prefix each stack with ``[endpoint];[layer]`` root frames
+        """
+        lines: Counter = Counter()
+        for stack_endpoint, stack_layer, stack, count in self._selected(
+            endpoint, layer, include_idle
+        ):
+            frames = [frame_label(code) for code in stack]
+            if group:
+                frames = [f"[{stack_endpoint}]", f"[{stack_layer}]"] + frames
+            lines[";".join(frames)] += count
+        return "".join(f"{line} {count}\n" for line, count in sorted(lines.items()))
+
+    def speedscope(
+        self,
+        endpoint: Optional[str] = None,
+        layer: Optional[str] = None,
+        include_idle: bool = False,
+    ) -> Dict[str, Any]:
+        """Speedscope file with one sampled profile per (endpoint, layer)."""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[CodeType, int] = {}
+        profiles: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for stack_endpoint, stack_layer, stack, count in self._selected(
+            endpoint, layer, include_idle
+        ):
+            indices = []
+            for code in stack:
+                index = frame_index.get(code)
+                if index is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append(
+                        {
+                            "name": code.co_name,
+                            "file": _short_path(code.co_filename),
+                            "line": code.co_firstlineno,
+                        }
+                    )
+                indices.append(index)
+            profile = profiles.get((stack_endpoint, stack_layer))
+            if profile is None:
+                profile = profiles[(stack_endpoint, stack_layer)] = {
+                    "type": "sampled",
+                    "name": f"{stack_endpoint} {stack_layer}",
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                }
+            profile["samples"].append(indices)
+            profile["weights"].append(count)
+            profile["endValue"] += count
+        ordered = sorted(profiles.values(), key=lambda p: p["endValue"], reverse=True)
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": "ai-service sampling profile",
+            "exporter": "ai_service.utils.sampling_profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": ordered,
+        }
+
+    def breakdown(self, include_idle: bool = False) -> Dict[str, Dict[str, int]]:
+        """Sample counts per endpoint and layer."""
+        result: Dict[str, Dict[str, int]] = {}
+        for stack_endpoint, stack_layer, _, count in self._selected(
+            None, None, include_idle
+        ):
+            layers = result.setdefault(stack_endpoint, {})
+            layers[stack_layer] = layers.get(stack_layer, 0) + count
+        return result
+
+    def top_functions(
+        self, top: int = 20, include_idle: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Functions with the most samples on top of the stack (self time)."""
+        leaves: Counter = Counter()
+        for _, _, stack, count in self._selected(None, None, include_idle):
+            if stack:
+                leaves[stack[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [
+            {
+                "function": frame_label(code),
+                "samples": count,
+                "share": round(count / total, 4),
+            }
+            for code, count in leaves.most_common(top)
+        ]
+
+    def status(self) -> Dict[str, Any]:
+        idle = sum(
+            count
+            for stack, count in list(self._stacks.items())
+            if self._attribute(stack)[2]
+        )
+        return {
+            "running": self.running,
+            "hz": self.hz,
+            "started_at": self.started_at,
+            "stopped_at": self.stopped_at,
+            "samples": self.samples,
+            "idle_samples": idle,
+            "stacks": len(self._stacks),
+            "dropped": self.dropped,
+        }
+
+    def reset(self) -> None:
+        """Forget collected samples (sampling continues if running)."""
+        self._stacks = Counter()
+        self._attribution.clear()
+        self.samples = 0
+        self.dropped = 0
+
+
+def sample_hz_from_env() -> float:
+    try:
+        return float(os.getenv(SAMPLE_HZ_ENV, DEFAULT_SAMPLE_HZ))
+    except ValueError:
+        logger.warning(
+            f"Invalid {SAMPLE_HZ_ENV}={os.getenv(SAMPLE_HZ_ENV)!r}, using {DEFAULT_SAMPLE_HZ:g}"
+        )
+        return DEFAULT_SAMPLE_HZ
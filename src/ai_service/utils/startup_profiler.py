@@ -0,0 +1,226 @@
+"""
+Cold-start profiling: per-module import times and startup phases.
+
+``ImportProfiler`` wraps ``builtins.__import__`` and records, for every module
+that is actually loaded (not already in ``sys.modules``), its self and
+cumulative import time, like ``python -X importtime``. Submodules pulled in
+through ``from pkg import sub`` or ``importlib.import_module`` are counted
+in the importing module's cumulative time.
+
+``StartupTimeline`` records named startup phases (imports, orchestrator,
+sanctions preload, ...) relative to process start.
+
+Both are process-wide and exposed through ``/admin/startup``. Import
+profiling is off unless ``IMPORT_PROFILE=true``; it has to be installed before
+the heavy imports, i.e. at the top of ``main``.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+IMPORT_PROFILE_ENV = "IMPORT_PROFILE"
+
+# Wall clock at first import of this module (main imports it first)
+_PROCESS_T0 = time.perf_counter()
+
+
+@dataclass
+class ImportRecord:
+    """Timing of one module import."""
+
+    module: str
+    parent: Optional[str]
+    self_s: float = 0.0
+    cumulative_s: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "module": self.module,
+            "parent": self.parent,
+            "self_ms": round(self.self_s * 1000, 3),
+            "cumulative_ms": round(self.cumulative_s * 1000, 3),
+        }
+
+
+class ImportProfiler:
+    """Records import timings while installed."""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, ImportRecord] = {}
+        self._local = threading.local()
+        self._original_import = None
+        self._lock = threading.Lock()
+
+    @property
+    def installed(self) -> bool:
+        return self._original_import is not None
+
+    def install(self) -> None:
+        if self.installed:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self.installed:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _stack(self) -> List[List[Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        module_name = name
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                return original(name, globals, locals, fromlist, level)
+        if module_name in sys.modules or module_name in self._records:
+            return original(name, globals, locals, fromlist, level)
+
+        stack = self._stack()
+        # [module, start, time spent in nested imports]
+        frame = [module_name, time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            if stack:
+                stack[-1][2] += elapsed
+            with self._lock:
+                self._records[module_name] = ImportRecord(
+                    module=module_name,
+                    parent=stack[-1][0] if stack else None,
+                    self_s=max(elapsed - frame[2], 0.0),
+                    cumulative_s=elapsed,
+                )
+
+    def records(self) -> List[ImportRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def report(self, top: int = 50) -> Dict[str, Any]:
+        """
+        Import timing report.
+
+        Args:
+            top: Number of modules to list, by cumulative time
+
+        Returns:
+            Totals, top modules and self time per top-level package
+        """
+        records = self.records()
+        by_package: Dict[str, float] = {}
+        for record in records:
+            package = record.module.split(".", 1)[0]
+            by_package[package] = by_package.get(package, 0.0) + record.self_s
+        slowest = sorted(records, key=lambda r: r.cumulative_s, reverse=True)[:top]
+        packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[
+            :top
+        ]
+        return {
+            "enabled": self.installed,
+            "modules": len(records),
+            "total_ms": round(sum(r.self_s for r in records) * 1000, 3),
+            "slowest": [record.to_dict() for record in slowest],
+            "packages": [
+                {"package": name, "self_ms": round(t * 1000, 3)} for name, t in packages
+            ],
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+class StartupTimeline:
+    """Named startup phases, relative to process start."""
+
+    def __init__(self, t0: float = _PROCESS_T0) -> None:
+        self._t0 = t0
+        self._phases: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name`` (recorded even on error)."""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.record(name, start, time.perf_counter(), error)
+
+    def record(
+        self, name: str, start: float, end: float, error: Optional[str] = None
+    ) -> None:
+        entry = {
+            "phase": name,
+            "start_ms": round((start - self._t0) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+        }
+        if error:
+            entry["error"] = error
+        with self._lock:
+            self._phases.append(entry)
+
+    def mark(self, name: str) -> None:
+        """Record phase ``name`` as running from process start until now."""
+        self.record(name, self._t0, time.perf_counter())
+
+    def since_start_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000, 3)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self._phases)
+        return {"uptime_ms": self.since_start_ms(), "phases": phases}
+
+
+_import_profiler = ImportProfiler()
+_timeline = StartupTimeline()
+
+
+def get_import_profiler() -> ImportProfiler:
+    """Process-wide import profiler."""
+    return _import_profiler
+
+
+def get_startup_timeline() -> StartupTimeline:
+    """Process-wide startup timeline."""
+    return _timeline
+
+
+def install_import_profiler_from_env() -> bool:
+    """Install the import profiler if IMPORT_PROFILE=true; returns whether it is active."""
+    if os.getenv(IMPORT_PROFILE_ENV, "false").lower() == "true":
+        _import_profiler.install()
+    return _import_profiler.installed
+
+
+def get_startup_report(top: int = 50) -> Dict[str, Any]:
+    """Startup phases plus the import report."""
+    return {
+        "timeline": _timeline.report(),
+        "imports": _import_profiler.report(top),
+    }
@@ -0,0 +1,210 @@
+"""
+Per-request text profile shared by all processing layers.
+
+A :class:`TextProfile` holds the character-class counts, script spans, digit
+runs and token boundaries of one text. Several layers need the same
+statistics (dominant script, mixed-script checks, Ukrainian/Russian markers);
+inside a profile scope opened by the orchestrator they read them from here
+instead of rescanning the text with their own regexes and loops.
+
+Counts are taken eagerly on a single CP1251 byte image of the text (C-level
+``bytes.translate`` rather than per-character Python); spans are built on
+first access since only a few callers need positions.
+
+Outside a scope :func:`get_text_profile` returns ``None`` and callers keep
+their own counting code.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Tuple
+
+Span = Tuple[int, int]
+
+UKRAINIAN_SPECIFIC_CHARS = "іїєґІЇЄҐ"
+RUSSIAN_SPECIFIC_CHARS = "ёъыэЁЪЫЭ"
+
+# Russian/Ukrainian alphabet (А-я + ЁІЇЄҐ) and ASCII letters as CP1251 bytes;
+# every other code point either has a different byte or is dropped on encode
+_CYRILLIC_UPPER = "".join(chr(code) for code in range(0x0410, 0x0430)) + "ЁІЇЄҐ"
+_CYRILLIC_LOWER = "".join(chr(code) for code in range(0x0430, 0x0450)) + "ёіїєґ"
+CYRILLIC_LETTER_BYTES = (_CYRILLIC_UPPER + _CYRILLIC_LOWER).encode("cp1251")
+LATIN_LETTER_BYTES = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_UPPER_LETTER_BYTES = _CYRILLIC_UPPER.encode("cp1251") + b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGIT_BYTES = b"0123456789"
+_UKRAINIAN_BYTES = UKRAINIAN_SPECIFIC_CHARS.encode("cp1251")
+_RUSSIAN_BYTES = RUSSIAN_SPECIFIC_CHARS.encode("cp1251")
+
+_CYRILLIC_EXTENDED_RE = re.compile(
+    "["
+    + "".join(
+        chr(code)
+        for code in range(0x0400, 0x0500)
+        if chr(code) not in _CYRILLIC_UPPER + _CYRILLIC_LOWER
+    )
+    + "]"
+)
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SCRIPT_RUN_RE = re.compile(
+    "(?P<cyrillic>[Ѐ-ӿ]+)|(?P<latin>[A-Za-z]+)|(?P<digits>[0-9]+)"
+)
+_TOKEN_RE = re.compile(r"\S+")
+
+# Distinct texts memoized per scope (sanitized, unicode-normalized, ...)
+MAX_PROFILES_PER_SCOPE = 8
+
+
+def _deleted(data: bytes, chars: bytes) -> int:
+    return len(data) - len(data.translate(None, chars))
+
+
+@dataclass
+class TextProfile:
+    """Character statistics of one text, shared across layers."""
+
+    text: str
+    length: int = 0
+    cyrillic: int = 0
+    cyrillic_extended: int = 0
+    latin: int = 0
+    uppercase: int = 0
+    digits: int = 0
+    spaces: int = 0
+    punct: int = 0
+    ukrainian_specific: int = 0
+    russian_specific: int = 0
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextProfile":
+        """Build a profile; counts use one CP1251 image of ``text``."""
+        data = text.encode("cp1251", "ignore")
+        cyrillic = _deleted(data, CYRILLIC_LETTER_BYTES)
+        ascii_only = text.isascii()
+        return cls(
+            text=text,
+            length=len(text),
+            cyrillic=cyrillic,
+            cyrillic_extended=(
+                0 if ascii_only else len(_CYRILLIC_EXTENDED_RE.findall(text))
+            ),
+            latin=_deleted(data, LATIN_LETTER_BYTES),
+            uppercase=_deleted(data, _UPPER_LETTER_BYTES),
+            digits=_deleted(data, _DIGIT_BYTES),
+            spaces=len(text) - len("".join(text.split())),
+            punct=len(_PUNCT_RE.findall(text)),
+            ukrainian_specific=_deleted(data, _UKRAINIAN_BYTES) if cyrillic else 0,
+            russian_specific=_deleted(data, _RUSSIAN_BYTES) if cyrillic else 0,
+        )
+
+    @property
+    def letters(self) -> int:
+        """Cyrillic + Latin letters (the alphabets the pipeline scores)."""
+        return self.cyrillic + self.latin
+
+    @property
+    def other(self) -> int:
+        """Characters that are not spaces, scored letters or ASCII digits."""
+        return self.length - self.spaces - self.letters - self.digits
+
+    @property
+    def has_mixed_scripts(self) -> bool:
+        """True if both Cyrillic and Latin letters are present."""
+        return self.cyrillic > 0 and self.latin > 0
+
+    @property
+    def has_cyrillic_block(self) -> bool:
+        """True if any U+0400-U+04FF character is present."""
+        return self.cyrillic > 0 or self.cyrillic_extended > 0
+
+    @property
+    def dominant_script(self) -> Optional[str]:
+        """'cyrillic' or 'latin' by letter count, None on a tie."""
+        if self.cyrillic > self.latin:
+            return "cyrillic"
+        if self.latin > self.cyrillic:
+            return "latin"
+        return None
+
+    @cached_property
+    def _script_runs(self) -> List[Tuple[str, int, int]]:
+        return [
+            (match.lastgroup, *match.span())
+            for match in _SCRIPT_RUN_RE.finditer(self.text)
+        ]
+
+    @cached_property
+    def script_spans(self) -> Tuple[Tuple[int, int, str], ...]:
+        """Maximal (start, end, 'cyrillic'|'latin') letter runs."""
+        return tuple(
+            (start, end, kind)
+            for kind, start, end in self._script_runs
+            if kind != "digits"
+        )
+
+    @cached_property
+    def digit_runs(self) -> Tuple[Span, ...]:
+        """(start, end) of every ASCII digit run."""
+        return tuple(
+            (start, end) for kind, start, end in self._script_runs if kind == "digits"
+        )
+
+    @cached_property
+    def token_spans(self) -> Tuple[Span, ...]:
+        """(start, end) of every whitespace-delimited token."""
+        return tuple(match.span() for match in _TOKEN_RE.finditer(self.text))
+
+    @property
+    def tokens(self) -> Iterator[str]:
+        """Whitespace-delimited tokens, sliced from the text."""
+        text = self.text
+        return (text[start:end] for start, end in self.token_spans)
+
+
+# ---- Request scope ------------------------------------------------------
+
+_scope: ContextVar[Optional[Dict[str, TextProfile]]] = ContextVar(
+    "text_profile_scope", default=None
+)
+
+
+def begin_text_profile_scope() -> Token:
+    """Open a profile scope for the current request; pass the token to end_text_profile_scope."""
+    return _scope.set({})
+
+
+def end_text_profile_scope(token: Token) -> None:
+    """Close the scope opened by begin_text_profile_scope."""
+    _scope.reset(token)
+
+
+@contextmanager
+def text_profile_scope() -> Iterator[None]:
+    """Context manager form of begin/end_text_profile_scope."""
+    token = begin_text_profile_scope()
+    try:
+        yield
+    finally:
+        end_text_profile_scope(token)
+
+
+def get_text_profile(text: str) -> Optional[TextProfile]:
+    """
+    Return the profile of ``text`` for the active request scope.
+
+    The first call for a given text builds the profile, later calls from any
+    layer reuse it. Returns None when no scope is active.
+    """
+    profiles = _scope.get()
+    if profiles is None or not isinstance(text, str):
+        return None
+    profile = profiles.get(text)
+    if profile is None:
+        profile = TextProfile.from_text(text)
+        if len(profiles) < MAX_PROFILES_PER_SCOPE:
+            profiles[text] = profile
+    return profile
@@ -163,3 +163,22 @@ class TraceCollector:
         self.errors.clear()
         self.start_time = None
         self.end_time = None
+
+
+class DeferredTraceList(list):
+    """
+    List of trace strings that are only formatted when tracing is on.
+
+    ``add(template, *args)`` appends ``template.format(*args)`` if the list
+    is enabled and does nothing otherwise, so requests without tracing skip
+    the string formatting. Otherwise it is a plain list.
+    """
+
+    def __init__(self, enabled: bool = True):
+        super().__init__()
+        self.enabled = enabled
+
+    def add(self, template: str, *args: Any) -> None:
+        """Append a formatted entry if enabled"""
+        if self.enabled:
+            self.append(template.format(*args) if args else template)
@@ -0,0 +1,293 @@
+"""
+Sampled per-request span trees.
+
+Request timing used to be scattered over ``profile_function`` counters,
+``perf_timer`` prints, per-layer ``metrics_service.record_timer`` calls and
+exporter lookups, most of them on for every request. This module is the one
+tracing surface: the orchestrator opens a root span per request, layers, ES
+calls and the model encode open child spans, and cache lookups add events.
+
+Sampling is decided once at the head of the request (``TRACE_SAMPLE_RATE``,
+1% by default). An unsampled request has no current span, so :func:`span`
+costs one ``ContextVar.get`` and returns a shared no-op object, and
+:func:`trace_event` returns immediately. When a sampled request finishes,
+every span duration is observed in the ``request_span_duration_ms``
+histogram, and a request slower than ``TRACE_SLOW_MS`` has its whole tree
+written to the slow-request log (and kept in a small in-memory ring).
+
+Spans live in a ``ContextVar``: tasks started inside a span attach their
+spans to it, and each task restores its own context when its span ends.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+slow_request_logger = get_logger(f"{__name__}.slow_requests")
+
+SAMPLE_RATE_ENV = "TRACE_SAMPLE_RATE"
+SLOW_MS_ENV = "TRACE_SLOW_MS"
+DEFAULT_SAMPLE_RATE = 0.01
+# Same threshold as the orchestrator's slow-processing warning
+DEFAULT_SLOW_MS = 100.0
+MAX_SLOW_TRACES = 100
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+
+
+class Span:
+    """One timed operation of a sampled request."""
+
+    __slots__ = ("name", "attrs", "start", "end", "children", "events")
+
+    def __init__(self, name: str, attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List[Span] = []
+        self.events: List[Tuple[str, float, Dict[str, Any]]] = []
+
+    @property
+    def duration_ms(self) -> float:
+        end = time.perf_counter() if self.end is None else self.end
+        return (end - self.start) * 1000
+
+    def set(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+    def event(self, name: str, **attrs: Any) -> None:
+        self.events.append((name, time.perf_counter(), attrs))
+
+    def walk(self) -> Iterator["Span"]:
+        """This span and all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self, origin: Optional[float] = None) -> Dict[str, Any]:
+        """JSON-ready tree; offsets are milliseconds from the root's start."""
+        origin = self.start if origin is None else origin
+        result: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attrs:
+            result["attrs"] = self.attrs
+        if self.events:
+            result["events"] = [
+                {"name": name, "at_ms": round((at - origin) * 1000, 3), **attrs}
+                for name, at, attrs in self.events
+            ]
+        if self.children:
+            result["children"] = [child.to_dict(origin) for child in self.children]
+        return result
+
+
+class _NoopSpan:
+    """Stand-in returned by :func:`span` outside a sampled request."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def event(self, name: str, **attrs: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanScope:
+    """Context manager that makes a child span current while it is open."""
+
+    __slots__ = ("_parent", "_span", "_token")
+
+    def __init__(self, parent: Span, name: str, attrs: Dict[str, Any]):
+        self._parent = parent
+        self._span = Span(name, attrs)
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Span:
+        self._span.start = time.perf_counter()
+        self._parent.children.append(self._span)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._span.end = time.perf_counter()
+        if exc_type is not None:
+            self._span.attrs["error"] = exc_type.__name__
+        _current_span.reset(self._token)
+
+
+def span(name: str, **attrs: Any):
+    """
+    Time a block as a child of the current span.
+
+    Returns a no-op context manager when the request is not sampled.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return _SpanScope(parent, name, attrs)
+
+
+def trace_event(name: str, **attrs: Any) -> None:
+    """Record a point event (e.g. a cache hit) on the current span, if sampled."""
+    current = _current_span.get()
+    if current is not None:
+        current.event(name, **attrs)
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span of a sampled request, or None."""
+    return _current_span.get()
+
+
+class Tracer:
+    """
+    Head sampler and exporter of request span trees.
+
+    Args:
+        sample_rate: Share of requests traced (0 disables tracing)
+        slow_ms: Requests at least this slow are written to the slow-request log
+        max_slow_traces: Slow trees kept in memory for inspection
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        slow_ms: float = DEFAULT_SLOW_MS,
+        max_slow_traces: int = MAX_SLOW_TRACES,
+    ):
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.slow_ms = slow_ms
+        self._slow_traces: deque = deque(maxlen=max_slow_traces)
+        self.stats = {"requests": 0, "sampled": 0, "slow": 0}
+
+    def _sampled(self) -> bool:
+        if self.sample_rate >= 1.0:
+            return True
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
+
+    def begin(
+        self, name: str, force: bool = False, **attrs: Any
+    ) -> Optional[Tuple[Span, Token]]:
+        """
+        Decide whether to trace a request and open its root span.
+
+        Args:
+            name: Root span name
+            force: Trace regardless of the sample rate
+            **attrs: Root span attributes
+
+        Returns:
+            Scope to pass to :meth:`end`; None when not sampled or when an
+            enclosing request is already being traced (its tree gets the spans)
+        """
+        if _current_span.get() is not None:
+            return None
+        self.stats["requests"] += 1
+        if not (force or self._sampled()):
+            return None
+        self.stats["sampled"] += 1
+        root = Span(name, attrs)
+        return root, _current_span.set(root)
+
+    def end(self, scope: Optional[Tuple[Span, Token]]) -> Optional[Span]:
+        """Close a request opened by :meth:`begin` and export its tree."""
+        if scope is None:
+            return None
+        root, token = scope
+        root.end = time.perf_counter()
+        _current_span.reset(token)
+        try:
+            self.export(root)
+        except Exception as e:
+            # Tracing must never fail a request
+            logger.debug(f"Trace export failed: {e}")
+        return root
+
+    def export(self, root: Span) -> None:
+        """Observe every span duration and log the tree if the request was slow."""
+        from ..monitoring.prometheus_exporter import get_exporter
+
+        exporter = get_exporter()
+        for node in root.walk():
+            exporter.record_span_duration(node.name, node.duration_ms)
+
+        if root.duration_ms >= self.slow_ms:
+            self.stats["slow"] += 1
+            tree = root.to_dict()
+            self._slow_traces.append(tree)
+            slow_request_logger.warning(
+                f"Slow request {root.name}: {root.duration_ms:.1f}ms "
+                f"{json.dumps(tree, ensure_ascii=False, default=str)}"
+            )
+
+    def slow_traces(self) -> List[Dict[str, Any]]:
+        """Most recent slow request trees, oldest first."""
+        return list(self._slow_traces)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer configured from TRACE_SAMPLE_RATE and TRACE_SLOW_MS."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer(
+                    sample_rate=_env_float(SAMPLE_RATE_ENV, DEFAULT_SAMPLE_RATE),
+                    slow_ms=_env_float(SLOW_MS_ENV, DEFAULT_SLOW_MS),
+                )
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Replace the process-wide tracer (None: rebuild from the environment)."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
+
+
+def begin_request_trace(name: str, **attrs: Any) -> Optional[Tuple[Span, Token]]:
+    """Head-sample a request with the process-wide tracer; see :meth:`Tracer.begin`."""
+    return get_tracer().begin(name, **attrs)
+
+
+def end_request_trace(scope: Optional[Tuple[Span, Token]]) -> Optional[Span]:
+    """Finish a request opened by :func:`begin_request_trace`."""
+    if scope is None:
+        return None
+    return get_tracer().end(scope)
@@ -0,0 +1,116 @@
+"""
+Micro-benchmark for the compiled UnicodeService normalization plan.
+
+Compares the precompiled character maps / fused script count against the
+previous per-character implementation on long payment descriptions.
+"""
+
+import re
+import time
+
+import pytest
+
+from src.ai_service.layers.unicode.unicode_service import UnicodeService
+
+PAYMENT_DESCRIPTION = (
+    "Оплата за послуги згідно рахунку № 123/45 від 01.02.2024, ТОВ «Ромашка» — "
+    "платник Пётр Іваненко, призначення: consulting services O’Connor & Müller GmbH, "
+    "ІПН 1234567890; "
+) * 8
+
+
+def _legacy_normalize_homoglyphs(service, text):
+    """Per-character implementation the compiled plan replaced."""
+    cyrillic_count = len(re.findall(r"[а-яёіїєґА-ЯЁІЇЄҐ]", text))
+    latin_count = len(re.findall(r"[a-zA-Z]", text))
+    if cyrillic_count > latin_count:
+        mapping = {v: k for k, v in service.homoglyph_mapping.items()}
+    elif latin_count > cyrillic_count:
+        mapping = service.homoglyph_mapping
+    else:
+        return text, 0
+    replacements = 0
+    result = ""
+    for char in text:
+        if char in mapping:
+            result += mapping[char]
+            replacements += 1
+        else:
+            result += char
+    return result, replacements
+
+
+def _legacy_replace_complex_characters(service, text):
+    replacements = 0
+    result = ""
+    for char in text:
+        if char in service.character_mapping:
+            result += service.character_mapping[char]
+            replacements += 1
+        else:
+            result += char
+    return result, replacements
+
+
+def _best_of(func, repeat=5, number=200):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+class TestUnicodeNormalizationPerformance:
+    """Compiled normalization plan vs per-character loops."""
+
+    @pytest.fixture(scope="class")
+    def service(self):
+        return UnicodeService()
+
+    @pytest.mark.perf_micro
+    def test_homoglyph_fold_speedup(self, service):
+        assert service._normalize_homoglyphs(
+            PAYMENT_DESCRIPTION
+        ) == _legacy_normalize_homoglyphs(service, PAYMENT_DESCRIPTION)
+
+        compiled = _best_of(lambda: service._normalize_homoglyphs(PAYMENT_DESCRIPTION))
+        legacy = _best_of(
+            lambda: _legacy_normalize_homoglyphs(service, PAYMENT_DESCRIPTION)
+        )
+
+        print(f"Homoglyph fold: {compiled * 1e6:.1f}us vs {legacy * 1e6:.1f}us legacy")
+        assert compiled * 3 < legacy
+
+    @pytest.mark.perf_micro
+    def test_complex_character_speedup(self, service):
+        assert service._replace_complex_characters(
+            PAYMENT_DESCRIPTION
+        ) == _legacy_replace_complex_characters(service, PAYMENT_DESCRIPTION)
+
+        compiled = _best_of(
+            lambda: service._replace_complex_characters(PAYMENT_DESCRIPTION)
+        )
+        legacy = _best_of(
+            lambda: _legacy_replace_complex_characters(service, PAYMENT_DESCRIPTION)
+        )
+
+        print(f"Complex chars: {compiled * 1e6:.1f}us vs {legacy * 1e6:.1f}us legacy")
+        assert compiled * 3 < legacy
+
+    @pytest.mark.perf_micro
+    def test_normalize_text_long_payment_description(self, service):
+        result = service.normalize_text(PAYMENT_DESCRIPTION, normalize_homoglyphs=True)
+        assert "«" not in result["normalized"]
+
+        per_call = _best_of(
+            lambda: service.normalize_text(
+                PAYMENT_DESCRIPTION, normalize_homoglyphs=True
+            )
+        )
+
+        print(
+            f"normalize_text ({len(PAYMENT_DESCRIPTION)} chars): {per_call * 1e6:.1f}us"
+        )
+        assert per_call < 0.002
@@ -47,21 +47,21 @@ def test_direct_cache_lookup():
     else:
         print(f"   [ERROR] NOT FOUND")
 
-    # Method 3: Check raw cache content
-    print(f"\n3. Checking raw cache content...")
-    if test_inn in cache.cache:
-        print(f"   [OK] INN '{test_inn}' exists as key in cache")
-        print(f"   Value: {cache.cache[test_inn]}")
+    # Method 3: Check raw index content
+    print(f"\n3. Checking raw index content...")
+    if cache.index is not None and test_inn in cache.index:
+        print(f"   [OK] INN '{test_inn}' exists as key in index")
+        print(f"   Value: {cache.index.lookup(test_inn, 'inn')}")
     else:
-        print(f"   [ERROR] INN '{test_inn}' NOT a key in cache")
-        # Show first few keys to verify format
-        print(f"   Sample cache keys: {list(cache.cache.keys())[:5]}")
+        print(f"   [ERROR] INN '{test_inn}' NOT a key in index")
+        # Show index stats to verify it was loaded
+        print(f"   Index stats: {cache.index.stats() if cache.index is not None else None}")
 
     # Try normalized lookup
     print(f"\n4. Testing normalized lookup...")
     normalized = str(test_inn).strip()
     print(f"   Normalized INN: '{normalized}' (type: {type(normalized)})")
-    if normalized in cache.cache:
+    if cache.index is not None and normalized in cache.index:
         print(f"   [OK] Normalized INN found in cache")
     else:
         print(f"   [ERROR] Normalized INN not found")
@@ -0,0 +1,155 @@
+"""
+Unit tests for the process-pool execution backend.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.ai_service.contracts.base_contracts import NormalizationResult, TokenTrace
+from src.ai_service.core import execution_backend
+from src.ai_service.core.execution_backend import (
+    ProcessPoolBackend,
+    dumps,
+    loads,
+    pack_feature_flags,
+    pack_normalization_result,
+    unpack_feature_flags,
+    unpack_normalization_result,
+)
+from src.ai_service.exceptions import NormalizationError, ServiceUnavailableError
+from src.ai_service.utils.feature_flags import FeatureFlags
+
+
+class FakeWorkerServices:
+    """Stands in for the pool process services; blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+
+    def run(self, text, language, kwargs):
+        self.release.wait(5)
+        if text == "boom":
+            raise ValueError("bad input")
+        result = NormalizationResult(
+            normalized=text.title(),
+            tokens=text.title().split(),
+            trace=[
+                TokenTrace(token=t, role="given", rule="test", output=t.title())
+                for t in text.split()
+            ],
+            language=language,
+        )
+        return result, {
+            "persons": [],
+            "organizations": [],
+            "extras": {"dates": [], "amounts": []},
+            "confidence": 0.0,
+        }
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeWorkerServices()
+    monkeypatch.setattr(execution_backend, "_worker", fake)
+    backend = ProcessPoolBackend(
+        workers=2, batch_size=4, batch_window_ms=5, queue_timeout=0.05
+    )
+    backend._executor = ThreadPoolExecutor(max_workers=2)
+    backend.fake = fake
+    yield backend
+    backend.shutdown()
+
+
+class TestSerialization:
+    """Test the compact wire format."""
+
+    def test_normalization_result_roundtrip(self):
+        result = NormalizationResult(
+            normalized="Іван Петренко",
+            tokens=["Іван", "Петренко"],
+            trace=[
+                TokenTrace(
+                    token="іван",
+                    role="given",
+                    rule="dict",
+                    output="Іван",
+                    cache={"morph": "hit"},
+                )
+            ],
+            language="uk",
+            persons=[{"tokens": ["Іван", "Петренко"], "gender": "masc"}],
+            homoglyph_analysis={"has_homoglyphs": False},
+        )
+        payload = dumps(pack_normalization_result(result))
+        assert payload[:1] == b"M"
+
+        restored = unpack_normalization_result(loads(payload))
+        assert restored.model_dump() == result.model_dump()
+        assert isinstance(restored.trace[0], TokenTrace)
+
+    def test_pickle_fallback(self):
+        flags = FeatureFlags(strict_stopwords=True)
+        payload = dumps({"flags": flags})
+        assert payload[:1] == b"P"
+        assert loads(payload)["flags"] == flags
+
+    def test_feature_flags_delta(self):
+        assert pack_feature_flags(FeatureFlags()) == {}
+        delta = pack_feature_flags(
+            FeatureFlags(strict_stopwords=True, enable_ac_tier0=False)
+        )
+        assert delta == {"strict_stopwords": True, "enable_ac_tier0": False}
+        assert unpack_feature_flags(delta) == FeatureFlags(
+            strict_stopwords=True, enable_ac_tier0=False
+        )
+        assert unpack_feature_flags(None) is None
+
+
+class TestProcessPoolBackend:
+    """Test batching, errors and back-pressure."""
+
+    @pytest.mark.asyncio
+    async def test_micro_batching(self, backend):
+        results = await asyncio.gather(
+            *(backend.normalize_and_extract(f"name {i}", "en", {}) for i in range(6))
+        )
+        assert [r.normalized for r, _ in results] == [f"Name {i}" for i in range(6)]
+        assert all(isinstance(signals, dict) for _, signals in results)
+
+        stats = backend.stats()
+        assert stats["completed"] == 6
+        assert stats["batches"] == 2  # one full batch of 4, one flushed by the window
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_error_is_per_request(self, backend):
+        ok, failed = await asyncio.gather(
+            backend.normalize_and_extract("ivan petrov", "en", {}),
+            backend.normalize_and_extract("boom", "en", {}),
+            return_exceptions=True,
+        )
+        assert ok[0].normalized == "Ivan Petrov"
+        assert isinstance(failed, NormalizationError)
+        assert backend.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_back_pressure_rejects_when_full(self, backend):
+        backend.max_queue = 2
+        backend.fake.release.clear()
+        admitted = [
+            asyncio.create_task(backend.normalize_and_extract(f"name {i}", "en", {}))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        assert backend.stats()["in_flight"] == 2
+
+        with pytest.raises(ServiceUnavailableError):
+            await backend.normalize_and_extract("one too many", "en", {})
+        assert backend.stats()["rejected"] == 1
+
+        backend.fake.release.set()
+        assert len(await asyncio.gather(*admitted)) == 2
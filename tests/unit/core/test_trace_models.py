@@ -413,3 +413,43 @@ class TestSearchTraceBuilder:
         assert trace.enabled is False
         assert len(trace.steps) == 0
         assert len(trace.notes) == 0
+
+
+class TestSearchTraceLevels:
+    """Test lazy steps and summary-level search traces."""
+
+    def _step(self):
+        return SearchTraceStep(
+            stage="AC", query="test", topk=10, took_ms=1.0,
+            hits=[create_ac_hit("doc1", 0.9, 1), create_ac_hit("doc2", 0.8, 2)],
+        )
+
+    def test_disabled_trace_never_builds_steps(self):
+        trace = SearchTrace(enabled=False)
+
+        def fail():
+            raise AssertionError("step should not be built for a disabled trace")
+
+        trace.add_step(fail)
+        trace.note("never %s", "formatted")
+        assert trace.steps == [] and trace.notes == []
+        assert not trace.include_hits
+
+    def test_full_trace_keeps_hits(self):
+        trace = SearchTrace(enabled=True)
+        trace.add_step(self._step)
+        trace.note("Search completed: %s results", 2)
+
+        assert trace.include_hits
+        assert len(trace.steps[0].hits) == 2
+        assert trace.notes == ["Search completed: 2 results"]
+
+    def test_summary_trace_drops_hit_lists(self):
+        trace = SearchTrace(enabled=True, level="summary")
+        trace.add_step(self._step)
+        trace.add_step(lambda: SearchTraceStep(stage="HYBRID", query="test", topk=10, took_ms=2.0), hit_count=5)
+
+        assert not trace.include_hits
+        assert [step.hits for step in trace.steps] == [[], []]
+        assert [step.meta["hit_count"] for step in trace.steps] == [2, 5]
+        assert trace.get_hit_count() == 7
@@ -53,15 +53,16 @@ class TestEmbeddingContract:
         assert result == []
 
     def test_encode_batch_mixed_valid_empty(self):
-        """Test that encode_batch filters out empty texts"""
+        """Test that encode_batch keeps empty texts aligned as empty vectors"""
         config = EmbeddingConfig()
         service = EmbeddingService(config)
         
         result = service.encode_batch(["Valid text", "", "   ", "Another valid"])
         
         assert isinstance(result, list)
-        assert len(result) == 2  # Only valid texts
-        assert all(len(vector) == 384 for vector in result)
+        assert len(result) == 4  # One vector per input
+        assert len(result[0]) == 384 and len(result[3]) == 384
+        assert result[1] == [] and result[2] == []
 
     def test_legacy_encode_method_still_works(self):
         """Test that legacy encode method still works for backward compatibility"""
@@ -342,3 +342,61 @@ class TestEmbeddingServiceErrorHandling:
             
             # Should return empty list on error
             assert result == []
+
+
+class TestEmbeddingServiceBatchDedup:
+    """Test dedup of preprocessed texts in encode_batch"""
+
+    def setup_method(self):
+        """Set up service with a mock model that echoes one row per input"""
+        from src.ai_service.config import EmbeddingConfig
+        config = EmbeddingConfig()
+        self.service = EmbeddingService(config)
+        self.model = Mock()
+        self.model.encode.side_effect = lambda texts, **kwargs: np.array(
+            [[float(i)] * 384 for i in range(len(texts))]
+        )
+        self.service.model_cache[config.model_name] = self.model
+
+    def test_duplicates_encoded_once(self):
+        """Same preprocessed text is sent to the model only once"""
+        result = self.service.encode_batch(["Ivan Petrov", "Anna Smith", "Ivan Petrov", "Ivan Petrov"])
+
+        sent = self.model.encode.call_args[0][0]
+        assert len(sent) == 2
+        assert len(result) == 4
+        assert result[0] == result[2] == result[3]
+        assert result[0] != result[1]
+        # Repeats are independent copies
+        assert result[0] is not result[2]
+
+    def test_dedup_on_preprocessed_key(self):
+        """Texts differing only in stripped attributes share one encoding"""
+        self.service.encode_batch(["Ivan Petrov 1980-01-01", "Ivan Petrov"])
+
+        sent = self.model.encode.call_args[0][0]
+        assert sent == ["Ivan Petrov"]
+
+    def test_alignment_with_empty_texts(self):
+        """Empty texts keep their position with an empty vector"""
+        result = self.service.encode_batch(["", "Anna Smith", "   ", "Anna Smith"])
+
+        assert len(result) == 4
+        assert result[0] == [] and result[2] == []
+        assert len(result[1]) == 384 and result[1] == result[3]
+
+    def test_all_empty_batch_skips_model(self):
+        """Batch with only empty texts never calls the model"""
+        result = self.service.encode_batch(["", "  "])
+
+        assert result == [[], []]
+        self.model.encode.assert_not_called()
+
+    def test_dedup_ratio_reported(self):
+        """Dedup ratio is exposed through cache stats"""
+        self.service.encode_batch(["A B", "A B", "A B", "C D"])
+
+        stats = self.service.get_cache_stats()
+        assert stats["batch_texts_total"] == 4
+        assert stats["batch_texts_encoded"] == 2
+        assert stats["batch_dedup_ratio"] == pytest.approx(0.5)
@@ -190,9 +190,10 @@ class TestEmbeddingsCanaryNames:
         mixed_inputs = ["Ivan Petrov", "", "   ", "Anna Smith"]
         mixed_results = embedding_service.encode_batch(mixed_inputs)
         
-        # Should only return embeddings for non-empty inputs
-        assert len(mixed_results) == 2  # Only "Ivan Petrov" and "Anna Smith"
-        assert all(len(emb) == 384 for emb in mixed_results)
+        # Empty inputs keep their position with an empty vector
+        assert len(mixed_results) == 4
+        assert len(mixed_results[0]) == 384 and len(mixed_results[3]) == 384
+        assert mixed_results[1] == [] and mixed_results[2] == []
 
     def test_consistency_across_calls(self, embedding_service):
         """
@@ -0,0 +1,210 @@
+"""
+Unit tests for the sketch-based metric aggregation.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from src.ai_service.monitoring.metrics_collector import (
+    AggregationType,
+    MetricBuffer,
+    MetricsCollector,
+)
+from src.ai_service.monitoring.prometheus_exporter import MetricsCollectorSummaries
+from src.ai_service.monitoring.quantile_sketch import DDSketch, WindowedSketch
+
+
+def exact_quantile(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+class TestDDSketch:
+    """Test the relative-error quantile sketch."""
+
+    @pytest.mark.parametrize("q", [0.01, 0.5, 0.9, 0.95, 0.99])
+    def test_quantiles_within_relative_accuracy(self, q):
+        rnd = random.Random(7)
+        values = [rnd.lognormvariate(3, 1.5) for _ in range(20000)]
+        sketch = DDSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        assert sketch.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.011)
+
+    def test_exact_moments_and_bounds(self):
+        sketch = DDSketch()
+        for value in [-5.0, 0.0, 2.0, 3.0, 1000.0]:
+            sketch.add(value)
+        assert (sketch.count, sketch.sum, sketch.min, sketch.max) == (
+            5,
+            1000.0,
+            -5.0,
+            1000.0,
+        )
+        assert sketch.quantile(0) == -5.0
+        assert sketch.quantile(1) == 1000.0
+        assert sketch.quantile(0.25) == 0.0
+        assert sketch.quantile(0.0001) == pytest.approx(-5.0, rel=0.01)
+
+    def test_quantiles_match_single_quantile(self):
+        sketch = DDSketch()
+        for value in range(1, 1001):
+            sketch.add(value)
+        qs = (0.99, 0.5, 0.95, 0.0, 1.0)
+        assert sketch.quantiles(qs) == [sketch.quantile(q) for q in qs]
+
+    def test_merge_equals_single_sketch(self):
+        whole, left, right = DDSketch(), DDSketch(), DDSketch()
+        for value in range(1, 501):
+            whole.add(value)
+            (left if value % 2 else right).add(value)
+        left.merge(right)
+        assert left.positive == whole.positive
+        assert left.quantile(0.95) == whole.quantile(0.95)
+        with pytest.raises(ValueError):
+            left.merge(DDSketch(0.05))
+
+    def test_empty_sketch(self):
+        assert DDSketch().quantile(0.5) == 0.0
+        assert DDSketch().quantiles([0.5, 0.99]) == [0.0, 0.0]
+
+
+class TestWindowedSketch:
+    """Test time slicing, tags and per-thread shards."""
+
+    def test_window_excludes_old_slices(self):
+        window = WindowedSketch(max_age_seconds=3600, slice_seconds=10)
+        now = time.time()
+        window.add(1.0, timestamp=now - 1000)
+        window.add(2.0, timestamp=now)
+        assert window.merged(start_time=now - 300).count == 1
+        assert window.merged().count == 2
+
+    def test_expired_slices_pruned(self):
+        window = WindowedSketch(max_age_seconds=60, slice_seconds=10)
+        window.add(1.0, timestamp=time.time() - 600)
+        window.add(1.0)
+        assert window.stats()["sketches"] == 1
+
+    def test_tags_filter(self):
+        window = WindowedSketch()
+        window.add(1.0, {"endpoint": "/process", "status": "200"})
+        window.add(5.0, {"endpoint": "/process", "status": "500"})
+        window.add(9.0, {"endpoint": "/health"})
+        assert window.merged(tags_filter={"endpoint": "/process"}).sum == 6.0
+        assert window.merged(tags_filter={"status": "500"}).sum == 5.0
+        assert len(window.merged_by_tags()) == 3
+
+    def test_threads_record_into_own_shards(self):
+        window = WindowedSketch()
+        barrier = threading.Barrier(4)
+
+        def record():
+            for i in range(1000):
+                window.add(float(i))
+            # Keep every thread alive until all have recorded (idents are reused)
+            barrier.wait()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert window.merged().count == 4000
+        assert window.stats()["shards"] == 4
+
+    def test_prune_drops_finished_threads(self):
+        window = WindowedSketch(max_age_seconds=60)
+        thread = threading.Thread(
+            target=window.add, args=(1.0,), kwargs={"timestamp": time.time() - 600}
+        )
+        thread.start()
+        thread.join()
+        assert window.stats()["shards"] == 1
+        window.prune()
+        assert window.stats() == {"shards": 0, "sketches": 0, "tag_sets": 1}
+
+
+class TestMetricsCollectorSketches:
+    """Test the collector reading aggregates from sketches."""
+
+    def test_aggregated_stats(self):
+        buffer = MetricBuffer()
+        for value in range(1, 101):
+            buffer.add(float(value), {"op": "search"})
+        stats = buffer.get_aggregated_stats(
+            [
+                AggregationType.COUNT,
+                AggregationType.SUM,
+                AggregationType.AVERAGE,
+                AggregationType.MIN,
+                AggregationType.MAX,
+                AggregationType.P95,
+                AggregationType.RATE_PER_MINUTE,
+            ],
+            time_window_seconds=300,
+        )
+        assert stats["count"] == 100
+        assert stats["sum"] == 5050
+        assert stats["avg"] == 50.5
+        assert (stats["min"], stats["max"]) == (1.0, 100.0)
+        assert stats["p95"] == pytest.approx(95, rel=0.02)
+        assert stats["rate_per_minute"] == 20.0
+        assert buffer.get_aggregated_stats(
+            [AggregationType.P99], 300, {"op": "other"}
+        ) == {"p99": 0.0}
+
+    def test_histogram_stats_and_time_series(self):
+        collector = MetricsCollector()
+        for value in range(1, 201):
+            collector.record_timer(
+                "api_request_duration", float(value), {"endpoint": "/process"}
+            )
+
+        stats = collector.get_histogram_stats(
+            "api_request_duration", {"endpoint": "/process"}
+        )
+        assert stats["count"] == 200
+        assert stats["buckets"][10.0] == 10
+        assert stats["p99"] == pytest.approx(198, rel=0.02)
+
+        series = collector.get_time_series(
+            "api_request_duration", AggregationType.MAX, 300
+        )
+        assert series and series[-1]["value"] == 200.0
+
+    def test_callbacks_receive_points(self):
+        collector = MetricsCollector()
+        points = []
+        collector.add_metric_callback(points.append)
+        collector.increment("api_requests_total")
+        collector.increment("api_requests_total")
+        assert [p.value for p in points] == [1.0, 2.0]
+
+    def test_prometheus_summaries(self):
+        collector = MetricsCollector()
+        for value in (10.0, 20.0, 30.0):
+            collector.record_histogram(
+                "processing.layer.search", value, {"mode": "hybrid"}
+            )
+        lines = MetricsCollectorSummaries(collector).text_lines()
+        assert "# TYPE ai_service_processing_layer_search summary" in lines
+        assert 'ai_service_processing_layer_search_count{mode="hybrid"} 3' in lines
+        assert any(
+            line.startswith(
+                'ai_service_processing_layer_search{mode="hybrid",quantile="0.95"}'
+            )
+            for line in lines
+        )
+
+    def test_timer_summarized_once(self):
+        collector = MetricsCollector()
+        for _ in range(100):
+            collector.record_timer("api_request_duration", 5.0)
+        lines = MetricsCollectorSummaries(collector).text_lines()
+        assert "ai_service_api_request_duration_count 100" in lines
+        assert "ai_service_api_request_duration_sum 500.0" in lines
+        assert collector.get_histogram_stats("api_request_duration")["count"] == 100
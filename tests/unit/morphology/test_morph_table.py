@@ -0,0 +1,140 @@
+"""
+Unit tests for the precompiled morphology lookup table.
+"""
+
+import pytest
+
+from src.ai_service.layers.normalization.morphology import morph_table
+from src.ai_service.layers.normalization.morphology.morph_table import (
+    MorphologyTable,
+    build_morphology_table,
+    collect_vocabulary,
+    expand_forms,
+)
+from src.ai_service.layers.normalization.morphology_adapter import MorphologyAdapter
+from src.ai_service.utils.feature_flags import FeatureFlags
+from src.ai_service.utils.mmap_hash import MmapHashTable, write_hash_table
+
+WORDS = ["иван", "анна", "петров", "сергій", "вика", "шевченко"]
+
+
+@pytest.fixture(scope="module")
+def live_adapter():
+    return MorphologyAdapter(use_morph_table=False)
+
+
+@pytest.fixture(scope="module")
+def table_path(live_adapter, tmp_path_factory):
+    path = tmp_path_factory.mktemp("morph") / "morph_table.bin"
+    build_morphology_table(live_adapter, str(path), WORDS)
+    return str(path)
+
+
+class TestMorphologyTableBuild:
+    """Test vocabulary collection and table build."""
+
+    def test_vocabulary_covers_lexicons_and_extra_names(self):
+        words = collect_vocabulary(["Петренко Іван Васильович", "John Smith"])
+
+        assert {"сергей", "сергій", "вика", "петренко", "васильович"} <= words
+        assert "john" not in words
+        assert all(word == word.lower() for word in words)
+
+    def test_forms_include_inflections(self, live_adapter):
+        forms = expand_forms(live_adapter, ["иван"], "ru")
+
+        assert {"иван", "ивана", "ивану", "иваном"} <= forms
+
+    def test_entries_match_live_pipeline(self, live_adapter, table_path):
+        table = MorphologyTable(table_path)
+        flags = FeatureFlags()
+
+        assert len(table) > 0
+        samples = [
+            ("Ивана", "ru"),
+            ("ИВАНУ", "ru"),
+            ("анной", "ru"),
+            ("Петрова", "ru"),
+            ("Вики", "ru"),
+            ("Сергія", "uk"),
+            ("Шевченка", "uk"),
+            ("Анни", "uk"),
+        ]
+        for token, lang in samples:
+            for role in ("given", "surname", "patronymic"):
+                expected = live_adapter._to_nominative_uncached_with_flags(
+                    token, lang, flags, role
+                )
+                hit = table.lookup(token, lang, role)
+                assert hit is not None, (token, lang, role)
+                assert (hit[0], hit[2]) == expected
+                assert hit[1] == live_adapter._detect_gender_uncached(token, lang)
+
+
+class TestAdapterWithTable:
+    """Test MorphologyAdapter serving from the table."""
+
+    def test_known_tokens_skip_pymorphy(self, table_path, monkeypatch):
+        adapter = MorphologyAdapter(morph_table_path=table_path)
+        expected = adapter._to_nominative_uncached_with_flags(
+            "Ивана", "ru", FeatureFlags(), "given"
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pymorphy3 pipeline should not run for table hits")
+
+        monkeypatch.setattr(adapter, "_to_nominative_uncached_with_flags", fail)
+        assert (
+            adapter.to_nominative_cached("Ивана", "ru", FeatureFlags(), "given")
+            == expected
+        )
+        assert adapter.get_cache_stats()["morph_table_hits"] == 1
+
+    def test_unknown_tokens_and_other_flags_fall_back(self, table_path):
+        adapter = MorphologyAdapter(morph_table_path=table_path)
+
+        result = adapter.to_nominative_cached(
+            "Ковальчука", "uk", FeatureFlags(), "surname"
+        )
+        assert result == adapter._to_nominative_uncached_with_flags(
+            "Ковальчука", "uk", FeatureFlags(), "surname"
+        )
+        assert adapter.get_cache_stats()["morph_table_misses"] == 1
+
+        no_enforce = FeatureFlags(enforce_nominative=False)
+        assert adapter.to_nominative_cached("Ивана", "ru", no_enforce, "given") == (
+            "Ивана",
+            "morph.nominal_noop",
+        )
+        assert adapter.get_cache_stats()["morph_table_hits"] == 0
+
+    def test_mismatched_fingerprint_is_ignored(self, table_path, tmp_path):
+        source = MmapHashTable(table_path)
+        meta = dict(source.meta, fingerprint={"pymorphy3": "0.0"})
+        stale = str(tmp_path / "stale.bin")
+        write_hash_table(stale, source.items(), meta)
+
+        adapter = MorphologyAdapter(morph_table_path=stale)
+        assert adapter._morph_table is None
+
+    def test_source_edit_invalidates_table(self, live_adapter, tmp_path, monkeypatch):
+        lexicon = tmp_path / "extra_names.py"
+        lexicon.write_text("NAMES = ['иван']\n")
+        monkeypatch.setattr(morph_table, "source_files", lambda: [lexicon])
+        path = str(tmp_path / "morph_table.bin")
+        build_morphology_table(live_adapter, path, ["иван"])
+        assert MorphologyAdapter(morph_table_path=path)._morph_table is not None
+
+        lexicon.write_text("NAMES = ['иван', 'анна']\n")
+        assert MorphologyAdapter(morph_table_path=path)._morph_table is None
+
+    def test_gender_uses_requested_role(self, table_path):
+        table = MorphologyAdapter(morph_table_path=table_path)._morph_table
+        for role in ("given", "surname", "patronymic"):
+            hit = table.lookup("петрова", "ru", role)
+            assert table.gender("петрова", "ru", role) == (hit[1] if hit else None)
+        assert table.gender("петрова", "ru", "unknown") is None
+
+    def test_missing_table_is_optional(self, tmp_path):
+        adapter = MorphologyAdapter(morph_table_path=str(tmp_path / "absent.bin"))
+        assert adapter._morph_table is None
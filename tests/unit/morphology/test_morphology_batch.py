@@ -0,0 +1,98 @@
+"""
+Unit tests for the batch morphology API and its use by NormalizationFactory.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.ai_service.layers.normalization.morphology_adapter import MorphologyAdapter
+from src.ai_service.layers.normalization.processors.normalization_factory import (
+    NormalizationConfig,
+    NormalizationFactory,
+)
+from src.ai_service.utils.feature_flags import FeatureFlags
+
+PAIRS = [
+    ("Ивана", "given"),
+    ("Петрова", "surname"),
+    ("Ивана", "given"),
+    ("Анны", "given"),
+    ("Ивановой", "surname"),
+    ("", "given"),
+    ("Петрова", "surname"),
+]
+
+
+class TestMorphologyBatch:
+    """Test MorphologyAdapter.to_nominative_batch."""
+
+    def test_matches_sequential_calls(self):
+        flags = FeatureFlags()
+        sequential = MorphologyAdapter(use_morph_table=False)
+        expected = [
+            sequential.to_nominative_cached(token, "ru", flags, role)
+            for token, role in PAIRS
+        ]
+
+        results, _ = MorphologyAdapter(use_morph_table=False).to_nominative_batch(
+            PAIRS, "ru", flags
+        )
+
+        assert results == expected
+
+    def test_duplicates_resolved_once(self):
+        adapter = MorphologyAdapter(use_morph_table=False)
+        with patch.object(
+            adapter,
+            "_to_nominative_uncached_with_flags",
+            wraps=adapter._to_nominative_uncached_with_flags,
+        ) as uncached:
+            results, stats = adapter.to_nominative_batch(PAIRS, "ru", FeatureFlags())
+
+        assert len(results) == len(PAIRS)
+        assert uncached.call_count == 4
+        assert stats == {"total": 7, "unique": 5, "cache_hits": 0, "cache_misses": 4}
+
+    def test_second_batch_is_served_from_cache(self):
+        adapter = MorphologyAdapter(use_morph_table=False)
+        first, _ = adapter.to_nominative_batch(PAIRS, "ru", FeatureFlags())
+
+        with patch.object(adapter, "_to_nominative_uncached_with_flags") as uncached:
+            second, stats = adapter.to_nominative_batch(PAIRS, "ru", FeatureFlags())
+
+        uncached.assert_not_called()
+        assert second == first
+        assert stats["cache_hits"] == 4 and stats["cache_misses"] == 0
+
+    def test_unsupported_language_is_noop(self):
+        results, stats = MorphologyAdapter(use_morph_table=False).to_nominative_batch(
+            [("John", "given")], "en", FeatureFlags()
+        )
+
+        assert results == [("John", "morph.nominal_noop")]
+        assert stats["cache_misses"] == 0
+
+
+class TestFactoryMorphologyBatch:
+    """Test that the factory resolves morphology tokens in one batch."""
+
+    @pytest.mark.asyncio
+    async def test_single_batch_and_no_stdout(self, capsys):
+        factory = NormalizationFactory()
+        factory.metrics_collector = Mock()
+        tokens = ["Ивану", "Петрову", "и", "Ивану", "Петрову"]
+        roles = ["given", "surname", "unknown", "given", "surname"]
+        config = NormalizationConfig(language="ru", enable_cache=True)
+
+        with patch.object(
+            factory.morphology_adapter,
+            "to_nominative_batch",
+            wraps=factory.morphology_adapter.to_nominative_batch,
+        ) as batch:
+            normalized, _ = await factory._normalize_morphology(tokens, roles, config)
+
+        assert normalized == ["Иван", "Петров", "и", "Иван", "Петров"]
+        assert batch.call_count == 1
+        assert factory.metrics_collector.collect_morphology_metrics.call_count == 1
+        assert "DEBUG" not in capsys.readouterr().out
@@ -0,0 +1,186 @@
+"""
+Unit tests for the canonical-name normalization fast path.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.ai_service.layers.normalization.processors.canonical_fastpath import (
+    CanonicalFastPath,
+    compare_results,
+)
+from src.ai_service.layers.normalization.processors.normalization_factory import (
+    NormalizationConfig,
+    NormalizationFactory,
+)
+from src.ai_service.utils.feature_flags import FeatureFlags
+
+# (token, lang, role) -> (nominative, gender) as served by the morphology table
+TABLE = {
+    ("Иванов", "ru", "surname"): ("Иванов", "masc"),
+    ("Иван", "ru", "given"): ("Иван", "masc"),
+    ("Иванович", "ru", "patronymic"): ("Иванович", "masc"),
+    ("Иванова", "ru", "surname"): ("Иванов", "femn"),
+    ("Петрова", "ru", "surname"): ("Петрова", "femn"),
+    ("Коваленко", "uk", "surname"): ("Коваленко", "unknown"),
+    ("Олена", "uk", "given"): ("Олена", "femn"),
+    ("Петрівна", "uk", "patronymic"): ("Петрівна", "femn"),
+}
+
+
+@pytest.fixture
+def fastpath():
+    adapter = Mock()
+    adapter.lookup_known_form.side_effect = lambda token, lang, role, flags: TABLE.get(
+        (token, lang, role)
+    )
+    return CanonicalFastPath(adapter, latin_surnames={"Smith"})
+
+
+class TestCanonicalFastPathMatch:
+    """Test CanonicalFastPath.match."""
+
+    @pytest.mark.parametrize(
+        "text, language, roles",
+        [
+            ("Иванов Иван Иванович", "ru", ["surname", "given", "patronymic"]),
+            ("Иван Иванович Иванов", "ru", ["given", "patronymic", "surname"]),
+            ("Коваленко Олена Петрівна", "uk", ["surname", "given", "patronymic"]),
+            ("John Smith", "en", ["given", "surname"]),
+        ],
+    )
+    def test_canonical_names_hit(self, fastpath, text, language, roles):
+        assert fastpath.match(text, language, FeatureFlags(), {}) == (
+            text.split(),
+            roles,
+        )
+
+    @pytest.mark.parametrize(
+        "text, language",
+        [
+            ("Иванова Ивана", "ru"),  # inflected forms
+            ("Петрова Иван", "ru"),  # surname gender differs from given name
+            ("Иванов Иванович", "ru"),  # no given name
+            ("Иван", "ru"),  # single token
+            ("Иванов И. И.", "ru"),  # initials
+            ("ИВАНОВ ИВАН", "ru"),  # not title case
+            ("Сидоров Иван", "ru"),  # not in table
+            ("John Smith", "ru"),  # Latin in Cyrillic request
+            ("Smith John", "en"),
+            ("Иванов Иван", "de"),
+        ],
+    )
+    def test_other_inputs_miss(self, fastpath, text, language):
+        assert fastpath.match(text, language, FeatureFlags(), {}) is None
+
+    def test_diminutives_miss(self, fastpath):
+        assert (
+            fastpath.match("Иванов Иван", "ru", FeatureFlags(), {"иван": "иван"})
+            is not None
+        )
+        assert (
+            fastpath.match("Иванов Иван", "ru", FeatureFlags(), {"иван": "иоанн"})
+            is None
+        )
+
+    def test_compare_results(self):
+        fast = SimpleNamespace(
+            normalized="Иван Иванов",
+            tokens=["Иван", "Иванов"],
+            persons_core=[],
+            person_gender="male",
+        )
+        full = SimpleNamespace(
+            normalized="Иван Иванов",
+            tokens=["Иван", "Иванов"],
+            persons_core=[],
+            person_gender=None,
+        )
+
+        assert compare_results(fast, fast) == []
+        assert compare_results(fast, full) == ["person_gender"]
+
+
+class TestFactoryCanonicalFastPath:
+    """Test NormalizationFactory with the canonical fast path enabled."""
+
+    @pytest.fixture
+    def factory(self):
+        factory = NormalizationFactory()
+        factory.canonical_fastpath = Mock()
+        factory.canonical_fastpath.match.return_value = (
+            ["Иванов", "Иван"],
+            ["surname", "given"],
+        )
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_full_pipeline(self, factory):
+        flags = FeatureFlags(enable_canonical_fastpath=True)
+        with patch.object(
+            factory, "_normalize_with_error_handling", new_callable=AsyncMock
+        ) as full:
+            result = await factory.normalize_text(
+                "Иванов Иван", NormalizationConfig(language="ru"), flags
+            )
+
+        full.assert_not_called()
+        assert result.success
+        assert result.normalized == "Иван Иванов"
+        assert [trace.rule for trace in result.trace] == [
+            "canonical_fastpath:surname",
+            "canonical_fastpath:given",
+        ]
+        assert factory.get_statistics()["canonical_fastpath"]["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_miss_uses_full_pipeline(self, factory):
+        factory.canonical_fastpath.match.return_value = None
+        flags = FeatureFlags(enable_canonical_fastpath=True)
+        with patch.object(
+            factory, "_normalize_with_error_handling", new_callable=AsyncMock
+        ) as full:
+            full.return_value = factory._build_empty_result("Иванова Ивана", "ru")
+            await factory.normalize_text(
+                "Иванова Ивана", NormalizationConfig(language="ru"), flags
+            )
+
+        full.assert_called_once()
+        stats = factory.get_statistics()["canonical_fastpath"]
+        assert (
+            stats["attempts"] == 1 and stats["hits"] == 0 and stats["hit_rate"] == 0.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_parity_mode_returns_full_result_and_counts_mismatches(self, factory):
+        flags = FeatureFlags(
+            enable_canonical_fastpath=True, canonical_fastpath_parity=True
+        )
+        full_result = factory._build_empty_result("Иванов Иван", "ru")
+        with patch.object(
+            factory, "_normalize_with_error_handling", new_callable=AsyncMock
+        ) as full:
+            full.return_value = full_result
+            result = await factory.normalize_text(
+                "Иванов Иван", NormalizationConfig(language="ru"), flags
+            )
+
+        full.assert_called_once()
+        assert result is full_result
+        stats = factory.get_statistics()["canonical_fastpath"]
+        assert stats["parity_checks"] == 1 and stats["parity_mismatches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, factory):
+        with patch.object(
+            factory, "_normalize_with_error_handling", new_callable=AsyncMock
+        ) as full:
+            full.return_value = factory._build_empty_result("Иванов Иван", "ru")
+            await factory.normalize_text(
+                "Иванов Иван", NormalizationConfig(language="ru"), FeatureFlags()
+            )
+
+        factory.canonical_fastpath.match.assert_not_called()
+        full.assert_called_once()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the precompiled lexicon bundle.
+"""
+
+import pytest
+
+from src.ai_service.layers.normalization import lexicon_bundle
+from src.ai_service.layers.normalization.lexicon_bundle import (
+    KIND_LIST,
+    KIND_MAP,
+    KIND_SET,
+    LexiconBundle,
+    build_lexicon_bundle,
+    collect_lexicons,
+)
+from src.ai_service.layers.normalization.lexicon_loader import load_lexicons
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return collect_lexicons()
+
+
+@pytest.fixture(scope="module")
+def bundle_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bundle") / "lexicons.bin"
+    build_lexicon_bundle(str(path))
+    return path
+
+
+@pytest.fixture
+def bundle(bundle_path):
+    bundle = LexiconBundle.open(str(bundle_path))
+    yield bundle
+    bundle.close()
+
+
+class TestLexiconBundle:
+    """Test building and reading the bundle."""
+
+    def test_bundle_matches_sources(self, bundle, sources):
+        assert bundle.namespaces() == {ns: kind for ns, (kind, _) in sources.items()}
+        for namespace, (kind, data) in sources.items():
+            if kind == KIND_SET:
+                view = bundle.get_set(namespace)
+                assert set(view) == set(data) and len(view) == len(data)
+                assert all(item in view for item in data)
+            elif kind == KIND_MAP:
+                assert dict(bundle.get_map(namespace)) == data
+            else:
+                assert all(
+                    bundle.get_list(namespace, key) == list(values)
+                    for key, values in data.items()
+                )
+
+    def test_bundle_without_ranges_still_iterates(self, bundle, sources):
+        # Bundles built before namespace ranges were recorded scan all records
+        bundle._records = dict.fromkeys(bundle._records)
+        assert set(bundle.get_set("stopwords:ru")) == set(sources["stopwords:ru"][1])
+        assert dict(bundle.get_map("diminutives:uk")) == sources["diminutives:uk"][1]
+
+    def test_build_stats(self, tmp_path):
+        stats = build_lexicon_bundle(str(tmp_path / "lexicons.bin"))
+        assert stats["entries"] > 0
+        assert 0 <= stats["took_s"] < 60
+
+    def test_lookups(self, bundle):
+        diminutives = bundle.get_map("diminutives:ru")
+        assert diminutives["вова"] == "владимир"
+        assert diminutives.get("нет-такого") is None
+        assert "нет-такого" not in bundle.get_set("stopwords:ru")
+        assert "вова" in bundle.get_list("diminutive_forms:ru", "владимир")
+        assert "владимир" not in bundle.get_list("diminutive_forms:ru", "владимир")
+
+    def test_unknown_namespace_is_empty(self, bundle):
+        assert bundle.get_set("missing") == frozenset()
+        assert bundle.get_map("missing") == {}
+        assert bundle.get_list("missing", "x") == []
+
+    def test_set_operations_return_plain_sets(self, bundle):
+        merged = bundle.get_set("stopwords:en") | {"extra"}
+        assert isinstance(merged, frozenset) and "extra" in merged
+
+    def test_load_prefers_current_bundle(self, bundle_path):
+        loaded = LexiconBundle.load(str(bundle_path))
+        assert loaded.is_mmap
+        loaded.close()
+
+    def test_load_falls_back_to_sources(self, tmp_path, bundle_path, monkeypatch):
+        assert not LexiconBundle.load(str(tmp_path / "missing.bin")).is_mmap
+
+        monkeypatch.setattr(
+            lexicon_bundle, "source_fingerprint", lambda root=None: "changed"
+        )
+        stale = LexiconBundle.load(str(bundle_path))
+        assert not stale.is_mmap
+        assert "вова" in stale.get_map("diminutives:ru")
+
+    def test_rejects_other_tables(self, tmp_path):
+        from src.ai_service.utils.mmap_hash import write_hash_table
+
+        path = tmp_path / "other.bin"
+        write_hash_table(str(path), [(b"k", b"v")], {"kind": "morphology"})
+        with pytest.raises(ValueError):
+            LexiconBundle.open(str(path))
+
+
+class TestLexiconLoaderFromBundle:
+    """Test that lexicon_loader serves the same data from the bundle."""
+
+    def test_same_as_parsing_files(self, bundle, monkeypatch):
+        monkeypatch.setattr(lexicon_bundle, "_bundle", bundle)
+        from_bundle = load_lexicons()
+        from_files = load_lexicons(use_bundle=False)
+
+        assert from_bundle == from_files
+        assert isinstance(from_bundle.stopwords["ru"], set)
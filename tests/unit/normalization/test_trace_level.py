@@ -0,0 +1,83 @@
+"""
+Unit tests for trace levels in normalization.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.ai_service.layers.normalization.processors.normalization_factory import (
+    NormalizationConfig,
+    NormalizationFactory,
+)
+from src.ai_service.utils.feature_flags import FeatureFlags, TraceLevel, get_trace_level
+from src.ai_service.utils.trace import DeferredTraceList
+
+
+class TestTraceLevelFlag:
+    """Test resolving the trace level from feature flags."""
+
+    def test_defaults_to_full(self):
+        assert get_trace_level(FeatureFlags()) == TraceLevel.FULL
+        assert get_trace_level(None) == TraceLevel.FULL
+
+    def test_reads_flags_and_manager(self):
+        flags = FeatureFlags(trace_level="summary")
+
+        assert get_trace_level(flags) == TraceLevel.SUMMARY
+        assert get_trace_level(SimpleNamespace(_flags=flags)) == TraceLevel.SUMMARY
+        assert flags.to_dict()["trace_level"] == "summary"
+
+    def test_invalid_value_falls_back_to_full(self):
+        assert (
+            get_trace_level(SimpleNamespace(trace_level="verbose")) == TraceLevel.FULL
+        )
+
+
+class TestDeferredTraceList:
+    """Test DeferredTraceList."""
+
+    def test_formats_only_when_enabled(self):
+        enabled = DeferredTraceList(True)
+        disabled = DeferredTraceList(False)
+        for traces in (enabled, disabled):
+            traces.add("Morphology normalization: '{}' -> '{}'", "Ивана", "Иван")
+            traces.add("plain")
+
+        assert enabled == ["Morphology normalization: 'Ивана' -> 'Иван'", "plain"]
+        assert disabled == []
+
+
+class TestFactoryTraceLevel:
+    """Test that summary traces keep output and drop trace strings."""
+
+    @pytest.fixture(scope="class")
+    def factory(self):
+        return NormalizationFactory()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("level", ["off", "summary"])
+    async def test_reduced_trace_keeps_output(self, factory, level):
+        text = "Петрова Ивана Сергеевича"
+        full = await factory.normalize_text(
+            text, NormalizationConfig(language="ru"), FeatureFlags()
+        )
+        reduced = await factory.normalize_text(
+            text, NormalizationConfig(language="ru"), FeatureFlags(trace_level=level)
+        )
+
+        assert reduced.normalized == full.normalized
+        assert reduced.tokens == full.tokens
+        assert [(t.token, t.role, t.output) for t in reduced.trace] == [
+            (t.token, t.role, t.output) for t in full.trace
+        ]
+        assert all(not t.notes for t in reduced.trace)
+
+    @pytest.mark.asyncio
+    async def test_debug_tracing_forces_full(self, factory):
+        config = NormalizationConfig(language="ru", debug_tracing=True)
+        await factory.normalize_text(
+            "Иван Петров", config, FeatureFlags(trace_level="off")
+        )
+
+        assert config.trace_level == TraceLevel.FULL
@@ -0,0 +1,190 @@
+"""
+Unit tests for the memory-mapped sanctioned ID index.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.ai_service.layers.search import sanctioned_id_index as sid
+from src.ai_service.layers.search.sanctioned_id_index import (
+    SanctionedIDIndex,
+    build_index,
+    clear_sanctioned_id_index,
+    entries_from_inn_cache,
+    index_id_type,
+    iter_record_ids,
+    load_sanctioned_id_index,
+    normalize_id_value,
+    write_index,
+)
+from src.ai_service.layers.search.sanctioned_inn_cache import SanctionedINNCache
+
+PERSON = {
+    "name": "Петренко Іван",
+    "type": "person",
+    "source": "sanctioned_persons",
+    "itn": "1234567890",
+    "passport": "АА 123456",
+}
+COMPANY = {
+    "name": "Acme Holdings",
+    "type": "organization",
+    "source": "sanctioned_companies",
+    "tax_number": "7707083893",
+    "reg_number": "1027700132195",
+    "ein": "12-3456789",
+    "iban": "DE89 3704 0044 0532 0130 00",
+}
+
+INN_CACHE = {
+    "1234567890": {"inn": "1234567890", "name": "Петренко Іван", "type": "person"},
+    "7707083893": {
+        "inn": "7707083893",
+        "name": "Acme Holdings",
+        "type": "organization",
+    },
+}
+
+
+def entries():
+    return [
+        (id_type, value, record)
+        for record in (PERSON, COMPANY)
+        for id_type, value in iter_record_ids(record)
+    ]
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    return write_index(entries(), tmp_path / "ids.idx")
+
+
+@pytest.fixture
+def inn_cache_file(tmp_path):
+    path = tmp_path / "sanctioned_inns_cache.json"
+    path.write_text(json.dumps(INN_CACHE, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestSanctionedIDIndex:
+    """Test building, mapping and querying the index."""
+
+    def test_normalize_id_value(self):
+        assert normalize_id_value("аа 123456") == "АА123456"
+        assert normalize_id_value(" 12-3456789 ") == "123456789"
+        assert normalize_id_value(7707083893) == "7707083893"
+
+    def test_roundtrip_all_id_types(self, index_file):
+        index = SanctionedIDIndex.open(index_file)
+        assert len(index) == 6
+        assert index.find("1234567890") == ("inn", PERSON)
+        assert index.find("АА123456") == ("passport", PERSON)
+        assert index.find("1027700132195") == ("ogrn", COMPANY)
+        assert index.find("DE89370400440532013000") == ("iban", COMPANY)
+        assert index.meta["id_types"]["inn"] == 2
+        assert index.meta["entity_types"] == {"person": 1, "organization": 1}
+        index.close()
+
+    def test_raw_values_match(self, index_file):
+        index = SanctionedIDIndex.open(index_file)
+        assert index.lookup("аа 123456") == PERSON
+        assert index.lookup("123456789") == COMPANY
+        assert "DE89 3704 0044 0532 0130 00" in index
+        assert "0000000000" not in index
+        assert index.lookup("") is None
+        index.close()
+
+    def test_id_type_filter_and_shared_values(self):
+        other = {"name": "Other", "type": "person"}
+        index = SanctionedIDIndex(
+            build_index(
+                [("inn", "1234567890", PERSON), ("passport", "1234567890", other)]
+            )
+        )
+        assert index.find("1234567890", "passport") == ("passport", other)
+        assert index.find("1234567890", "inn") == ("inn", PERSON)
+        assert index.find("1234567890", "ogrn") is None
+        assert index.meta["records"] == 2
+
+    def test_extractor_types_mapped(self):
+        index = SanctionedIDIndex(build_index([("inn", "1234567890", PERSON)]))
+        assert index.find("1234567890", index_id_type("inn_ua")) == ("inn", PERSON)
+        assert index.find("1234567890", index_id_type("passport_ua")) is None
+        assert index.find("1234567890", index_id_type("ssn")) is None
+        assert index_id_type("VAT_EU") == "vat"
+
+    def test_first_record_wins_and_records_deduplicated(self):
+        index = SanctionedIDIndex(
+            build_index(entries() + [("inn", "1234567890", COMPANY)])
+        )
+        assert index.lookup("1234567890") == PERSON
+        assert index.meta["records"] == 2
+
+    def test_hash_collision_checks_key(self, monkeypatch):
+        monkeypatch.setattr(sid, "_key_hash", lambda key: 42)
+        index = SanctionedIDIndex(build_index(entries()))
+        assert index.find("АА123456") == ("passport", PERSON)
+        assert index.find("7707083893") == ("inn", COMPANY)
+        assert index.find("999") is None
+
+    def test_rejects_foreign_file(self):
+        with pytest.raises(ValueError):
+            SanctionedIDIndex(b"\x00" * 64)
+
+
+class TestLoadSanctionedIDIndex:
+    """Test opening and rebuilding the index file."""
+
+    def test_builds_missing_index_from_inn_cache(self, tmp_path, inn_cache_file):
+        index_file = tmp_path / "ids.idx"
+        index = load_sanctioned_id_index(index_file, inn_cache_file)
+        assert index_file.exists()
+        assert index.find("7707083893") == ("inn", INN_CACHE["7707083893"])
+
+    def test_rebuilds_stale_index(self, index_file, inn_cache_file):
+        old = os.stat(inn_cache_file).st_mtime - 10
+        os.utime(index_file, (old, old))
+        index = load_sanctioned_id_index(index_file, inn_cache_file)
+        assert len(index) == len(INN_CACHE)
+        assert "АА123456" not in index
+
+    def test_opens_fresh_index_without_json(self, index_file, tmp_path):
+        index = load_sanctioned_id_index(index_file, tmp_path / "missing.json")
+        assert index.find("АА123456") == ("passport", PERSON)
+
+    def test_missing_files(self, tmp_path):
+        assert (
+            load_sanctioned_id_index(tmp_path / "ids.idx", tmp_path / "missing.json")
+            is None
+        )
+
+    def test_inn_cache_entries_default_to_inn(self):
+        assert [e[:2] for e in entries_from_inn_cache(INN_CACHE)] == [
+            ("inn", "1234567890"),
+            ("inn", "7707083893"),
+        ]
+
+
+class TestSanctionedINNCacheIndex:
+    """Test the INN cache served from the index."""
+
+    @pytest.fixture
+    def inn_cache(self, monkeypatch, index_file):
+        monkeypatch.setenv(sid.INDEX_PATH_ENV, str(index_file))
+        monkeypatch.setattr(
+            sid, "DEFAULT_INN_CACHE_FILE", index_file.parent / "missing.json"
+        )
+        clear_sanctioned_id_index()
+        yield SanctionedINNCache()
+        clear_sanctioned_id_index()
+
+    def test_lookup_through_index(self, inn_cache):
+        assert inn_cache.load_cache()
+        assert inn_cache.stats["total_inns"] == 6
+        assert inn_cache.get_sanctioned_person("1234567890") == PERSON
+        assert inn_cache.get_sanctioned_organization("1234567890") is None
+        assert inn_cache.find("12-3456789") == ("ein", COMPANY)
+        assert inn_cache.lookup("АА123456", "inn") is None
+        assert inn_cache.get_stats()["hits"] == 3
@@ -0,0 +1,117 @@
+"""
+Unit tests for sparse (inverted index) retrieval mode of CharTfidfVectorIndex.
+"""
+
+import tempfile
+
+import pytest
+
+from src.ai_service.layers.embeddings.indexing.enhanced_vector_index_service import (
+    EnhancedVectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.vector_index_service import (
+    CharTfidfVectorIndex,
+    VectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.watchlist_index_service import (
+    WatchlistIndexService,
+)
+
+DOCS = [
+    ("1", "Ivan Petrov"),
+    ("2", "Иван Петров"),
+    ("3", "Anna Smith"),
+    ("4", "Petrova Anna"),
+    ("5", "ООО Ромашка"),
+    ("6", "John Smyth"),
+]
+
+
+class TestSparseRetrievalMode:
+    """Test sparse char n-gram retrieval."""
+
+    def setup_method(self):
+        self.sparse = CharTfidfVectorIndex(VectorIndexConfig(retrieval_mode="sparse"))
+        self.sparse.rebuild(DOCS)
+        self.dense = CharTfidfVectorIndex(
+            VectorIndexConfig(use_svd=False, use_faiss=False)
+        )
+        self.dense.rebuild(DOCS)
+
+    def test_no_dense_materialization(self):
+        """Sparse mode keeps only the inverted index."""
+        assert self.sparse.X_vec is None
+        assert self.sparse.svd is None
+        assert self.sparse.faiss_index is None
+        assert self.sparse.postings is not None
+        assert self.sparse.postings.shape[1] == len(DOCS)
+
+    @pytest.mark.parametrize(
+        "query", ["Ivan Petrov", "Anna Smith", "Петров", "Smyth John"]
+    )
+    def test_scores_match_dense_tfidf(self, query):
+        """Sparse dot product equals cosine over densified TF-IDF for matching docs."""
+        dense = {
+            doc_id: score
+            for doc_id, score in self.dense.search(query, top_k=len(DOCS))
+            if score > 0
+        }
+        sparse = dict(self.sparse.search(query, top_k=len(DOCS)))
+
+        assert sparse.keys() == dense.keys()
+        for doc_id, score in sparse.items():
+            assert score == pytest.approx(dense[doc_id], abs=1e-5)
+
+    def test_top_k_ordering(self):
+        """Results are ordered by score and truncated to top_k."""
+        results = self.sparse.search("Anna Petrova", top_k=2)
+
+        assert len(results) == 2
+        assert results[0][0] == "4"
+        assert results[0][1] >= results[1][1]
+
+    def test_unknown_ngrams_return_empty(self):
+        """Query without any indexed n-gram returns no hits."""
+        assert self.sparse.search("zzzqqq", top_k=5) == []
+
+    def test_empty_rebuild_clears_state(self):
+        """Rebuilding with no docs clears the inverted index."""
+        self.sparse.rebuild([])
+
+        assert self.sparse.postings is None
+        assert self.sparse.search("Ivan", top_k=5) == []
+
+
+class TestWatchlistSparseMode:
+    """Test sparse mode through WatchlistIndexService."""
+
+    def setup_method(self):
+        cfg = EnhancedVectorIndexConfig(
+            retrieval_mode="sparse", use_semantic_embeddings=False
+        )
+        self.service = WatchlistIndexService(cfg)
+        self.service.build_from_corpus(
+            [(doc_id, text, "person", {}) for doc_id, text in DOCS]
+        )
+
+    def test_search_uses_sparse_index(self):
+        """WatchlistIndexService.search serves results from the sparse index."""
+        results = self.service.search("Anna Smith", top_k=3)
+
+        assert results[0][0] == "3"
+        assert self.service.status()["retrieval_mode"] == "sparse"
+
+    def test_snapshot_roundtrip(self):
+        """Sparse postings survive save/reload."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.save_snapshot(tmp)
+            cfg = EnhancedVectorIndexConfig(
+                retrieval_mode="sparse", use_semantic_embeddings=False
+            )
+            restored = WatchlistIndexService(cfg)
+            info = restored.reload_snapshot(tmp)
+
+            assert info["active_loaded"] is True
+            assert restored.search("Anna Smith", top_k=3) == self.service.search(
+                "Anna Smith", top_k=3
+            )
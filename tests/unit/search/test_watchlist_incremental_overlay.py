@@ -0,0 +1,195 @@
+"""
+Unit tests for incremental overlay updates and compaction in WatchlistIndexService.
+"""
+
+import pytest
+
+from src.ai_service.layers.embeddings.indexing.enhanced_vector_index_service import (
+    EnhancedVectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.vector_index_service import (
+    CharTfidfVectorIndex,
+    VectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.watchlist_index_service import (
+    WatchlistIndexService,
+)
+
+CORPUS = [
+    ("p1", "Ivan Petrov", "person", {}),
+    ("p2", "Иван Петров", "person", {}),
+    ("p3", "Anna Smith", "person", {}),
+    ("p4", "Petrova Anna", "person", {}),
+    ("o1", "ООО Ромашка", "org", {}),
+    ("p5", "John Smyth", "person", {}),
+]
+
+
+def _service(mode="dense", **kwargs):
+    cfg = EnhancedVectorIndexConfig(
+        retrieval_mode=mode, use_semantic_embeddings=False, svd_dim=4, **kwargs
+    )
+    service = WatchlistIndexService(cfg)
+    service.build_from_corpus(CORPUS)
+    return service
+
+
+class TestCharIndexAppend:
+    """Test append/remove on CharTfidfVectorIndex."""
+
+    @pytest.mark.parametrize("mode", ["dense", "sparse"])
+    def test_append_uses_frozen_vectorizer(self, mode):
+        base = CharTfidfVectorIndex(VectorIndexConfig(retrieval_mode=mode, svd_dim=4))
+        base.rebuild([(d, t) for d, t, _, _ in CORPUS])
+        vocab = dict(base.vectorizer.vocabulary_)
+
+        overlay = base.frozen_copy()
+        overlay.append([("n1", "Anna Smith"), ("n2", "Ivan Petrov")])
+
+        assert overlay.vectorizer is base.vectorizer
+        assert base.vectorizer.vocabulary_ == vocab
+        assert overlay.search("Anna Smith", top_k=1)[0][0] == "n1"
+        assert base.search("Anna Smith", top_k=1)[0][0] == "p3"
+
+    @pytest.mark.parametrize("mode", ["dense", "sparse"])
+    def test_remove_and_supersede(self, mode):
+        idx = CharTfidfVectorIndex(VectorIndexConfig(retrieval_mode=mode, svd_dim=4))
+        idx.rebuild([(d, t) for d, t, _, _ in CORPUS])
+
+        idx.append([("p3", "John Smyth")])
+        assert idx.remove(["p1", "missing"]) == 1
+
+        ids = [doc_id for doc_id, _ in idx.search("Ivan Petrov", top_k=10)]
+        assert "p1" not in ids
+        assert idx.search("John Smyth", top_k=2)[0][0] in {"p3", "p5"}
+        assert [doc_id for doc_id, _ in idx.search("Anna Smith", top_k=10)].count(
+            "p3"
+        ) <= 1
+        assert idx.live_count == len(CORPUS) - 1
+
+    def test_append_requires_fitted_index(self):
+        with pytest.raises(RuntimeError):
+            CharTfidfVectorIndex().append([("x", "text")])
+
+
+class TestWatchlistIncrementalOverlay:
+    """Test upsert/remove/compaction through WatchlistIndexService."""
+
+    @pytest.mark.parametrize("mode", ["dense", "sparse"])
+    def test_upsert_is_searchable_without_refit(self, mode):
+        service = _service(mode)
+        vectorizer = service._active.vectorizer
+
+        result = service.upsert_docs(
+            [("n1", "Anna Smithson", "person", {"list": "urgent"})]
+        )
+
+        assert result["upserted"] == 1
+        assert service._active.vectorizer is vectorizer
+        assert service._overlay.vectorizer is vectorizer
+        assert "n1" in [
+            doc_id for doc_id, _ in service.search("Anna Smithson", top_k=3)
+        ]
+        assert service.get_doc("n1").metadata == {"list": "urgent"}
+
+    def test_upsert_shadows_active_doc(self):
+        service = _service("sparse")
+
+        service.upsert_docs([("p3", "Ivan Petrov", "person", {})])
+
+        assert "p3" not in [
+            doc_id for doc_id, _ in service.search("Anna Smith", top_k=10)
+        ]
+        assert service.get_doc("p3").text == "Ivan Petrov"
+        assert service.status()["tombstones"] == 1
+
+    def test_remove_hides_active_and_overlay_docs(self):
+        service = _service("sparse")
+        service.upsert_docs([("n1", "Anna Smithson", "person", {})])
+
+        result = service.remove_docs(["p3", "n1", "missing"])
+
+        assert result["removed"] == 2
+        ids = [doc_id for doc_id, _ in service.search("Anna Smith", top_k=10)]
+        assert "p3" not in ids and "n1" not in ids
+        assert service.get_doc("p3") is None
+        assert service.get_doc("n1") is None
+
+    def test_compaction_folds_overlay(self):
+        service = _service("sparse")
+        service.upsert_docs([("n1", "Anna Smithson", "person", {})])
+        service.remove_docs(["p1"])
+
+        result = service.compact()
+
+        assert result["compacted"] is True
+        status = service.status()
+        assert status["generation"] == 1
+        assert status["overlay"]["count"] == 0
+        assert status["tombstones"] == 0
+        assert status["active"]["count"] == len(CORPUS)
+        assert service.get_doc("p1") is None
+        assert service.search("Anna Smithson", top_k=1)[0][0] == "n1"
+
+    def test_updates_during_compaction_are_replayed(self):
+        service = _service("sparse")
+        original_rebuild = service._active.__class__.rebuild
+
+        def rebuild_with_concurrent_update(index, docs):
+            original_rebuild(index, docs)
+            service.upsert_docs([("n2", "Petrova Maria", "person", {})])
+            service.remove_docs(["p5"])
+
+        service._active.__class__.rebuild = rebuild_with_concurrent_update
+        try:
+            result = service.compact()
+        finally:
+            service._active.__class__.rebuild = original_rebuild
+
+        assert result["replayed"] == 2
+        assert service.get_doc("n2") is not None
+        assert service.get_doc("p5") is None
+        assert "n2" in [
+            doc_id for doc_id, _ in service.search("Petrova Maria", top_k=3)
+        ]
+
+    def test_search_uses_one_view_during_compaction(self):
+        service = _service("sparse")
+        service.upsert_docs(
+            [("n1", "Anna Smithson", "person", {}), ("p3", "Ivan Petrov", "person", {})]
+        )
+        old_active = service._active
+        original_search = old_active.search
+
+        def search_while_compacting(query, top_k):
+            service.compact()
+            return original_search(query, top_k=top_k)
+
+        old_active.search = search_while_compacting
+        ids = [doc_id for doc_id, _ in service.search("Anna Smith", top_k=10)]
+
+        assert service.status()["generation"] == 1
+        assert "n1" in ids
+        # Tombstones are those of the view the overlay was searched in
+        assert "p3" not in ids
+
+    def test_background_compaction_on_threshold(self):
+        service = _service("sparse", overlay_compaction_threshold=2)
+
+        service.upsert_docs([("n1", "Anna Smithson", "person", {})])
+        assert service.status()["generation"] == 0
+        service.upsert_docs([("n2", "Petrova Maria", "person", {})])
+
+        assert service.wait_for_compaction(timeout=30)
+        assert service.status()["generation"] == 1
+        assert service.status()["active"]["count"] == len(CORPUS) + 2
+
+    def test_upsert_without_active_index_builds_overlay(self):
+        service = WatchlistIndexService(
+            EnhancedVectorIndexConfig(use_semantic_embeddings=False)
+        )
+
+        service.upsert_docs([("n1", "Anna Smith", "person", {})])
+
+        assert service.get_doc("n1") is not None
+        assert service.status()["overlay"]["count"] == 1
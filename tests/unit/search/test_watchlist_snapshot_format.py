@@ -0,0 +1,223 @@
+"""
+Unit tests for the binary WatchlistIndexService snapshot format.
+"""
+
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.ai_service.layers.embeddings.indexing.enhanced_vector_index_service import (
+    EnhancedVectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.snapshot_format import (
+    GENERATION_PREFIX,
+    MANIFEST_FILE,
+    SNAPSHOT_VERSION,
+    LazyRecordStore,
+    SortedStringIndex,
+    StringPool,
+    read_manifest,
+    write_record_store,
+    write_sorted_index,
+    write_string_pool,
+)
+from src.ai_service.layers.embeddings.indexing.watchlist_index_service import (
+    WatchlistIndexService,
+)
+
+CORPUS = [
+    ("p1", "Ivan Petrov", "person", {"dob": "1980-01-01"}),
+    ("p2", "Иван Петров", "person", {}),
+    ("p3", "Anna Smith", "person", {"country": "GB"}),
+    ("p4", "Petrova Anna", "person", {}),
+    ("o1", "ООО Ромашка", "org", {"inn": "7701234567"}),
+    ("p5", "John Smyth", "person", {}),
+]
+
+
+def _service(mode="dense"):
+    cfg = EnhancedVectorIndexConfig(
+        retrieval_mode=mode, use_semantic_embeddings=False, svd_dim=4
+    )
+    return WatchlistIndexService(cfg)
+
+
+class TestStringStructures:
+    """Test memory-mapped string pool primitives."""
+
+    def test_string_pool_roundtrip(self, tmp_path):
+        values = ["alpha", "", "бета", "γ"]
+        write_string_pool(str(tmp_path / "pool"), values)
+
+        pool = StringPool(str(tmp_path / "pool"))
+        assert len(pool) == 4
+        assert list(pool) == values
+        assert pool[2] == "бета"
+        assert pool[-1] == "γ"
+        assert pool[1:3] == ["", "бета"]
+        with pytest.raises(IndexError):
+            pool[4]
+
+    def test_sorted_index_lookup(self, tmp_path):
+        items = {"zeta": 3, "alpha": 0, "петр": 7, "ab": 5}
+        write_sorted_index(str(tmp_path / "idx"), items.items())
+
+        index = SortedStringIndex(str(tmp_path / "idx"))
+        assert len(index) == 4
+        for key, value in items.items():
+            assert index[key] == value
+        assert "missing" not in index
+        with pytest.raises(KeyError):
+            index["missing"]
+
+    def test_record_store_decodes_lazily(self, tmp_path):
+        write_record_store(str(tmp_path / "docs"), [("b", {"v": 2}), ("a", {"v": 1})])
+        calls = []
+
+        def factory(key, record):
+            calls.append(key)
+            return record["v"]
+
+        store = LazyRecordStore(str(tmp_path / "docs"), factory)
+        assert len(store) == 2
+        assert calls == []
+        assert store["a"] == 1
+        assert store["a"] == 1
+        assert calls == ["a"]
+        assert store.get("zzz") is None
+
+
+class TestBinarySnapshot:
+    """Test save/reload of binary snapshots."""
+
+    @pytest.mark.parametrize("mode", ["dense", "sparse"])
+    def test_roundtrip_matches_search(self, mode):
+        service = _service(mode)
+        service.build_from_corpus(CORPUS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = service.save_snapshot(tmp)
+            restored = _service(mode)
+            info = restored.reload_snapshot(tmp)
+
+            assert result["version"] == SNAPSHOT_VERSION
+            assert info["active_loaded"] is True
+            assert info["active_count"] == len(CORPUS)
+            for query in ["Anna Smith", "Петров", "Romashka"]:
+                expected = service.search(query, top_k=3)
+                actual = restored.search(query, top_k=3)
+                assert [doc_id for doc_id, _ in actual] == [
+                    doc_id for doc_id, _ in expected
+                ]
+                for (_, a), (_, b) in zip(actual, expected):
+                    assert a == pytest.approx(b, abs=1e-5)
+
+    def test_no_pickle_and_mmap_vectors(self):
+        service = _service("dense")
+        service.build_from_corpus(CORPUS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            service.save_snapshot(tmp)
+            files = [name for _, _, names in os.walk(tmp) for name in names]
+            assert not any(name.endswith(".pkl") for name in files)
+            assert "docs.json" not in files
+
+            restored = _service("dense")
+            restored.reload_snapshot(tmp)
+            assert isinstance(restored._active.X_vec, np.memmap)
+            assert restored._active.doc_ids[0] == "p1"
+
+    def test_metadata_loaded_per_doc(self):
+        service = _service("sparse")
+        service.build_from_corpus(CORPUS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            service.save_snapshot(tmp)
+            restored = _service("sparse")
+            restored.reload_snapshot(tmp)
+
+            assert isinstance(restored._docs, LazyRecordStore)
+            doc = restored.get_doc("o1")
+            assert doc.entity_type == "org"
+            assert doc.metadata == {"inn": "7701234567"}
+            assert restored.get_doc("missing") is None
+
+    def test_unsupported_version_is_reported(self):
+        service = _service("sparse")
+        service.build_from_corpus(CORPUS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            service.save_snapshot(tmp)
+            manifest_path = os.path.join(tmp, MANIFEST_FILE)
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            manifest["version"] = SNAPSHOT_VERSION + 1
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+
+            info = _service("sparse").reload_snapshot(tmp)
+            assert "error" in info
+            assert "Unsupported snapshot version" in info["error"]
+
+    def test_rewrite_commits_new_generation(self):
+        service = _service("sparse")
+        service.build_from_corpus(CORPUS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            service.save_snapshot(tmp)
+            first = read_manifest(tmp)["generation"]
+            service.build_from_corpus(CORPUS[:3])
+            service.save_snapshot(tmp)
+            second = read_manifest(tmp)["generation"]
+
+            generations = {
+                name for name in os.listdir(tmp) if name.startswith(GENERATION_PREFIX)
+            }
+            assert first != second
+            # The previous generation stays for loaders that read the old manifest
+            assert generations == {first, second}
+
+            service.save_snapshot(tmp)
+            assert first not in os.listdir(tmp)
+            info = _service("sparse").reload_snapshot(tmp)
+            assert info["active_count"] == 3
+
+    def test_legacy_snapshot_still_loads(self):
+        service = _service("dense")
+        service.build_from_corpus(CORPUS)
+        idx = service._active
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "vectorizer.pkl"), "wb") as f:
+                pickle.dump(idx.vectorizer, f)
+            with open(os.path.join(tmp, "svd.pkl"), "wb") as f:
+                pickle.dump(idx.svd, f)
+            with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "doc_ids": idx.doc_ids,
+                        "doc_texts": idx.doc_texts,
+                        "index_config": {},
+                    },
+                    f,
+                )
+            np.save(os.path.join(tmp, "X_vec.npy"), idx.X_vec)
+            with open(os.path.join(tmp, "docs.json"), "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        d: {"text": t, "entity_type": e, "metadata": m}
+                        for d, t, e, m in CORPUS
+                    },
+                    f,
+                )
+
+            restored = _service("dense")
+            info = restored.reload_snapshot(tmp)
+
+            assert info["active_loaded"] is True
+            assert restored.search("Anna Smith", top_k=1)[0][0] == "p3"
+            assert restored.get_doc("p1").metadata == {"dob": "1980-01-01"}
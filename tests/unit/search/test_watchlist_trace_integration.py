@@ -237,6 +237,7 @@ class TestWatchlistTraceIntegration:
     def test_reload_snapshot_with_exception(self):
         """Test reload_snapshot with exception handling."""
         with patch('os.path.exists', return_value=True), \
+             patch('src.ai_service.layers.embeddings.indexing.watchlist_index_service.read_manifest', return_value=None), \
              patch.object(self.service, '_load_char_index', side_effect=Exception("Load failed")):
             
             result = self.service.reload_snapshot("/test/path", trace=self.trace)
@@ -0,0 +1,157 @@
+"""
+Unit tests for the single-scan identifier extractor.
+"""
+
+import pytest
+
+from src.ai_service.data.patterns.identifiers import (
+    IDENTIFIER_PATTERNS,
+    get_compiled_patterns_cached,
+    get_validation_function,
+    normalize_identifier,
+    validate_identifiers,
+)
+from src.ai_service.layers.signals.extractors.identifier_extractor import (
+    IdentifierExtractor,
+    pattern_keywords,
+    scan_identifiers,
+)
+
+TEXTS = [
+    "Іван Петренко ІПН 1234567890, паспорт АА123456, ЄДРПОУ 12345678",
+    "ООО Ромашка ИНН 7707083893 ОГРН 1027700132195 IBAN DE89 3704 0044 0532 0130 00 SWIFT: DEUTDEFF",
+    "Payment to John Smith SSN 123-45-6789 EIN 12-3456789 LEI 5493001KJTIIGC8Y1R12 TIN 123456789",
+    "серия AB номер 123456 passport id card 123456789 документ",
+    "bic deutdeff",
+    "Оплата за послуги згідно договору 15 від 01.02.2024 Іван Петренко",
+    "Іван Петренко",
+]
+
+
+def naive_extract(text, id_types):
+    """Per-pattern loop the extractor used to run for each category."""
+    found = []
+    for pattern, compiled_regex in get_compiled_patterns_cached():
+        if pattern.type not in id_types:
+            continue
+        for match in compiled_regex.finditer(text):
+            if (
+                pattern.type in ["passport_rf", "passport_ua"]
+                and len(match.groups()) > 1
+            ):
+                raw_value = "".join(g for g in match.groups() if g is not None)
+            else:
+                raw_value = match.group(1) if match.group(1) else match.group(0)
+            value = normalize_identifier(raw_value, pattern.type)
+            validator = get_validation_function(pattern.type)
+            is_valid = validator(value) if validator else True
+            found.append(
+                {
+                    "type": pattern.type,
+                    "value": value,
+                    "raw": match.group(0),
+                    "name": pattern.name,
+                    "confidence": 0.9 if is_valid else 0.6,
+                    "position": match.span(),
+                    "valid": is_valid,
+                }
+            )
+    unique, seen = [], set()
+    for id_info in found:
+        if id_info["value"] not in seen:
+            seen.add(id_info["value"])
+            unique.append(id_info)
+    return unique
+
+
+@pytest.fixture
+def extractor():
+    return IdentifierExtractor()
+
+
+class TestPatternKeywords:
+    """Test keyword gating of identifier patterns."""
+
+    def test_leading_keyword_group(self):
+        assert pattern_keywords(
+            r"\b(?:ИНН|inn|идентификационный\s+номер)[:\s]*(\d{10})\b"
+        ) == (
+            "инн",
+            "inn",
+            "идентификационный",
+        )
+
+    def test_lookahead_keyword_group(self):
+        assert pattern_keywords(r"\b(\d{8})\b(?=.*(?:ЄДРПОУ|edrpou))") == (
+            "єдрпоу",
+            "edrpou",
+        )
+
+    def test_leading_literal(self):
+        assert pattern_keywords(r"\bсерия\s+([А-ЯA-Z]{2})\s+номер\s+(\d{6})\b") == (
+            "серия",
+        )
+
+    def test_optional_group_always_runs(self):
+        assert (
+            pattern_keywords(r"\b(?:SSN|Social\s+Security\s+Number)?[:\s]*(\d{9})\b")
+            is None
+        )
+        assert pattern_keywords(r"\b([A-Z0-9]{18}[0-9]{2})\b") is None
+
+    def test_every_pattern_matched_text_contains_a_keyword(self):
+        for pattern in IDENTIFIER_PATTERNS:
+            keywords = pattern_keywords(pattern.pattern)
+            if keywords is None:
+                continue
+            for text in TEXTS:
+                if get_compiled_patterns_cached()[IDENTIFIER_PATTERNS.index(pattern)][
+                    1
+                ].search(text):
+                    assert any(k in text.lower() for k in keywords), (
+                        pattern.name,
+                        text,
+                    )
+
+
+class TestIdentifierExtractor:
+    """Test that one scan reproduces the per-category pattern loops."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_same_ids_as_per_pattern_loop(self, extractor, text):
+        assert extractor.extract_organization_ids(text) == naive_extract(
+            text, extractor._org_id_types
+        )
+        assert extractor.extract_person_ids(text) == naive_extract(
+            text, extractor._person_id_types
+        )
+
+    def test_scan_shared_between_categories(self, extractor):
+        text = TEXTS[1]
+        assert scan_identifiers(text) is scan_identifiers(text)
+
+    def test_text_without_digits_only_runs_swift(self):
+        assert [m.type for m in scan_identifiers("bic deutdeff")] == ["swift_bic"]
+        assert scan_identifiers("Іван Петренко") == ()
+
+    def test_extract_batch(self, extractor):
+        batch = extractor.extract_batch(TEXTS + ["", "   "])
+        assert batch[: len(TEXTS)] == [extractor.extract(text) for text in TEXTS]
+        assert batch[-1] == {"organization_ids": [], "person_ids": []}
+
+
+class TestValidateIdentifiers:
+    """Test batched checksum validation."""
+
+    def test_validates_each_distinct_value_once(self):
+        values = [
+            ("inn", "7707083893"),
+            ("inn", "7707083894"),
+            ("inn", "7707083893"),
+            ("passport_ua", "123"),
+        ]
+        assert validate_identifiers(values) == {
+            ("inn", "7707083893"): True,
+            ("inn", "7707083894"): False,
+            ("passport_ua", "123"): True,
+        }
@@ -0,0 +1,80 @@
+"""
+Unit tests for the sorted span index used by proximity linking.
+"""
+
+from src.ai_service.layers.signals.signals_service import PersonSignal, SignalsService
+from src.ai_service.layers.signals.span_index import SpanIndex, locate_spans
+
+
+class TestLocateSpans:
+    """Test locating person mentions."""
+
+    def test_first_case_insensitive_occurrence(self):
+        text = "Оплата ІВАН ПЕТРЕНКО, потім Іван Петренко"
+        assert locate_spans(text, ["Іван Петренко", "Коваль"]) == [(7, 20), None]
+
+    def test_repeated_phrases_share_span(self):
+        assert locate_spans("a John b john", ["john", "John"]) == [(2, 6), (2, 6)]
+
+    def test_length_changing_lowercase_falls_back_to_regex(self):
+        text = "İlker Yılmaz paid Anna"
+        assert locate_spans(text, ["Anna"]) == [(18, 22)]
+
+
+class TestSpanIndex:
+    """Test nearest-neighbour queries."""
+
+    def test_nearest_within_distance(self):
+        index = SpanIndex([(0, 10), None, (100, 110)])
+        assert index.nearest((90, 94)) == (2, 13)
+        assert index.nearest((20, 24)) == (0, 17)
+        assert index.nearest((50, 56), max_distance=40) is None
+        assert len(index) == 2
+
+    def test_ties_go_to_earliest_item(self):
+        index = SpanIndex([(100, 110), (0, 10), (0, 10)])
+        assert index.nearest((50, 60)) == (0, 50)
+        assert index.nearest((0, 4)) == (1, 3)
+
+    def test_first_located(self):
+        assert SpanIndex([None, (5, 9)]).first_located() == 1
+        assert SpanIndex([None]).first_located() is None
+
+
+class TestProximityLinking:
+    """Test SignalsService linking through the span index."""
+
+    def test_ids_and_birthdates_go_to_nearest_person(self):
+        service = SignalsService()
+        text = (
+            "Іван Петренко, 01.02.1980, ІПН 1234567890; оплата за договором поставки обладнання; "
+            "Олена Коваль, 03.04.1990, ІПН 0987654321"
+        )
+        persons = [
+            PersonSignal(core=["Іван", "Петренко"], full_name=""),
+            PersonSignal(core=["Олена", "Коваль"], full_name=""),
+        ]
+        ids = [
+            {
+                "type": "inn",
+                "value": value,
+                "raw": value,
+                "confidence": 0.9,
+                "valid": True,
+                "position": (text.index(value), text.index(value) + 10),
+            }
+            for value in ("0987654321", "1234567890")
+        ]
+        dates = [
+            {
+                "raw": raw,
+                "iso_format": iso,
+                "position": (text.index(raw), text.index(raw) + 10),
+            }
+            for raw, iso in (("01.02.1980", "1980-02-01"), ("03.04.1990", "1990-04-03"))
+        ]
+        service._link_ids_to_persons_by_proximity(persons, ids, text)
+        service._enrich_persons_with_birthdates(persons, dates, text)
+
+        assert [p.ids[0]["value"] for p in persons] == ["1234567890", "0987654321"]
+        assert [p.dob for p in persons] == ["1980-02-01", "1990-04-03"]
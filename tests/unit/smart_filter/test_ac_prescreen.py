@@ -0,0 +1,186 @@
+"""
+Unit tests for the local tier-0/1 AC pre-screen index.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ahocorasick")
+
+from src.ai_service.layers.smart_filter import ac_prescreen, smart_filter_service
+from src.ai_service.layers.smart_filter.ac_prescreen import (
+    ACPrescreenIndex,
+    clear_prescreen_index,
+    find_patterns_file,
+    get_prescreen_index,
+)
+from src.ai_service.layers.smart_filter.smart_filter_service import SmartFilterService
+
+PATTERNS = [
+    {
+        "pattern": "Іван Петров",
+        "tier": 0,
+        "type": "full_name",
+        "entity_type": "person",
+        "entity_id": "p1",
+        "confidence": 0.95,
+    },
+    {
+        "pattern": "петров іван",
+        "tier": 1,
+        "type": "name_reversed",
+        "entity_type": "person",
+        "entity_id": "p1",
+        "confidence": 0.8,
+    },
+    {
+        "pattern": "1234567890",
+        "tier": 0,
+        "type": "inn",
+        "entity_type": "person",
+        "entity_id": "p1",
+        "confidence": 1.0,
+    },
+    {
+        "pattern": "петров",
+        "tier": 2,
+        "type": "surname",
+        "entity_type": "person",
+        "entity_id": "p1",
+        "confidence": 0.5,
+    },
+]
+
+
+@pytest.fixture
+def patterns_file(tmp_path):
+    path = tmp_path / "ac_patterns_20250101_000000.json"
+    path.write_text(
+        json.dumps(
+            {"metadata": {"total_patterns": len(PATTERNS)}, "patterns": PATTERNS},
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def index():
+    return ACPrescreenIndex.build(PATTERNS)
+
+
+class TestACPrescreenIndex:
+    """Test building and searching the index."""
+
+    def test_keeps_only_tier0_and_tier1(self, index):
+        assert index.pattern_count == 3
+        assert index.search("петров") == []
+
+    def test_partial_input_does_not_match_longer_pattern(self, index):
+        # The former ES wildcard query matched patterns containing the input
+        assert index.search("Іван") == []
+        assert [m["pattern"] for m in index.search("Іван Петров")] == ["іван петров"]
+
+    def test_finds_patterns_on_word_boundaries(self, index):
+        text = "Оплата від Іван Петров, ІПН 1234567890"
+        matches = index.search(text)
+
+        assert {m["pattern"] for m in matches} == {"іван петров", "1234567890"}
+        name = next(m for m in matches if m["pattern_type"] == "full_name")
+        assert name["tier"] == "tier_0"
+        assert (
+            text[name["start"] : name["end"]] == name["matched_text"] == "Іван Петров"
+        )
+        assert name["entity_id"] == "p1"
+
+    def test_ignores_matches_inside_words(self, index):
+        assert index.search("Іван Петрова ІПН 12345678901") == []
+
+    def test_max_matches_and_ordering(self, index):
+        matches = index.search("петров іван 1234567890")
+        assert [m["tier"] for m in matches] == ["tier_0", "tier_1"]
+        assert (
+            index.search("петров іван 1234567890", max_matches=1)[0]["pattern"]
+            == "1234567890"
+        )
+
+    def test_from_file_streams_export(self, patterns_file):
+        index = ACPrescreenIndex.from_file(patterns_file)
+        assert index.pattern_count == 3
+        assert index.stats()["source"] == str(patterns_file)
+
+
+class TestPrescreenIndexLoading:
+    """Test locating the export and the process-wide index."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.delenv(ac_prescreen.PATTERNS_PATH_ENV, raising=False)
+        clear_prescreen_index()
+        yield
+        clear_prescreen_index()
+
+    def test_picks_newest_export(self, tmp_path, patterns_file):
+        newer = tmp_path / "ac_patterns_20250202_000000.json"
+        newer.write_text(patterns_file.read_text(encoding="utf-8"), encoding="utf-8")
+        assert find_patterns_file(tmp_path) == newer
+
+    def test_env_path_wins(self, tmp_path, patterns_file, monkeypatch):
+        monkeypatch.setenv(ac_prescreen.PATTERNS_PATH_ENV, str(patterns_file))
+        assert find_patterns_file(tmp_path / "elsewhere") == patterns_file
+
+    def test_unavailable_without_export(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ac_prescreen, "DEFAULT_PATTERNS_DIR", tmp_path)
+        assert get_prescreen_index() is None
+
+    def test_loaded_once(self, patterns_file, monkeypatch):
+        monkeypatch.setenv(ac_prescreen.PATTERNS_PATH_ENV, str(patterns_file))
+        assert get_prescreen_index() is get_prescreen_index()
+
+
+class TestSmartFilterUsesLocalIndex:
+    """Test that the smart filter's tier-0 check stays local."""
+
+    @pytest.fixture
+    def service(self, index, monkeypatch):
+        monkeypatch.setattr(smart_filter_service, "get_prescreen_index", lambda: index)
+        return SmartFilterService(enable_aho_corasick=True)
+
+    def test_search_does_not_touch_elasticsearch(self, service, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError(
+                "ES must not be queried when the local index is available"
+            )
+
+        monkeypatch.setattr(service, "_search_es_sync", fail)
+        result = service.search_aho_corasick("Іван Петров")
+
+        assert result["source"] == "local"
+        assert result["total_matches"] == 1
+        assert result["patterns_loaded"] == 3
+
+    def test_name_variants_checked_locally(self, service):
+        # Only the "Петров Іван" variant matches (tier-1 reversed form)
+        assert (
+            service.search_aho_corasick("Іван Сергійович Петров")["total_matches"] == 0
+        )
+        matches = service.find_ac_matches("Іван Сергійович Петров")
+        assert matches and matches[0]["pattern"] == "петров іван"
+
+    @pytest.mark.asyncio
+    async def test_async_falls_back_to_es_without_index(self, monkeypatch):
+        monkeypatch.setattr(smart_filter_service, "get_prescreen_index", lambda: None)
+        service = SmartFilterService(enable_aho_corasick=True)
+        calls = []
+
+        async def fake_es(text, max_matches):
+            calls.append(text)
+            return {"matches": [], "total_matches": 0, "enabled": True}
+
+        monkeypatch.setattr(service, "_search_es_async", fake_es)
+        assert await service.find_ac_matches_async("Іван Петров") == []
+        assert calls[0] == "Іван Петров"
+        # Inside the event loop the sync path must not block on ES
+        assert service.search_aho_corasick("Іван Петров")["total_matches"] == 0
@@ -0,0 +1,143 @@
+"""
+Unit tests for the compiled smart-filter detection engine.
+"""
+
+import re
+
+import pytest
+
+from src.ai_service.data.dicts.smart_filter_patterns import (
+    BANKING_TERMS,
+    COMPANY_KEYWORDS,
+    COMPANY_PATTERNS,
+    FINANCIAL_SERVICES_PATTERNS,
+    REGISTRATION_PATTERNS,
+    TERRORISM_FINANCING_PATTERNS,
+)
+from src.ai_service.layers.smart_filter.company_detector import CompanyDetector
+from src.ai_service.layers.smart_filter.detection_engine import (
+    BANKING_TERMS_FAMILY,
+    COMPANY_KEYWORDS_FAMILY,
+    FINANCIAL_SERVICES_FAMILY,
+    LEGAL_ENTITIES_FAMILY,
+    REGISTRATION_FAMILY,
+    DetectionEngine,
+    get_detection_engine,
+    literal_anchors,
+    payment_family,
+    terrorism_family,
+)
+from src.ai_service.layers.smart_filter.terrorism_detector import TerrorismDetector
+
+TEXTS = [
+    'Оплата ТОВ "Агросвіт" за договором 123, ЄДРПОУ 12345678, вул. Шевченка 5',
+    "Payment to Acme Bank LLC, wire transfer via SWIFT, credit card fee",
+    "Перевод ООО Ромашка, ИНН 7707083893, банковский счет, кредит",
+    "jihad fund support operation Phoenix",
+    "Іван Петренко",
+    "",
+]
+
+
+class TestLiteralAnchors:
+    """Test extraction of pattern anchors."""
+
+    def test_leading_literal_group(self):
+        assert literal_anchors(r"\b(?:Банк|bank)\s+\w+") == ("банк", "bank")
+
+    def test_escaped_literals(self):
+        assert literal_anchors(r"\b(?:вул\.|ул\.)\s*\w+") == ("вул.", "ул.")
+
+    def test_non_literal_leading_group(self):
+        assert literal_anchors(r"\b(?:\d{8}|\d{10})\b") is None
+        assert literal_anchors(r"(?:ооо|тов)?\s+\w+") is None
+        assert literal_anchors(r"\b[А-Я][а-я]+") is None
+
+
+class TestDetectionEngine:
+    """Test that one scan reproduces the per-keyword and per-pattern loops."""
+
+    @pytest.fixture
+    def engine(self):
+        return get_detection_engine()
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_patterns_match_findall(self, engine, text):
+        hits = engine.scan(text)
+        families = {
+            LEGAL_ENTITIES_FAMILY: COMPANY_PATTERNS["legal_entities"],
+            REGISTRATION_FAMILY: REGISTRATION_PATTERNS,
+            FINANCIAL_SERVICES_FAMILY: FINANCIAL_SERVICES_PATTERNS,
+            terrorism_family("financing"): TERRORISM_FINANCING_PATTERNS,
+        }
+        for family, patterns in families.items():
+            expected = [m for p in patterns for m in re.findall(p, text, re.IGNORECASE)]
+            assert hits.patterns(family) == expected, family
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_keywords_match_substring_loop(self, engine, text):
+        hits = engine.scan(text)
+        families = {
+            COMPANY_KEYWORDS_FAMILY: COMPANY_KEYWORDS,
+            BANKING_TERMS_FAMILY: BANKING_TERMS,
+        }
+        for family, by_language in families.items():
+            expected = [
+                k
+                for words in by_language.values()
+                for k in words
+                if k.lower() in text.lower()
+            ]
+            assert hits.keywords(family) == expected, family
+
+    def test_keywords_keep_family_order_and_duplicates(self):
+        engine = DetectionEngine(
+            {"a": ["Bank", "credit", "bank"], "b": ["", "bank"]}, {}
+        )
+        hits = engine.scan("CREDIT from the BANK")
+        assert hits.keywords("a") == ["Bank", "credit", "bank"]
+        assert hits.keywords("b") == ["", "bank"]
+        assert hits.keywords("missing") == []
+
+    def test_unanchored_and_case_sensitive_patterns_always_run(self):
+        engine = DetectionEngine(
+            {},
+            {
+                "anchored": ([r"\b(?:тов|ооо)\s+\w+"], True),
+                "digits": ([r"\b\d{8}\b"], True),
+                "caps": ([r"\b[A-Z][a-z]+\b"], False),
+            },
+        )
+        assert engine.pattern_count == 3
+        assert engine.anchored_pattern_count == 1
+        hits = engine.scan("Paid 12345678 to ТОВ Світ")
+        assert hits.patterns("anchored") == ["ТОВ Світ"]
+        assert hits.patterns("digits") == ["12345678"]
+        assert hits.patterns("caps") == ["Paid"]
+
+    def test_payment_triggers_indexed_per_language(self, engine):
+        hits = engine.scan("Оплата за услуги от Иванова")
+        assert "оплата" in [
+            k.lower() for k in hits.keywords(payment_family("ru", "context"))
+        ]
+
+
+class TestDetectorsShareScan:
+    """Test that detectors accept a precomputed scan."""
+
+    def test_company_detector_same_result_with_hits(self):
+        detector = CompanyDetector()
+        text = TEXTS[2]
+        hits = get_detection_engine().scan(text)
+        assert detector.detect_company_signals(
+            text, hits=hits
+        ) == detector.detect_company_signals(text)
+
+    def test_terrorism_detector_uses_hits(self):
+        detector = TerrorismDetector()
+        text = TEXTS[3]
+        hits = get_detection_engine().scan(text)
+        assert detector.detect_terrorism_signals(
+            text, hits=hits
+        ) == detector.detect_terrorism_signals(text)
+        assert detector._detect_financing_patterns(text, hits)["count"] > 0
@@ -287,3 +287,39 @@ class TestUnicodeService:
 
         # German text with umlauts must show normalization changes
         assert len(char_changes) > 0 or len(ascii_changes) > 0, "Umlaut normalization should produce changes"
+
+
+class TestCompiledNormalizationPlan:
+    """Compiled character maps keep the per-character semantics"""
+
+    def setup_method(self):
+        self.service = UnicodeService()
+
+    def test_homoglyphs_to_dominant_script(self):
+        # Latin-dominant: Cyrillic \u0430 / \u043e become Latin a / o
+        assert self.service._normalize_homoglyphs("Iv\u0430n Petr\u043ev") == ("Ivan Petrov", 2)
+        # Cyrillic-dominant: Latin a / o become Cyrillic
+        assert self.service._normalize_homoglyphs("\u0406вaн Петрo") == (
+            "\u0406в\u0430н Петр\u043e",
+            2,
+        )
+        # Equal counts: unchanged
+        assert self.service._normalize_homoglyphs("ab вг") == ("ab вг", 0)
+
+    def test_complex_characters_counted_per_occurrence(self):
+        result, replacements = self.service._replace_complex_characters("«Ёлка» — ёж")
+
+        assert result == '"елка" - еж'
+        assert replacements == 5
+
+    def test_ascii_folding_preserves_cyrillic(self):
+        result, changes = self.service._apply_ascii_folding("Müller Ïван Crème")
+
+        assert result == "Muller Iван Creme"
+        assert changes == 3
+
+    def test_final_cleanup_removes_invisible_and_control(self):
+        text = "  Ivan\u200b\x01   Petrov\u2063 😀 "
+
+        assert self.service._final_cleanup(text) == "Ivan Petrov 😀"
+        assert self.service._final_cleanup(text, aggressive=True) == "Ivan Petrov "
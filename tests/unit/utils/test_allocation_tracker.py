@@ -0,0 +1,125 @@
+"""
+Unit tests for per-layer allocation accounting and leak reports.
+"""
+
+import tracemalloc
+
+import pytest
+
+from src.ai_service.utils import allocation_tracker as at
+from src.ai_service.utils.allocation_tracker import (
+    AllocationTracker,
+    cache_sizes,
+    estimate_size,
+    register_cache,
+    track_layer_allocations,
+)
+from src.ai_service.utils.memory_aware_cache import memory_aware_lru_cache
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = AllocationTracker(sample_rate=1.0, snapshot_interval_s=0)
+    monkeypatch.setattr(at, "_tracker", tracker)
+    tracker.start()
+    yield tracker
+    tracker.stop()
+
+
+class TestLayerAccounting:
+    """Test sampled per-layer measurements."""
+
+    def test_layer_allocations_recorded(self, tracker):
+        token = tracker.begin_request()
+        try:
+            with track_layer_allocations("signals"):
+                kept = [bytearray(1000) for _ in range(100)]
+            with track_layer_allocations("decision"):
+                temporary = bytearray(500_000)
+                del temporary
+        finally:
+            tracker.end_request(token)
+
+        layers = {stats["layer"]: stats for stats in tracker.layer_report()}
+        assert layers["signals"]["samples"] == 1
+        assert layers["signals"]["avg_retained_bytes"] >= 100_000
+        assert layers["signals"]["avg_objects"] >= 100
+        assert layers["decision"]["max_peak_bytes"] >= 500_000
+        assert layers["decision"]["avg_retained_bytes"] < 100_000
+        assert tracker.layer_report()[0]["layer"] == "decision"
+        assert kept
+
+    def test_unsampled_request_not_measured(self, tracker):
+        tracker.sample_rate = 0.0
+        assert tracker.begin_request() is None
+        with track_layer_allocations("signals"):
+            pass
+        assert tracker.layer_report() == []
+
+    def test_disabled_tracker_is_noop(self):
+        tracker = AllocationTracker(sample_rate=1.0)
+        assert tracker.begin_request() is None
+        assert track_layer_allocations("search") is at._NOOP_LAYER
+
+
+class TestLeakReport:
+    """Test snapshot comparisons."""
+
+    def test_growth_since_baseline(self, tracker):
+        leaked = []
+        tracker.take_snapshot()
+        leaked.extend(bytearray(10_000) for _ in range(50))
+        report = tracker.leak_report(top=5)
+
+        growth = report["since_previous"]
+        assert growth["size_diff_bytes"] >= 500_000
+        assert "test_allocation_tracker.py" in growth["top"][0]["location"]
+        assert report["since_baseline"]["size_diff_bytes"] >= 500_000
+        assert len(report["history"]) == 3
+        assert leaked
+
+    def test_stop_only_stops_own_tracemalloc(self):
+        tracemalloc.start()
+        try:
+            tracker = AllocationTracker(snapshot_interval_s=0)
+            tracker.start()
+            tracker.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestCacheSizes:
+    """Test cache size accounting."""
+
+    def test_estimate_size(self):
+        entries, size = estimate_size(
+            {f"key{i}": "x" * 100 for i in range(1000)}, sample=10
+        )
+        assert entries == 1000
+        assert size > 100 * 1000
+        assert estimate_size(None) == (0, 0)
+
+    def test_registered_and_monitored_caches(self):
+        class Service:
+            def __init__(self):
+                self._cache = {str(i): "v" * 1000 for i in range(100)}
+
+        service = Service()
+        register_cache("test.service", service, "_cache")
+
+        @memory_aware_lru_cache(maxsize=10)
+        def cached_square(value):
+            return value * value
+
+        cached_square(3)
+        sizes = {item["name"]: item for item in cache_sizes()}
+        assert sizes["test.service"]["entries"] == 100
+        assert sizes["test.service"]["approx_bytes"] > 100_000
+        assert any(
+            name.endswith("cached_square") and item["entries"] == 1
+            for name, item in sizes.items()
+        )
+
+        del service
+        assert "test.service" not in {item["name"] for item in cache_sizes()}
@@ -0,0 +1,136 @@
+"""
+Unit tests for the replay benchmark.
+"""
+
+import asyncio
+import copy
+
+from src.ai_service.utils import tracing
+from src.ai_service.utils.benchmark import (
+    ReplayCase,
+    compare_reports,
+    corpus_fingerprint,
+    corpus_to_jsonl,
+    load_corpus,
+    run_benchmark,
+    synthetic_corpus,
+)
+from src.ai_service.utils.tracing import (
+    begin_request_trace,
+    end_request_trace,
+    span,
+    trace_event,
+)
+
+
+class FakeTarget:
+    """Traces each request like the orchestrator; odd-numbered texts fail."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.seen = []
+
+    async def send(self, case):
+        cached = case.text in self.seen
+        self.seen.append(case.text)
+        scope = begin_request_trace("process")
+        try:
+            trace_event("cache.hit" if cached else "cache.miss", cache="result")
+            with span("layer.normalization"):
+                await asyncio.sleep(0)
+            with span("layer.search"):
+                await asyncio.sleep(0.001)
+            return not case.text.endswith("1")
+        finally:
+            end_request_trace(scope)
+
+
+class TestCorpus:
+    """Test synthetic and recorded corpora."""
+
+    def test_synthetic_is_seeded_and_mixed(self):
+        cases = synthetic_corpus(300, seed=7)
+        assert [c.text for c in cases] == [
+            c.text for c in synthetic_corpus(300, seed=7)
+        ]
+        assert {c.language for c in cases} == {"ru", "uk", "en"}
+        assert {c.kind for c in cases} == {"name", "payment", "ids"}
+        assert corpus_fingerprint(cases) != corpus_fingerprint(
+            synthetic_corpus(300, seed=8)
+        )
+
+    def test_load_formats(self, tmp_path):
+        cases = synthetic_corpus(5)
+        corpus_to_jsonl(cases, tmp_path / "corpus.jsonl")
+        assert load_corpus(str(tmp_path / "corpus.jsonl")) == cases
+
+        golden = tmp_path / "golden.json"
+        golden.write_text(
+            '[{"id": "a", "input": "Иван Петров", "language": "ru"}, {"id": "empty"}]'
+        )
+        assert load_corpus(str(golden)) == [
+            ReplayCase(id="a", text="Иван Петров", language="ru")
+        ]
+
+
+class TestRun:
+    """Test concurrency sweeps and report diffs."""
+
+    def test_levels_report_spans_and_caches(self):
+        previous = tracing.get_tracer()
+        cases = [ReplayCase(id=str(i), text=f"text {i % 4}") for i in range(8)]
+        target = FakeTarget()
+        report = asyncio.run(
+            run_benchmark(target, cases, concurrency=(1, 4), requests=12, warmup=2)
+        )
+
+        assert tracing.get_tracer() is previous
+        assert len(target.seen) == 2 + 12 * 2
+        assert report["corpus"]["fingerprint"] == corpus_fingerprint(cases)
+        first, second = report["levels"]
+        assert (first["concurrency"], second["concurrency"]) == (1, 4)
+        assert first["errors"] == 3
+        assert first["latency_ms"]["count"] == 12
+        assert first["latency_ms"]["p99"] >= first["latency_ms"]["p50"] >= 1.0
+        assert set(first["spans_ms"]) == {
+            "process",
+            "layer.normalization",
+            "layer.search",
+        }
+        assert first["spans_ms"]["layer.search"]["p50"] >= 1.0
+        assert (
+            first["cache_hit_rates"]["result"]["hits"]
+            + first["cache_hit_rates"]["result"]["misses"]
+            == 12
+        )
+        assert second["cache_hit_rates"]["result"]["hit_rate"] == 1.0
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            "corpus": {"fingerprint": "abc"},
+            "levels": [
+                {
+                    "concurrency": 4,
+                    "throughput_rps": 100.0,
+                    "latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 30.0},
+                    "rss_bytes": {"peak": 1000},
+                    "spans_ms": {"layer.search": {"p95": 5.0}},
+                }
+            ],
+        }
+        current = copy.deepcopy(baseline)
+        current["levels"][0]["throughput_rps"] = 80.0
+        current["levels"][0]["latency_ms"]["p95"] = 21.0
+        current["levels"][0]["spans_ms"]["layer.search"]["p95"] = 8.0
+
+        comparison = compare_reports(baseline, current, threshold=0.1)
+        assert comparison["comparable"]
+        assert {r["metric"] for r in comparison["regressions"]} == {
+            "throughput_rps",
+            "spans_ms.layer.search.p95",
+        }
+        assert len(comparison["levels"]["4"]) == 6
+
+        current["corpus"]["fingerprint"] = "other"
+        assert not compare_reports(baseline, current)["comparable"]
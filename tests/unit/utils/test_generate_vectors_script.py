@@ -0,0 +1,173 @@
+"""
+Tests for streaming shard output of scripts/generate_vectors.py
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+
+import generate_vectors
+from generate_vectors import (
+    VectorGenerator,
+    iter_pattern_records,
+    iter_vector_entries,
+    open_vector_shards,
+)
+
+
+def _patterns(count=40):
+    return [
+        {
+            "pattern": f"name {i % 6}",
+            "tier": i % 4,
+            "entity_id": str(i),
+            "type": "exact",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def generator():
+    """VectorGenerator without a model (dummy vectors)"""
+    gen = VectorGenerator.__new__(VectorGenerator)
+    gen.model_name = "dummy"
+    gen.model = None
+    gen._pool = None
+    return gen
+
+
+class TestIterPatternRecords:
+    """Test incremental pattern reading"""
+
+    def test_envelope_format_small_chunks(self, tmp_path):
+        patterns = _patterns()
+        path = tmp_path / "patterns.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "metadata": {"patterns": 3, "nested": [1, {"a": "]"}]},
+                    "patterns": patterns,
+                    "trailer": 1.25,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+        assert list(iter_pattern_records(path, chunk_size=5)) == patterns
+
+    def test_bare_list_and_jsonl(self, tmp_path):
+        patterns = _patterns(10)
+        list_path = tmp_path / "patterns.json"
+        list_path.write_text(json.dumps(patterns), encoding="utf-8")
+        jsonl_path = tmp_path / "patterns.jsonl"
+        jsonl_path.write_text(
+            "\n".join(json.dumps(p) for p in patterns), encoding="utf-8"
+        )
+
+        assert list(iter_pattern_records(list_path, chunk_size=3)) == patterns
+        assert list(iter_pattern_records(jsonl_path)) == patterns
+
+
+class TestGenerateVectorShards:
+    """Test shard generation, dedup and resume"""
+
+    def test_dedup_and_manifest(self, generator, tmp_path):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps({"patterns": _patterns()}), encoding="utf-8")
+
+        count = generator.generate_vector_shards(path, tmp_path / "out", shard_size=2)
+
+        manifest, arrays = open_vector_shards(tmp_path / "out")
+        assert count == 30  # tier 3 skipped
+        assert manifest["complete"] is True
+        assert manifest["unique_texts"] == 6
+        assert sum(a.shape[0] for a in arrays) == 6
+        assert all(a.dtype == np.float32 for a in arrays)
+        assert isinstance(arrays[0], np.memmap)
+
+        entries = list(iter_vector_entries(tmp_path / "out"))
+        assert len(entries) == 30
+        assert {name for name, _, _ in entries} == {f"name {i}" for i in range(6)}
+
+    def test_resume_skips_completed_shards(self, generator, tmp_path, monkeypatch):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps({"patterns": _patterns()}), encoding="utf-8")
+        out = tmp_path / "out"
+
+        calls = []
+        original = VectorGenerator._encode_array
+
+        def fail_after_first(self, texts, batch_size, workers):
+            calls.append(list(texts))
+            if len(calls) > 1:
+                raise RuntimeError("interrupted")
+            return original(self, texts, batch_size, workers)
+
+        monkeypatch.setattr(VectorGenerator, "_encode_array", fail_after_first)
+        with pytest.raises(RuntimeError):
+            generator.generate_vector_shards(path, out, shard_size=2)
+
+        with open(out / generate_vectors.MANIFEST_NAME, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        assert checkpoint["complete"] is False
+        assert len(checkpoint["shards"]) == 1
+
+        calls.clear()
+        monkeypatch.setattr(VectorGenerator, "_encode_array", original)
+        count = generator.generate_vector_shards(path, out, shard_size=2)
+
+        manifest, arrays = open_vector_shards(out)
+        assert count == 30
+        assert manifest["unique_texts"] == 6
+        assert sum(a.shape[0] for a in arrays) == 6
+
+    def test_pool_stopped_when_encoding_fails(self, generator, tmp_path):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps({"patterns": _patterns()}), encoding="utf-8")
+        stopped = []
+
+        class PoolModel:
+            device = type("Device", (), {"type": "cpu"})()
+
+            def start_multi_process_pool(self, target_devices=None):
+                return "pool"
+
+            def encode_multi_process(self, texts, pool, batch_size=32):
+                raise RuntimeError("worker died")
+
+            def stop_multi_process_pool(self, pool):
+                stopped.append(pool)
+
+        generator.model = PoolModel()
+        with pytest.raises(RuntimeError):
+            generator.generate_vector_shards(
+                path, tmp_path / "out", shard_size=2, workers=2
+            )
+
+        assert stopped == ["pool"]
+        assert generator._pool is None
+
+    def test_limited_run_is_not_reused_by_full_run(self, generator, tmp_path):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps({"patterns": _patterns()}), encoding="utf-8")
+        out = tmp_path / "out"
+
+        assert (
+            generator.generate_vector_shards(path, out, max_patterns=10, shard_size=2)
+            == 10
+        )
+        assert generator.generate_vector_shards(path, out, shard_size=2) == 30
+        assert generator.generate_vector_shards(path, out, shard_size=4) == 30
+
+        manifest, arrays = open_vector_shards(out)
+        assert manifest["shard_size"] == 4
+        assert sum(a.shape[0] for a in arrays) == 6
@@ -0,0 +1,65 @@
+"""
+Unit tests for the memory-mapped hash table.
+"""
+
+import pytest
+
+from src.ai_service.utils.mmap_hash import MmapHashTable, record_size, write_hash_table
+
+
+class TestMmapHashTable:
+    """Test write/read roundtrip of MmapHashTable."""
+
+    def test_roundtrip(self, tmp_path):
+        items = [(f"key-{i}".encode(), f"value-{i % 7}".encode()) for i in range(500)]
+        items.append(("ключ".encode("utf-8"), b""))
+        path = str(tmp_path / "table.bin")
+
+        assert write_hash_table(path, items, {"kind": "test"}) == 501
+
+        table = MmapHashTable(path)
+        assert len(table) == 501
+        assert table.meta == {"kind": "test"}
+        for key, value in items:
+            assert table.get(key) == value
+        assert table.get(b"missing") is None
+        assert b"key-3" in table
+        assert b"nope" not in table
+        assert sorted(table.items()) == sorted(items)
+
+    def test_items_range(self, tmp_path):
+        items = [(f"a:{i}".encode(), b"") for i in range(3)] + [
+            (f"b:{i}".encode(), b"v") for i in range(4)
+        ]
+        path = str(tmp_path / "table.bin")
+        write_hash_table(path, items)
+
+        start = sum(record_size(key) for key, _ in items[:3])
+        table = MmapHashTable(path)
+        assert list(table.items(start)) == items[3:]
+        assert list(table.items(0, start)) == items[:3]
+
+    def test_later_duplicates_win_and_values_are_shared(self, tmp_path):
+        path = str(tmp_path / "table.bin")
+        write_hash_table(path, [(b"a", b"shared"), (b"b", b"shared"), (b"a", b"new")])
+
+        table = MmapHashTable(path)
+        assert len(table) == 2
+        assert table.get(b"a") == b"new"
+        assert table.get(b"b") == b"shared"
+
+    def test_empty_table(self, tmp_path):
+        path = str(tmp_path / "table.bin")
+        write_hash_table(path, [])
+
+        table = MmapHashTable(path)
+        assert len(table) == 0
+        assert table.get(b"x") is None
+        assert list(table.items()) == []
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"not a table at all, just some bytes")
+
+        with pytest.raises(ValueError):
+            MmapHashTable(str(path))
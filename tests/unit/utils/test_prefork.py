@@ -0,0 +1,106 @@
+"""
+Unit tests for the pre-fork server and its memory report.
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.ai_service.utils.prefork import memory_report, parse_smaps_rollup
+
+SMAPS_ROLLUP = """\
+55d0c0a00000-7ffd5e9f1000 ---p 00000000 00:00 0                          [rollup]
+Rss:              120000 kB
+Pss:               50000 kB
+Shared_Clean:      80000 kB
+Shared_Dirty:       4000 kB
+Private_Clean:      1000 kB
+Private_Dirty:     35000 kB
+Swap:                  0 kB
+"""
+
+linux_only = pytest.mark.skipif(
+    not Path(f"/proc/{os.getpid()}/smaps_rollup").exists(),
+    reason="needs /proc/<pid>/smaps_rollup",
+)
+
+# Master warms a payload, workers answer every connection with "<pid> <payload size> <frozen>"
+SERVER_SCRIPT = textwrap.dedent(
+    """
+    import gc, os, sys
+    sys.path.insert(0, {root!r})
+    from src.ai_service.utils.prefork import PreforkServer
+
+    state = {{}}
+
+    def warm():
+        state["payload"] = [str(i) for i in range(100000)]
+
+    def serve(sock):
+        while True:
+            conn, _ = sock.accept()
+            conn.sendall(f"{{os.getpid()}} {{len(state['payload'])}} {{gc.get_freeze_count() > 0}}".encode())
+            conn.close()
+
+    server = PreforkServer(serve, workers=2, host="127.0.0.1", port=0, graceful_timeout=5)
+    sock = server.bind()
+    print(sock.getsockname()[1], flush=True)
+    sys.exit(server.run(warm=warm))
+    """
+)
+
+
+class TestMemoryReport:
+    """Test shared/private memory accounting."""
+
+    def test_parse_smaps_rollup(self):
+        assert parse_smaps_rollup(SMAPS_ROLLUP) == {
+            "rss_kb": 120000,
+            "pss_kb": 50000,
+            "shared_kb": 84000,
+            "private_kb": 36000,
+        }
+
+    @linux_only
+    def test_report_for_current_process(self):
+        report = memory_report()
+        assert report["available"]
+        assert report["master"]["pid"] == os.getpid()
+        assert report["total_rss_kb"] >= report["total_pss_kb"] > 0
+
+
+@linux_only
+class TestPreforkServer:
+    """Test forking workers from a warmed master."""
+
+    def test_workers_share_warm_state_and_stop_on_sigterm(self):
+        root = str(Path(__file__).resolve().parents[3])
+        proc = subprocess.Popen(
+            [sys.executable, "-c", SERVER_SCRIPT.format(root=root)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            port = int(proc.stdout.readline())
+            replies = set()
+            for _ in range(20):
+                with socket.create_connection(("127.0.0.1", port), timeout=10) as conn:
+                    replies.add(conn.recv(100).decode())
+
+            pids = {reply.split()[0] for reply in replies}
+            assert str(proc.pid) not in pids
+            assert 1 <= len(pids) <= 2
+            assert all(reply.endswith(" 100000 True") for reply in replies)
+
+            workers = memory_report(proc.pid)["workers"]
+            assert {str(w["pid"]) for w in workers} >= pids
+            assert all(w["shared_kb"] > 0 for w in workers)
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            assert proc.wait(timeout=15) == 0
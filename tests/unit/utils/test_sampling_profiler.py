@@ -0,0 +1,139 @@
+"""
+Unit tests for the in-process sampling profiler.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.ai_service.utils import profiling
+from src.ai_service.utils.sampling_profiler import SamplingProfiler, frame_label
+
+
+def process_endpoint(ready, done):
+    return _handle_signals_layer(ready, done)
+
+
+def _handle_signals_layer(ready, done):
+    return busy_leaf(ready, done)
+
+
+def busy_leaf(ready, done):
+    ready.set()
+    # A plain flag keeps this function the leaf of every sample
+    while not done:
+        pass
+
+
+@pytest.fixture
+def busy_thread():
+    ready, done = threading.Event(), []
+    thread = threading.Thread(target=process_endpoint, args=(ready, done))
+    thread.start()
+    ready.wait()
+    yield thread
+    done.append(True)
+    thread.join()
+
+
+def sampled(threads, count=5):
+    # Only the test's own threads: stray threads of other tests would skew counts
+    profiler = SamplingProfiler()
+    profiler.register_endpoints({process_endpoint: "/process"})
+    for _ in range(count):
+        profiler.sample(threads=[thread.ident for thread in threads])
+    return profiler
+
+
+class TestAttribution:
+    """Test stack sampling and endpoint/layer attribution."""
+
+    def test_collapsed_stacks_grouped(self, busy_thread):
+        profiler = sampled([busy_thread])
+        lines = profiler.collapsed(endpoint="/process").splitlines()
+        assert len(lines) == 1
+        stack, count = lines[0].rsplit(" ", 1)
+        frames = stack.split(";")
+        assert frames[:2] == ["[/process]", "[signals]"]
+        assert frames[-1] == frame_label(busy_leaf.__code__)
+        assert int(count) == 5
+        assert profiler.breakdown()["/process"]["signals"] == 5
+
+    def test_filters_and_ungrouped(self, busy_thread):
+        profiler = sampled([busy_thread])
+        assert profiler.collapsed(endpoint="/normalize") == ""
+        assert profiler.collapsed(layer="signals", group=False).startswith(
+            frame_label(threading.Thread._bootstrap.__code__)
+        )
+
+    def test_idle_threads_excluded(self, busy_thread):
+        waiter_done = threading.Event()
+        waiter = threading.Thread(target=waiter_done.wait)
+        waiter.start()
+        try:
+            profiler = sampled([busy_thread, waiter])
+        finally:
+            waiter_done.set()
+            waiter.join()
+        assert profiler.status()["idle_samples"] == 5
+        assert "[-]" not in profiler.collapsed()
+        assert "[-]" in profiler.collapsed(include_idle=True)
+
+    def test_top_functions(self, busy_thread):
+        top = sampled([busy_thread]).top_functions(top=1)
+        assert top[0]["function"] == frame_label(busy_leaf.__code__)
+        assert top[0]["share"] == 1.0
+
+
+class TestExport:
+    """Test speedscope output and limits."""
+
+    def test_speedscope_profiles(self, busy_thread):
+        document = sampled([busy_thread], 3).speedscope()
+        frames = document["shared"]["frames"]
+        profile = document["profiles"][0]
+        assert profile["name"] == "/process signals"
+        assert profile["endValue"] == 3 == sum(profile["weights"])
+        leaf = frames[profile["samples"][0][-1]]
+        assert leaf["name"] == "busy_leaf"
+        assert leaf["line"] == busy_leaf.__code__.co_firstlineno
+
+    def test_new_stacks_dropped_at_limit(self, busy_thread):
+        profiler = SamplingProfiler(max_stacks=0)
+        profiler.sample()
+        assert profiler.status()["stacks"] == 0
+        assert profiler.dropped == profiler.samples > 0
+
+
+class TestProfilingManager:
+    """Test starting the sampler through utils.profiling."""
+
+    def test_background_thread_and_stats(self, busy_thread):
+        sampler = profiling.start_sampling_profiler(hz=200)
+        try:
+            assert sampler.running
+            assert profiling.start_sampling_profiler() is sampler
+            deadline = time.time() + 5
+            while sampler.samples < 10 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            profiling.stop_sampling_profiler()
+        assert not sampler.running
+        stats = profiling.get_profiling_stats()["sampling"]
+        assert stats["samples"] >= 10
+        # The sampler never records its own thread
+        assert frame_label(SamplingProfiler._run.__code__) not in sampler.collapsed(
+            include_idle=True
+        )
+
+        profiling.clear_profiling_stats()
+        assert sampler.samples == 0
+
+    def test_stops_after_duration(self):
+        sampler = SamplingProfiler(hz=500)
+        sampler.start(duration_s=0.05)
+        sampler._thread.join(timeout=5)
+        assert not sampler.running
+        assert sampler.stopped_at is not None
+        sampler.stop()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the cold-start profiler and the readiness state machine.
+"""
+
+import sys
+
+import pytest
+
+from src.ai_service.utils.readiness import (
+    SCREENING_COMPONENTS,
+    ComponentState,
+    ReadinessState,
+    ReadinessTracker,
+)
+from src.ai_service.utils.startup_profiler import ImportProfiler, StartupTimeline
+
+
+@pytest.fixture
+def profiler():
+    profiler = ImportProfiler()
+    profiler.install()
+    yield profiler
+    profiler.uninstall()
+
+
+class TestImportProfiler:
+    """Test per-module import timing."""
+
+    def test_records_new_imports_with_parent(self, profiler, tmp_path, monkeypatch):
+        (tmp_path / "cold_parent_mod.py").write_text("import cold_child_mod\n")
+        (tmp_path / "cold_child_mod.py").write_text("import time\ntime.sleep(0.02)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        import cold_parent_mod  # noqa: F401
+
+        records = {r.module: r for r in profiler.records()}
+        parent, child = records["cold_parent_mod"], records["cold_child_mod"]
+        assert child.parent == "cold_parent_mod"
+        assert child.self_s >= 0.02
+        assert parent.cumulative_s >= child.cumulative_s
+        assert parent.self_s < child.self_s
+
+        report = profiler.report(top=1)
+        assert report["enabled"] and report["modules"] >= 2
+        assert report["slowest"][0]["module"] == "cold_parent_mod"
+
+        for name in ("cold_parent_mod", "cold_child_mod"):
+            sys.modules.pop(name, None)
+
+    def test_cached_modules_not_recorded(self, profiler):
+        import json  # noqa: F401
+
+        assert "json" not in {r.module for r in profiler.records()}
+
+    def test_uninstall_restores_import(self):
+        import builtins
+
+        original = builtins.__import__
+        profiler = ImportProfiler()
+        profiler.install()
+        assert builtins.__import__ is not original
+        profiler.uninstall()
+        assert builtins.__import__ is original
+        assert not profiler.report()["enabled"]
+
+
+class TestStartupTimeline:
+    """Test startup phase recording."""
+
+    def test_phases_recorded_on_error(self):
+        timeline = StartupTimeline()
+        with timeline.phase("ok"):
+            pass
+        with pytest.raises(RuntimeError):
+            with timeline.phase("broken"):
+                raise RuntimeError("boom")
+
+        phases = timeline.report()["phases"]
+        assert [p["phase"] for p in phases] == ["ok", "broken"]
+        assert "error" not in phases[0] and phases[1]["error"] == "RuntimeError"
+
+
+class TestReadinessTracker:
+    """Test readiness state transitions."""
+
+    def test_lazy_startup_transitions(self):
+        tracker = ReadinessTracker()
+        assert tracker.state == ReadinessState.STARTING
+        assert not tracker.is_serving()
+
+        tracker.register("search")
+        tracker.register("embeddings")
+        tracker.mark_core_ready()
+        assert tracker.state == ReadinessState.CORE_READY
+        assert tracker.is_serving(ready_on_core=True)
+        assert not tracker.is_serving(ready_on_core=False)
+
+        assert tracker.loading(SCREENING_COMPONENTS) == ["search"]
+
+        tracker.start("search")
+        assert tracker.loading(SCREENING_COMPONENTS) == ["search"]
+        tracker.ready("search")
+        assert tracker.loading(SCREENING_COMPONENTS) == []
+        assert tracker.component_state("search") == ComponentState.READY
+        assert tracker.state == ReadinessState.CORE_READY
+
+        tracker.start("embeddings")
+        tracker.fail("embeddings", "no model")
+        assert tracker.state == ReadinessState.DEGRADED
+        assert tracker.is_serving(ready_on_core=False)
+
+        snapshot = tracker.snapshot()
+        assert snapshot["state"] == "degraded"
+        assert snapshot["components"]["embeddings"]["error"] == "no model"
+        assert snapshot["ready_s"] is not None
+
+    def test_eager_startup_is_ready(self):
+        tracker = ReadinessTracker()
+        tracker.mark_core_ready()
+        assert tracker.state == ReadinessState.READY
+
+    def test_core_failure(self):
+        tracker = ReadinessTracker()
+        tracker.mark_core_failed(ValueError("bad config"))
+        assert tracker.state == ReadinessState.FAILED
+        assert not tracker.is_serving()
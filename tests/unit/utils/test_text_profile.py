@@ -0,0 +1,129 @@
+"""
+Unit tests for the per-request TextProfile and its use by processing layers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_service.layers.language.language_detection_service import (
+    LanguageDetectionService,
+)
+from src.ai_service.layers.normalization.normalization_service import (
+    NormalizationService,
+)
+from src.ai_service.layers.signals.signals_service import SignalsService
+from src.ai_service.layers.smart_filter.smart_filter_service import SmartFilterService
+from src.ai_service.layers.unicode.unicode_service import UnicodeService
+from src.ai_service.utils.text_profile import (
+    MAX_PROFILES_PER_SCOPE,
+    TextProfile,
+    get_text_profile,
+    text_profile_scope,
+)
+
+TEXTS = [
+    "",
+    "Ivan Petrov",
+    "Іван Петренко",
+    "Сергей Ёлкин, ИНН 7701234567",
+    "Оплата за договором № 123/45 від 01.02.2024 Петренко І.І. (ІПН 1234567890)",
+    "Ivаn Pеtrov",  # Cyrillic а/е homoglyphs
+    "Ўладзімір Đorđević ҂ 42 кг\tΑθήνα_x!",
+    "   ",
+]
+
+
+class TestTextProfile:
+    """Test TextProfile counts and spans."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_counts_match_character_classes(self, text):
+        profile = TextProfile.from_text(text)
+
+        assert profile.length == len(text)
+        assert profile.cyrillic == sum(
+            1 for c in text if c in "ЁІЇЄҐёіїєґ" or "А" <= c <= "я"
+        )
+        assert profile.cyrillic_extended + profile.cyrillic == sum(
+            1 for c in text if "Ѐ" <= c <= "ӿ"
+        )
+        assert profile.latin == sum(1 for c in text if c.isascii() and c.isalpha())
+        assert profile.digits == sum(1 for c in text if "0" <= c <= "9")
+        assert profile.spaces == sum(1 for c in text if c.isspace())
+        assert profile.ukrainian_specific == sum(1 for c in text if c in "іїєґІЇЄҐ")
+        assert profile.russian_specific == sum(1 for c in text if c in "ёъыэЁЪЫЭ")
+
+    def test_spans(self):
+        profile = TextProfile.from_text("ИНН 7701 Ivаn 12-34")
+
+        assert profile.token_spans == ((0, 3), (4, 8), (9, 13), (14, 19))
+        assert list(profile.tokens) == ["ИНН", "7701", "Ivаn", "12-34"]
+        assert profile.digit_runs == ((4, 8), (14, 16), (17, 19))
+        assert profile.script_spans == (
+            (0, 3, "cyrillic"),
+            (9, 11, "latin"),
+            (11, 12, "cyrillic"),
+            (12, 13, "latin"),
+        )
+        assert profile.has_mixed_scripts
+        assert profile.dominant_script == "cyrillic"
+
+
+class TestTextProfileScope:
+    """Test request-scoped sharing of profiles."""
+
+    def test_no_scope_returns_none(self):
+        assert get_text_profile("Ivan Petrov") is None
+
+    def test_profile_is_shared_within_scope(self):
+        with text_profile_scope():
+            first = get_text_profile("Ivan Petrov")
+            assert get_text_profile("Ivan " + "Petrov") is first
+        assert get_text_profile("Ivan Petrov") is None
+
+    def test_scope_is_bounded(self):
+        with text_profile_scope():
+            for i in range(MAX_PROFILES_PER_SCOPE + 2):
+                assert get_text_profile(f"text {i}").text == f"text {i}"
+
+    def test_scopes_are_isolated_between_tasks(self):
+        async def worker(text):
+            with text_profile_scope():
+                profile = get_text_profile(text)
+                await asyncio.sleep(0)
+                return get_text_profile(text) is profile
+
+        async def main():
+            return await asyncio.gather(worker("a"), worker("b"))
+
+        assert asyncio.run(main()) == [True, True]
+
+
+class TestLayerParity:
+    """Layers give the same answers with and without a shared profile."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.language = LanguageDetectionService()
+        cls.unicode = UnicodeService()
+        cls.signals = SignalsService()
+        cls.normalization = NormalizationService()
+        cls.smart_filter = SmartFilterService(language_service=None)
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_results_unchanged(self, text):
+        def run():
+            return (
+                self.language._calculate_character_ratios(text),
+                self.language._detect_cyrillic_priority(text),
+                self.unicode._normalize_homoglyphs(text),
+                self.signals._is_mixed_language_text(text),
+                self.normalization._has_mixed_scripts(text),
+                self.smart_filter._analyze_language_composition(text),
+                self.smart_filter._detect_language(text),
+            )
+
+        expected = run()
+        with text_profile_scope():
+            assert run() == expected
@@ -0,0 +1,140 @@
+"""
+Unit tests for sampled per-request span trees.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_service.monitoring.prometheus_exporter import get_exporter
+from src.ai_service.utils import tracing
+from src.ai_service.utils.profiling import profile_time
+from src.ai_service.utils.tracing import (
+    NOOP_SPAN,
+    Tracer,
+    current_span,
+    span,
+    trace_event,
+)
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    durations = []
+    monkeypatch.setattr(
+        get_exporter(),
+        "record_span_duration",
+        lambda name, ms: durations.append((name, ms)),
+    )
+    return durations
+
+
+class TestUnsampled:
+    """Test the no-op path outside a sampled request."""
+
+    def test_span_is_shared_noop(self):
+        assert current_span() is None
+        with span("layer.signals", texts=1) as s:
+            s.set("key", "value")
+            s.event("ignored")
+        assert span("other") is NOOP_SPAN
+        trace_event("cache.hit", cache="result")
+
+    def test_zero_rate_never_samples(self):
+        tracer = Tracer(sample_rate=0.0)
+        assert all(tracer.begin("process") is None for _ in range(100))
+        assert tracer.stats == {"requests": 100, "sampled": 0, "slow": 0}
+
+
+class TestSpanTree:
+    """Test building and exporting span trees."""
+
+    def test_tree_events_and_histograms(self, recorded):
+        tracer = Tracer(sample_rate=1.0, slow_ms=10_000)
+        scope = tracer.begin("process", text_length=12)
+        with span("layer.search"):
+            with span("es.search", index="watchlist_ac"):
+                trace_event("cache.miss", cache="result")
+        with profile_time("tracing_test.block"):
+            pass
+        root = tracer.end(scope)
+
+        assert current_span() is None
+        tree = root.to_dict()
+        assert tree["attrs"] == {"text_length": 12}
+        search = tree["children"][0]
+        assert search["name"] == "layer.search"
+        assert search["children"][0]["attrs"] == {"index": "watchlist_ac"}
+        assert search["children"][0]["events"][0]["cache"] == "result"
+        assert tree["children"][1]["name"] == "tracing_test.block"
+        assert [name for name, _ in recorded] == [
+            "process",
+            "layer.search",
+            "es.search",
+            "tracing_test.block",
+        ]
+        assert tracer.slow_traces() == []
+
+    def test_slow_request_logged(self, recorded, caplog):
+        tracer = Tracer(sample_rate=1.0, slow_ms=0.0)
+        scope = tracer.begin("process")
+        with span("layer.decision"):
+            pass
+        tracer.end(scope)
+
+        assert tracer.stats["slow"] == 1
+        assert tracer.slow_traces()[0]["children"][0]["name"] == "layer.decision"
+        assert any(
+            "Slow request process" in record.getMessage() for record in caplog.records
+        )
+
+    def test_span_records_exception(self, recorded):
+        tracer = Tracer(sample_rate=1.0, slow_ms=10_000)
+        scope = tracer.begin("process")
+        with pytest.raises(ValueError):
+            with span("layer.signals"):
+                raise ValueError("boom")
+        root = tracer.end(scope)
+        assert root.children[0].attrs == {"error": "ValueError"}
+
+    def test_nested_request_joins_outer_trace(self, recorded):
+        tracer = Tracer(sample_rate=1.0, slow_ms=10_000)
+        outer = tracer.begin("batch")
+        assert tracer.begin("process") is None
+        assert tracer.end(None) is None
+        tracer.end(outer)
+        assert tracer.stats["sampled"] == 1
+
+    def test_concurrent_tasks_attach_to_parent(self, recorded):
+        tracer = Tracer(sample_rate=1.0, slow_ms=10_000)
+
+        async def child(name):
+            with span(name):
+                await asyncio.sleep(0)
+            return current_span().name
+
+        async def request():
+            scope = tracer.begin("process")
+            with span("layer.search"):
+                names = await asyncio.gather(
+                    child("es.search"), child("embeddings.encode")
+                )
+            return names, tracer.end(scope)
+
+        names, root = asyncio.run(request())
+        assert names == ["layer.search", "layer.search"]
+        assert sorted(c.name for c in root.children[0].children) == [
+            "embeddings.encode",
+            "es.search",
+        ]
+
+
+def test_tracer_configured_from_environment(monkeypatch):
+    monkeypatch.setenv(tracing.SAMPLE_RATE_ENV, "0.25")
+    monkeypatch.setenv(tracing.SLOW_MS_ENV, "bad")
+    tracing.set_tracer(None)
+    try:
+        tracer = tracing.get_tracer()
+        assert (tracer.sample_rate, tracer.slow_ms) == (0.25, tracing.DEFAULT_SLOW_MS)
+    finally:
+        tracing.set_tracer(None)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Replay load benchmark for the full /process pipeline.
+
+Examples:
+    # In-process, synthetic corpus, stand-in ES; save a baseline
+    python tools/replay_benchmark.py run --concurrency 1,4,16 --output baseline.json
+
+    # Recorded corpus against a running service, gated on the baseline
+    python tools/replay_benchmark.py run --corpus tests/fixtures/parity_golden.jsonl \\
+        --url http://localhost:8000 --baseline baseline.json
+
+    # Diff two saved reports
+    python tools/replay_benchmark.py compare baseline.json current.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Sequence
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_service.utils import get_logger
+from ai_service.utils.benchmark import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    HttpTarget,
+    InProcessTarget,
+    compare_reports,
+    corpus_to_jsonl,
+    load_corpus,
+    load_report,
+    run_benchmark,
+    save_report,
+    synthetic_corpus,
+)
+
+logger = get_logger(__name__)
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay a corpus against the /process pipeline"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run a concurrency sweep")
+    run.add_argument("--corpus", help="Recorded JSONL/JSON corpus (default: synthetic)")
+    run.add_argument("--size", type=int, default=200, help="Synthetic corpus size")
+    run.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    run.add_argument("--save-corpus", help="Write the replayed corpus as JSONL")
+    run.add_argument(
+        "--url", help="Replay over HTTP against this service instead of in-process"
+    )
+    run.add_argument(
+        "--concurrency", default="1,4,16", help="Comma-separated worker counts"
+    )
+    run.add_argument(
+        "--requests", type=int, help="Requests per level (default: corpus size)"
+    )
+    run.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests before the sweep"
+    )
+    run.add_argument(
+        "--no-variants", action="store_true", help="Disable variant generation"
+    )
+    run.add_argument(
+        "--embeddings", action="store_true", help="Enable embeddings (loads the model)"
+    )
+    run.add_argument("--output", help="Write the report as JSON")
+    run.add_argument(
+        "--baseline", help="Compare with this report; exit 1 on regression"
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="Diff two saved reports")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD
+    )
+    return parser.parse_args(argv)
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    corpus = report["corpus"]
+    print(
+        f"Target: {report['target']}, corpus {corpus['name']} ({corpus['size']} cases, {corpus['fingerprint']})"
+    )
+    print(
+        f"{'conc':>5} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'rss MB':>8}"
+    )
+    for level in report["levels"]:
+        latency = level["latency_ms"]
+        peak = level["rss_bytes"]["peak"]
+        print(
+            f"{level['concurrency']:>5} {level['throughput_rps']:>9.1f} {latency['p50']:>9.2f} "
+            f"{latency['p95']:>9.2f} {latency['p99']:>9.2f} {level['errors']:>7} "
+            f"{(peak or 0) / 2**20:>8.1f}"
+        )
+    last = report["levels"][-1]
+    for name, stats in last.get("spans_ms", {}).items():
+        print(
+            f"  {name:<32} p50={stats['p50']:.2f} p95={stats['p95']:.2f} p99={stats['p99']:.2f}"
+        )
+    for cache, stats in last.get("cache_hit_rates", {}).items():
+        print(
+            f"  cache {cache:<26} hit rate {stats['hit_rate']:.1%} ({stats['hits']}/{stats['hits'] + stats['misses']})"
+        )
+
+
+def _print_comparison(comparison: Dict[str, Any]) -> int:
+    if not comparison["comparable"]:
+        print("Warning: reports were produced from different corpora")
+    for regression in comparison["regressions"]:
+        print(
+            f"REGRESSION c={regression['concurrency']} {regression['metric']}: "
+            f"{regression['baseline']} -> {regression['current']} ({regression['change']:+.1%})"
+        )
+    if not comparison["regressions"]:
+        print(f"No regressions above {comparison['threshold']:.0%}")
+    return 1 if comparison["regressions"] else 0
+
+
+async def _run(args: argparse.Namespace) -> int:
+    if args.corpus:
+        cases, corpus_name = load_corpus(args.corpus), Path(args.corpus).name
+    else:
+        cases, corpus_name = (
+            synthetic_corpus(args.size, args.seed),
+            f"synthetic(seed={args.seed})",
+        )
+    if args.save_corpus:
+        corpus_to_jsonl(cases, args.save_corpus)
+
+    target = HttpTarget(args.url) if args.url else InProcessTarget()
+    await target.setup(
+        enable_variants=not args.no_variants, enable_embeddings=args.embeddings
+    )
+    try:
+        report = await run_benchmark(
+            target,
+            cases,
+            concurrency=[int(value) for value in args.concurrency.split(",")],
+            requests=args.requests,
+            warmup=args.warmup,
+            corpus_name=corpus_name,
+        )
+    finally:
+        await target.close()
+
+    _print_report(report)
+    if args.output:
+        save_report(report, args.output)
+        print(f"Report written to {args.output}")
+    if args.baseline:
+        return _print_comparison(
+            compare_reports(load_report(args.baseline), report, args.threshold)
+        )
+    return 0
+
+
+def main(argv: Sequence[str] = None) -> int:
+    args = _parse_args(argv if argv is not None else sys.argv[1:])
+    if args.command == "compare":
+        comparison = compare_reports(
+            load_report(args.baseline), load_report(args.current), args.threshold
+        )
+        print(json.dumps(comparison["levels"], indent=2))
+        return _print_comparison(comparison)
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())